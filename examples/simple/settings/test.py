@@ -117,3 +117,11 @@ try:
     from .loca_settings import TEST_DATABASES as DATABASES
 except:
     pass
+
+# Read database (replica) for the ``fobi.routers.ReadDatabaseRouter`` tests.
+# Not a mirror of the default database, so that it's seen where the data has
+# been read from.
+DATABASES.setdefault('replica', {
+    'ENGINE': 'django.db.backends.sqlite3',
+    'NAME': ':memory:',
+})
@@ -360,6 +360,7 @@ if PY3:
 else:
     install_requires.append('simplejson>=2.1.0')  # When using Python 2.*
     install_requires.append('ordereddict>=1.1')
+    install_requires.append('futures>=3.0.0')
     if DJANGO_INSTALLED and not DJANGO_1_11:
         install_requires.append('easy-thumbnails>=1.4')
     else:
@@ -12,5 +12,48 @@ try:
 
         name = label = 'fobi'
 
+        def ready(self):
+            """Keep the compiled form definitions in sync."""
+            from django.db.models.signals import post_delete, post_save
+
+            from .models import (
+                FormElementEntry,
+                FormEntryVersion,
+                FormHandlerEntry,
+                FormWizardEntryVersion,
+                invalidate_compiled_definitions,
+                invalidate_version_definition,
+            )
+
+            for model_cls in (FormElementEntry, FormHandlerEntry):
+                model_name = model_cls._meta.model_name
+                post_save.connect(
+                    invalidate_compiled_definitions,
+                    sender=model_cls,
+                    dispatch_uid='fobi.compiled_definition.post_save.'
+                                 '{0}'.format(model_name)
+                )
+                post_delete.connect(
+                    invalidate_compiled_definitions,
+                    sender=model_cls,
+                    dispatch_uid='fobi.compiled_definition.post_delete.'
+                                 '{0}'.format(model_name)
+                )
+
+            for model_cls in (FormEntryVersion, FormWizardEntryVersion):
+                model_name = model_cls._meta.model_name
+                post_save.connect(
+                    invalidate_version_definition,
+                    sender=model_cls,
+                    dispatch_uid='fobi.version_definition.post_save.'
+                                 '{0}'.format(model_name)
+                )
+                post_delete.connect(
+                    invalidate_version_definition,
+                    sender=model_cls,
+                    dispatch_uid='fobi.version_definition.post_delete.'
+                                 '{0}'.format(model_name)
+                )
+
 except ImportError:
     pass
@@ -5,17 +5,21 @@ PEP http://www.python.org/dev/peps/pep-0008/#function-names).
 import copy
 import logging
 import re
+import threading
 import traceback
 import uuid
 
 from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import simplejson as json
 
 from django import forms
 from django.forms import ModelForm
+from django.db import close_old_connections
 from django.forms.utils import ErrorList
 from django.http import Http404
+from django.utils import translation
 from django.utils.translation import ugettext_lazy as _
 from django.template import RequestContext, Template
 
@@ -45,6 +49,8 @@ from .helpers import (
     StrippedRequest,
     uniquify_sequence,
 )
+from .instrumentation import incr, span
+from .routers import get_current_read_database, read_database
 from .settings import (
     CUSTOM_THEME_DATA,
     DEBUG,
@@ -58,6 +64,7 @@ from .settings import (
     FAIL_ON_MISSING_INTEGRATION_FORM_ELEMENT_PLUGINS,
     FAIL_ON_MISSING_INTEGRATION_FORM_HANDLER_PLUGINS,
     FORM_HANDLER_PLUGINS_EXECUTION_ORDER,
+    FORM_HANDLER_PLUGINS_MAX_WORKERS,
     FORM_WIZARD_HANDLER_PLUGINS_EXECUTION_ORDER,
     SORT_PLUGINS_BY_VALUE,
     THEME_FOOTER_TEXT,
@@ -74,6 +81,7 @@ __all__ = (
     'BaseFormFieldPluginForm',
     'BasePlugin',
     'BasePluginForm',
+    'check_submission',
     'BaseRegistry',
     'ClassProperty',
     'classproperty',
@@ -106,9 +114,15 @@ __all__ = (
     'FormWizardHandlerPluginWidget',
     'FormWizardHandlerPluginWidgetRegistry',
     'get_form_element_plugin_widget',
+    'get_form_element_submission_checks',
+    'get_form_handler_executor',
     'get_form_handler_plugin_widget',
+    'get_handler_plugin_stages',
+    'get_handler_plugins_execution_order',
     'get_form_wizard_handler_plugin_widget',
+    'get_ordered_form_handler_plugin_uids',
     'get_ordered_form_handlers',
+    'get_ordered_form_wizard_handler_plugin_uids',
     'get_ordered_form_wizard_handlers',
     'get_plugin_widget',
     'get_processed_form_data',
@@ -131,6 +145,7 @@ __all__ = (
     'get_registered_plugins',
     'get_registered_theme_uids',
     'get_registered_themes',
+    'get_rejected_submissions_counts',
     'get_theme',
     'integration_form_callback_registry',
     'integration_form_element_plugin_registry',
@@ -145,8 +160,11 @@ __all__ = (
     'IntegrationFormHandlerPlugin',
     'IntegrationFormHandlerPluginDataStorage',
     'IntegrationFormHandlerPluginRegistry',
+    'reset_rejected_submissions_counts',
     'run_form_handlers',
     'run_form_wizard_handlers',
+    'run_handler_plugins',
+    'sort_handler_entries',
     'submit_plugin_form_data',
     'theme_registry',
     'validate_form_element_plugin_uid',
@@ -215,6 +233,7 @@ class BaseTheme(object):
     edit_form_wizard_entry = 'fobi.edit_form_wizard_entry'
     delete_form_wizard_entry = 'fobi.delete_form_wizard_entry'
     export_form_wizard_entry = 'fobi.export_form_wizard_entry'
+    publish_form_wizard_entry = 'fobi.publish_form_wizard_entry'
 
     add_form_wizard_form_entry = 'fobi.add_form_wizard_form_entry'
     delete_form_wizard_form_entry = 'fobi.delete_form_wizard_form_entry'
@@ -228,6 +247,7 @@ class BaseTheme(object):
     create_form_entry = 'fobi.create_form_entry'
     import_form_entry = 'fobi.import_form_entry'
     export_form_entry = 'fobi.export_form_entry'
+    publish_form_entry = 'fobi.publish_form_entry'
     delete_form_entry = 'fobi.delete_form_entry'
     edit_form_entry = 'fobi.edit_form_entry'
     view_form_entry = 'fobi.view_form_entry'
@@ -617,7 +637,7 @@ class BaseTheme(object):
         return """
         <ul class="{container_class}">
           {edit_option_html}
-          <li><a href="{delete_url}">
+          <li><a href="{delete_url}" class="fobi-delete-form-element-entry">
             <span class="{delete_option_class}"></span> {delete_text}</a>
           </li>
         </ul>
@@ -1004,7 +1024,7 @@ class BasePlugin(object):
     def process(self, plugin_data=None, fetch_related_data=False):
         """Process.
 
-        Init plugin with data.
+        Init plugin with data (JSON string or already parsed).
         """
         try:
             # Calling pre-processor.
@@ -1013,7 +1033,8 @@ class BasePlugin(object):
             if plugin_data:
                 try:
                     # Trying to load the plugin data to JSON.
-                    plugin_data = json.loads(plugin_data)
+                    if isinstance(plugin_data, string_types):
+                        plugin_data = json.loads(plugin_data)
 
                     # If a valid JSON object, feed it to our plugin and process
                     # the data. The ``process_data`` method should be defined
@@ -1259,13 +1280,18 @@ class BasePlugin(object):
 
         For private use. Do not override this method. Override
         `update_plugin_data` instead.
+
+        :param fobi.models.BaseAbstractPluginEntry entry:
+        :return str: JSON dumped updated plugin data or None if there's
+            nothing to update. The entry is not saved.
         """
         try:
             updated_plugin_data = self.update_plugin_data(entry)
-            plugin_data = self.get_updated_plugin_data(
+            if not updated_plugin_data:
+                return None
+            return self.get_updated_plugin_data(
                 update=updated_plugin_data
             )
-            return self.save_plugin_data(entry, plugin_data=plugin_data)
         except Exception as err:
             logging.debug(str(err))
 
@@ -1571,6 +1597,35 @@ class FormElementPlugin(BasePlugin):
         """
         return []
 
+    @classmethod
+    def get_submission_check(cls, plugin_data):
+        """Get the data of the early check of the submissions.
+
+        Override in the security plugins (honeypot, captcha, etc.) able to
+        reject the (bot) submissions from the raw submitted data, before the
+        form is assembled. The data is precomputed (stored in the compiled
+        definition of the form).
+
+        :param dict plugin_data: Plugin data of the form element entry.
+        :return dict: Data passed to the ``check_submission``. None if the
+            submissions are not checked early.
+        """
+        return None
+
+    @classmethod
+    def check_submission(cls, check_data, data):
+        """Check the raw submitted data early (before the form is assembled).
+
+        Shall be cheap (no database queries, no plugin or form construction)
+        and reject obvious bot submissions only. The form field validation
+        is done anyway.
+
+        :param dict check_data: As returned by ``get_submission_check``.
+        :param django.http.QueryDict data: Raw submitted (POST) data.
+        :return bool: False if the submission shall be rejected.
+        """
+        return True
+
     def get_custom_field_instances(self,
                                    integrate_with,
                                    request=None,
@@ -1789,10 +1844,16 @@ class FormHandlerPlugin(BasePlugin):
     :property fobi.base.FormHandlerPluginDataStorage storage:
     :property bool allow_multiple: If set to True, plugin can be used multiple
         times within (per form). Otherwise - just once.
+    :property bool io_bound: If set to True, the handlers of the plugin may
+        be run concurrently with other I/O bound handlers of the form.
+    :property tuple run_after: Uids of the form handler plugins to be run
+        (completed) before the handlers of this plugin.
     """
 
     storage = FormHandlerPluginDataStorage
     allow_multiple = True
+    io_bound = False
+    run_after = ()
 
     def _run(self, form_entry, request, form, form_element_entries=None):
         """Run (internal method).
@@ -1942,12 +2003,18 @@ class FormWizardHandlerPlugin(BasePlugin):
     :property fobi.base.FormWizardHandlerPluginDataStorage storage:
     :property bool allow_multiple: If set to True, plugin can be used multiple
         times within (per form). Otherwise - just once.
+    :property bool io_bound: If set to True, the handlers of the plugin may
+        be run concurrently with other I/O bound handlers of the form wizard.
+    :property tuple run_after: Uids of the form wizard handler plugins to be
+        run (completed) before the handlers of this plugin.
 
     DONE
     """
 
     storage = FormWizardHandlerPluginDataStorage
     allow_multiple = True
+    io_bound = False
+    run_after = ()
 
     def _run(self, form_wizard_entry, request, form_list, form_wizard,
              form_element_entries=None):
@@ -2301,6 +2368,8 @@ class BaseRegistry(object):
         assert self.type
         self._registry = {}
         self._forced = []
+        # Incremented on each change of the registry.
+        self.version = 0
 
     @property
     def registry(self):
@@ -2330,6 +2399,7 @@ class BaseRegistry(object):
             if cls.uid not in self._forced:
                 self._registry[cls.uid] = cls
                 self._forced.append(cls.uid)
+                self.version += 1
                 return True
             else:
                 return False
@@ -2340,6 +2410,7 @@ class BaseRegistry(object):
                 return False
             else:
                 self._registry[cls.uid] = cls
+                self.version += 1
                 return True
 
     def unregister(self, cls):
@@ -2353,6 +2424,7 @@ class BaseRegistry(object):
         # Only non-forced items are allowed to be unregistered.
         if cls.uid in self._registry and cls.uid not in self._forced:
             self._registry.pop(cls.uid)
+            self.version += 1
             return True
         else:
             return False
@@ -2405,6 +2477,8 @@ class BaseIntegrationPluginRegistry(object):
         super(BaseIntegrationPluginRegistry, self).__init__()
         self._registry = defaultdict(dict)
         self._forced = defaultdict(dict)
+        # Incremented on each change of the registry.
+        self.version = 0
 
     @property
     def registry(self):
@@ -2434,6 +2508,7 @@ class BaseIntegrationPluginRegistry(object):
             if cls.uid not in self._forced:
                 self._registry[cls.integrate_with][cls.uid] = cls
                 self._forced[cls.integrate_with].append(cls.uid)
+                self.version += 1
                 return True
             else:
                 return False
@@ -2444,6 +2519,7 @@ class BaseIntegrationPluginRegistry(object):
                 return False
             else:
                 self._registry[cls.integrate_with][cls.uid] = cls
+                self.version += 1
                 return True
 
     def unregister(self, cls):
@@ -2458,6 +2534,7 @@ class BaseIntegrationPluginRegistry(object):
         if cls.uid in self._registry[cls.integrate_with] \
                 and cls.uid not in self._forced[cls.integrate_with]:
             self._registry[cls.integrate_with].pop(cls.uid)
+            self.version += 1
             return True
         else:
             return False
@@ -2988,13 +3065,15 @@ def submit_plugin_form_data(form_entry, request, form,
     for form_element_entry in form_element_entries:
         # Get the plugin.
         form_element_plugin = form_element_entry.get_plugin(request=request)
-        updated_form = form_element_plugin._submit_plugin_form_data(
-            form_entry=form_entry,
-            request=request,
-            form=form,
-            form_element_entries=form_element_entries,
-            **kwargs
-        )
+        with span('form_element.submit_plugin_form_data',
+                  uid=form_element_entry.plugin_uid):
+            updated_form = form_element_plugin._submit_plugin_form_data(
+                form_entry=form_entry,
+                request=request,
+                form=form,
+                form_element_entries=form_element_entries,
+                **kwargs
+            )
         if updated_form:
             form = updated_form
 
@@ -3069,6 +3148,100 @@ def get_ignorable_form_fields(form_element_entries):
 
     return ignorable_form_fields
 
+
+def get_form_element_submission_checks(form_element_entries):
+    """Get the early checks of the submissions of the form.
+
+    :param iterable form_element_entries: Iterable of
+        :class:`fobi.models.FormElementEntry` instances.
+    :return list: List of dicts (``plugin_uid`` and ``data`` of the check).
+    """
+    ensure_autodiscover()
+
+    submission_checks = []
+    for form_element_entry in form_element_entries:
+        plugin_cls = form_element_plugin_registry._registry.get(
+            form_element_entry.plugin_uid
+        )
+        if plugin_cls is None:
+            continue
+
+        plugin_data = getattr(form_element_entry, 'compiled_plugin_data', None)
+        if plugin_data is None:
+            try:
+                plugin_data = json.loads(form_element_entry.plugin_data or '{}')
+            except ValueError:
+                continue
+        if not isinstance(plugin_data, dict):
+            continue
+
+        check_data = plugin_cls.get_submission_check(plugin_data)
+        if check_data is not None:
+            submission_checks.append({
+                'plugin_uid': form_element_entry.plugin_uid,
+                'data': check_data,
+            })
+    return submission_checks
+
+
+_REJECTED_SUBMISSIONS_COUNTS = defaultdict(lambda: defaultdict(int))
+
+_REJECTED_SUBMISSIONS_COUNTS_LOCK = threading.Lock()
+
+
+def check_submission(form_entry, data, submission_checks):
+    """Check the raw submitted data early (before the form is assembled).
+
+    Rejected submissions are counted (see
+    ``get_rejected_submissions_counts``).
+
+    :param fobi.models.FormEntry form_entry:
+    :param django.http.QueryDict data: Raw submitted (POST) data.
+    :param list submission_checks: As returned by the
+        ``fobi.models.FormEntry.get_submission_checks``.
+    :return str: UID of the plugin rejecting the submission or None if not
+        rejected.
+    """
+    for submission_check in submission_checks:
+        plugin_cls = form_element_plugin_registry._registry.get(
+            submission_check['plugin_uid']
+        )
+        if plugin_cls is None \
+                or plugin_cls.check_submission(submission_check['data'],
+                                               data):
+            continue
+
+        with _REJECTED_SUBMISSIONS_COUNTS_LOCK:
+            _REJECTED_SUBMISSIONS_COUNTS[form_entry.slug][
+                submission_check['plugin_uid']
+            ] += 1
+        incr('submission.rejected', uid=submission_check['plugin_uid'])
+        logger.debug("Submission of the form %s rejected by %s.",
+                     form_entry.slug,
+                     submission_check['plugin_uid'])
+        return submission_check['plugin_uid']
+
+    return None
+
+
+def get_rejected_submissions_counts():
+    """Get the counts of the submissions rejected early (in this process).
+
+    :return dict: Counts per plugin UID per form slug.
+    """
+    with _REJECTED_SUBMISSIONS_COUNTS_LOCK:
+        return {
+            form_entry_slug: dict(counts)
+            for form_entry_slug, counts
+            in _REJECTED_SUBMISSIONS_COUNTS.items()
+        }
+
+
+def reset_rejected_submissions_counts():
+    """Reset the counts of the submissions rejected early."""
+    with _REJECTED_SUBMISSIONS_COUNTS_LOCK:
+        _REJECTED_SUBMISSIONS_COUNTS.clear()
+
 # *****************************************************************************
 # **************************** Form handler specific **************************
 # *****************************************************************************
@@ -3204,6 +3377,231 @@ def validate_form_handler_plugin_uid(plugin_uid):
     return validate_plugin_uid(form_handler_plugin_registry, plugin_uid)
 
 
+_FORM_HANDLER_EXECUTOR = None
+_FORM_HANDLER_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_form_handler_executor():
+    """Get the (shared) executor of the concurrently run form handlers.
+
+    :return concurrent.futures.ThreadPoolExecutor: Or None if concurrent
+        execution is disabled (``FORM_HANDLER_PLUGINS_MAX_WORKERS`` < 2,
+        default).
+    """
+    global _FORM_HANDLER_EXECUTOR
+    if not FORM_HANDLER_PLUGINS_MAX_WORKERS \
+            or FORM_HANDLER_PLUGINS_MAX_WORKERS < 2:
+        return None
+
+    if _FORM_HANDLER_EXECUTOR is None:
+        with _FORM_HANDLER_EXECUTOR_LOCK:
+            if _FORM_HANDLER_EXECUTOR is None:
+                _FORM_HANDLER_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=FORM_HANDLER_PLUGINS_MAX_WORKERS
+                )
+    return _FORM_HANDLER_EXECUTOR
+
+
+def _get_thread_context():
+    """Get the state of the current thread the form handlers depend on.
+
+    :return dict: Active language and the read database (see
+        ``fobi.routers.read_database``).
+    """
+    return {
+        'language': translation.get_language(),
+        'read_database': get_current_read_database(),
+    }
+
+
+def _run_in_thread(thread_context, func, *args):
+    """Run the function in a worker thread.
+
+    Run with the state of the submitting thread (see
+    ``_get_thread_context``). Unusable or expired database connections of
+    the worker thread are closed before and after (as around requests).
+    """
+    close_old_connections()
+    try:
+        with translation.override(thread_context['language']), \
+                read_database(thread_context['read_database']):
+            return func(*args)
+    finally:
+        close_old_connections()
+
+
+def get_handler_plugin_stages(handler_plugins):
+    """Split the handler plugins into the stages of execution.
+
+    The plugins are (stable) sorted so that each plugin comes after the
+    plugins listed in its ``run_after``. Consecutive ``io_bound`` plugins
+    (not depending on each other) make a single stage and are run
+    concurrently. Any other plugin makes a stage of its own (it's run
+    after all the preceding plugins and before all the following ones).
+
+    :param list handler_plugins: List of form handler plugins or form wizard
+        handler plugins, in the execution order.
+    :return list: List of stages (lists of plugins).
+    """
+    uids = []
+    for plugin in handler_plugins:
+        if plugin.uid not in uids:
+            uids.append(plugin.uid)
+
+    dependencies = dict((uid, set()) for uid in uids)
+    for plugin in handler_plugins:
+        dependencies[plugin.uid].update(
+            uid for uid in plugin.run_after
+            if uid in dependencies and uid != plugin.uid
+        )
+
+    ordered_uids = []
+    remaining_uids = list(uids)
+    while remaining_uids:
+        for uid in remaining_uids:
+            if dependencies[uid].issubset(ordered_uids):
+                break
+        else:
+            # Circular dependencies. Falling back to the execution order.
+            uid = remaining_uids[0]
+            logger.warning(
+                "Circular dependencies of the handler plugin %s.", uid
+            )
+        remaining_uids.remove(uid)
+        ordered_uids.append(uid)
+
+    stages = []
+    stage, stage_uids = [], set()
+    for uid in ordered_uids:
+        for plugin in handler_plugins:
+            if plugin.uid != uid:
+                continue
+
+            if not plugin.io_bound or dependencies[uid] & stage_uids:
+                if stage:
+                    stages.append(stage)
+                stage, stage_uids = [], set()
+
+            stage.append(plugin)
+            stage_uids.add(uid)
+
+            if not plugin.io_bound:
+                stages.append(stage)
+                stage, stage_uids = [], set()
+
+    if stage:
+        stages.append(stage)
+
+    return stages
+
+
+def run_handler_plugins(handler_plugins, run_handler_plugin):
+    """Run the handler plugins.
+
+    Plugins of the same stage (see ``get_handler_plugin_stages``) are run
+    concurrently (if enabled with ``FORM_HANDLER_PLUGINS_MAX_WORKERS``),
+    stages - one after another.
+
+    :param list handler_plugins: List of form handler plugins or form wizard
+        handler plugins, in the execution order.
+    :param callable run_handler_plugin: Runs the plugin given, returning a
+        (success, response) tuple.
+    :return list: List of (plugin, success, response) tuples, in the order
+        of execution (regardless of the order of completion).
+    """
+    executor = get_form_handler_executor()
+
+    results = []
+    for stage in get_handler_plugin_stages(handler_plugins):
+        if executor is None or len(stage) < 2:
+            stage_results = [run_handler_plugin(plugin) for plugin in stage]
+        else:
+            thread_context = _get_thread_context()
+            futures = [
+                executor.submit(_run_in_thread,
+                                thread_context,
+                                run_handler_plugin,
+                                plugin)
+                for plugin in stage
+            ]
+            stage_results = [future.result() for future in futures]
+
+        for plugin, (success, response) in zip(stage, stage_results):
+            results.append((plugin, success, response))
+
+    return results
+
+
+# Handler plugins execution orders (and the versions of the registries they
+# were computed for), registry as key.
+_HANDLER_PLUGINS_EXECUTION_ORDERS = {}
+
+
+def get_handler_plugins_execution_order(registry, execution_order):
+    """Get the execution order of the handler plugins of the registry.
+
+    Plugins specified in the ``execution_order`` go first, followed by the
+    rest of the registered plugins. The order is computed once per version
+    of the registry (and not on each form submission).
+
+    :param fobi.base.BaseRegistry registry:
+    :param iterable execution_order: Plugin UIDs (as in settings).
+    :return tuple: Plugin UIDs in the execution order.
+    """
+    cached = _HANDLER_PLUGINS_EXECUTION_ORDERS.get(registry)
+    if cached is not None and cached[0] == registry.version:
+        return cached[1]
+
+    ordered_plugin_uids = []
+    seen = set()
+    # Priority goes to the ones specified as first in the settings
+    for uid in list(execution_order) + list(registry._registry.keys()):
+        if uid not in seen:
+            seen.add(uid)
+            ordered_plugin_uids.append(uid)
+
+    ordered_plugin_uids = tuple(ordered_plugin_uids)
+    _HANDLER_PLUGINS_EXECUTION_ORDERS[registry] = (registry.version,
+                                                   ordered_plugin_uids)
+    return ordered_plugin_uids
+
+
+def sort_handler_entries(handler_entries, ordered_plugin_uids):
+    """Sort the handler entries in the execution order.
+
+    Entries of the plugins missing in the execution order (no longer
+    registered) are left out.
+
+    :param iterable handler_entries: Iterable of
+        ``fobi.models.FormHandlerEntry`` or
+        ``fobi.models.FormWizardHandlerEntry`` instances.
+    :param iterable ordered_plugin_uids: Plugin UIDs in the execution order.
+    :return list:
+    """
+    grouped_handler_entries = defaultdict(list)
+    for handler_entry in handler_entries:
+        grouped_handler_entries[handler_entry.plugin_uid].append(
+            handler_entry
+        )
+
+    return [
+        handler_entry
+        for uid in ordered_plugin_uids
+        for handler_entry in grouped_handler_entries.get(uid, [])
+    ]
+
+
+def get_ordered_form_handler_plugin_uids():
+    """Get the form handler plugin UIDs in the execution order.
+
+    :return tuple:
+    """
+    return get_handler_plugins_execution_order(
+        form_handler_plugin_registry,
+        FORM_HANDLER_PLUGINS_EXECUTION_ORDER
+    )
+
+
 def get_ordered_form_handler_plugins():
     """Get ordered form handler plugins.
 
@@ -3213,18 +3611,9 @@ def get_ordered_form_handler_plugins():
 
     :return fobi.data_structures.SortableDict:
     """
-    form_handler_plugins = SortableDict()
-
-    # Priority goes to the ones specified as first in the settings
-    for uid in FORM_HANDLER_PLUGINS_EXECUTION_ORDER:
-        form_handler_plugins[uid] = []
-
-    # Adding all the rest
-    for uid in form_handler_plugin_registry._registry.keys():
-        if uid not in form_handler_plugins:
-            form_handler_plugins[uid] = []
-
-    return form_handler_plugins
+    return SortableDict(
+        (uid, []) for uid in get_ordered_form_handler_plugin_uids()
+    )
 
 
 # For backwards compatibility, if someone had ever used this.
@@ -3246,36 +3635,34 @@ def run_form_handlers(form_entry, request, form, form_element_entries=None):
     # Responses of successfully processed handlers
     responses = []
 
-    # Getting form handler plugins in their execution order.
-    ordered_form_handlers = get_ordered_form_handler_plugins()
-
-    # Getting the form handlers to be executed.
-    form_handlers = form_entry.formhandlerentry_set.order_by('plugin_uid')[:]
-
-    # Assembling a new dictionary of the form handlers to iterate later.
-    for form_handler in form_handlers:
-        ordered_form_handlers[form_handler.plugin_uid].append(form_handler)
-
-    # Iterating through the form handlers in the order
-    # specified in the settings.
-    for uid, form_handlers in ordered_form_handlers.items():
-        # logger.debug("UID: {0}".format(uid))
-        for form_handler in form_handlers:
-            # Get the form handler plugin
-            form_handler_plugin = form_handler.get_plugin(request=request)
-
-            # Run the form handler
-            success, response = form_handler_plugin._run(
-                form_entry,
-                request,
-                form,
-                form_element_entries
-            )
+    # Getting the form handlers to be executed (of the published version).
+    form_handlers = form_entry.get_form_handler_entries(
+        version_id=form_entry.published_version_id
+    )
 
-            if success:
-                responses.append((form_handler_plugin, response))
-            else:
-                errors.append((form_handler_plugin, response))
+    # Get the form handler plugins in the order specified in the settings.
+    form_handler_plugins = [
+        form_handler.get_plugin(request=request)
+        for form_handler in sort_handler_entries(
+            form_handlers,
+            get_ordered_form_handler_plugin_uids()
+        )
+    ]
+
+    def run(plugin):
+        with span('form_handler.run', uid=plugin.uid):
+            return plugin._run(form_entry, request, form, form_element_entries)
+
+    # Run the form handlers
+    with span('form_handlers.run'):
+        results = run_handler_plugins(form_handler_plugins, run)
+
+    for form_handler_plugin, success, response in results:
+        if success:
+            responses.append((form_handler_plugin, response))
+        else:
+            incr('form_handler.errors', uid=form_handler_plugin.uid)
+            errors.append((form_handler_plugin, response))
 
     return (responses, errors)
 
@@ -3318,6 +3705,17 @@ def validate_form_wizard_handler_plugin_uid(plugin_uid):
     return validate_plugin_uid(form_wizard_handler_plugin_registry, plugin_uid)
 
 
+def get_ordered_form_wizard_handler_plugin_uids():
+    """Get the form wizard handler plugin UIDs in the execution order.
+
+    :return tuple:
+    """
+    return get_handler_plugins_execution_order(
+        form_wizard_handler_plugin_registry,
+        FORM_WIZARD_HANDLER_PLUGINS_EXECUTION_ORDER
+    )
+
+
 def get_ordered_form_wizard_handler_plugins():
     """Get ordered form wizard_handler plugins.
 
@@ -3327,18 +3725,9 @@ def get_ordered_form_wizard_handler_plugins():
 
     :return fobi.data_structures.SortableDict:
     """
-    form_wizard_handler_plugins = SortableDict()
-
-    # Priority goes to the ones specified as first in the settings
-    for uid in FORM_WIZARD_HANDLER_PLUGINS_EXECUTION_ORDER:
-        form_wizard_handler_plugins[uid] = []
-
-    # Adding all the rest
-    for uid in form_wizard_handler_plugin_registry._registry.keys():
-        if uid not in form_wizard_handler_plugins:
-            form_wizard_handler_plugins[uid] = []
-
-    return form_wizard_handler_plugins
+    return SortableDict(
+        (uid, []) for uid in get_ordered_form_wizard_handler_plugin_uids()
+    )
 
 
 # For backwards compatibility, if someone had ever used this.
@@ -3364,42 +3753,41 @@ def run_form_wizard_handlers(form_wizard_entry, request, form_list,
     # Responses of successfully processed handlers
     responses = []
 
-    # Getting form handler plugins in their execution order.
-    ordered_form_wizard_handlers = get_ordered_form_wizard_handler_plugins()
-
-    # Getting the form handlers to be executed.
-    form_wizard_handlers = form_wizard_entry.formwizardhandlerentry_set \
-                                            .order_by('plugin_uid')[:]
+    # Getting the form handlers to be executed (of the version the form
+    # wizard was started with).
+    form_wizard_handlers = form_wizard_entry.get_form_wizard_handler_entries(
+        version_id=getattr(form_wizard, 'form_wizard_entry_version_id', None)
+    )
 
-    # Assembling a new dictionary of the form handlers to iterate later.
-    for form_wizard_handler in form_wizard_handlers:
-        ordered_form_wizard_handlers[form_wizard_handler.plugin_uid].append(
-            form_wizard_handler
+    # Get the form wizard handler plugins in the order specified in the
+    # settings.
+    form_wizard_handler_plugins = [
+        form_wizard_handler.get_plugin(request=request)
+        for form_wizard_handler in sort_handler_entries(
+            form_wizard_handlers,
+            get_ordered_form_wizard_handler_plugin_uids()
         )
+    ]
 
-    # Iterating through the form handlers in the order
-    # specified in the settings.
-    for uid, form_wizard_handlers in ordered_form_wizard_handlers.items():
-        # logger.debug("UID: {0}".format(uid))
-        for form_wizard_handler in form_wizard_handlers:
-            # Get the form handler plugin
-            form_wizard_handler_plugin = form_wizard_handler.get_plugin(
-                request=request
-            )
-
-            # Run the form handler
-            success, response = form_wizard_handler_plugin._run(
-                form_wizard_entry,
-                request,
-                form_list,
-                form_wizard,
-                form_element_entries
-            )
-
-            if success:
-                responses.append((form_wizard_handler_plugin, response))
-            else:
-                errors.append((form_wizard_handler_plugin, response))
+    def run(plugin):
+        with span('form_wizard_handler.run', uid=plugin.uid):
+            return plugin._run(form_wizard_entry,
+                               request,
+                               form_list,
+                               form_wizard,
+                               form_element_entries)
+
+    # Run the form wizard handlers
+    with span('form_wizard_handlers.run'):
+        results = run_handler_plugins(form_wizard_handler_plugins, run)
+
+    for form_wizard_handler_plugin, success, response in results:
+        if success:
+            responses.append((form_wizard_handler_plugin, response))
+        else:
+            incr('form_wizard_handler.errors',
+                 uid=form_wizard_handler_plugin.uid)
+            errors.append((form_wizard_handler_plugin, response))
 
     return (responses, errors)
 
@@ -3500,11 +3888,12 @@ def fire_form_callbacks(form_entry, request, form, stage=None):
     :return django.forms.Form form:
     """
     callbacks = form_callback_registry.get_callbacks(stage=stage)
-    for CallbackClass in callbacks:
-        callback = CallbackClass()
-        updated_form = callback.callback(form_entry, request, form)
-        if updated_form:
-            form = updated_form
+    with span('form_callbacks.fire', stage=stage):
+        for CallbackClass in callbacks:
+            callback = CallbackClass()
+            updated_form = callback.callback(form_entry, request, form)
+            if updated_form:
+                form = updated_form
     return form
 
 # *****************************************************************************
@@ -21,6 +21,9 @@ __all__ = (
     'WIZARD_TYPE_COOKIE',
     'WIZARD_TYPES',
     'DEFAULT_WIZARD_TYPE',
+    'FORM_ELEMENT_ENTRY_POSITION_STEP',
+    'COMPILED_FORM_DEFINITION_VERSION',
+    'MODEL_OBJECT_CHOICES_IGNORED_APPS',
 )
 
 ACTION_CHOICE_REPLACE = '1'
@@ -55,3 +58,15 @@ WIZARD_TYPES = (
     (WIZARD_TYPE_SESSION, "Session wizard"),
     (WIZARD_TYPE_COOKIE, "Cookie wizard"),
 )
+
+# Gap between the positions of the form element entries (the entries can be
+# moved in between without shifting the others).
+FORM_ELEMENT_ENTRY_POSITION_STEP = 1024
+
+# Version of the compiled form definition format (compiled definitions of
+# other versions are compiled again).
+COMPILED_FORM_DEFINITION_VERSION = 3
+
+# Apps, changes of which models do not invalidate the cached model object
+# choices (their models are not meant to be offered as choices).
+MODEL_OBJECT_CHOICES_IGNORED_APPS = ('admin', 'contenttypes', 'sessions')
@@ -4,12 +4,15 @@ import logging
 from ....base import (
     clean_dict,
     get_ignorable_form_fields,
-    get_ordered_form_handler_plugins,
+    get_ordered_form_handler_plugin_uids,
     integration_form_callback_registry,
     integration_form_element_plugin_registry,
     IntegrationFormElementPluginProcessor,
+    run_handler_plugins,
+    sort_handler_entries,
 )
 from ....helpers import get_ignorable_form_values
+from ....instrumentation import incr, span
 
 from . import UID
 from .helpers import map_field_name_to_label
@@ -145,15 +148,16 @@ def fire_form_callbacks(form_entry, request, serializer, stage=None):
         integrate_with=UID,
         stage=stage
     )
-    for callback_cls in callbacks:
-        callback = callback_cls()
-        updated_serializer = callback.callback(
-            form_entry=form_entry,
-            request=request,
-            serializer=serializer
-        )
-        if updated_serializer:
-            serializer = updated_serializer
+    with span('form_callbacks.fire', stage=stage):
+        for callback_cls in callbacks:
+            callback = callback_cls()
+            updated_serializer = callback.callback(
+                form_entry=form_entry,
+                request=request,
+                serializer=serializer
+            )
+            if updated_serializer:
+                serializer = updated_serializer
     return serializer
 
 
@@ -175,38 +179,41 @@ def run_form_handlers(form_entry,
     # Responses of successfully processed handlers
     responses = []
 
-    # Getting form handler plugins in their execution order.
-    ordered_form_handlers = get_ordered_form_handler_plugins()
-
-    # Getting the form handlers to be executed.
-    form_handlers = form_entry.formhandlerentry_set.order_by('plugin_uid')[:]
+    # Getting the form handlers to be executed (published version of the
+    # form).
+    form_handlers = form_entry.get_form_handler_entries(
+        version_id=form_entry.published_version_id
+    )
 
-    # Assembling a new dictionary of the form handlers to iterate later.
-    for form_handler in form_handlers:
-        ordered_form_handlers[form_handler.plugin_uid].append(form_handler)
+    # Get the form handler plugins in the order specified in the settings.
+    form_handler_plugins = [
+        form_handler.get_plugin(request=request)
+        for form_handler in sort_handler_entries(
+            form_handlers,
+            get_ordered_form_handler_plugin_uids()
+        )
+    ]
 
-    # Iterating through the form handlers in the order
-    # specified in the settings.
-    for uid, form_handlers in ordered_form_handlers.items():
-        # logger.debug("UID: {0}".format(uid))
-        for form_handler in form_handlers:
-            # Get the form handler plugin
-            form_handler_plugin = form_handler.get_plugin(request=request)
+    def run(plugin):
+        with span('form_handler.run', uid=plugin.uid):
+            return plugin._run_integration_handler(
+                integrate_with=UID,
+                form_entry=form_entry,
+                request=request,
+                serializer=serializer,
+                form_element_entries=form_element_entries,
+            )
 
-            # Run the form handler
-            success, response = \
-                form_handler_plugin._run_integration_handler(
-                    integrate_with=UID,
-                    form_entry=form_entry,
-                    request=request,
-                    serializer=serializer,
-                    form_element_entries=form_element_entries,
-                )
+    # Run the form handlers
+    with span('form_handlers.run'):
+        results = run_handler_plugins(form_handler_plugins, run)
 
-            if success:
-                responses.append((form_handler_plugin, response))
-            else:
-                errors.append((form_handler_plugin, response))
+    for form_handler_plugin, success, response in results:
+        if success:
+            responses.append((form_handler_plugin, response))
+        else:
+            incr('form_handler.errors', uid=form_handler_plugin.uid)
+            errors.append((form_handler_plugin, response))
 
     return responses, errors
 
@@ -225,7 +232,9 @@ def submit_plugin_form_data(form_entry,
     :param iterable form_element_entries:
     """
     if not form_element_entries:
-        form_element_entries = form_entry.formelemententry_set.all()
+        form_element_entries = form_entry.get_form_element_entries(
+            version_id=form_entry.published_version_id
+        )
     for form_element_entry in form_element_entries:
         # Get the plugin.
         form_element_plugin = form_element_entry.get_plugin(request=request)
@@ -235,15 +244,17 @@ def submit_plugin_form_data(form_entry,
         )
         if custom_plugin_cls:
             custom_plugin = custom_plugin_cls()
-            updated_serializer = \
-                custom_plugin._submit_plugin_form_data(
-                    form_element_plugin=form_element_plugin,
-                    form_entry=form_entry,
-                    request=request,
-                    serializer=serializer,
-                    form_element_entries=form_element_entries,
-                    **kwargs
-                )
+            with span('form_element.submit_plugin_form_data',
+                      uid=form_element_plugin.uid):
+                updated_serializer = \
+                    custom_plugin._submit_plugin_form_data(
+                        form_element_plugin=form_element_plugin,
+                        form_entry=form_entry,
+                        request=request,
+                        serializer=serializer,
+                        form_element_entries=form_element_entries,
+                        **kwargs
+                    )
             if updated_serializer:
                 serializer = updated_serializer
 
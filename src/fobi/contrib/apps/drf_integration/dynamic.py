@@ -58,7 +58,9 @@ def get_declared_fields(form_entry,
     declared_fields = []
     declared_fields_metadata = []
     if form_element_entries is None:
-        form_element_entries = form_entry.formelemententry_set.all()
+        form_element_entries = form_entry.get_form_element_entries(
+            version_id=form_entry.published_version_id
+        )
 
     for creation_counter, form_element_entry \
             in enumerate(form_element_entries):
@@ -53,7 +53,8 @@ class DBStoreHandlerPlugin(IntegrationFormHandlerPlugin):
             form_entry,
             request,
             field_name_to_label_map,
-            cleaned_data
+            cleaned_data,
+            form_element_entries=form_element_entries
         )
 
     def _prepare_files(self, request, serializer):
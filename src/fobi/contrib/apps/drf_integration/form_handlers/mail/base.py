@@ -1,14 +1,11 @@
 import logging
-from mimetypes import guess_type
-import os
 
-from django.conf import settings
 from django.utils.translation import ugettext_lazy as _
 
-from six import PY3
-
 from ......base import IntegrationFormHandlerPlugin
-from ......helpers import extract_file_path
+from ......contrib.plugins.form_handlers.mail.helpers import (
+    prepare_attachments,
+)
 
 from ... import UID as INTEGRATE_WITH_UID
 from ...base import get_processed_serializer_data
@@ -66,34 +63,12 @@ class MailHandlerPlugin(IntegrationFormHandlerPlugin):
 
     def _prepare_files(self, request, serializer):
         """Prepares the files for being attached to the mail message."""
-        files = {}
-
-        def process_path(file_path, imf):
-            """Processes the file path and the file."""
-            if file_path:
-                file_path = file_path.replace(
-                    settings.MEDIA_URL,
-                    os.path.join(settings.MEDIA_ROOT, '')
-                )
-                mime_type = guess_type(imf.name)
-
-                if PY3:
-                    imf_chunks = b''.join([c for c in imf.chunks()])
-                else:
-                    imf_chunks = ''.join([c for c in imf.chunks()])
-
-                files[field_name] = (
-                    imf.name,
-                    imf_chunks,
-                    mime_type[0] if mime_type else ''
-                )
-
+        file_field_values = []
+        filenames = {}
         for field_name, imf in request.FILES.items():
-            try:
-                file_path = serializer.validated_data.get(field_name, '')
-                process_path(file_path, imf)
-            except Exception as err:
-                file_path = extract_file_path(imf.name)
-                process_path(file_path, imf)
-
-        return files
+            file_field_values.append(
+                (field_name, serializer.validated_data.get(field_name, imf))
+            )
+            filenames[field_name] = imf.name
+
+        return prepare_attachments(file_field_values, filenames=filenames)
@@ -1,11 +1,19 @@
 # from __future__ import unicode_literals
+import hashlib
+
+import simplejson as json
+
 from django.contrib import messages
 from django.http import HttpRequest
-from django.utils.translation import ugettext
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
+from django.utils.http import parse_etags, quote_etag
+from django.utils.translation import get_language, ugettext
 
 from nine import versions
 
-from rest_framework import mixins, permissions
+from rest_framework import mixins, permissions, status
+from rest_framework.exceptions import Throttled
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
@@ -16,7 +24,17 @@ from ....constants import (
     CALLBACK_FORM_VALID_AFTER_FORM_HANDLERS,
     CALLBACK_FORM_INVALID
 )
+from ....decorators import use_read_database
+from ....idempotency import (
+    claim_submission,
+    complete_submission,
+    get_submission_key,
+    get_submission_outcome,
+    release_submission,
+)
 from ....models import FormEntry
+from ....ratelimit import check_submission_rate_limits
+from ....settings import CACHE_CONTROL, CACHE_CONTROL_PER_FORM
 
 from .base import (
     fire_form_callbacks,
@@ -57,6 +75,45 @@ class FobiFormEntryViewSet(
     lookup_url_kwarg = 'slug'
     metadata_class = FobiMetaData
 
+    @method_decorator(use_read_database)
+    def dispatch(self, request, *args, **kwargs):
+        """Dispatch.
+
+        The list, retrieve and metadata actions read from the read database
+        (if configured).
+        """
+        return super(FobiFormEntryViewSet, self).dispatch(
+            request, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve (conditionally).
+
+        The ETag is derived of the data served (not of the form definition,
+        the retrieve action does not serve the form fields). The browsable
+        API is always served in full.
+        """
+        response = super(FobiFormEntryViewSet, self).retrieve(
+            request, *args, **kwargs
+        )
+        cache_control = CACHE_CONTROL_PER_FORM.get(kwargs.get('slug'),
+                                                   CACHE_CONTROL)
+        if cache_control is None \
+                or response.status_code != status.HTTP_200_OK \
+                or request.accepted_renderer.format == 'api':
+            return response
+
+        etag = quote_etag(hashlib.md5('|'.join([
+            json.dumps(response.data, sort_keys=True),
+            request.accepted_media_type or '',
+            get_language() or '',
+        ]).encode('utf-8')).hexdigest())
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        response['ETag'] = etag
+        patch_cache_control(response, **cache_control)
+        return response
+
     def has_value(self):
         return None if self.action == 'metadata' else True
 
@@ -79,6 +136,10 @@ class FobiFormEntryViewSet(
         """Override get_object to get things done."""
         obj = super(FobiFormEntryViewSet, self).get_object()
 
+        # Form fields are not served by the retrieve action.
+        if self.action == 'retrieve':
+            return obj
+
         # OK, calling this twice sucks, but fine for the time being.
         # In future we should try to get rid of additional queries
         # made double.
@@ -129,6 +190,21 @@ class FobiFormEntryViewSet(
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop('partial', False)
         instance = self.get_object()
+
+        # Rate limits are checked before the serializer is assembled.
+        retry_after = check_submission_rate_limits(request, instance)
+        if retry_after is not None:
+            raise Throttled(wait=retry_after)
+
+        # Duplicate submissions (client retries) are answered with the
+        # outcome of the original submission.
+        submission_key = get_submission_key(request,
+                                            instance,
+                                            data=request.data)
+        outcome = get_submission_outcome(submission_key)
+        if outcome is not None:
+            return self._get_duplicate_submission_response(outcome)
+
         serializer = self.get_serializer(instance,
                                          data=request.data,
                                          partial=partial)
@@ -136,12 +212,23 @@ class FobiFormEntryViewSet(
 
         self.perform_update(serializer)
 
-        # Handle submitted form data by firing form handler plugins.
-        self._handle_form_entry_data_submission(
-            form_entry=instance,
-            request=request,
-            serializer=serializer
-        )
+        # Handle submitted form data by firing form handler plugins (once
+        # per submission).
+        if not claim_submission(submission_key):
+            return self._get_duplicate_submission_response(
+                get_submission_outcome(submission_key)
+            )
+        try:
+            self._handle_form_entry_data_submission(
+                form_entry=instance,
+                request=request,
+                serializer=serializer
+            )
+        except Exception:
+            # Failed submissions can be retried
+            release_submission(submission_key)
+            raise
+        complete_submission(submission_key, data=dict(serializer.data))
 
         if getattr(instance, '_prefetched_objects_cache', None):
             # If 'prefetch_related' has been applied to a queryset, we need to
@@ -150,13 +237,31 @@ class FobiFormEntryViewSet(
 
         return Response(serializer.data)
 
+    def _get_duplicate_submission_response(self, outcome):
+        """Get the response to the duplicate submission.
+
+        Outcome (data) of the original submission, if completed already.
+        Otherwise, 409 Conflict.
+
+        :param dict outcome: See ``fobi.idempotency.get_submission_outcome``.
+        :return rest_framework.response.Response:
+        """
+        if outcome and outcome.get('completed'):
+            return Response(outcome.get('data'))
+        return Response(
+            {'detail': ugettext("Submission is being processed.")},
+            status=status.HTTP_409_CONFLICT
+        )
+
     def _handle_form_entry_data_submission(self,
                                            form_entry,
                                            request,
                                            serializer):
         """Handle form entry data submission."""
-        # Try to fetch only once.
-        form_element_entries = form_entry.formelemententry_set.all()
+        # Try to fetch only once (published version of the form).
+        form_element_entries = form_entry.get_form_element_entries(
+            version_id=form_entry.published_version_id
+        )
 
         # Fire form valid before submit plugin data
         serializer = fire_form_callbacks(
@@ -170,7 +275,8 @@ class FobiFormEntryViewSet(
         serializer = submit_plugin_form_data(
             form_entry=form_entry,
             request=request,
-            serializer=serializer
+            serializer=serializer,
+            form_element_entries=form_element_entries
         )
 
         # Fire form valid callbacks
@@ -10,14 +10,12 @@ from django.utils.translation import ugettext_lazy as _
 from nonefield.fields import NoneField
 
 from fobi.base import FormElementPlugin
-from fobi.helpers import delete_file, clone_file
+from fobi.helpers import delete_file
 
 from . import UID
 from .forms import ContentImageForm
 from .helpers import get_crop_filter
-from .settings import (
-    FIT_METHOD_FIT_WIDTH, FIT_METHOD_FIT_HEIGHT, IMAGES_UPLOAD_DIR
-)
+from .settings import FIT_METHOD_FIT_WIDTH, FIT_METHOD_FIT_HEIGHT
 
 __title__ = 'fobi.contrib.plugins.form_elements.content.content_image.base'
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
@@ -42,20 +40,29 @@ class ContentImagePlugin(FormElementPlugin):
         self.data.name = "{0}_{1}".format(self.uid, uuid4())
 
     def delete_plugin_data(self):
-        """Delete uploaded file."""
-        delete_file(self.data.file)
+        """Delete uploaded file.
+
+        Images are stored under content-addressed names, thus the same file
+        might be used by other elements (for instance, clones). The file is
+        deleted only if it's not used elsewhere.
+        """
+        from fobi.models import FormElementEntry
+
+        used_by = FormElementEntry._default_manager.filter(
+            plugin_uid=self.uid,
+            plugin_data__contains=self.data.file
+        ).count()
+
+        if used_by <= 1:
+            delete_file(self.data.file)
 
     def clone_plugin_data(self, entry):
         """Clone plugin data.
 
-        Clone plugin data, which means we make a copy of the original image.
-
-        TODO: Perhaps rely more on data of ``form_element_entry``?
+        The image file is shared between the original and the clone (see
+        ``delete_plugin_data``), thus there's no need to copy it.
         """
-        cloned_image = clone_file(
-            IMAGES_UPLOAD_DIR, self.data.file, relative_path=True
-        )
-        return self.get_cloned_plugin_data(update={'file': cloned_image})
+        return self.get_cloned_plugin_data()
 
     def get_raw_data(self):
         """Get raw data.
@@ -1,18 +1,22 @@
 from __future__ import absolute_import
 
-import os
-
-from django.conf import settings
+from django.core.files.storage import default_storage
 from django.forms.widgets import ClearableFileInput
 from django.utils.translation import ugettext_lazy as _
 
+from six import string_types
+
 from fobi.base import FormFieldPlugin
-from fobi.helpers import handle_uploaded_file
+from fobi.helpers import get_file_upload_url, handle_uploaded_file
+from fobi.widgets import DirectUploadFileInput
 
 from . import UID
-from .fields import AllowedExtensionsFileField as FileField
+from .fields import (
+    AllowedExtensionsFileField as FileField,
+    DirectUploadAllowedExtensionsFileField,
+)
 from .forms import FileInputForm
-from .settings import FILES_UPLOAD_DIR
+from .settings import DIRECT_UPLOAD_TOKEN_MAX_AGE, FILES_UPLOAD_DIR
 
 __title__ = 'fobi.contrib.plugins.form_elements.fields.file.base'
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
@@ -50,6 +54,24 @@ class FileInputPlugin(FormFieldPlugin):
         if self.data.allowed_extensions:
             field_kwargs['allowed_extensions'] = self.data.allowed_extensions
 
+        if getattr(self.data, 'direct_upload', False) \
+                and form_entry is not None:
+            field_kwargs.update({
+                'widget': DirectUploadFileInput(
+                    url=get_file_upload_url(form_entry, self.data.name),
+                    attrs=attrs
+                ),
+                'upload_dir': FILES_UPLOAD_DIR,
+                'token_salt': 'fobi.direct_upload.{0}.{1}'.format(
+                    form_entry.pk,
+                    self.data.name
+                ),
+                'token_max_age': DIRECT_UPLOAD_TOKEN_MAX_AGE,
+            })
+            return [(self.data.name,
+                     DirectUploadAllowedExtensionsFileField,
+                     field_kwargs)]
+
         return [(self.data.name, FileField, field_kwargs)]
 
     def prepare_plugin_form_data(self, cleaned_data):
@@ -61,15 +83,15 @@ class FileInputPlugin(FormFieldPlugin):
         # Get the file path
         file_path = cleaned_data.get(self.data.name, None)
         if file_path:
-            # Handle the upload
-            saved_file = handle_uploaded_file(FILES_UPLOAD_DIR, file_path)
-            # Overwrite ``cleaned_data`` of the ``form`` with path to moved
-            # file.
-            file_relative_url = saved_file.replace(os.path.sep, '/')
-            cleaned_data[self.data.name] = "{0}{1}".format(
-                settings.MEDIA_URL,
-                file_relative_url
-            )
+            # Handle the upload. In the direct upload mode, the file has
+            # already been stored.
+            if isinstance(file_path, string_types):
+                saved_file = file_path
+            else:
+                saved_file = handle_uploaded_file(FILES_UPLOAD_DIR, file_path)
+            # Overwrite ``cleaned_data`` of the ``form`` with URL of the
+            # stored file.
+            cleaned_data[self.data.name] = default_storage.url(saved_file)
             # It's critically important to return the ``form`` with updated
             # ``cleaned_data``
             return cleaned_data
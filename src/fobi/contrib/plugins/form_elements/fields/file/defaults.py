@@ -4,6 +4,9 @@ __title__ = 'fobi.contrib.plugins.form_elements.fields.file.defaults'
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
-__all__ = ('FILES_UPLOAD_DIR',)
+__all__ = ('DIRECT_UPLOAD_TOKEN_MAX_AGE', 'FILES_UPLOAD_DIR',)
 
 FILES_UPLOAD_DIR = os.path.join('fobi_plugins', 'file')
+
+# Max age (in seconds) of the upload tokens in the direct upload mode.
+DIRECT_UPLOAD_TOKEN_MAX_AGE = 60 * 60 * 24
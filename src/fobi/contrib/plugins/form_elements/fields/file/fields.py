@@ -4,11 +4,16 @@ from django.forms import forms
 from django.forms.fields import FileField
 from django.utils.translation import ugettext_lazy as _
 
+from fobi.fields import DirectUploadFileMixin
+
 __title__ = 'fobi.contrib.plugins.form_elements.fields.file.fields'
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
-__all__ = ('AllowedExtensionsFileField',)
+__all__ = (
+    'AllowedExtensionsFileField',
+    'DirectUploadAllowedExtensionsFileField',
+)
 
 
 class AllowedExtensionsFileField(FileField):
@@ -41,3 +46,8 @@ class AllowedExtensionsFileField(FileField):
                 raise forms.ValidationError(
                     _("File extension '{0}' is not allowed.".format(extension))
                 )
+
+
+class DirectUploadAllowedExtensionsFileField(DirectUploadFileMixin,
+                                             AllowedExtensionsFileField):
+    """Same as AllowedExtensionsFileField, but accepts upload tokens."""
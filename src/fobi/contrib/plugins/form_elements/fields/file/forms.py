@@ -25,7 +25,8 @@ class FileInputForm(forms.Form, BaseFormFieldPluginForm):
         ("initial", ""),
         ("max_length", str(DEFAULT_MAX_LENGTH)),
         ("required", False),
-        ("allowed_extensions", "")
+        ("allowed_extensions", ""),
+        ("direct_upload", False),
     ]
 
     label = forms.CharField(
@@ -81,6 +82,15 @@ class FileInputForm(forms.Form, BaseFormFieldPluginForm):
             attrs={'class': theme.form_element_html_class}
         )
     )
+    direct_upload = forms.BooleanField(
+        label=_("Direct upload"),
+        help_text=_("Upload the file as soon as it's chosen. The form is "
+                    "then submitted without the file."),
+        required=False,
+        widget=forms.widgets.CheckboxInput(
+            attrs={'class': theme.form_element_checkbox_html_class}
+        )
+    )
 
     def clean(self):
         super(FileInputForm, self).clean()
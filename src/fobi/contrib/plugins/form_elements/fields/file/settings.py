@@ -1,5 +1,6 @@
 """
 - ``FILES_UPLOAD_DIR`` (string)
+- ``DIRECT_UPLOAD_TOKEN_MAX_AGE`` (int)
 """
 from .conf import get_setting
 
@@ -7,6 +8,8 @@ __title__ = 'fobi.contrib.plugins.form_elements.fields.file.settings'
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
-__all__ = ('FILES_UPLOAD_DIR',)
+__all__ = ('DIRECT_UPLOAD_TOKEN_MAX_AGE', 'FILES_UPLOAD_DIR',)
 
 FILES_UPLOAD_DIR = get_setting('FILES_UPLOAD_DIR')
+
+DIRECT_UPLOAD_TOKEN_MAX_AGE = get_setting('DIRECT_UPLOAD_TOKEN_MAX_AGE')
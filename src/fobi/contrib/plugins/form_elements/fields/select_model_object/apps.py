@@ -13,3 +13,11 @@ class Config(AppConfig):
 
     name = 'fobi.contrib.plugins.form_elements.fields.select_model_object'
     label = 'fobi_contrib_plugins_form_elements_fields_select_model_object'
+
+    def ready(self):
+        """Invalidate the cached choices on changes of model objects."""
+        from fobi.helpers import connect_model_object_choices_signals
+
+        from .settings import IGNORED_MODELS
+
+        connect_model_object_choices_signals(ignore=IGNORED_MODELS)
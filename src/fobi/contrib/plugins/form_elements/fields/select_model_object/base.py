@@ -10,15 +10,23 @@ from fobi.constants import (
     SUBMIT_VALUE_AS_VAL,
     SUBMIT_VALUE_AS_REPR
 )
+from fobi.fields import CachedModelChoiceField
 from fobi.helpers import (
     safe_text,
     get_app_label_and_model_name,
-    get_model_name_for_object
+    get_cached_model_object_choices,
+    get_model_name_for_object,
+    get_model_object_choices_url,
 )
+from fobi.widgets import RemoteSelect
 
 from . import UID
 from .forms import SelectModelObjectInputForm
-from .settings import SUBMIT_VALUE_AS
+from .settings import (
+    CACHE_CHOICES_MAX_OBJECTS,
+    CACHE_CHOICES_TIMEOUT,
+    SUBMIT_VALUE_AS,
+)
 
 __title__ = 'fobi.contrib.plugins.form_elements.fields.' \
             'select_model_object.base'
@@ -56,16 +64,38 @@ class SelectModelObjectInputPlugin(FormFieldPlugin):
         """Get form field instances."""
         queryset = self.get_queryset()
 
+        widget_attrs = {'class': theme.form_element_html_class}
+        if getattr(self.data, 'remote', False) and form_entry is not None:
+            widget = RemoteSelect(
+                url=get_model_object_choices_url(form_entry, self.data.name),
+                attrs=widget_attrs
+            )
+        else:
+            widget = Select(attrs=widget_attrs)
+
         field_kwargs = {
             'label': self.data.label,
             'help_text': self.data.help_text,
             'initial': self.data.initial,
             'required': self.data.required,
             'queryset': queryset,
-            'widget': Select(attrs={'class': theme.form_element_html_class}),
+            'widget': widget,
         }
-
-        return [(self.data.name, ModelChoiceField, field_kwargs)]
+        field_cls = ModelChoiceField
+
+        if getattr(self.data, 'cache_choices', False) \
+                and not isinstance(widget, RemoteSelect):
+            cached_choices = get_cached_model_object_choices(
+                queryset,
+                element_data=self.plugin_data,
+                timeout=CACHE_CHOICES_TIMEOUT,
+                max_objects=CACHE_CHOICES_MAX_OBJECTS
+            )
+            if cached_choices is not None:
+                field_kwargs['cached_choices'] = cached_choices
+                field_cls = CachedModelChoiceField
+
+        return [(self.data.name, field_cls, field_kwargs)]
 
     def prepare_plugin_form_data(self, cleaned_data):
         """Prepare plugin form data.
@@ -2,7 +2,7 @@ from django import forms
 from django.utils.translation import ugettext_lazy as _
 
 from fobi.base import BaseFormFieldPluginForm, get_theme
-from fobi.helpers import get_registered_models
+from fobi.helpers import get_registered_models, validate_search_fields
 
 from .settings import IGNORED_MODELS
 
@@ -25,7 +25,10 @@ class SelectModelObjectInputForm(forms.Form, BaseFormFieldPluginForm):
         ("model", ""),
         ("help_text", ""),
         ("initial", ""),
-        ("required", False)
+        ("required", False),
+        ("remote", False),
+        ("search_fields", ""),
+        ("cache_choices", False),
     ]
 
     label = forms.CharField(
@@ -71,6 +74,35 @@ class SelectModelObjectInputForm(forms.Form, BaseFormFieldPluginForm):
             attrs={'class': theme.form_element_checkbox_html_class}
         )
     )
+    remote = forms.BooleanField(
+        label=_("Load options remotely"),
+        required=False,
+        help_text=_("Load the options incrementally (with search) instead "
+                    "of rendering all of them. Recommended for large "
+                    "tables."),
+        widget=forms.widgets.CheckboxInput(
+            attrs={'class': theme.form_element_checkbox_html_class}
+        )
+    )
+    search_fields = forms.CharField(
+        label=_("Search fields"),
+        required=False,
+        help_text=_("Comma separated list of text fields of the model to "
+                    "search the options in, when loaded remotely. "
+                    "Example: \"title,slug\"."),
+        widget=forms.widgets.TextInput(
+            attrs={'class': theme.form_element_html_class}
+        )
+    )
+    cache_choices = forms.BooleanField(
+        label=_("Cache choices"),
+        required=False,
+        help_text=_("Cache the choices (until the objects change). "
+                    "Recommended for small, rarely changing tables."),
+        widget=forms.widgets.CheckboxInput(
+            attrs={'class': theme.form_element_checkbox_html_class}
+        )
+    )
 
     def __init__(self, *args, **kwargs):
         """Constructor.
@@ -81,3 +113,7 @@ class SelectModelObjectInputForm(forms.Form, BaseFormFieldPluginForm):
         self.fields['model'].choices = get_registered_models(
             ignore=IGNORED_MODELS
         )
+
+    def clean_search_fields(self):
+        """Validating the search fields."""
+        return validate_search_fields(self, 'model', 'search_fields')
@@ -15,7 +15,9 @@ from fobi.helpers import (
     safe_text,
     get_app_label_and_model_name,
     get_model_name_for_object,
+    get_model_object_choices_url,
 )
+from fobi.widgets import RemoteSelect
 
 from . import UID
 from .forms import SelectMPTTModelObjectInputForm
@@ -39,15 +41,32 @@ class SelectMPTTModelObjectInputPlugin(FormFieldPlugin):
     group = _("Fields")
     form = SelectMPTTModelObjectInputForm
 
+    def get_queryset(self):
+        """Get queryset.
+
+        Might be used in integration packages.
+        """
+        app_label, model_name = get_app_label_and_model_name(self.data.model)
+        model = apps.get_model(app_label, model_name)
+        queryset = model._default_manager.all()
+        return queryset
+
     def get_form_field_instances(self,
                                  request=None,
                                  form_entry=None,
                                  form_element_entries=None,
                                  **kwargs):
         """Get form field instances."""
-        app_label, model_name = get_app_label_and_model_name(self.data.model)
-        model = apps.get_model(app_label, model_name)
-        queryset = model._default_manager.all()
+        queryset = self.get_queryset()
+
+        widget_attrs = {'class': theme.form_element_html_class}
+        if getattr(self.data, 'remote', False) and form_entry is not None:
+            widget = RemoteSelect(
+                url=get_model_object_choices_url(form_entry, self.data.name),
+                attrs=widget_attrs
+            )
+        else:
+            widget = Select(attrs=widget_attrs)
 
         field_kwargs = {
             'label': self.data.label,
@@ -55,7 +74,7 @@ class SelectMPTTModelObjectInputPlugin(FormFieldPlugin):
             'initial': self.data.initial,
             'required': self.data.required,
             'queryset': queryset,
-            'widget': Select(attrs={'class': theme.form_element_html_class}),
+            'widget': widget,
         }
 
         return [(self.data.name, TreeNodeChoiceField, field_kwargs)]
@@ -15,3 +15,11 @@ class Config(AppConfig):
            'select_multiple_model_objects'
     label = 'fobi_contrib_plugins_form_elements_fields_' \
             'select_multiple_model_objects'
+
+    def ready(self):
+        """Invalidate the cached choices on changes of model objects."""
+        from fobi.helpers import connect_model_object_choices_signals
+
+        from .settings import IGNORED_MODELS
+
+        connect_model_object_choices_signals(ignore=IGNORED_MODELS)
@@ -12,15 +12,23 @@ from fobi.constants import (
     SUBMIT_VALUE_AS_VAL,
     SUBMIT_VALUE_AS_REPR
 )
+from fobi.fields import CachedModelMultipleChoiceField
 from fobi.helpers import (
     safe_text,
     get_app_label_and_model_name,
+    get_cached_model_object_choices,
     get_model_name_for_object,
+    get_model_object_choices_url,
 )
+from fobi.widgets import RemoteSelectMultiple
 
 from . import UID
 from .forms import SelectMultipleModelObjectsInputForm
-from .settings import SUBMIT_VALUE_AS
+from .settings import (
+    CACHE_CHOICES_MAX_OBJECTS,
+    CACHE_CHOICES_TIMEOUT,
+    SUBMIT_VALUE_AS,
+)
 
 __title__ = 'fobi.contrib.plugins.form_elements.fields.' \
             'select_multiple_model_objects.fobi_form_elements'
@@ -55,18 +63,38 @@ class SelectMultipleModelObjectsInputPlugin(FormFieldPlugin):
         """Get form field instances."""
         queryset = self.get_queryset()
 
+        widget_attrs = {'class': theme.form_element_html_class}
+        if getattr(self.data, 'remote', False) and form_entry is not None:
+            widget = RemoteSelectMultiple(
+                url=get_model_object_choices_url(form_entry, self.data.name),
+                attrs=widget_attrs
+            )
+        else:
+            widget = SelectMultiple(attrs=widget_attrs)
+
         field_kwargs = {
             'label': self.data.label,
             'help_text': self.data.help_text,
             'initial': self.data.initial,
             'required': self.data.required,
             'queryset': queryset,
-            'widget': SelectMultiple(
-                attrs={'class': theme.form_element_html_class}
-            ),
+            'widget': widget,
         }
-
-        return [(self.data.name, ModelMultipleChoiceField, field_kwargs)]
+        field_cls = ModelMultipleChoiceField
+
+        if getattr(self.data, 'cache_choices', False) \
+                and not isinstance(widget, RemoteSelectMultiple):
+            cached_choices = get_cached_model_object_choices(
+                queryset,
+                element_data=self.plugin_data,
+                timeout=CACHE_CHOICES_TIMEOUT,
+                max_objects=CACHE_CHOICES_MAX_OBJECTS
+            )
+            if cached_choices is not None:
+                field_kwargs['cached_choices'] = cached_choices
+                field_cls = CachedModelMultipleChoiceField
+
+        return [(self.data.name, field_cls, field_kwargs)]
 
     def submit_plugin_form_data(self, form_entry, request, form,
                                 form_element_entries=None, **kwargs):
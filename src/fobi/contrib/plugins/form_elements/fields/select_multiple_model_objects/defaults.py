@@ -5,8 +5,20 @@ __title__ = 'fobi.contrib.plugins.form_elements.fields.' \
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
-__all__ = ('IGNORED_MODELS', 'SUBMIT_VALUE_AS',)
+__all__ = (
+    'CACHE_CHOICES_MAX_OBJECTS',
+    'CACHE_CHOICES_TIMEOUT',
+    'IGNORED_MODELS',
+    'SUBMIT_VALUE_AS',
+)
 
 IGNORED_MODELS = []
 
 SUBMIT_VALUE_AS = SUBMIT_VALUE_AS_MIX
+
+# Cache timeout (in seconds) of the choices of the elements having the
+# "Cache choices" option checked.
+CACHE_CHOICES_TIMEOUT = 3600
+
+# Choices are not cached if the model has more objects than given.
+CACHE_CHOICES_MAX_OBJECTS = 500
@@ -7,10 +7,19 @@ __title__ = 'fobi.contrib.plugins.form_elements.fields.' \
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
-__all__ = ('IGNORED_MODELS', 'SUBMIT_VALUE_AS',)
+__all__ = (
+    'CACHE_CHOICES_MAX_OBJECTS',
+    'CACHE_CHOICES_TIMEOUT',
+    'IGNORED_MODELS',
+    'SUBMIT_VALUE_AS',
+)
 
 IGNORED_MODELS = get_setting('IGNORED_MODELS')
 
 SUBMIT_VALUE_AS = get_setting('SUBMIT_VALUE_AS')
 
 validate_submit_value_as(SUBMIT_VALUE_AS)
+
+CACHE_CHOICES_TIMEOUT = get_setting('CACHE_CHOICES_TIMEOUT')
+
+CACHE_CHOICES_MAX_OBJECTS = get_setting('CACHE_CHOICES_MAX_OBJECTS')
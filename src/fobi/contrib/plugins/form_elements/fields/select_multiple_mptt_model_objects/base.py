@@ -17,7 +17,9 @@ from fobi.helpers import (
     safe_text,
     get_app_label_and_model_name,
     get_model_name_for_object,
+    get_model_object_choices_url,
 )
+from fobi.widgets import RemoteSelectMultiple
 
 from . import UID
 from .forms import SelectMultipleMPTTModelObjectsInputForm
@@ -41,12 +43,29 @@ class SelectMultipleMPTTModelObjectsInputPlugin(FormFieldPlugin):
     group = _("Fields")
     form = SelectMultipleMPTTModelObjectsInputForm
 
-    def get_form_field_instances(self, request=None, form_entry=None,
-                                 form_element_entries=None, **kwargs):
-        """Get form field instances."""
+    def get_queryset(self):
+        """Get queryset.
+
+        Might be used in integration packages.
+        """
         app_label, model_name = get_app_label_and_model_name(self.data.model)
         model = apps.get_model(app_label, model_name)
         queryset = model._default_manager.all()
+        return queryset
+
+    def get_form_field_instances(self, request=None, form_entry=None,
+                                 form_element_entries=None, **kwargs):
+        """Get form field instances."""
+        queryset = self.get_queryset()
+
+        widget_attrs = {'class': theme.form_element_html_class}
+        if getattr(self.data, 'remote', False) and form_entry is not None:
+            widget = RemoteSelectMultiple(
+                url=get_model_object_choices_url(form_entry, self.data.name),
+                attrs=widget_attrs
+            )
+        else:
+            widget = SelectMultiple(attrs=widget_attrs)
 
         field_kwargs = {
             'label': self.data.label,
@@ -54,9 +73,7 @@ class SelectMultipleMPTTModelObjectsInputPlugin(FormFieldPlugin):
             'initial': self.data.initial,
             'required': self.data.required,
             'queryset': queryset,
-            'widget': SelectMultiple(
-                attrs={'class': theme.form_element_html_class}
-            ),
+            'widget': widget,
         }
 
         return [(self.data.name, TreeNodeMultipleChoiceField, field_kwargs)]
@@ -99,3 +99,19 @@ class CaptchaInputPlugin(FormElementPlugin):
         }
 
         return [(self.data.name, CaptchaField, field_kwargs)]
+
+    @classmethod
+    def get_submission_check(cls, plugin_data):
+        """Get the data of the early check of the submissions."""
+        if not (plugin_data.get('name') and plugin_data.get('required')):
+            return None
+        return {'name': plugin_data['name']}
+
+    @classmethod
+    def check_submission(cls, check_data, data):
+        """Reject the submissions without the answer to the captcha.
+
+        The answer is submitted in the ``<name>_1`` field (the ``<name>_0``
+        field holds the hidden captcha hashkey).
+        """
+        return bool(data.get('{0}_1'.format(check_data['name'])))
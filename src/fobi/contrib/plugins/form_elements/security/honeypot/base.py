@@ -46,3 +46,19 @@ class HoneypotInputPlugin(FormElementPlugin):
 
         # return [(self.data.name, (HoneypotField, TextInput), kwargs)]
         return [(self.data.name, HoneypotField, field_kwargs)]
+
+    @classmethod
+    def get_submission_check(cls, plugin_data):
+        """Get the data of the early check of the submissions.
+
+        Dynamic initial values (rendered per request) are not checked early.
+        """
+        initial = plugin_data.get('initial') or ''
+        if not plugin_data.get('name') or '{{' in initial:
+            return None
+        return {'name': plugin_data['name'], 'value': initial}
+
+    @classmethod
+    def check_submission(cls, check_data, data):
+        """Reject the submissions having the honeypot value changed."""
+        return (data.get(check_data['name']) or '') == check_data['value']
@@ -50,3 +50,18 @@ class InvisibleRecaptchaInputPlugin(FormElementPlugin):
         }
 
         return [(self.data.name, InvisibleRecaptchaField, field_kwargs)]
+
+    @classmethod
+    def get_submission_check(cls, plugin_data):
+        """Get the data of the early check of the submissions."""
+        if not plugin_data.get('required'):
+            return None
+        return {}
+
+    @classmethod
+    def check_submission(cls, check_data, data):
+        """Reject the submissions without the reCAPTCHA token.
+
+        The token is set by the reCAPTCHA script before submitting.
+        """
+        return bool(data.get(RECAPTCHA_FIELD))
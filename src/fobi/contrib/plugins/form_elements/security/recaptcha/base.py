@@ -16,6 +16,8 @@ from .forms import ReCaptchaInputForm
 
 logger = logging.getLogger(__name__)
 
+RECAPTCHA_FIELD = 'g-recaptcha-response'
+
 DJANGO_RECAPTCHA_INSTALLED = False
 DJANGO_SIMPLE_CAPTCHA_INSTALLED = False
 
@@ -102,3 +104,19 @@ class ReCaptchaInputPlugin(FormElementPlugin):
         }
 
         return [(self.data.name, ReCaptchaField, field_kwargs)]
+
+    @classmethod
+    def get_submission_check(cls, plugin_data):
+        """Get the data of the early check of the submissions."""
+        if not plugin_data.get('required'):
+            return None
+        return {}
+
+    @classmethod
+    def check_submission(cls, check_data, data):
+        """Reject the submissions without the reCAPTCHA response field.
+
+        The field is added to the form by the reCAPTCHA script (empty if not
+        solved).
+        """
+        return RECAPTCHA_FIELD in data
@@ -12,3 +12,24 @@ class Config(AppConfig):
 
     name = 'fobi.contrib.plugins.form_handlers.db_store'
     label = 'fobi_contrib_plugins_form_handlers_db_store'
+
+    def ready(self):
+        """Keep the search index in sync with the saved form data."""
+        from django.db.models.signals import post_delete, post_save
+
+        from .helpers import (
+            delete_search_index_entry,
+            update_search_index_entry,
+        )
+        from .models import SavedFormDataEntry
+
+        post_save.connect(
+            update_search_index_entry,
+            sender=SavedFormDataEntry,
+            dispatch_uid='fobi.db_store.search_index.post_save'
+        )
+        post_delete.connect(
+            delete_search_index_entry,
+            sender=SavedFormDataEntry,
+            dispatch_uid='fobi.db_store.search_index.post_delete'
+        )
@@ -1,4 +1,5 @@
 import datetime
+import logging
 
 import simplejson as json
 
@@ -16,7 +17,9 @@ from .....base import (
 )
 from .....helpers import get_form_element_entries_for_form_wizard_entry
 from . import UID
+from .helpers import update_form_data_aggregates
 from .models import SavedFormDataEntry, SavedFormWizardDataEntry
+from .settings import AGGREGATE_FORM_DATA
 
 if DJANGO_GTE_1_10:
     from django.urls import reverse
@@ -32,6 +35,8 @@ __all__ = (
     'DBStoreWizardHandlerPlugin',
 )
 
+LOGGER = logging.getLogger(__name__)
+
 # *****************************************************************************
 # **************************** Form handler ***********************************
 # *****************************************************************************
@@ -67,17 +72,20 @@ class DBStoreHandlerPlugin(FormHandlerPlugin):
             form_entry,
             request,
             field_name_to_label_map,
-            cleaned_data
+            cleaned_data,
+            form_element_entries=form_element_entries
         )
 
     def save_form_data_entry(self,
                              form_entry,
                              request,
                              field_name_to_label_map,
-                             cleaned_data):
+                             cleaned_data,
+                             form_element_entries=None):
         """Save form data entry.
 
-        Might be used in integration plugins.
+        Might be used in integration plugins. The aggregates of the form
+        data are updated as well (unless disabled in settings).
         """
         for key, value in cleaned_data.items():
             if isinstance(value, (datetime.datetime, datetime.date)):
@@ -87,12 +95,25 @@ class DBStoreHandlerPlugin(FormHandlerPlugin):
 
         saved_form_data_entry = SavedFormDataEntry(
             form_entry=form_entry,
+            form_entry_version_id=form_entry.published_version_id,
             user=request.user if request.user and request.user.pk else None,
             form_data_headers=json.dumps(field_name_to_label_map),
             saved_data=json.dumps(cleaned_data)
         )
         saved_form_data_entry.save()
 
+        if AGGREGATE_FORM_DATA:
+            try:
+                update_form_data_aggregates(
+                    form_entry,
+                    cleaned_data,
+                    created=saved_form_data_entry.created,
+                    form_element_entries=form_element_entries
+                )
+            except Exception as err:
+                # Aggregates can be rebuilt, the data is saved already.
+                LOGGER.exception(err)
+
     def custom_actions(self, form_entry, request=None):
         """Custom actions.
 
@@ -178,6 +199,9 @@ class DBStoreWizardHandlerPlugin(FormWizardHandlerPlugin):
 
         saved_form_wizard_data_entry = SavedFormWizardDataEntry(
             form_wizard_entry=form_wizard_entry,
+            form_wizard_entry_version_id=getattr(
+                form_wizard, 'form_wizard_entry_version_id', None
+            ),
             user=request.user if request.user and request.user.pk else None,
             form_data_headers=json.dumps(field_name_to_label_map),
             saved_data=json.dumps(cleaned_data)
@@ -42,7 +42,9 @@ class AutoFormDbStore(FormCallback):
         :param form:
         :return:
         """
-        form_element_entries = form_entry.formelemententry_set.all()
+        form_element_entries = form_entry.get_form_element_entries(
+            version_id=form_entry.published_version_id
+        )
 
         # Clean up the values, leave our content fields and empty values.
         field_name_to_label_map, cleaned_data = get_processed_form_data(
@@ -58,6 +60,7 @@ class AutoFormDbStore(FormCallback):
 
         saved_form_data_entry = SavedFormDataEntry(
             form_entry=form_entry,
+            form_entry_version_id=form_entry.published_version_id,
             user=request.user if request.user and request.user.pk else None,
             form_data_headers=json.dumps(field_name_to_label_map),
             saved_data=json.dumps(cleaned_data)
@@ -3,8 +3,59 @@ __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
 __all__ = (
-    'CSV_DELIMITER', 'CSV_QUOTECHAR',
+    'AGGREGATE_CHOICE_PLUGIN_UIDS',
+    'AGGREGATE_FORM_DATA',
+    'AGGREGATE_NUMERIC_PLUGIN_UIDS',
+    'CSV_DELIMITER',
+    'CSV_QUOTECHAR',
+    'HISTOGRAM_BIN_WIDTH',
+    'HISTOGRAM_BINS',
+    'RETENTION_DAYS',
+    'RETENTION_DAYS_PER_FORM',
+    'SEARCH_MAX_RESULTS_PER_PAGE',
+    'SEARCH_RESULTS_PER_PAGE',
 )
 
 CSV_DELIMITER = ','
 CSV_QUOTECHAR = '"'
+
+# Maintain the aggregates (submission counts, choice counts, numeric
+# summaries) of the saved form data.
+AGGREGATE_FORM_DATA = True
+
+# Form element plugins, values of which are counted per choice.
+AGGREGATE_CHOICE_PLUGIN_UIDS = (
+    'checkbox_select_multiple',
+    'radio',
+    'select',
+    'select_multiple',
+)
+
+# Form element plugins, values of which are summarized (min, max, mean and
+# histogram).
+AGGREGATE_NUMERIC_PLUGIN_UIDS = (
+    'decimal',
+    'float',
+    'integer',
+    'slider',
+)
+
+# Number of histogram bins of the fields having both min and max values.
+HISTOGRAM_BINS = 10
+
+# Width of histogram bins of the other fields.
+HISTOGRAM_BIN_WIDTH = 1
+
+# Number of the search results per page (by default).
+SEARCH_RESULTS_PER_PAGE = 25
+
+# Max number of the search results per page (as requested).
+SEARCH_MAX_RESULTS_PER_PAGE = 100
+
+# Number of days the saved form data is kept (archived and deleted after by
+# the ``fobi_db_store_archive`` management command). If None, kept forever.
+RETENTION_DAYS = None
+
+# Number of days the saved form data of the given forms (slug as key) is
+# kept. Overrides the ``RETENTION_DAYS``.
+RETENTION_DAYS_PER_FORM = {}
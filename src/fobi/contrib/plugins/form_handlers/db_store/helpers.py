@@ -1,16 +1,43 @@
 import csv
 import logging
-
+import math
+import os
+
+from collections import Counter, OrderedDict
+
+from django.db import (
+    DEFAULT_DB_ALIAS,
+    IntegrityError,
+    connections,
+    transaction,
+)
+from django.db.models import F
 from django.http import HttpResponse
+from django.utils import timezone
 
 import simplejson as json
 
 from six import StringIO, BytesIO, text_type
 
 from .....exceptions import ImproperlyConfigured
-from .....helpers import safe_text
-
-from .settings import CSV_DELIMITER, CSV_QUOTECHAR
+from .....helpers import iter_json_lines, safe_text
+
+from .models import (
+    SavedFormDataCount,
+    SavedFormDataEntry,
+    SavedFormDataNumericSummary,
+    get_search_text,
+)
+from .settings import (
+    AGGREGATE_CHOICE_PLUGIN_UIDS,
+    AGGREGATE_NUMERIC_PLUGIN_UIDS,
+    CSV_DELIMITER,
+    CSV_QUOTECHAR,
+    HISTOGRAM_BIN_WIDTH,
+    HISTOGRAM_BINS,
+    RETENTION_DAYS,
+    RETENTION_DAYS_PER_FORM,
+)
 
 XLWT_INSTALLED = False
 try:
@@ -23,7 +50,21 @@ __title__ = 'fobi.contrib.plugins.form_handlers.db_store.helpers'
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
-__all__ = ('DataExporter',)
+__all__ = (
+    'DataExporter',
+    'SEARCH_INDEX_TABLE',
+    'archive_saved_form_data_entries',
+    'delete_search_index_entry',
+    'get_aggregated_fields',
+    'get_form_data_aggregates',
+    'get_retention_days',
+    'rebuild_form_data_aggregates',
+    'rebuild_search_index',
+    'search_index_available',
+    'search_form_data_entries',
+    'update_form_data_aggregates',
+    'update_search_index_entry',
+)
 
 
 LOGGER = logging.getLogger(__name__)
@@ -183,3 +224,559 @@ class DataExporter(object):
             return self._export_to_xls()
         else:
             return self.export_to_csv()
+
+
+# *****************************************************************************
+# ****************************** Aggregates ***********************************
+# *****************************************************************************
+
+
+def _to_float(value):
+    """Convert the value to float (None if not possible)."""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    if math.isnan(value) or math.isinf(value):
+        return None
+    return value
+
+
+def _get_histogram_bins(plugin_data):
+    """Get the histogram bins of the numeric field.
+
+    :param dict plugin_data:
+    :return tuple: Origin, width of the bins and the number of bins (None if
+        unlimited).
+    """
+    min_value = _to_float(plugin_data.get('min_value'))
+    max_value = _to_float(plugin_data.get('max_value'))
+    if min_value is not None and max_value is not None \
+            and max_value > min_value:
+        return min_value, (max_value - min_value) / HISTOGRAM_BINS, \
+            HISTOGRAM_BINS
+    return 0, HISTOGRAM_BIN_WIDTH, None
+
+
+def _get_histogram_bin(value, bins):
+    """Get the (lower bound of the) histogram bin of the value.
+
+    :param float value:
+    :param tuple bins: As returned by ``_get_histogram_bins``.
+    :return str:
+    """
+    origin, width, number_of_bins = bins
+    index = int(math.floor((value - origin) / width))
+    if number_of_bins is not None:
+        # The max value belongs to the last bin.
+        index = max(0, min(index, number_of_bins - 1))
+    return text_type(round(float(origin + index * width), 10))
+
+
+def _get_day(created):
+    """Get the (local) day of the date.
+
+    :param datetime.datetime created:
+    :return str:
+    """
+    if timezone.is_aware(created):
+        created = timezone.localtime(created)
+    return created.date().isoformat()
+
+
+def get_aggregated_fields(form_element_entries):
+    """Get the fields of the form, data of which is aggregated.
+
+    :param iterable form_element_entries: Iterable of
+        ``fobi.models.FormElementEntry`` instances.
+    :return collections.OrderedDict: Kind (``SavedFormDataCount.KIND_CHOICE``
+        or ``SavedFormDataCount.KIND_HISTOGRAM``) and histogram bins (if
+        applicable), field name as key.
+    """
+    aggregated_fields = OrderedDict()
+    for form_element_entry in form_element_entries:
+        plugin_uid = form_element_entry.plugin_uid
+        if plugin_uid not in AGGREGATE_CHOICE_PLUGIN_UIDS \
+                and plugin_uid not in AGGREGATE_NUMERIC_PLUGIN_UIDS:
+            continue
+
+        try:
+            plugin_data = json.loads(form_element_entry.plugin_data or '{}')
+        except ValueError:
+            continue
+        if not isinstance(plugin_data, dict) or not plugin_data.get('name'):
+            continue
+
+        if plugin_uid in AGGREGATE_CHOICE_PLUGIN_UIDS:
+            aggregated_fields[plugin_data['name']] = (
+                SavedFormDataCount.KIND_CHOICE, None
+            )
+        else:
+            aggregated_fields[plugin_data['name']] = (
+                SavedFormDataCount.KIND_HISTOGRAM,
+                _get_histogram_bins(plugin_data)
+            )
+    return aggregated_fields
+
+
+def _collect_form_data_aggregates(aggregated_fields, data, created, counts,
+                                  numeric_summaries):
+    """Collect the aggregates of a single submission.
+
+    :param dict aggregated_fields: As returned by ``get_aggregated_fields``.
+    :param dict data: Submitted (cleaned) data.
+    :param datetime.datetime created: Date of the submission.
+    :param collections.Counter counts: Counts, (kind, field name, value) as
+        key. Updated in place.
+    :param dict numeric_summaries: Lists of count, total, minimum and
+        maximum, field name as key. Updated in place.
+    """
+    counts[(SavedFormDataCount.KIND_SUBMISSIONS, '', _get_day(created))] += 1
+
+    for field_name, (kind, bins) in aggregated_fields.items():
+        value = data.get(field_name)
+        if value in (None, '', [], ()):
+            continue
+
+        if SavedFormDataCount.KIND_CHOICE == kind:
+            values = value if isinstance(value, (list, tuple)) else [value]
+            for choice in values:
+                counts[(kind, field_name, text_type(choice)[:255])] += 1
+            continue
+
+        value = _to_float(value)
+        if value is None:
+            continue
+        counts[(kind, field_name, _get_histogram_bin(value, bins))] += 1
+        summary = numeric_summaries.get(field_name)
+        if summary is None:
+            numeric_summaries[field_name] = [1, value, value, value]
+        else:
+            summary[0] += 1
+            summary[1] += value
+            summary[2] = min(summary[2], value)
+            summary[3] = max(summary[3], value)
+
+
+def update_form_data_aggregates(form_entry, data, created=None,
+                                form_element_entries=None):
+    """Update the aggregates with a single submission.
+
+    Updates are done in the database (``F`` expressions), so that the
+    concurrent submissions do not overwrite each other.
+
+    :param fobi.models.FormEntry form_entry:
+    :param dict data: Submitted (cleaned) data.
+    :param datetime.datetime created: Date of the submission. Defaults to
+        now.
+    :param iterable form_element_entries: Iterable of
+        ``fobi.models.FormElementEntry`` instances. Fetched if not given.
+    """
+    if form_element_entries is None:
+        form_element_entries = form_entry.formelemententry_set.all()[:]
+
+    counts = Counter()
+    numeric_summaries = {}
+    _collect_form_data_aggregates(get_aggregated_fields(form_element_entries),
+                                  data,
+                                  created or timezone.now(),
+                                  counts,
+                                  numeric_summaries)
+
+    with transaction.atomic():
+        for (kind, field_name, value), count in counts.items():
+            queryset = SavedFormDataCount._default_manager.filter(
+                form_entry=form_entry,
+                kind=kind,
+                field_name=field_name,
+                value=value
+            )
+            if queryset.update(count=F('count') + count):
+                continue
+            try:
+                with transaction.atomic():
+                    SavedFormDataCount._default_manager.create(
+                        form_entry=form_entry,
+                        kind=kind,
+                        field_name=field_name,
+                        value=value,
+                        count=count
+                    )
+            except IntegrityError:
+                # Created by a concurrent submission.
+                queryset.update(count=F('count') + count)
+
+        for field_name, (count, total, minimum, maximum) \
+                in numeric_summaries.items():
+            queryset = SavedFormDataNumericSummary._default_manager.filter(
+                form_entry=form_entry,
+                field_name=field_name
+            )
+            if not queryset.update(count=F('count') + count,
+                                   total=F('total') + total):
+                try:
+                    with transaction.atomic():
+                        SavedFormDataNumericSummary._default_manager.create(
+                            form_entry=form_entry,
+                            field_name=field_name,
+                            count=count,
+                            total=total,
+                            minimum=minimum,
+                            maximum=maximum
+                        )
+                    continue
+                except IntegrityError:
+                    queryset.update(count=F('count') + count,
+                                    total=F('total') + total)
+            queryset.filter(minimum__gt=minimum).update(minimum=minimum)
+            queryset.filter(maximum__lt=maximum).update(maximum=maximum)
+
+
+def rebuild_form_data_aggregates(form_entry, batch_size=1000):
+    """Rebuild the aggregates of the form from the saved form data.
+
+    Saved form data entries are processed in batches (only the data and
+    the date of the entries are fetched). Aggregates are replaced at once.
+
+    :param fobi.models.FormEntry form_entry:
+    :param int batch_size: Number of saved form data entries fetched at once.
+    :return int: Number of saved form data entries processed.
+    """
+    aggregated_fields = get_aggregated_fields(
+        form_entry.formelemententry_set.all()
+    )
+    counts = Counter()
+    numeric_summaries = {}
+
+    queryset = SavedFormDataEntry._default_manager \
+        .filter(form_entry=form_entry) \
+        .order_by('pk') \
+        .values_list('pk', 'created', 'saved_data')
+
+    processed = 0
+    last_pk = None
+    while True:
+        batch_queryset = queryset
+        if last_pk is not None:
+            batch_queryset = batch_queryset.filter(pk__gt=last_pk)
+        batch = list(batch_queryset[:batch_size])
+        if not batch:
+            break
+
+        for pk, created, saved_data in batch:
+            try:
+                data = json.loads(saved_data or '{}')
+            except ValueError:
+                data = {}
+            if not isinstance(data, dict):
+                data = {}
+            _collect_form_data_aggregates(aggregated_fields,
+                                          data,
+                                          created,
+                                          counts,
+                                          numeric_summaries)
+
+        processed += len(batch)
+        last_pk = batch[-1][0]
+
+    with transaction.atomic():
+        SavedFormDataCount._default_manager \
+            .filter(form_entry=form_entry) \
+            .delete()
+        SavedFormDataNumericSummary._default_manager \
+            .filter(form_entry=form_entry) \
+            .delete()
+        SavedFormDataCount._default_manager.bulk_create([
+            SavedFormDataCount(form_entry=form_entry,
+                               kind=kind,
+                               field_name=field_name,
+                               value=value,
+                               count=count)
+            for (kind, field_name, value), count in counts.items()
+        ])
+        SavedFormDataNumericSummary._default_manager.bulk_create([
+            SavedFormDataNumericSummary(form_entry=form_entry,
+                                        field_name=field_name,
+                                        count=count,
+                                        total=total,
+                                        minimum=minimum,
+                                        maximum=maximum)
+            for field_name, (count, total, minimum, maximum)
+            in numeric_summaries.items()
+        ])
+
+    return processed
+
+
+def get_form_data_aggregates(form_entry):
+    """Get the aggregates of the form (two queries).
+
+    :param fobi.models.FormEntry form_entry:
+    :return dict: Submission counts (``total`` and ``per_day``) and
+        aggregates of the ``fields`` (``choices`` counts of the choice
+        fields; ``count``, ``min``, ``max``, ``mean`` and ``histogram`` of
+        the numeric fields).
+    """
+    per_day = {}
+    fields = {}
+
+    for kind, field_name, value, count in SavedFormDataCount._default_manager \
+            .filter(form_entry=form_entry) \
+            .values_list('kind', 'field_name', 'value', 'count'):
+        if SavedFormDataCount.KIND_SUBMISSIONS == kind:
+            per_day[value] = count
+        elif SavedFormDataCount.KIND_CHOICE == kind:
+            fields.setdefault(field_name, {'choices': {}})
+            fields[field_name]['choices'][value] = count
+        else:
+            fields.setdefault(field_name, {'histogram': {}})
+            fields[field_name]['histogram'][value] = count
+
+    for numeric_summary in SavedFormDataNumericSummary._default_manager \
+            .filter(form_entry=form_entry):
+        fields.setdefault(numeric_summary.field_name, {'histogram': {}})
+        fields[numeric_summary.field_name].update({
+            'count': numeric_summary.count,
+            'min': numeric_summary.minimum,
+            'max': numeric_summary.maximum,
+            'mean': numeric_summary.mean,
+        })
+
+    for field_aggregates in fields.values():
+        if 'histogram' in field_aggregates:
+            field_aggregates['histogram'] = OrderedDict(
+                sorted(field_aggregates['histogram'].items(),
+                       key=lambda item: float(item[0]))
+            )
+        else:
+            field_aggregates['choices'] = OrderedDict(
+                sorted(field_aggregates['choices'].items(),
+                       key=lambda item: (-item[1], item[0]))
+            )
+
+    return {
+        'submissions': {
+            'total': sum(per_day.values()),
+            'per_day': OrderedDict(sorted(per_day.items())),
+        },
+        'fields': OrderedDict(sorted(fields.items())),
+    }
+
+
+# SQLite FTS5 (trigram tokenizer) search index table of the saved form data
+# entries (created by the migrations, if supported). PostgreSQL uses the
+# trigram (GIN) index of the ``search_text`` column instead.
+SEARCH_INDEX_TABLE = 'db_store_savedformdataentry_fts'
+
+_SEARCH_INDEX_AVAILABLE = {}
+
+
+def search_index_available(using=DEFAULT_DB_ALIAS):
+    """Check if the (SQLite FTS5) search index table exists.
+
+    :param str using: Database alias.
+    :return bool:
+    """
+    connection = connections[using]
+    if 'sqlite' != connection.vendor:
+        return False
+
+    if using not in _SEARCH_INDEX_AVAILABLE:
+        _SEARCH_INDEX_AVAILABLE[using] = \
+            SEARCH_INDEX_TABLE in connection.introspection.table_names()
+    return _SEARCH_INDEX_AVAILABLE[using]
+
+
+def update_search_index_entry(sender, instance, **kwargs):
+    """Update the search index entry of the saved form data entry.
+
+    Connected to the ``post_save`` signal of the ``SavedFormDataEntry``.
+    """
+    using = kwargs.get('using') or DEFAULT_DB_ALIAS
+    if not search_index_available(using):
+        return
+
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "DELETE FROM {0} WHERE rowid = %s".format(SEARCH_INDEX_TABLE),
+            [instance.pk]
+        )
+        if instance.search_text:
+            cursor.execute(
+                "INSERT INTO {0} (rowid, search_text) "
+                "VALUES (%s, %s)".format(SEARCH_INDEX_TABLE),
+                [instance.pk, instance.search_text]
+            )
+
+
+def delete_search_index_entry(sender, instance, **kwargs):
+    """Delete the search index entry of the saved form data entry.
+
+    Connected to the ``post_delete`` signal of the ``SavedFormDataEntry``.
+    """
+    using = kwargs.get('using') or DEFAULT_DB_ALIAS
+    if not search_index_available(using):
+        return
+
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "DELETE FROM {0} WHERE rowid = %s".format(SEARCH_INDEX_TABLE),
+            [instance.pk]
+        )
+
+
+def rebuild_search_index(batch_size=1000, using=DEFAULT_DB_ALIAS):
+    """Rebuild the search text (and the search index) of the entries.
+
+    Needed for the entries not saved one by one (bulk created or updated).
+    Saved form data entries are processed in batches; only the changed
+    search texts are updated.
+
+    :param int batch_size: Number of saved form data entries fetched at once.
+    :param str using: Database alias.
+    :return int: Number of saved form data entries updated.
+    """
+    queryset = SavedFormDataEntry._default_manager \
+        .using(using) \
+        .order_by('pk') \
+        .values_list('pk', 'saved_data', 'search_text')
+
+    updated = 0
+    last_pk = None
+    while True:
+        batch_queryset = queryset
+        if last_pk is not None:
+            batch_queryset = batch_queryset.filter(pk__gt=last_pk)
+        batch = list(batch_queryset[:batch_size])
+        if not batch:
+            break
+
+        with transaction.atomic(using=using):
+            for pk, saved_data, search_text in batch:
+                new_search_text = get_search_text(saved_data)
+                if new_search_text != search_text:
+                    SavedFormDataEntry._default_manager \
+                        .using(using) \
+                        .filter(pk=pk) \
+                        .update(search_text=new_search_text)
+                    updated += 1
+
+        last_pk = batch[-1][0]
+
+    if search_index_available(using):
+        with transaction.atomic(using=using):
+            with connections[using].cursor() as cursor:
+                cursor.execute("DELETE FROM {0}".format(SEARCH_INDEX_TABLE))
+                cursor.execute(
+                    "INSERT INTO {0} (rowid, search_text) "
+                    "SELECT id, search_text FROM {1} "
+                    "WHERE search_text IS NOT NULL "
+                    "AND search_text != ''".format(
+                        SEARCH_INDEX_TABLE,
+                        SavedFormDataEntry._meta.db_table
+                    )
+                )
+
+    return updated
+
+
+def search_form_data_entries(queryset, query):
+    """Search the saved form data entries (case insensitive substring).
+
+    The SQLite FTS5 search index is used for the queries of at least three
+    characters (the trigram tokenizer does not match the shorter ones).
+    Otherwise the ``search_text`` column is matched (using the trigram
+    index on PostgreSQL).
+
+    :param django.db.models.QuerySet queryset: Saved form data entries.
+    :param str query:
+    :return django.db.models.QuerySet:
+    """
+    query = (query or '').strip().lower()
+    if not query:
+        return queryset
+
+    if len(query) >= 3 and search_index_available(queryset.db):
+        quote_name = connections[queryset.db].ops.quote_name
+        return queryset.extra(
+            where=["{0}.{1} IN (SELECT rowid FROM {2} WHERE {2} MATCH %s)"
+                   "".format(quote_name(queryset.model._meta.db_table),
+                             quote_name(queryset.model._meta.pk.column),
+                             SEARCH_INDEX_TABLE)],
+            params=['"{0}"'.format(query.replace('"', '""'))]
+        )
+
+    return queryset.filter(search_text__contains=query)
+
+
+def get_retention_days(form_entry):
+    """Get the number of days the saved data of the form is kept.
+
+    :param fobi.models.FormEntry form_entry:
+    :return int: None if kept forever.
+    """
+    return RETENTION_DAYS_PER_FORM.get(form_entry.slug, RETENTION_DAYS)
+
+
+def _load_json(value):
+    """Load the JSON value (left as is if not valid JSON)."""
+    try:
+        return json.loads(value) if value else value
+    except ValueError:
+        return value
+
+
+def archive_saved_form_data_entries(form_entry, before, archive_file=None,
+                                    batch_size=500):
+    """Archive (and delete) the saved form data entries created before.
+
+    Entries are processed in batches (oldest first), using the
+    ``(form_entry, created)`` index. Each batch is written to the archive
+    file (as JSON lines) and flushed before being deleted (in a transaction
+    per batch), so that an interrupted archival loses no data.
+
+    Aggregates are not updated (they keep counting the archived data).
+
+    :param fobi.models.FormEntry form_entry:
+    :param datetime.datetime before:
+    :param file archive_file: File (opened for writing bytes). If None,
+        entries are deleted without being archived.
+    :param int batch_size: Number of entries archived at once.
+    :return int: Number of entries archived.
+    """
+    queryset = SavedFormDataEntry._default_manager \
+        .filter(form_entry=form_entry, created__lt=before) \
+        .order_by('created') \
+        .values_list('pk', 'user_id', 'created', 'form_data_headers',
+                     'saved_data')
+
+    archived = 0
+    while True:
+        batch = list(queryset[:batch_size])
+        if not batch:
+            break
+
+        if archive_file is not None:
+            archive_file.writelines(iter_json_lines(
+                {
+                    'id': pk,
+                    'form_entry': form_entry.slug,
+                    'user': user_id,
+                    'created': created,
+                    'headers': _load_json(form_data_headers),
+                    'data': _load_json(saved_data),
+                }
+                for pk, user_id, created, form_data_headers, saved_data
+                in batch
+            ))
+            archive_file.flush()
+            if hasattr(archive_file, 'fileno'):
+                os.fsync(archive_file.fileno())
+
+        with transaction.atomic():
+            SavedFormDataEntry._default_manager \
+                .filter(pk__in=[item[0] for item in batch]) \
+                .delete()
+        archived += len(batch)
+
+    return archived
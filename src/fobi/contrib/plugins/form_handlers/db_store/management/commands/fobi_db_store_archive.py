@@ -0,0 +1,147 @@
+import datetime
+import gzip
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from fobi.models import FormEntry
+
+from ...helpers import archive_saved_form_data_entries, get_retention_days
+from ...models import SavedFormDataEntry
+
+
+class Command(BaseCommand):
+    """Archives (and deletes) the saved form data older than retained.
+
+    Number of days the saved form data is retained is set per form with the
+    ``FOBI_PLUGIN_DB_STORE_RETENTION_DAYS_PER_FORM`` setting (form slug as
+    key), or for all forms with the ``FOBI_PLUGIN_DB_STORE_RETENTION_DAYS``
+    setting.
+
+    Saved form data of each form is archived into a compressed JSON lines
+    file (``<form slug>-<timestamp>.jsonl.gz``) in the output directory and
+    deleted in small batches.
+
+    Example:
+
+        ./manage.py fobi_db_store_archive --output-dir=/var/archive/fobi
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output-dir',
+            dest='output_dir',
+            help='Directory the archive files are written to.',
+        )
+        parser.add_argument(
+            '--no-archive',
+            action='store_true',
+            dest='no_archive',
+            default=False,
+            help='Delete the old saved form data without archiving it.',
+        )
+        parser.add_argument(
+            '--form-entry',
+            type=int,
+            action='append',
+            dest='form_entry_ids',
+            help='Archive the saved data of the given form (ID) only. Can be '
+                 'given multiple times.',
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=None,
+            dest='days',
+            help='Number of days the saved form data is retained '
+                 '(overrides the settings).',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            dest='batch_size',
+            help='Number of saved form data entries archived at once.',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            dest='dry_run',
+            default=False,
+            help='Report the number of entries to be archived only.',
+        )
+
+    def handle(self, *args, **options):
+        """Handle."""
+        output_dir = options.get('output_dir')
+        if not output_dir and not options['no_archive']:
+            raise CommandError(
+                "Either --output-dir or --no-archive shall be given."
+            )
+        if output_dir and not os.path.isdir(output_dir):
+            raise CommandError(
+                "Directory {0} does not exist.".format(output_dir)
+            )
+
+        form_entries = FormEntry._default_manager.filter(
+            pk__in=SavedFormDataEntry._default_manager
+                                     .values('form_entry_id')
+        ).order_by('pk')
+        if options.get('form_entry_ids'):
+            form_entries = form_entries.filter(
+                pk__in=options['form_entry_ids']
+            )
+
+        now = timezone.now()
+        for form_entry in form_entries.iterator():
+            days = options['days']
+            if days is None:
+                days = get_retention_days(form_entry)
+            if days is None:
+                continue
+
+            before = now - datetime.timedelta(days=days)
+            queryset = SavedFormDataEntry._default_manager.filter(
+                form_entry=form_entry,
+                created__lt=before
+            )
+            if options['dry_run']:
+                self.stdout.write(
+                    "{0}: {1} saved form data entries to archive".format(
+                        form_entry.slug, queryset.count()
+                    )
+                )
+                continue
+
+            if not queryset.exists():
+                continue
+
+            if options['no_archive']:
+                archived = archive_saved_form_data_entries(
+                    form_entry,
+                    before,
+                    batch_size=options['batch_size']
+                )
+            else:
+                path = os.path.join(
+                    output_dir,
+                    '{0}-{1}.jsonl.gz'.format(form_entry.slug,
+                                              now.strftime('%Y%m%d%H%M%S'))
+                )
+                with gzip.open(path, 'ab') as archive_file:
+                    archived = archive_saved_form_data_entries(
+                        form_entry,
+                        before,
+                        archive_file=archive_file,
+                        batch_size=options['batch_size']
+                    )
+
+            self.stdout.write(
+                "{0}: {1} saved form data entries archived".format(
+                    form_entry.slug, archived
+                )
+            )
+
+        if options['dry_run']:
+            self.stdout.write("Dry run, nothing has been archived.")
@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from fobi.models import FormEntry
+
+from ...helpers import rebuild_form_data_aggregates
+from ...models import SavedFormDataCount, SavedFormDataEntry
+
+
+class Command(BaseCommand):
+    """Rebuilds the aggregates of the saved form data.
+
+    Aggregates are maintained on each submission. Rebuild them after the
+    saved form data entries have been deleted or changed, or when the
+    aggregates have been enabled for a form with existing data.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--form-entry',
+            type=int,
+            action='append',
+            dest='form_entry_ids',
+            help='Rebuild the aggregates of the given form (ID) only. Can be '
+                 'given multiple times.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            dest='batch_size',
+            help='Number of saved form data entries fetched at once.',
+        )
+
+    def handle(self, *args, **options):
+        """Handle."""
+        # Forms having saved data or (stale) aggregates.
+        form_entries = FormEntry._default_manager.filter(
+            Q(pk__in=SavedFormDataEntry._default_manager
+                                       .values('form_entry_id')) |
+            Q(pk__in=SavedFormDataCount._default_manager
+                                       .values('form_entry_id'))
+        ).order_by('pk')
+        if options.get('form_entry_ids'):
+            form_entries = form_entries.filter(
+                pk__in=options['form_entry_ids']
+            )
+
+        for form_entry in form_entries.iterator():
+            processed = rebuild_form_data_aggregates(
+                form_entry,
+                batch_size=options['batch_size']
+            )
+            self.stdout.write(
+                "{0}: {1} saved form data entries processed".format(
+                    form_entry.slug, processed
+                )
+            )
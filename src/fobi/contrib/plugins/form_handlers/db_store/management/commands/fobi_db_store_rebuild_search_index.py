@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+from ...helpers import rebuild_search_index
+
+
+class Command(BaseCommand):
+    """Rebuilds the search index of the saved form data.
+
+    The search index is kept in sync on each save. Rebuild it after the
+    saved form data entries have been created or changed in bulk.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            dest='batch_size',
+            help='Number of saved form data entries fetched at once.',
+        )
+        parser.add_argument(
+            '--database',
+            default=DEFAULT_DB_ALIAS,
+            dest='database',
+            help='Database alias.',
+        )
+
+    def handle(self, *args, **options):
+        """Handle."""
+        updated = rebuild_search_index(batch_size=options['batch_size'],
+                                       using=options['database'])
+        self.stdout.write(
+            "{0} saved form data entries updated".format(updated)
+        )
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 2.2.28 on 2026-10-18 22:01
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fobi', '0015_auto_20180130_0013'),
+        ('fobi_contrib_plugins_form_handlers_db_store', '0002_savedformwizarddataentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavedFormDataNumericSummary',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('field_name', models.CharField(max_length=255, verbose_name='Field name')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='Count')),
+                ('total', models.FloatField(default=0, verbose_name='Total')),
+                ('minimum', models.FloatField(verbose_name='Minimum')),
+                ('maximum', models.FloatField(verbose_name='Maximum')),
+                ('form_entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='fobi.FormEntry', verbose_name='Form')),
+            ],
+            options={
+                'verbose_name': 'Saved form data numeric summary',
+                'verbose_name_plural': 'Saved form data numeric summaries',
+                'db_table': 'db_store_savedformdatanumericsummary',
+                'unique_together': {('form_entry', 'field_name')},
+            },
+        ),
+        migrations.CreateModel(
+            name='SavedFormDataCount',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=32, verbose_name='Kind')),
+                ('field_name', models.CharField(blank=True, max_length=255, verbose_name='Field name')),
+                ('value', models.CharField(blank=True, max_length=255, verbose_name='Value')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='Count')),
+                ('form_entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='fobi.FormEntry', verbose_name='Form')),
+            ],
+            options={
+                'verbose_name': 'Saved form data count',
+                'verbose_name_plural': 'Saved form data counts',
+                'db_table': 'db_store_savedformdatacount',
+                'unique_together': {('form_entry', 'kind', 'field_name', 'value')},
+            },
+        ),
+    ]
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 2.2.28 on 2026-10-18 22:07
+from __future__ import unicode_literals
+
+import simplejson as json
+from six import text_type
+
+from django.db import DatabaseError, migrations, models, transaction
+
+SEARCH_INDEX_TABLE = 'db_store_savedformdataentry_fts'
+SEARCH_INDEX_NAME = 'db_store_savedformdataentry_search_trgm'
+
+
+def get_search_text(saved_data):
+    """Get the (lower case) search text of the saved data.
+
+    Copy of the ``get_search_text`` of the ``models`` module at the time of
+    the migration (migrations shall not depend on the code changing later).
+
+    :param str saved_data: Saved data (JSON).
+    :return str:
+    """
+    try:
+        data = json.loads(saved_data or '{}')
+    except ValueError:
+        return ''
+    if not isinstance(data, dict):
+        return ''
+
+    values = []
+    for value in data.values():
+        if not isinstance(value, (list, tuple)):
+            value = [value]
+        for item in value:
+            if item is not None and item != '':
+                values.append(text_type(item).lower())
+    return '\n'.join(values)
+
+
+def fill_search_text(apps, schema_editor):
+    """Fill the search text of the existing entries."""
+    SavedFormDataEntry = apps.get_model(
+        'fobi_contrib_plugins_form_handlers_db_store',
+        'SavedFormDataEntry'
+    )
+    using = schema_editor.connection.alias
+    queryset = SavedFormDataEntry._default_manager \
+        .using(using) \
+        .order_by('pk') \
+        .values_list('pk', 'saved_data')
+
+    last_pk = None
+    while True:
+        batch_queryset = queryset
+        if last_pk is not None:
+            batch_queryset = batch_queryset.filter(pk__gt=last_pk)
+        batch = list(batch_queryset[:1000])
+        if not batch:
+            break
+        for pk, saved_data in batch:
+            SavedFormDataEntry._default_manager \
+                .using(using) \
+                .filter(pk=pk) \
+                .update(search_text=get_search_text(saved_data))
+        last_pk = batch[-1][0]
+
+
+def create_search_index(apps, schema_editor):
+    """Create the search index (if supported by the database).
+
+    - PostgreSQL: trigram (GIN) index of the search text.
+    - SQLite: FTS5 table (trigram tokenizer, SQLite 3.34+).
+    """
+    connection = schema_editor.connection
+    try:
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                if 'postgresql' == connection.vendor:
+                    cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+                    cursor.execute(
+                        "CREATE INDEX {0} ON db_store_savedformdataentry "
+                        "USING gin (search_text gin_trgm_ops)".format(
+                            SEARCH_INDEX_NAME
+                        )
+                    )
+                elif 'sqlite' == connection.vendor:
+                    cursor.execute(
+                        "CREATE VIRTUAL TABLE {0} USING "
+                        "fts5(search_text, tokenize='trigram')".format(
+                            SEARCH_INDEX_TABLE
+                        )
+                    )
+                    cursor.execute(
+                        "INSERT INTO {0} (rowid, search_text) "
+                        "SELECT id, search_text "
+                        "FROM db_store_savedformdataentry "
+                        "WHERE search_text IS NOT NULL "
+                        "AND search_text != ''".format(SEARCH_INDEX_TABLE)
+                    )
+    except DatabaseError:
+        # Not supported (no ``pg_trgm`` extension or FTS5 trigram
+        # tokenizer). The search text is matched without an index.
+        pass
+
+
+def drop_search_index(apps, schema_editor):
+    """Drop the search index."""
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        if 'postgresql' == connection.vendor:
+            cursor.execute(
+                "DROP INDEX IF EXISTS {0}".format(SEARCH_INDEX_NAME)
+            )
+        elif 'sqlite' == connection.vendor:
+            cursor.execute(
+                "DROP TABLE IF EXISTS {0}".format(SEARCH_INDEX_TABLE)
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fobi_contrib_plugins_form_handlers_db_store', '0003_savedformdatacount_savedformdatanumericsummary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='savedformdataentry',
+            name='search_text',
+            field=models.TextField(blank=True, editable=False, null=True, verbose_name='Search text'),
+        ),
+        migrations.RunPython(fill_search_text, migrations.RunPython.noop),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
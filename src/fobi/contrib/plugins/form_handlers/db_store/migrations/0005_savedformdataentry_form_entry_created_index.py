@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 2.2.28 on 2026-10-18 22:12
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fobi', '0015_auto_20180130_0013'),
+        ('fobi_contrib_plugins_form_handlers_db_store', '0004_savedformdataentry_search_text'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='savedformdataentry',
+            index_together={('form_entry', 'created')},
+        ),
+    ]
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 2.2.28 on 2026-10-18 22:34
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fobi', '0018_formentryversion_formwizardentryversion'),
+        ('fobi_contrib_plugins_form_handlers_db_store', '0005_savedformdataentry_form_entry_created_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='savedformdataentry',
+            name='form_entry_version',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='fobi.FormEntryVersion', verbose_name='Form version'),
+        ),
+        migrations.AddField(
+            model_name='savedformwizarddataentry',
+            name='form_wizard_entry_version',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='fobi.FormWizardEntryVersion', verbose_name='Form wizard version'),
+        ),
+    ]
@@ -1,6 +1,6 @@
 import bleach
 import simplejson as json
-from six import python_2_unicode_compatible, string_types
+from six import python_2_unicode_compatible, string_types, text_type
 
 from django.conf import settings
 from django.db import models
@@ -14,8 +14,11 @@ __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
 __all__ = (
     'AbstractSavedFormDataEntry',
+    'SavedFormDataCount',
     'SavedFormDataEntry',
+    'SavedFormDataNumericSummary',
     'SavedFormWizardDataEntry',
+    'get_search_text',
 )
 
 # ****************************************************************************
@@ -28,6 +31,32 @@ AUTH_USER_MODEL = settings.AUTH_USER_MODEL
 # ****************************************************************************
 
 
+def get_search_text(saved_data):
+    """Get the (lower case) search text of the saved data.
+
+    Values of the saved data (values of the lists one by one) are put on
+    separate lines.
+
+    :param str saved_data: Saved data (JSON).
+    :return str:
+    """
+    try:
+        data = json.loads(saved_data or '{}')
+    except ValueError:
+        return ''
+    if not isinstance(data, dict):
+        return ''
+
+    values = []
+    for value in data.values():
+        if not isinstance(value, (list, tuple)):
+            value = [value]
+        for item in value:
+            if item is not None and item != '':
+                values.append(text_type(item).lower())
+    return '\n'.join(values)
+
+
 class AbstractSavedFormDataEntry(models.Model):
     """Abstract saved form data entry."""
 
@@ -90,6 +119,20 @@ class SavedFormDataEntry(AbstractSavedFormDataEntry):
         blank=True,
         on_delete=models.CASCADE
     )
+    form_entry_version = models.ForeignKey(
+        'fobi.FormEntryVersion',
+        verbose_name=_("Form version"),
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL
+    )
+    search_text = models.TextField(
+        _("Search text"),
+        null=True,
+        blank=True,
+        editable=False
+    )
 
     class Meta(object):
         """Meta options."""
@@ -98,10 +141,19 @@ class SavedFormDataEntry(AbstractSavedFormDataEntry):
         verbose_name = _("Saved form data entry")
         verbose_name_plural = _("Saved form data entries")
         db_table = 'db_store_savedformdataentry'
+        index_together = (('form_entry', 'created'),)
 
     def __str__(self):
         return "Saved form data entry from {0}".format(self.created)
 
+    def save(self, *args, **kwargs):
+        """Keep the search text in sync with the saved data."""
+        self.search_text = get_search_text(self.saved_data)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'saved_data' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'search_text'}
+        super(SavedFormDataEntry, self).save(*args, **kwargs)
+
 
 @python_2_unicode_compatible
 class SavedFormWizardDataEntry(AbstractSavedFormDataEntry):
@@ -114,6 +166,14 @@ class SavedFormWizardDataEntry(AbstractSavedFormDataEntry):
         blank=True,
         on_delete=models.CASCADE
     )
+    form_wizard_entry_version = models.ForeignKey(
+        'fobi.FormWizardEntryVersion',
+        verbose_name=_("Form wizard version"),
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL
+    )
 
     class Meta(object):
         """Meta options."""
@@ -125,3 +185,83 @@ class SavedFormWizardDataEntry(AbstractSavedFormDataEntry):
 
     def __str__(self):
         return "Saved form wizard data entry from {0}".format(self.created)
+
+
+@python_2_unicode_compatible
+class SavedFormDataCount(models.Model):
+    """Count of the saved form data.
+
+    Aggregate maintained on each submission (and rebuilt by the
+    ``fobi_db_store_rebuild_aggregates`` management command):
+
+    - Number of submissions per day (``KIND_SUBMISSIONS``, day as value).
+    - Number of submissions per choice of the field (``KIND_CHOICE``).
+    - Number of submissions per histogram bin of the numeric field
+      (``KIND_HISTOGRAM``, lower bound of the bin as value).
+    """
+
+    KIND_SUBMISSIONS = 'submissions'
+    KIND_CHOICE = 'choice'
+    KIND_HISTOGRAM = 'histogram'
+
+    form_entry = models.ForeignKey(
+        'fobi.FormEntry',
+        verbose_name=_("Form"),
+        on_delete=models.CASCADE
+    )
+    kind = models.CharField(_("Kind"), max_length=32)
+    field_name = models.CharField(_("Field name"),
+                                  max_length=255,
+                                  blank=True)
+    value = models.CharField(_("Value"), max_length=255, blank=True)
+    count = models.PositiveIntegerField(_("Count"), default=0)
+
+    class Meta(object):
+        """Meta options."""
+
+        verbose_name = _("Saved form data count")
+        verbose_name_plural = _("Saved form data counts")
+        db_table = 'db_store_savedformdatacount'
+        unique_together = (('form_entry', 'kind', 'field_name', 'value'),)
+
+    def __str__(self):
+        return "{0} {1} {2}: {3}".format(self.kind,
+                                         self.field_name,
+                                         self.value,
+                                         self.count)
+
+
+@python_2_unicode_compatible
+class SavedFormDataNumericSummary(models.Model):
+    """Summary of the saved numeric form field data.
+
+    Aggregate maintained on each submission (and rebuilt by the
+    ``fobi_db_store_rebuild_aggregates`` management command).
+    """
+
+    form_entry = models.ForeignKey(
+        'fobi.FormEntry',
+        verbose_name=_("Form"),
+        on_delete=models.CASCADE
+    )
+    field_name = models.CharField(_("Field name"), max_length=255)
+    count = models.PositiveIntegerField(_("Count"), default=0)
+    total = models.FloatField(_("Total"), default=0)
+    minimum = models.FloatField(_("Minimum"))
+    maximum = models.FloatField(_("Maximum"))
+
+    class Meta(object):
+        """Meta options."""
+
+        verbose_name = _("Saved form data numeric summary")
+        verbose_name_plural = _("Saved form data numeric summaries")
+        db_table = 'db_store_savedformdatanumericsummary'
+        unique_together = (('form_entry', 'field_name'),)
+
+    def __str__(self):
+        return "{0}: {1}".format(self.field_name, self.count)
+
+    @property
+    def mean(self):
+        """Mean value."""
+        return self.total / self.count if self.count else None
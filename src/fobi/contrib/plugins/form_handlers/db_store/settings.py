@@ -1,6 +1,15 @@
 """
 - ``CSV_DELIMITER`` (string)
 - ``CSV_QUOTECHAR`` (string)
+- ``AGGREGATE_FORM_DATA`` (bool)
+- ``AGGREGATE_CHOICE_PLUGIN_UIDS`` (tuple)
+- ``AGGREGATE_NUMERIC_PLUGIN_UIDS`` (tuple)
+- ``HISTOGRAM_BINS`` (int)
+- ``HISTOGRAM_BIN_WIDTH`` (int)
+- ``SEARCH_RESULTS_PER_PAGE`` (int)
+- ``SEARCH_MAX_RESULTS_PER_PAGE`` (int)
+- ``RETENTION_DAYS`` (int)
+- ``RETENTION_DAYS_PER_FORM`` (dict)
 """
 from .conf import get_setting
 
@@ -9,8 +18,30 @@ __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
 __all__ = (
-    'CSV_DELIMITER', 'CSV_QUOTECHAR',
+    'AGGREGATE_CHOICE_PLUGIN_UIDS',
+    'AGGREGATE_FORM_DATA',
+    'AGGREGATE_NUMERIC_PLUGIN_UIDS',
+    'CSV_DELIMITER',
+    'CSV_QUOTECHAR',
+    'HISTOGRAM_BIN_WIDTH',
+    'HISTOGRAM_BINS',
+    'RETENTION_DAYS',
+    'RETENTION_DAYS_PER_FORM',
+    'SEARCH_MAX_RESULTS_PER_PAGE',
+    'SEARCH_RESULTS_PER_PAGE',
 )
 
 CSV_DELIMITER = get_setting('CSV_DELIMITER')
 CSV_QUOTECHAR = get_setting('CSV_QUOTECHAR')
+
+AGGREGATE_FORM_DATA = get_setting('AGGREGATE_FORM_DATA')
+AGGREGATE_CHOICE_PLUGIN_UIDS = get_setting('AGGREGATE_CHOICE_PLUGIN_UIDS')
+AGGREGATE_NUMERIC_PLUGIN_UIDS = get_setting('AGGREGATE_NUMERIC_PLUGIN_UIDS')
+HISTOGRAM_BINS = get_setting('HISTOGRAM_BINS')
+HISTOGRAM_BIN_WIDTH = get_setting('HISTOGRAM_BIN_WIDTH')
+
+SEARCH_RESULTS_PER_PAGE = get_setting('SEARCH_RESULTS_PER_PAGE')
+SEARCH_MAX_RESULTS_PER_PAGE = get_setting('SEARCH_MAX_RESULTS_PER_PAGE')
+
+RETENTION_DAYS = get_setting('RETENTION_DAYS')
+RETENTION_DAYS_PER_FORM = get_setting('RETENTION_DAYS_PER_FORM')
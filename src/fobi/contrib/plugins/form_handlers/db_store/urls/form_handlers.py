@@ -1,7 +1,10 @@
 from django.conf.urls import url
 
 from ..views import (
-    view_saved_form_data_entries, export_saved_form_data_entries,
+    view_saved_form_data_aggregates,
+    view_saved_form_data_entries,
+    export_saved_form_data_entries,
+    search_saved_form_data_entries,
 )
 
 __title__ = 'fobi.contrib.plugins.form_handlers.db_store.urls'
@@ -33,6 +36,30 @@ urlpatterns = [
         name='fobi.contrib.plugins.form_handlers.db_store.'
              'view_saved_form_data_entries'),
 
+    # ***********************************************************************
+    # *************************** Aggregates ********************************
+    # ***********************************************************************
+    # Specific form aggregates
+    url(r'^aggregates/(?P<form_entry_id>\d+)/$',
+        view=view_saved_form_data_aggregates,
+        name='fobi.contrib.plugins.form_handlers.db_store.'
+             'view_saved_form_data_aggregates'),
+
+    # ***********************************************************************
+    # ***************************** Search **********************************
+    # ***********************************************************************
+    # Specific form entries search
+    url(r'^search/(?P<form_entry_id>\d+)/$',
+        view=search_saved_form_data_entries,
+        name='fobi.contrib.plugins.form_handlers.db_store.'
+             'search_saved_form_data_entries'),
+
+    # Form entries search
+    url(r'^search/$',
+        view=search_saved_form_data_entries,
+        name='fobi.contrib.plugins.form_handlers.db_store.'
+             'search_saved_form_data_entries'),
+
     # ***********************************************************************
     # ***************************** Export **********************************
     # ***********************************************************************
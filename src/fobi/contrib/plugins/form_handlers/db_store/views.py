@@ -1,5 +1,10 @@
+import simplejson as json
+
 from django.contrib.auth.decorators import login_required
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.http import Http404, JsonResponse
 from django.template import RequestContext
+from django.utils.translation import ugettext
 
 # from fobi.decorators import permissions_required, SATISFY_ALL, SATISFY_ANY
 from .....base import (
@@ -9,9 +14,17 @@ from .....base import (
 
 from nine import versions
 
+from .....decorators import use_read_database
+from .....models import FormEntry
+
 from . import UID
 from .models import SavedFormDataEntry, SavedFormWizardDataEntry
-from .helpers import DataExporter
+from .helpers import (
+    DataExporter,
+    get_form_data_aggregates,
+    search_form_data_entries,
+)
+from .settings import SEARCH_MAX_RESULTS_PER_PAGE, SEARCH_RESULTS_PER_PAGE
 
 if versions.DJANGO_GTE_1_10:
     from django.shortcuts import render
@@ -24,7 +37,9 @@ __copyright__ = 'Copyright (c) 2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
 __all__ = (
     'view_saved_form_data_entries',
+    'view_saved_form_data_aggregates',
     'export_saved_form_data_entries',
+    'search_saved_form_data_entries',
     'view_saved_form_wizard_data_entries',
     'export_saved_form_wizard_data_entries',
 )
@@ -42,6 +57,7 @@ __all__ = (
 
 # @permissions_required(satisfy=SATISFY_ANY, perms=entries_permissions)
 @login_required
+@use_read_database
 def view_saved_form_data_entries(
         request, form_entry_id=None, theme=None,
         template_name='db_store/view_saved_form_data_entries.html'):
@@ -83,6 +99,7 @@ def view_saved_form_data_entries(
 
 
 @login_required
+@use_read_database
 def export_saved_form_data_entries(request, form_entry_id=None, theme=None):
     """Export saved form data entries.
 
@@ -102,12 +119,98 @@ def export_saved_form_data_entries(request, form_entry_id=None, theme=None):
 
     return data_exporter.graceful_export()
 
+
+@login_required
+@use_read_database
+def view_saved_form_data_aggregates(request, form_entry_id):
+    """View the aggregates of the saved form data (as JSON).
+
+    :param django.http.HttpRequest request:
+    :param int form_entry_id: Form ID.
+    :return django.http.JsonResponse:
+    """
+    try:
+        form_entry = FormEntry._default_manager.only('pk').get(
+            pk=form_entry_id,
+            user__pk=request.user.pk
+        )
+    except FormEntry.DoesNotExist:
+        raise Http404(ugettext("Form entry not found."))
+
+    return JsonResponse(get_form_data_aggregates(form_entry))
+
+
+@login_required
+@use_read_database
+def search_saved_form_data_entries(request, form_entry_id=None):
+    """Search the saved form data entries (as JSON).
+
+    GET parameters:
+
+    - ``q``: Search query (case insensitive; matches any part of any
+      value of the saved data).
+    - ``page``: Page number.
+    - ``per_page``: Number of entries per page.
+
+    :param django.http.HttpRequest request:
+    :param int form_entry_id: Form ID.
+    :return django.http.JsonResponse:
+    """
+    entries = SavedFormDataEntry._default_manager \
+        .filter(form_entry__user__pk=request.user.pk) \
+        .order_by('-pk')
+
+    if form_entry_id:
+        entries = entries.filter(form_entry__id=form_entry_id)
+
+    query = request.GET.get('q', '')
+    entries = search_form_data_entries(entries, query)
+
+    try:
+        per_page = int(request.GET.get('per_page', SEARCH_RESULTS_PER_PAGE))
+    except (TypeError, ValueError):
+        per_page = SEARCH_RESULTS_PER_PAGE
+    per_page = max(1, min(per_page, SEARCH_MAX_RESULTS_PER_PAGE))
+
+    paginator = Paginator(
+        entries.only('pk', 'form_entry', 'saved_data', 'created'),
+        per_page
+    )
+    try:
+        page = paginator.page(request.GET.get('page', 1))
+    except PageNotAnInteger:
+        page = paginator.page(1)
+    except EmptyPage:
+        page = paginator.page(paginator.num_pages)
+
+    results = []
+    for entry in page.object_list:
+        try:
+            data = json.loads(entry.saved_data or '{}')
+        except ValueError:
+            data = {}
+        results.append({
+            'id': entry.pk,
+            'form_entry': entry.form_entry_id,
+            'created': entry.created,
+            'data': data,
+        })
+
+    return JsonResponse({
+        'query': query,
+        'count': paginator.count,
+        'page': page.number,
+        'num_pages': paginator.num_pages,
+        'results': results,
+    })
+
 # *****************************************************************************
 # ************************ Form wizard handler views  *************************
 # *****************************************************************************
 
 
 @login_required
+@use_read_database
 def view_saved_form_wizard_data_entries(
         request, form_wizard_entry_id=None, theme=None,
         template_name='db_store/view_saved_form_wizard_data_entries.html'):
@@ -153,6 +256,7 @@ def view_saved_form_wizard_data_entries(
 
 
 @login_required
+@use_read_database
 def export_saved_form_wizard_data_entries(request,
                                           form_wizard_entry_id=None,
                                           theme=None):
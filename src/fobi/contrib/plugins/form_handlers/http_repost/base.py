@@ -1,24 +1,18 @@
 import logging
-import os
 
-import requests
-
-from django.conf import settings
 from django.template.loader import render_to_string
 from django.utils.translation import ugettext_lazy as _
 
-from six import PY3
-
 from .....base import (
     form_handler_plugin_registry,
     form_wizard_handler_plugin_registry,
     FormHandlerPlugin,
     FormWizardHandlerPlugin,
 )
-from .....helpers import extract_file_path
 
 from . import UID
 from .forms import HTTPRepostForm
+from .helpers import close_files, http_repost, prepare_files
 
 __title__ = 'fobi.contrib.plugins.form_handlers.http_repost.base'
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
@@ -46,6 +40,7 @@ class HTTPRepostHandlerPlugin(FormHandlerPlugin):
     uid = UID
     name = _("HTTP Repost")
     form = HTTPRepostForm
+    io_bound = True
 
     def run(self, form_entry, request, form, form_element_entries=None):
         """Run.
@@ -58,8 +53,10 @@ class HTTPRepostHandlerPlugin(FormHandlerPlugin):
             ``fobi.models.FormElementEntry`` objects.
         """
         files = self._prepare_files(request, form)
-
-        return self.do_http_repost(request, files)
+        try:
+            return self.do_http_repost(request, files)
+        finally:
+            close_files(files)
 
     def do_http_repost(self, request, files):
         """Re-post data via HTTP.
@@ -67,12 +64,10 @@ class HTTPRepostHandlerPlugin(FormHandlerPlugin):
         Might be used in integration plugins.
         """
         try:
-            response = requests.post(
+            response = http_repost(
                 self.data.endpoint_url,
                 data=request.POST.dict(),
-                files=files,
-                allow_redirects=True,
-                timeout=5
+                files=files
             )
             return True, response
         except Exception as err:
@@ -80,29 +75,13 @@ class HTTPRepostHandlerPlugin(FormHandlerPlugin):
             return False, err
 
     def _prepare_files(self, request, form):
-        """Prepares the files for being attached to the mail message."""
-        files = {}
-
-        def process_path(file_path, imf):
-            if file_path:
-                # if file_path.startswith(settings.MEDIA_URL):
-                #     file_path = file_path[1:]
-                # file_path = settings.PROJECT_DIR('../{0}'.format(file_path))
-                file_path = file_path.replace(
-                    settings.MEDIA_URL,
-                    os.path.join(settings.MEDIA_ROOT, '')
-                )
-                files[field_name] = (imf.name, open(file_path, 'rb'))
-
-        for field_name, imf in request.FILES.items():
-            try:
-                file_path = form.cleaned_data.get(field_name, '')
-                process_path(file_path, imf)
-            except Exception as err:
-                file_path = extract_file_path(imf.name)
-                process_path(file_path, imf)
-
-        return files
+        """Prepares the files for being reposted."""
+        filenames = dict(
+            (field_name, imf.name)
+            for field_name, imf
+            in request.FILES.items()
+        )
+        return prepare_files([form], filenames=filenames)
 
     def plugin_data_repr(self):
         """Human readable representation of plugin data.
@@ -133,6 +112,7 @@ class HTTPRepostWizardHandlerPlugin(FormWizardHandlerPlugin):
     uid = UID
     name = _("HTTP Repost")
     form = HTTPRepostForm
+    io_bound = True
 
     def run(self, form_wizard_entry, request, form_list, form_wizard,
             form_element_entries=None):
@@ -149,43 +129,26 @@ class HTTPRepostWizardHandlerPlugin(FormWizardHandlerPlugin):
         """
         files = self._prepare_files(request, form_list)
         try:
-            response = requests.post(
+            response = http_repost(
                 self.data.endpoint_url,
                 data=request.POST.dict(),
-                files=files,
-                allow_redirects=True,
-                timeout=5
+                files=files
             )
             return (True, response)
         except Exception as err:
             logger.debug(str(err))
             return (False, err)
+        finally:
+            close_files(files)
 
     def _prepare_files(self, request, form_list):
-        """Prepares the files for being attached to the mail message."""
-        files = {}
-
-        def process_path(file_path, imf):
-            if file_path:
-                # if file_path.startswith(settings.MEDIA_URL):
-                #     file_path = file_path[1:]
-                # file_path = settings.PROJECT_DIR('../{0}'.format(file_path))
-                file_path = file_path.replace(
-                    settings.MEDIA_URL,
-                    os.path.join(settings.MEDIA_ROOT, '')
-                )
-                files[field_name] = (imf.name, open(file_path, 'rb'))
-
-        for form in form_list:
-            for field_name, imf in request.FILES.items():
-                try:
-                    file_path = form.cleaned_data.get(field_name, '')
-                    process_path(file_path, imf)
-                except Exception as err:
-                    file_path = extract_file_path(imf.name)
-                    process_path(file_path, imf)
-
-        return files
+        """Prepares the files for being reposted."""
+        filenames = dict(
+            (field_name, imf.name)
+            for field_name, imf
+            in request.FILES.items()
+        )
+        return prepare_files(form_list, filenames=filenames)
 
     def plugin_data_repr(self):
         """Human readable representation of plugin data.
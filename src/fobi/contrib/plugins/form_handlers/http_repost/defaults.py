@@ -0,0 +1,41 @@
+__title__ = 'fobi.contrib.plugins.form_handlers.http_repost.defaults'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = (
+    'BACKOFF_FACTOR',
+    'CIRCUIT_BREAKER_RESET_TIMEOUT',
+    'CIRCUIT_BREAKER_THRESHOLD',
+    'MAX_RETRIES',
+    'POOL_MAXSIZE',
+    'RETRY_STATUSES',
+    'TIMEOUT',
+)
+
+# Timeout of the repost request (in seconds).
+TIMEOUT = 5
+
+# Max number of retries of the repost request. Requests are retried on
+# connection errors (request not sent) and on the response statuses listed
+# in ``RETRY_STATUSES`` only.
+MAX_RETRIES = 3
+
+# Retries are made after 0, 2 * BACKOFF_FACTOR, 4 * BACKOFF_FACTOR, ...
+# seconds.
+BACKOFF_FACTOR = 0.5
+
+# Response statuses the (POST) repost requests are retried on. By default,
+# 503 only (request refused, not processed). Gateways may respond with 502
+# or 504 after the endpoint has processed the request, so adding those may
+# duplicate the reposts.
+RETRY_STATUSES = (503,)
+
+# Max number of (keep-alive) connections kept per endpoint host.
+POOL_MAXSIZE = 10
+
+# Number of consecutive failures after which the endpoint host is no longer
+# requested (the circuit is open) for ``CIRCUIT_BREAKER_RESET_TIMEOUT``
+# seconds. Set to 0 to disable.
+CIRCUIT_BREAKER_THRESHOLD = 5
+
+CIRCUIT_BREAKER_RESET_TIMEOUT = 60
@@ -0,0 +1,274 @@
+import logging
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from six.moves.urllib.parse import urlsplit
+
+from django.core.files.base import File
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import UploadedFile
+
+from .....helpers import get_file_field_values, get_storage_name
+
+from .settings import (
+    BACKOFF_FACTOR,
+    CIRCUIT_BREAKER_RESET_TIMEOUT,
+    CIRCUIT_BREAKER_THRESHOLD,
+    MAX_RETRIES,
+    POOL_MAXSIZE,
+    RETRY_STATUSES,
+    TIMEOUT,
+)
+
+try:
+    from urllib3.util.retry import Retry
+except ImportError:
+    from requests.packages.urllib3.util.retry import Retry
+
+__title__ = 'fobi.contrib.plugins.form_handlers.http_repost.helpers'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = (
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'close_files',
+    'get_circuit_breaker',
+    'get_session',
+    'http_repost',
+    'prepare_files',
+)
+
+logger = logging.getLogger(__name__)
+
+_SESSIONS = {}
+_CIRCUIT_BREAKERS = {}
+_LOCK = threading.Lock()
+
+
+class CircuitOpenError(Exception):
+    """Raised when the endpoint host is not requested (circuit is open)."""
+
+
+class CircuitBreaker(object):
+    """Circuit breaker of the endpoint host.
+
+    After ``threshold`` consecutive failures the circuit is open and the
+    host is no longer requested for ``reset_timeout`` seconds. After that,
+    a single (trial) request is let through. The circuit closes on its
+    success and opens again on its failure.
+    """
+
+    def __init__(self, threshold=CIRCUIT_BREAKER_THRESHOLD,
+                 reset_timeout=CIRCUIT_BREAKER_RESET_TIMEOUT):
+        """Constructor.
+
+        :param int threshold: Number of consecutive failures. If 0, the
+            circuit never opens.
+        :param int reset_timeout: Number of seconds the circuit stays open.
+        """
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    def allow_request(self):
+        """Check if the host may be requested.
+
+        :return bool:
+        """
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.time() - self.opened_at >= self.reset_timeout:
+                # Let a single trial request through.
+                self.opened_at = time.time()
+                return True
+            return False
+
+    def record_success(self):
+        """Record success."""
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        """Record failure."""
+        with self.lock:
+            self.failures += 1
+            if self.threshold and self.failures >= self.threshold:
+                self.opened_at = time.time()
+
+
+def _get_host(url):
+    """Get the scheme and host of the URL.
+
+    :param str url:
+    :return str:
+    """
+    parts = urlsplit(url)
+    return '{0}://{1}'.format(parts.scheme, parts.netloc)
+
+
+def _get_retry():
+    """Get the retry configuration of the sessions.
+
+    Only connection errors (request not sent) and the ``RETRY_STATUSES``
+    (503 by default) are retried, since the POST requests are not
+    idempotent. Read errors (request possibly processed) are never retried.
+
+    :return urllib3.util.retry.Retry:
+    """
+    kwargs = {
+        'total': MAX_RETRIES,
+        'connect': MAX_RETRIES,
+        'read': 0,
+        'status': MAX_RETRIES,
+        'backoff_factor': BACKOFF_FACTOR,
+        'status_forcelist': RETRY_STATUSES,
+        'raise_on_status': False,
+    }
+    methods = frozenset(['GET', 'HEAD', 'OPTIONS', 'POST', 'PUT'])
+    try:
+        return Retry(allowed_methods=methods, **kwargs)
+    except TypeError:
+        # urllib3 < 1.26
+        return Retry(method_whitelist=methods, **kwargs)
+
+
+def get_session(url):
+    """Get the (shared) session of the endpoint host.
+
+    Sessions keep the connections to the host alive (pooled) and retry the
+    failed requests.
+
+    :param str url: Endpoint URL.
+    :return requests.Session:
+    """
+    host = _get_host(url)
+    session = _SESSIONS.get(host)
+    if session is None:
+        with _LOCK:
+            session = _SESSIONS.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1,
+                                      pool_maxsize=POOL_MAXSIZE,
+                                      max_retries=_get_retry())
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _SESSIONS[host] = session
+    return session
+
+
+def get_circuit_breaker(url):
+    """Get the circuit breaker of the endpoint host.
+
+    :param str url: Endpoint URL.
+    :return CircuitBreaker:
+    """
+    host = _get_host(url)
+    circuit_breaker = _CIRCUIT_BREAKERS.get(host)
+    if circuit_breaker is None:
+        with _LOCK:
+            circuit_breaker = _CIRCUIT_BREAKERS.setdefault(host,
+                                                           CircuitBreaker())
+    return circuit_breaker
+
+
+def http_repost(url, data, files=None, timeout=TIMEOUT):
+    """Post the data to the endpoint.
+
+    Connection errors and server errors (5xx) count as failures of the
+    endpoint host.
+
+    :param str url: Endpoint URL.
+    :param dict data:
+    :param dict files:
+    :param int timeout: Timeout (in seconds).
+    :return requests.Response:
+    :raise CircuitOpenError: If the endpoint host is not requested.
+    """
+    circuit_breaker = get_circuit_breaker(url)
+    if not circuit_breaker.allow_request():
+        raise CircuitOpenError(
+            "Requests to {0} are suspended.".format(_get_host(url))
+        )
+
+    try:
+        response = get_session(url).post(url,
+                                         data=data,
+                                         files=files,
+                                         allow_redirects=True,
+                                         timeout=timeout)
+    except Exception:
+        circuit_breaker.record_failure()
+        raise
+
+    if response.status_code >= 500:
+        circuit_breaker.record_failure()
+    else:
+        circuit_breaker.record_success()
+    return response
+
+
+def prepare_files(forms, filenames=None, storage=None):
+    """Prepare the files of the forms for being reposted.
+
+    Stored files are opened (for reading) from the storage. The files
+    should be closed (see ``close_files``) after the request is made.
+
+    :param iterable forms: List of ``django.forms.Form`` instances.
+    :param dict filenames: Original filenames (field name as key).
+    :param django.core.files.storage.Storage storage: Defaults to the
+        ``default_storage``.
+    :return dict: Files (field name as key) as expected by ``requests``.
+    """
+    if storage is None:
+        storage = default_storage
+    if filenames is None:
+        filenames = {}
+
+    files = {}
+    for form in forms:
+        for field_name, value in get_file_field_values(form):
+            try:
+                if isinstance(value, File):
+                    value.seek(0)
+                    name = value.name
+                    _file = value
+                else:
+                    name = get_storage_name(value, storage)
+                    if not name:
+                        continue
+                    _file = storage.open(name, 'rb')
+            except Exception as err:
+                logger.debug(str(err))
+                continue
+
+            files[field_name] = (
+                filenames.get(field_name) or os.path.basename(name),
+                _file
+            )
+
+    return files
+
+
+def close_files(files):
+    """Close the files prepared by ``prepare_files``.
+
+    :param dict files:
+    """
+    for _name, _file in files.values():
+        # Uploaded files are closed along with the request.
+        if isinstance(_file, UploadedFile):
+            continue
+        try:
+            _file.close()
+        except Exception as err:
+            logger.debug(str(err))
@@ -0,0 +1,38 @@
+"""
+- ``TIMEOUT`` (int)
+- ``MAX_RETRIES`` (int)
+- ``BACKOFF_FACTOR`` (float)
+- ``RETRY_STATUSES`` (tuple)
+- ``POOL_MAXSIZE`` (int)
+- ``CIRCUIT_BREAKER_THRESHOLD`` (int)
+- ``CIRCUIT_BREAKER_RESET_TIMEOUT`` (int)
+"""
+from .conf import get_setting
+
+__title__ = 'fobi.contrib.plugins.form_handlers.http_repost.settings'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = (
+    'BACKOFF_FACTOR',
+    'CIRCUIT_BREAKER_RESET_TIMEOUT',
+    'CIRCUIT_BREAKER_THRESHOLD',
+    'MAX_RETRIES',
+    'POOL_MAXSIZE',
+    'RETRY_STATUSES',
+    'TIMEOUT',
+)
+
+TIMEOUT = get_setting('TIMEOUT')
+
+MAX_RETRIES = get_setting('MAX_RETRIES')
+
+BACKOFF_FACTOR = get_setting('BACKOFF_FACTOR')
+
+RETRY_STATUSES = get_setting('RETRY_STATUSES')
+
+POOL_MAXSIZE = get_setting('POOL_MAXSIZE')
+
+CIRCUIT_BREAKER_THRESHOLD = get_setting('CIRCUIT_BREAKER_THRESHOLD')
+
+CIRCUIT_BREAKER_RESET_TIMEOUT = get_setting('CIRCUIT_BREAKER_RESET_TIMEOUT')
@@ -1,10 +1,6 @@
 from __future__ import absolute_import
 
-import datetime
-from mimetypes import guess_type
-import os
-
-from six import string_types, PY3
+from six import string_types
 
 from django.conf import settings
 from django.template.loader import render_to_string
@@ -18,13 +14,12 @@ from .....base import (
 )
 from .....helpers import (
     safe_text,
-    extract_file_path,
     get_form_element_entries_for_form_wizard_entry,
 )
 
 from . import UID
 from .forms import MailForm
-from .helpers import send_mail
+from .helpers import get_file_field_values, prepare_attachments, send_mail
 from .mixins import MailHandlerMixin
 from .settings import MULTI_EMAIL_FIELD_VALUE_SPLITTER
 
@@ -52,6 +47,7 @@ class MailHandlerPlugin(FormHandlerPlugin, MailHandlerMixin):
     uid = UID
     name = _("Mail")
     form = MailForm
+    io_bound = True
 
     def run(self, form_entry, request, form, form_element_entries=None):
         """Run.
@@ -119,6 +115,7 @@ class MailWizardHandlerPlugin(FormWizardHandlerPlugin):
     uid = UID
     name = _("Mail")
     form = MailForm
+    io_bound = True
 
     def run(self, form_wizard_entry, request, form_list, form_wizard,
             form_element_entries=None):
@@ -188,40 +185,16 @@ class MailWizardHandlerPlugin(FormWizardHandlerPlugin):
 
     def _prepare_files(self, request, form_list):
         """Prepares the files for being attached to the mail message."""
-        files = {}
-
-        def process_path(file_path, imf):
-            """Processes the file path and the file."""
-            if file_path:
-                # if file_path.startswith(settings.MEDIA_URL):
-                #     file_path = file_path[1:]
-                # file_path = settings.PROJECT_DIR('../{0}'.format(file_path))
-                file_path = file_path.replace(
-                    settings.MEDIA_URL,
-                    os.path.join(settings.MEDIA_ROOT, '')
-                )
-                mime_type = guess_type(imf.name)
-                if PY3:
-                    imf_chunks = b''.join([c for c in imf.chunks()])
-                else:
-                    imf_chunks = ''.join([c for c in imf.chunks()])
-
-                files[field_name] = (
-                    imf.name,
-                    imf_chunks,
-                    mime_type[0] if mime_type else ''
-                )
-
+        filenames = dict(
+            (field_name, imf.name)
+            for field_name, imf
+            in request.FILES.items()
+        )
+        file_field_values = []
         for form in form_list:
-            for field_name, imf in request.FILES.items():
-                try:
-                    file_path = form.cleaned_data.get(field_name, '')
-                    process_path(file_path, imf)
-                except Exception as err:
-                    file_path = extract_file_path(imf.name)
-                    process_path(file_path, imf)
-
-        return files
+            file_field_values += get_file_field_values(form)
+
+        return prepare_attachments(file_field_values, filenames=filenames)
 
     def plugin_data_repr(self):
         """Human readable representation of plugin data.
@@ -3,10 +3,17 @@ __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
 __all__ = (
+    'ATTACHMENT_MAX_SIZE',
+    'ATTACHMENTS_MAX_TOTAL_SIZE',
     'AUTO_MAIL_BODY',
     'AUTO_MAIL_FROM',
     'AUTO_MAIL_SUBJECT',
     'AUTO_MAIL_TO',
+    'BATCH_INTERVAL',
+    'BATCH_SIZE',
+    'DELIVERY_MODE',
+    'DELIVERY_MODE_BATCHED',
+    'DELIVERY_MODE_IMMEDIATE',
     'MULTI_EMAIL_FIELD_VALUE_SPLITTER',
 )
 
@@ -16,3 +23,29 @@ AUTO_MAIL_TO = []
 AUTO_MAIL_SUBJECT = 'Automatic email'
 AUTO_MAIL_BODY = 'Automatic email'
 AUTO_MAIL_FROM = ''
+
+# Files larger than given (in bytes) are not attached to the mail message
+# (they are still referred to by URL in the message body).
+ATTACHMENT_MAX_SIZE = 5 * 1024 * 1024
+
+# Max size of all attachments of a single mail message (in bytes).
+ATTACHMENTS_MAX_TOTAL_SIZE = 10 * 1024 * 1024
+
+# Mail messages are sent right away (over a shared connection).
+DELIVERY_MODE_IMMEDIATE = 'immediate'
+
+# Mail messages are queued and sent in batches (over a shared connection).
+# The queue is kept in the memory of the process, thus meant for
+# long-running processes only (messages still queued are lost when a web
+# server worker is killed or recycled).
+DELIVERY_MODE_BATCHED = 'batched'
+
+# Messages are sent right away (in the request) by default.
+DELIVERY_MODE = DELIVERY_MODE_IMMEDIATE
+
+# Max number of messages in the queue (batched mode). When reached, the
+# queue is sent right away.
+BATCH_SIZE = 50
+
+# Max number of seconds a message waits in the queue (batched mode).
+BATCH_INTERVAL = 5
@@ -1,13 +1,237 @@
 from __future__ import absolute_import
 
+import atexit
+import logging
+from mimetypes import guess_type
+import os
+import threading
+
+from six import string_types
+
+from django.core.files.base import File
+from django.core.files.storage import default_storage
 from django.core.mail import get_connection
 from django.core.mail.message import EmailMultiAlternatives
 
+from .....helpers import get_file_field_values, get_storage_name
+
+from .defaults import DELIVERY_MODE_BATCHED
+from .settings import (
+    ATTACHMENT_MAX_SIZE,
+    ATTACHMENTS_MAX_TOTAL_SIZE,
+    BATCH_INTERVAL,
+    BATCH_SIZE,
+    DELIVERY_MODE,
+)
+
 __title__ = 'fobi.contrib.plugins.form_handlers.mail.helpers'
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
-__all__ = ('send_mail',)
+__all__ = (
+    'get_delivery_metrics',
+    'get_file_field_values',
+    'get_mail_dispatcher',
+    'MailDispatcher',
+    'prepare_attachments',
+    'send_mail',
+)
+
+logger = logging.getLogger(__name__)
+
+
+class MailDispatcher(object):
+    """Sends mail messages over a shared connection.
+
+    The connection is opened once and then reused by all the messages sent
+    (by all handlers, in all threads). A connection dropped by the server
+    is re-opened once before giving up.
+
+    In the batched mode the messages are queued and sent together, either
+    when ``batch_size`` messages are queued or ``batch_interval`` seconds
+    after the first message was queued - whichever comes first. Errors of
+    the batched delivery are logged (the submission has been already
+    handled by then).
+
+    The queue lives in the memory of the process. The batched mode is
+    therefore meant for long-running processes only (such as workers of a
+    task queue); web server workers may be killed or recycled with messages
+    still queued. On a normal exit the queue is flushed (see ``shutdown``),
+    but a killed process loses it.
+    """
+
+    def __init__(self, delivery_mode=DELIVERY_MODE, batch_size=BATCH_SIZE,
+                 batch_interval=BATCH_INTERVAL, connection=None):
+        """Constructor.
+
+        :param str delivery_mode: Either "immediate" or "batched".
+        :param int batch_size: Max number of queued messages.
+        :param int batch_interval: Max number of seconds a message is queued.
+        :param connection: Email backend instance. If not given, one
+            is obtained using ``django.core.mail.get_connection``.
+        """
+        self.batched = delivery_mode == DELIVERY_MODE_BATCHED
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.connection = connection
+        self.queue = []
+        self.timer = None
+        self.lock = threading.RLock()
+        self.metrics = {
+            'connections_opened': 0,
+            'batches_sent': 0,
+            'messages_sent': 0,
+            'messages_failed': 0,
+            'messages_queued': 0,
+        }
+
+    def get_connection(self):
+        """Get the (open) shared connection."""
+        if self.connection is None:
+            self.connection = get_connection(fail_silently=False)
+        if self.connection.open():
+            self.metrics['connections_opened'] += 1
+        return self.connection
+
+    def close(self):
+        """Close the shared connection."""
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except Exception as err:
+                logger.debug(err)
+
+    def send_messages(self, messages):
+        """Send the messages over the shared connection.
+
+        :param list messages: List of ``EmailMessage`` instances.
+        :return int: Number of messages sent.
+        """
+        if not messages:
+            return 0
+
+        with self.lock:
+            try:
+                sent = self.get_connection().send_messages(messages)
+            except Exception as err:
+                # The server might have dropped the connection; try once
+                # again over a fresh one.
+                logger.debug(err)
+                self.close()
+                try:
+                    sent = self.get_connection().send_messages(messages)
+                except Exception:
+                    self.close()
+                    self.metrics['messages_failed'] += len(messages)
+                    raise
+
+            sent = sent or 0
+            self.metrics['batches_sent'] += 1
+            self.metrics['messages_sent'] += sent
+            self.metrics['messages_failed'] += len(messages) - sent
+            return sent
+
+    def send(self, message):
+        """Send (or queue, in the batched mode) the message.
+
+        :param django.core.mail.EmailMessage message:
+        :return int: Number of messages sent (queued messages are counted
+            as sent).
+        """
+        if not self.batched:
+            return self.send_messages([message])
+
+        with self.lock:
+            self.queue.append(message)
+            self.metrics['messages_queued'] += 1
+            if len(self.queue) >= self.batch_size:
+                self.flush()
+            elif self.timer is None:
+                self.timer = threading.Timer(self.batch_interval, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+        return 1
+
+    def flush(self):
+        """Send all the queued messages.
+
+        :return int: Number of messages sent.
+        """
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            messages, self.queue = self.queue, []
+
+        try:
+            return self.send_messages(messages)
+        except Exception as err:
+            logger.error(
+                "Failed to send %s queued mail messages: %s",
+                len(messages),
+                err
+            )
+            return 0
+
+    def shutdown(self):
+        """Send all the queued messages on exit.
+
+        The number of messages which could not be sent is logged.
+
+        :return int: Number of messages not sent.
+        """
+        with self.lock:
+            queued = len(self.queue)
+            if not queued:
+                return 0
+            unsent = queued - self.flush()
+
+        if unsent:
+            logger.warning(
+                "%s of %s queued mail messages were not sent on shutdown.",
+                unsent,
+                queued
+            )
+        return unsent
+
+    def get_metrics(self):
+        """Get delivery metrics.
+
+        :return dict:
+        """
+        with self.lock:
+            metrics = dict(self.metrics)
+            metrics['messages_pending'] = len(self.queue)
+        return metrics
+
+
+_DISPATCHER = None
+_DISPATCHER_LOCK = threading.Lock()
+
+
+def get_mail_dispatcher():
+    """Get the shared mail dispatcher.
+
+    :return fobi.contrib.plugins.form_handlers.mail.helpers.MailDispatcher:
+    """
+    global _DISPATCHER
+    if _DISPATCHER is None:
+        with _DISPATCHER_LOCK:
+            if _DISPATCHER is None:
+                _DISPATCHER = MailDispatcher()
+                # Do not lose the queued messages on (normal) exit. A
+                # killed process loses them anyway.
+                atexit.register(_DISPATCHER.shutdown)
+    return _DISPATCHER
+
+
+def get_delivery_metrics():
+    """Get delivery metrics of the shared mail dispatcher.
+
+    :return dict: Numbers of connections opened, batches sent, messages
+        sent, failed, queued and pending.
+    """
+    return get_mail_dispatcher().get_metrics()
 
 
 def send_mail(subject, message, from_email, recipient_list,
@@ -21,16 +245,106 @@ def send_mail(subject, message, from_email, recipient_list,
     If auth_user is None, the EMAIL_HOST_USER setting is used.
     If auth_password is None, the EMAIL_HOST_PASSWORD setting is used.
 
+    Unless a connection or credentials are given, the message is sent by
+    the shared mail dispatcher (see ``get_mail_dispatcher``).
+
     Note: The API for this method is frozen. New code wanting to extend the
     functionality should use the EmailMessage class directly.
     """
-    connection = connection or get_connection(username=auth_user,
-                                              password=auth_password,
-                                              fail_silently=fail_silently)
+    use_dispatcher = connection is None \
+        and auth_user is None \
+        and auth_password is None
+
+    if not use_dispatcher:
+        connection = connection or get_connection(username=auth_user,
+                                                  password=auth_password,
+                                                  fail_silently=fail_silently)
     mail = EmailMultiAlternatives(subject, message, from_email, recipient_list,
                                   connection=connection,
                                   attachments=attachments)
     if html_message:
         mail.attach_alternative(html_message, 'text/html')
 
-    return mail.send()
+    if not use_dispatcher:
+        return mail.send()
+
+    if not mail.recipients():
+        return 0
+
+    try:
+        return get_mail_dispatcher().send(mail)
+    except Exception:
+        if not fail_silently:
+            raise
+        return 0
+
+
+def prepare_attachments(file_field_values, filenames=None, storage=None,
+                        max_size=ATTACHMENT_MAX_SIZE,
+                        max_total_size=ATTACHMENTS_MAX_TOTAL_SIZE):
+    """Prepare attachments of the mail message.
+
+    Each file is read (from the storage) once, straight into the
+    attachment. Files larger than `max_size` or not fitting into the
+    `max_total_size` are not attached (they are still referred to by URL
+    in the message body).
+
+    :param iterable file_field_values: List of (field name, value) tuples as
+        returned by ``get_file_field_values``.
+    :param dict filenames: Original filenames (field name as key).
+    :param django.core.files.storage.Storage storage: Defaults to the
+        ``default_storage``.
+    :param int max_size: Max size of a single attachment (in bytes).
+    :param int max_total_size: Max size of all attachments of the message
+        (in bytes).
+    :return dict: Attachments (field name as key) as expected by the
+        ``EmailMessage``.
+    """
+    if storage is None:
+        storage = default_storage
+    if filenames is None:
+        filenames = {}
+
+    attachments = {}
+    total_size = 0
+    for field_name, value in file_field_values:
+        try:
+            if isinstance(value, File):
+                size = value.size
+                name = value.name
+            elif isinstance(value, string_types):
+                name = get_storage_name(value, storage)
+                if not name:
+                    continue
+                size = storage.size(name)
+            else:
+                continue
+
+            if size > max_size or total_size + size > max_total_size:
+                logger.debug(
+                    "File %s (%s bytes) is too large to be attached.",
+                    name,
+                    size
+                )
+                continue
+
+            if isinstance(value, File):
+                value.seek(0)
+                content = value.read()
+            else:
+                with storage.open(name, 'rb') as _file:
+                    content = _file.read()
+        except Exception as err:
+            logger.debug(str(err))
+            continue
+
+        total_size += size
+        filename = filenames.get(field_name) or os.path.basename(name)
+        mime_type = guess_type(filename)
+        attachments[field_name] = (
+            filename,
+            content,
+            mime_type[0] if mime_type else ''
+        )
+
+    return attachments
@@ -2,16 +2,14 @@
 from __future__ import absolute_import, unicode_literals
 
 import datetime
-from mimetypes import guess_type
-import os
 
-from six import string_types, PY3
+from six import string_types
 
 from django.conf import settings
 
-from .....helpers import extract_file_path, safe_text
+from .....helpers import safe_text
 
-from .helpers import send_mail
+from .helpers import get_file_field_values, prepare_attachments, send_mail
 from .settings import MULTI_EMAIL_FIELD_VALUE_SPLITTER
 
 __title__ = 'fobi.contrib.plugins.form_handlers.mail.mixins'
@@ -100,35 +98,10 @@ class MailHandlerMixin(object):
 
     def _prepare_files(self, request, form):
         """Prepares the files for being attached to the mail message."""
-        files = {}
-
-        def process_path(file_path, imf):
-            """Processes the file path and the file."""
-            if file_path:
-                # if file_path.startswith(settings.MEDIA_URL):
-                #     file_path = file_path[1:]
-                # file_path = settings.PROJECT_DIR('../{0}'.format(file_path))
-                file_path = file_path.replace(
-                    settings.MEDIA_URL,
-                    os.path.join(settings.MEDIA_ROOT, '')
-                )
-                mime_type = guess_type(imf.name)
-                if PY3:
-                    imf_chunks = b''.join([c for c in imf.chunks()])
-                else:
-                    imf_chunks = str('').join([c for c in imf.chunks()])
-                files[field_name] = (
-                    imf.name,
-                    imf_chunks,
-                    mime_type[0] if mime_type else ''
-                )
-
-        for field_name, imf in request.FILES.items():
-            try:
-                file_path = form.cleaned_data.get(field_name, '')
-                process_path(file_path, imf)
-            except Exception as err:
-                file_path = extract_file_path(imf.name)
-                process_path(file_path, imf)
-
-        return files
+        filenames = dict(
+            (field_name, imf.name)
+            for field_name, imf
+            in request.FILES.items()
+        )
+        return prepare_attachments(get_file_field_values(form),
+                                   filenames=filenames)
@@ -5,10 +5,15 @@ __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
 __all__ = (
+    'ATTACHMENT_MAX_SIZE',
+    'ATTACHMENTS_MAX_TOTAL_SIZE',
     'AUTO_MAIL_BODY',
     'AUTO_MAIL_FROM',
     'AUTO_MAIL_SUBJECT',
     'AUTO_MAIL_TO',
+    'BATCH_INTERVAL',
+    'BATCH_SIZE',
+    'DELIVERY_MODE',
     'MULTI_EMAIL_FIELD_VALUE_SPLITTER',
 )
 
@@ -31,3 +36,13 @@ AUTO_MAIL_BODY = get_setting(
 AUTO_MAIL_FROM = get_setting(
     'AUTO_MAIL_FROM'
 )
+
+ATTACHMENT_MAX_SIZE = get_setting('ATTACHMENT_MAX_SIZE')
+
+ATTACHMENTS_MAX_TOTAL_SIZE = get_setting('ATTACHMENTS_MAX_TOTAL_SIZE')
+
+DELIVERY_MODE = get_setting('DELIVERY_MODE')
+
+BATCH_SIZE = get_setting('BATCH_SIZE')
+
+BATCH_INTERVAL = get_setting('BATCH_INTERVAL')
@@ -29,6 +29,9 @@ class Bootstrap3Theme(BaseTheme):
         'bootstrap3/js/bootstrap.min.js',
         'js/jquery.slugify.js',
         'js/fobi.core.js',
+        'js/fobi.remote_select.js',
+        'js/fobi.direct_upload.js',
+        'js/fobi.builder.js',
         'bootstrap3/js/bootstrap3_fobi_extras.js',  # Theme-specific scripts
     )
 
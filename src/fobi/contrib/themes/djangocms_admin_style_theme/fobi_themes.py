@@ -31,6 +31,9 @@ class DjangoCMSAdminStyleTheme(BaseTheme):
         'jquery-ui/js/jquery-ui-1.10.4.custom.min.js',
         'js/jquery.slugify.js',
         'js/fobi.core.js',
+        'js/fobi.remote_select.js',
+        'js/fobi.direct_upload.js',
+        'js/fobi.builder.js',
         # 'js/fobi.simple.js',
     )
 
@@ -150,8 +153,10 @@ class DjangoCMSAdminStyleTheme(BaseTheme):
         return """
             <ul class="{container_class}">
               {edit_option_html}
-              <li><a href="{delete_url}" class="{delete_option_class}">
-                <span>{delete_text}</span></a>
+              <li>
+                <a href="{delete_url}"
+                   class="{delete_option_class} fobi-delete-form-element-entry">
+                  <span>{delete_text}</span></a>
               </li>
             </ul>
             <input type="hidden" value="{form_element_position}"
@@ -42,6 +42,9 @@ class Foundation5Theme(BaseTheme):
         # 'foundation5/js/foundation_template-4.js', # Foundation Template 4
         'foundation5/js/foundation.min.js',
         'js/fobi.core.js',
+        'js/fobi.remote_select.js',
+        'js/fobi.direct_upload.js',
+        'js/fobi.builder.js',
         'js/jquery.slugify.js',
         'foundation5/js/foundation5_fobi_extras.js',  # Theme specific scripts
     )
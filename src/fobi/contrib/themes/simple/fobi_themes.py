@@ -30,6 +30,9 @@ class SimpleTheme(BaseTheme):
         'jquery-ui/js/jquery-ui-1.10.4.custom.min.js',
         'js/jquery.slugify.js',
         'js/fobi.core.js',
+        'js/fobi.remote_select.js',
+        'js/fobi.direct_upload.js',
+        'js/fobi.builder.js',
         # 'js/fobi.simple.js',
     )
 
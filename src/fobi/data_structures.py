@@ -16,33 +16,84 @@ class SortableDict(dict):
     inserted. Very similar to (and partly based on) ``SortedDict`` of
     the ``Django``, but has several additional methods implemented,
     such as: ``insert_before_key`` and ``insert_after_key``.
+
+    Keys are kept in a doubly linked list (same as in the pure Python
+    implementation of the ``collections.OrderedDict``), thus setting,
+    deleting, inserting before/after a key and moving the keys take a
+    constant time. Only the operations addressing the keys by index
+    (``insert`` and ``value_for_index``) take a linear time (of the index).
     """
 
     def __new__(cls, *args, **kwargs):
         """New."""
         instance = super(SortableDict, cls).__new__(cls, *args, **kwargs)
-        instance.key_order = []
+        instance._init_links()
         return instance
 
     def __init__(self, data=None):
         """Constructor."""
-        if data is None or isinstance(data, dict):
-            data = data or []
-            super(SortableDict, self).__init__(data)
-            self.key_order = list(data) if data else []
+        super(SortableDict, self).__init__()
+        self._init_links()
+        if data is None:
+            return
+        if isinstance(data, dict):
+            data = six.iteritems(data)
+        for key, value in data:
+            # Take the ordering from first key, but override with last
+            # value in data (dict() does this)
+            self[key] = value
+
+    def _init_links(self):
+        """Initialise the (empty) linked list of keys."""
+        # Sentinel node of the circular doubly linked list. Nodes are
+        # [previous node, next node, key] lists.
+        self._root = root = []
+        root[:] = [root, root, None]
+        # Nodes by key
+        self._nodes = {}
+
+    def _link_before(self, node, key):
+        """Link the key before the node given."""
+        prev = node[0]
+        self._nodes[key] = prev[1] = node[0] = [prev, node, key]
+
+    def _unlink(self, key):
+        """Unlink the key."""
+        prev, next_, _key = self._nodes.pop(key)
+        prev[1] = next_
+        next_[0] = prev
+
+    def _get_node(self, index):
+        """Get the node at the given (zero-based, non-negative) index.
+
+        :param int index:
+        :return list: The root node if the index is out of range.
+        """
+        root = self._root
+        size = len(self._nodes)
+        if index >= size:
+            return root
+        if index < size // 2:
+            node = root[1]
+            for _i in range(index):
+                node = node[1]
         else:
-            super(SortableDict, self).__init__()
-            super_set = super(SortableDict, self).__setitem__
-            for key, value in data:
-                # Take the ordering from first key
-                if key not in self:
-                    self.key_order.append(key)
-                # But override with last value in data (dict() does this)
-                super_set(key, value)
+            node = root[0]
+            for _i in range(size - index - 1):
+                node = node[0]
+        return node
+
+    @property
+    def key_order(self):
+        """List of keys in their order."""
+        return list(self)
+
+    def __reduce__(self):
+        return self.__class__, (list(self._iteritems()),)
 
     def __deepcopy__(self, memo):
         return self.__class__([(key, copy.deepcopy(value, memo))
-                               for key, value in self.items()])
+                               for key, value in self._iteritems()])
 
     def __copy__(self):
         # The Python's default copy implementation will alter the state
@@ -52,47 +103,53 @@ class SortableDict(dict):
 
     def __setitem__(self, key, value):
         if key not in self:
-            self.key_order.append(key)
+            self._link_before(self._root, key)
         super(SortableDict, self).__setitem__(key, value)
 
     def __delitem__(self, key):
         super(SortableDict, self).__delitem__(key)
-        self.key_order.remove(key)
+        self._unlink(key)
 
     def __iter__(self):
-        return iter(self.key_order)
+        root = self._root
+        node = root[1]
+        while node is not root:
+            yield node[2]
+            node = node[1]
 
     def __reversed__(self):
-        return reversed(self.key_order)
+        root = self._root
+        node = root[0]
+        while node is not root:
+            yield node[2]
+            node = node[0]
 
     def pop(self, key, *args):
         """Pop."""
         result = super(SortableDict, self).pop(key, *args)
-        try:
-            self.key_order.remove(key)
-        except ValueError:
-            # Key wasn't in the dictionary in the first place. No problem.
-            pass
+        if key in self._nodes:
+            self._unlink(key)
         return result
 
     def popitem(self):
-        """Pop item."""
-        result = super(SortableDict, self).popitem()
-        self.key_order.remove(result[0])
-        return result
+        """Pop item (the last one)."""
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        key = self._root[0][2]
+        return key, self.pop(key)
 
     def _iteritems(self):
         """Iter items (internal method)."""
-        for key in self.key_order:
+        for key in self:
             yield key, self[key]
 
     def _iterkeys(self):
-        for key in self.key_order:
+        for key in self:
             yield key
 
     def _itervalues(self):
         """Iter values (internal method)."""
-        for key in self.key_order:
+        for key in self:
             yield self[key]
 
     if six.PY3:
@@ -105,13 +162,13 @@ class SortableDict(dict):
         itervalues = _itervalues
 
         def items(self):
-            return [(key, self[key]) for key in self.key_order]
+            return list(self._iteritems())
 
         def keys(self):
-            return self.key_order[:]
+            return list(self)
 
         def values(self):
-            return [self[key] for key in self.key_order]
+            return list(self._itervalues())
 
     def update(self, dict_):
         """Update."""
@@ -121,24 +178,41 @@ class SortableDict(dict):
     def setdefault(self, key, default):
         """Set default."""
         if key not in self:
-            self.key_order.append(key)
-        return super(SortableDict, self).setdefault(key, default)
+            self[key] = default
+        return self[key]
 
     def value_for_index(self, index):
         """Returns the value of the item at the given zero-based index."""
-        # This, and insert() are deprecated because they cannot be implemented
-        # using collections.OrderedDict (Python 2.7 and up), which we'll
-        # eventually switch to
-        return self[self.key_order[index]]
+        if index < 0:
+            index += len(self._nodes)
+        node = self._get_node(index)
+        if index < 0 or node is self._root:
+            raise IndexError("Index out of range.")
+        return self[node[2]]
 
     def insert(self, index, key, value):
         """Inserts the key, value pair before the item with the given index."""
-        if key in self.key_order:
-            num = self.key_order.index(key)
-            del self.key_order[num]
-            if num < index:
-                index -= 1
-        self.key_order.insert(index, key)
+        if key in self._nodes:
+            # Keys before the index given shift the index (only the first
+            # ``index`` nodes are walked through).
+            key_node = self._nodes[key]
+            root = self._root
+            node = root[1]
+            for _i in range(index):
+                if node is key_node:
+                    index -= 1
+                    break
+                if node is root:
+                    break
+                node = node[1]
+            self._unlink(key)
+        if index < 0:
+            index = max(index + len(self._nodes), 0)
+        self._insert_before_node(self._get_node(index), key, value)
+
+    def _insert_before_node(self, node, key, value):
+        """Insert the key, value pair before the node given."""
+        self._link_before(node, key)
         super(SortableDict, self).__setitem__(key, value)
 
     def copy(self):
@@ -153,12 +227,12 @@ class SortableDict(dict):
         in their sorted order.
         """
         return '{%s}' % ', '.join(['%r: %r' % (key, val)
-                                   for key, val in six.iteritems(self)])
+                                   for key, val in self._iteritems()])
 
     def clear(self):
         """Clear."""
         super(SortableDict, self).clear()
-        self.key_order = []
+        self._init_links()
 
     # *************************************************************************
     # ************************** Additional methods ***************************
@@ -176,9 +250,28 @@ class SortableDict(dict):
         :param int offset:
         :return bool:
         """
-        if target_key in self.key_order:
-            index = self.key_order.index(target_key) + offset
-            self.insert(index, key, value)
+        if target_key in self._nodes:
+            if key == target_key:
+                super(SortableDict, self).__setitem__(key, value)
+                return True
+
+            if key in self._nodes:
+                self._unlink(key)
+
+            node = self._nodes[target_key]
+            root = self._root
+            if offset > 0:
+                for _i in range(offset):
+                    if node is root:
+                        break
+                    node = node[1]
+            else:
+                for _i in range(-offset):
+                    if node[0] is root:
+                        break
+                    node = node[0]
+
+            self._insert_before_node(node, key, value)
             return True
         elif not fail_silently:
             raise ValueError(
@@ -214,9 +307,10 @@ class SortableDict(dict):
         :param int offset:
         :return bool:
         """
-        if target_key in self.key_order and source_key in self.key_order:
-            source_value = self.pop(source_key)
-            return self.insert_before_key(target_key, source_key, source_value,
+        if target_key in self._nodes and source_key in self._nodes:
+            return self.insert_before_key(target_key,
+                                          source_key,
+                                          self[source_key],
                                           fail_silently=True,
                                           offset=offset)
         elif not fail_silently:
@@ -1,5 +1,17 @@
+from functools import wraps
+
 from django.core.exceptions import PermissionDenied
 from django.contrib.auth.decorators import user_passes_test
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+
+from .routers import (
+    SAFE_METHODS,
+    get_read_database,
+    pin_primary_database,
+    read_database,
+)
+from .utils import get_form_entry_cache_validators
 
 SATISFY_ANY = 'any'
 SATISFY_ALL = 'all'
@@ -17,6 +29,9 @@ __all__ = (
     'permissions_required',
     'all_permissions_required',
     'any_permission_required',
+    'form_entry_condition',
+    'pins_primary_database',
+    'use_read_database',
 )
 
 
@@ -114,3 +129,111 @@ def any_permission_required(perms, login_url=None, raise_exception=False):
     return permissions_required(perms, satisfy=SATISFY_ANY,
                                 login_url=login_url,
                                 raise_exception=raise_exception)
+
+
+def pins_primary_database(view_func):
+    """Serve the session from the default database after using the view.
+
+    Meant for the views changing data (such as the form builder views).
+    Successful unsafe (POST, etc.) requests pin the session to the default
+    database for ``FOBI_READ_DATABASE_PIN_SECONDS`` seconds, so that the
+    changes are seen despite of the replication lag. Views changing data on
+    safe (GET) requests call ``fobi.routers.pin_primary_database`` themselves.
+
+    :example:
+    >>> @login_required
+    >>> @pins_primary_database
+    >>> def edit_form_entry(request, form_entry_id):
+    >>>     # your code
+    """
+    @wraps(view_func)
+    def _wrapped_view(request, *args, **kwargs):
+        response = view_func(request, *args, **kwargs)
+        if request.method not in SAFE_METHODS \
+                and response.status_code < 400:
+            pin_primary_database(request)
+        return response
+
+    return _wrapped_view
+
+
+def use_read_database(view_func):
+    """Serve the read-only requests from the read database.
+
+    Safe (GET, HEAD, OPTIONS) requests of the sessions not pinned to the
+    default database read the `fobi` models from the ``FOBI_READ_DATABASE``
+    database (see ``fobi.routers.ReadDatabaseRouter``). Other requests are
+    served from the default database and, if successful, pin the session to
+    it (see ``pins_primary_database``).
+
+    :example:
+    >>> @use_read_database
+    >>> def view_form_entry(request, form_entry_slug):
+    >>>     # your code
+    """
+    @wraps(view_func)
+    def _wrapped_view(request, *args, **kwargs):
+        using = get_read_database(request)
+        if using is None:
+            response = view_func(request, *args, **kwargs)
+            if request.method not in SAFE_METHODS \
+                    and response.status_code < 400:
+                pin_primary_database(request)
+            return response
+
+        with read_database(using):
+            response = view_func(request, *args, **kwargs)
+            # Lazy (template) responses are rendered while reading from the
+            # read database as well.
+            if callable(getattr(response, 'render', None)) \
+                    and not response.is_rendered:
+                response.render()
+        return response
+
+    return _wrapped_view
+
+
+def form_entry_condition(slug_kwarg='form_entry_slug'):
+    """Conditionally serve the form page (ETag and Last-Modified headers).
+
+    Not modified (304) responses are returned without assembling the form.
+    See ``fobi.utils.get_form_entry_cache_validators`` for the requests
+    served conditionally. The Cache-Control directives of the form (the
+    ``FOBI_CACHE_CONTROL`` and ``FOBI_CACHE_CONTROL_PER_FORM`` settings) are
+    added to the responses.
+
+    :param str slug_kwarg: Name of the view keyword argument holding the slug
+        of the form.
+
+    :example:
+    >>> @form_entry_condition()
+    >>> def view_form_entry(request, form_entry_slug):
+    >>>     # your code
+    """
+    def get_validators(request, kwargs):
+        return get_form_entry_cache_validators(request,
+                                               kwargs.get(slug_kwarg))
+
+    def etag_func(request, *args, **kwargs):
+        return get_validators(request, kwargs)[0]
+
+    def last_modified_func(request, *args, **kwargs):
+        return get_validators(request, kwargs)[1]
+
+    def decorator(view_func):
+        conditional_view_func = condition(
+            etag_func=etag_func,
+            last_modified_func=last_modified_func
+        )(view_func)
+
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            response = conditional_view_func(request, *args, **kwargs)
+            cache_control = get_validators(request, kwargs)[2]
+            if cache_control and response.status_code in (200, 304):
+                patch_cache_control(response, **cache_control)
+            return response
+
+        return _wrapped_view
+
+    return decorator
@@ -5,6 +5,9 @@ __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
 __all__ = (
+    'CACHE_CONTROL',
+    'CACHE_CONTROL_PER_FORM',
+    'COMPILE_FORM_DEFINITIONS',
     'CUSTOM_THEME_DATA',
     'DEBUG',
     'DEFAULT_MAX_LENGTH',
@@ -20,14 +23,27 @@ __all__ = (
     'FORM_CALLBACKS_MODULE_NAME',
     'FORM_ELEMENT_PLUGINS_MODULE_NAME',
     'FORM_HANDLER_PLUGINS_EXECUTION_ORDER',
+    'FORM_HANDLER_PLUGINS_MAX_WORKERS',
     'FORM_HANDLER_PLUGINS_MODULE_NAME',
     'FORM_IMPORTER_PLUGINS_MODULE_NAME',
     'FORM_WIZARD_HANDLER_PLUGINS_EXECUTION_ORDER',
     'GET_PARAM_INITIAL_DATA',
     'SORT_PLUGINS_BY_VALUE',
+    'INSTRUMENTATION_BACKEND',
+    'INSTRUMENTATION_BACKEND_OPTIONS',
     'INTEGRATION_FORM_ELEMENT_PLUGINS_MODULE_NAME',
     'INTEGRATION_FORM_HANDLER_PLUGINS_MODULE_NAME',
+    'MODEL_OBJECT_CHOICES_MAX_PAGE_SIZE',
+    'MODEL_OBJECT_CHOICES_PAGE_SIZE',
+    'READ_DATABASE',
+    'READ_DATABASE_PIN_SECONDS',
     'RESTRICT_PLUGIN_ACCESS',
+    'SUBMISSION_IDEMPOTENCY_CACHE',
+    'SUBMISSION_IDEMPOTENCY_FINGERPRINT',
+    'SUBMISSION_IDEMPOTENCY_TIMEOUT',
+    'SUBMISSION_RATE_LIMIT_CACHE',
+    'SUBMISSION_RATE_LIMITS',
+    'SUBMISSION_RATE_LIMITS_PER_FORM',
     'THEME_FOOTER_TEXT',
     'THEMES_MODULE_NAME',
     'WAIT_AT_TEST_END',
@@ -111,8 +127,94 @@ FORM_WIZARD_HANDLER_PLUGINS_EXECUTION_ORDER = (
     # be the last plugin to be executed.
 )
 
+# Max number of threads running the I/O bound form handlers (such as
+# ``http_repost``) concurrently. By default, form handlers are run
+# sequentially. Set to 2 (or more) to run them concurrently (opt-in, the
+# form handlers then use database connections of their own, outside of the
+# transaction of the request).
+FORM_HANDLER_PLUGINS_MAX_WORKERS = 1
+
 SORT_PLUGINS_BY_VALUE = False
 
+# If set to True, the form elements and the form handlers of the form are
+# compiled into a single document stored on the form entry, so that the
+# form is rendered (and submitted) with a single query. Compiled definitions
+# are invalidated on each change and compiled again once read.
+COMPILE_FORM_DEFINITIONS = False
+
+# Alias of the database (read replica) the read-only public views (form
+# rendering, DRF retrieve/metadata, db_store listing/export) read from. Used
+# with the ``fobi.routers.ReadDatabaseRouter`` database router. If set to
+# None, everything is read from the default database.
+READ_DATABASE = None
+
+# Number of seconds the session is served from the default database after
+# changing data (submissions, form builder changes), so that the changes are
+# seen despite of the replication lag.
+READ_DATABASE_PIN_SECONDS = 10
+
+# Cache-Control directives (keyword arguments of the
+# ``django.utils.cache.patch_cache_control``) of the form pages served to
+# the anonymous users (along with the ETag and Last-Modified headers). By
+# default, browsers may cache the pages, but shall revalidate them on each
+# use. If set to None, the form pages are not conditionally served.
+CACHE_CONTROL = {'private': True, 'no_cache': True}
+
+# Cache-Control directives of the given forms (slug as key). Overrides the
+# ``CACHE_CONTROL``.
+CACHE_CONTROL_PER_FORM = {}
+
+# Number of seconds the submissions are remembered for (duplicate
+# submissions, such as double clicks and client retries, do not run the form
+# handlers again). If set to 0, duplicates are not suppressed.
+SUBMISSION_IDEMPOTENCY_TIMEOUT = 60
+
+# Alias of the cache the submissions are remembered in. Shall be shared by
+# all the processes serving the forms.
+SUBMISSION_IDEMPOTENCY_CACHE = 'default'
+
+# If set to True, submissions without the idempotency key (the
+# ``Idempotency-Key`` header or the ``fobi_idempotency_key`` form field) are
+# identified by the submitted data. Note, that identical submissions of the
+# same client (within the ``SUBMISSION_IDEMPOTENCY_TIMEOUT``) are then
+# suppressed as well.
+SUBMISSION_IDEMPOTENCY_FINGERPRINT = False
+
+# Rate limits of the form submissions (token buckets). Keys are the scopes:
+# "form" (all submissions of the form), "ip" (submissions of the form per IP
+# address) and "user" (submissions of the form per authenticated user).
+# Values are the rates (for instance, "10/m" stands for 10 submissions per
+# minute, with bursts of up to 10 submissions). Empty by default (no
+# limits).
+SUBMISSION_RATE_LIMITS = {}
+
+# Rate limits of the given forms (slug as key). Overrides the
+# ``SUBMISSION_RATE_LIMITS``. If set to None, submissions of the form are not
+# limited.
+SUBMISSION_RATE_LIMITS_PER_FORM = {}
+
+# Alias of the cache the rate limits are counted in. Shall be shared by all
+# the processes serving the forms and support atomic increments (memcached,
+# redis). If not configured, rate limits are counted in the local memory
+# (per process).
+SUBMISSION_RATE_LIMIT_CACHE = 'default'
+
+# Dotted path to the instrumentation backend class (timings of the form
+# assembly, validation, plugins, callbacks and handlers), for instance
+# "fobi.instrumentation.StatsdInstrumentationBackend". If set to None,
+# instrumentation is disabled.
+INSTRUMENTATION_BACKEND = None
+
+# Keyword arguments of the instrumentation backend class.
+INSTRUMENTATION_BACKEND_OPTIONS = {}
+
+# Number of options returned per page by the model object choices endpoint
+# (used by the model object select fields in the "remote" mode).
+MODEL_OBJECT_CHOICES_PAGE_SIZE = 20
+
+# Upper limit for the page size requested by the client.
+MODEL_OBJECT_CHOICES_MAX_PAGE_SIZE = 100
+
 FAIL_ON_MISSING_FORM_ELEMENT_PLUGINS = True
 FAIL_ON_MISSING_FORM_HANDLER_PLUGINS = True
 FAIL_ON_MISSING_INTEGRATION_FORM_ELEMENT_PLUGINS = False
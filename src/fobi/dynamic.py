@@ -12,6 +12,7 @@ from nine.versions import (
 from six import with_metaclass
 
 from .constants import WIZARD_TYPE_COOKIE, WIZARD_TYPE_SESSION
+from .instrumentation import span
 
 if DJANGO_GTE_1_8:
     from formtools.wizard.views import (
@@ -88,24 +89,28 @@ def assemble_form_class(form_entry,
 
             for creation_counter, form_element_entry \
                     in enumerate(form_element_entries):
-                plugin = form_element_entry.get_plugin(request=request)
+                with span('form_element.get_plugin',
+                          uid=form_element_entry.plugin_uid):
+                    plugin = form_element_entry.get_plugin(request=request)
 
                 # We simply make sure the plugin exists. We don't handle
                 # exceptions relate to the non-existent plugins here. They
                 # are instead handled in registry.
                 if plugin:
-                    plugin_form_field_instances = \
-                        plugin._get_form_field_instances(
-                            form_element_entry=form_element_entry,
-                            origin=origin,
-                            kwargs_update_func=origin_kwargs_update_func,
-                            return_func=origin_return_func,
-                            extra={'counter': creation_counter},
-                            request=request,
-                            form_entry=form_entry,
-                            form_element_entries=form_element_entries,
-                            **get_form_field_instances_kwargs
-                        )
+                    with span('form_element.get_form_field_instances',
+                              uid=form_element_entry.plugin_uid):
+                        plugin_form_field_instances = \
+                            plugin._get_form_field_instances(
+                                form_element_entry=form_element_entry,
+                                origin=origin,
+                                kwargs_update_func=origin_kwargs_update_func,
+                                return_func=origin_return_func,
+                                extra={'counter': creation_counter},
+                                request=request,
+                                form_entry=form_entry,
+                                form_element_entries=form_element_entries,
+                                **get_form_field_instances_kwargs
+                            )
                     for form_field_name, form_field_instance \
                             in plugin_form_field_instances:
                         base_fields.append(
@@ -122,9 +127,16 @@ def assemble_form_class(form_entry,
 
             return new_class
 
-    # DynamicForm
-    class DynamicForm(with_metaclass(DeclarativeFieldsMetaclass, base_class)):
-        """Dynamically created form element plugin class."""
+    # DynamicForm (fields are collected by the metaclass, on creation)
+    with span('form.assemble'):
+        class DynamicForm(with_metaclass(DeclarativeFieldsMetaclass,
+                                         base_class)):
+            """Dynamically created form element plugin class."""
+
+            def full_clean(self):
+                """Validate the form (timed)."""
+                with span('form.validate'):
+                    super(DynamicForm, self).full_clean()
 
     # Finally, return the DynamicForm
     return DynamicForm
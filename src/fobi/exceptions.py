@@ -10,6 +10,7 @@ __all__ = (
     'FormElementPluginError',
     'FormHandlerPluginDoesNotExist',
     'FormHandlerPluginError',
+    'FormImportError',
     'FormPluginError',
     'FormWizardHandlerPluginDoesNotExist',
     'ImproperlyConfigured',
@@ -94,3 +95,7 @@ class FormHandlerPluginError(FormPluginError):
 
 class FormCallbackError(FormPluginError):
     """Raised when form callback error occurs."""
+
+
+class FormImportError(ValueError, BaseException):
+    """Raised when the imported form data is invalid."""
@@ -0,0 +1,97 @@
+from django.forms import ValidationError
+from django.forms.fields import ChoiceField
+from django.forms.models import ModelChoiceField, ModelMultipleChoiceField
+
+from six import string_types
+
+from .helpers import get_file_from_upload_token
+
+__title__ = 'fobi.fields'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = (
+    'CachedModelChoiceField',
+    'CachedModelMultipleChoiceField',
+    'DirectUploadFileMixin',
+)
+
+
+class CachedModelChoiceMixin(object):
+    """Mixin for model choice fields with pre-built choices.
+
+    Choices are taken from the ``cached_choices`` (list of (pk, label)
+    tuples) given, instead of being built from the queryset. Thus, no
+    queries are made and no model instances are created on render. The
+    submitted values are still validated against the queryset.
+    """
+
+    def __init__(self, queryset, cached_choices=None, *args, **kwargs):
+        """Constructor.
+
+        :param django.db.models.QuerySet queryset:
+        :param list cached_choices: List of (pk, label) tuples.
+        """
+        self.cached_choices = cached_choices
+        super(CachedModelChoiceMixin, self).__init__(
+            queryset, *args, **kwargs
+        )
+
+    def _get_choices(self):
+        """Get choices."""
+        if self.cached_choices is None:
+            return super(CachedModelChoiceMixin, self)._get_choices()
+
+        choices = list(self.cached_choices)
+        if self.empty_label is not None:
+            choices.insert(0, ("", self.empty_label))
+        return choices
+
+    choices = property(_get_choices, ChoiceField._set_choices)
+
+
+class CachedModelChoiceField(CachedModelChoiceMixin, ModelChoiceField):
+    """Model choice field with pre-built choices."""
+
+
+class CachedModelMultipleChoiceField(CachedModelChoiceMixin,
+                                     ModelMultipleChoiceField):
+    """Model multiple choice field with pre-built choices."""
+
+
+class DirectUploadFileMixin(object):
+    """Mixin for file fields accepting upload tokens.
+
+    In the direct upload mode the file is uploaded (and stored) before the
+    form is submitted. The form is then submitted with the upload token
+    only. The cleaned value is the path to the stored file (relative).
+    Regular file uploads are still accepted.
+    """
+
+    def __init__(self, upload_dir, token_salt, token_max_age=None,
+                 *args, **kwargs):
+        """Constructor.
+
+        :param str upload_dir: Directory to store the uploaded files in.
+        :param str token_salt: Salt of the upload tokens.
+        :param int token_max_age: Max age of the upload tokens (in seconds).
+        """
+        self.upload_dir = upload_dir
+        self.token_salt = token_salt
+        self.token_max_age = token_max_age
+        super(DirectUploadFileMixin, self).__init__(*args, **kwargs)
+
+    def clean(self, data, initial=None):
+        """Clean."""
+        if data and isinstance(data, string_types):
+            name = get_file_from_upload_token(
+                data,
+                salt=self.token_salt,
+                max_age=self.token_max_age
+            )
+            if name is None:
+                raise ValidationError(self.error_messages['invalid'],
+                                      code='invalid')
+            return name
+
+        return super(DirectUploadFileMixin, self).clean(data, initial)
@@ -3,7 +3,7 @@ import socket
 from six.moves.urllib.parse import urlparse
 
 from django import forms
-from django.forms.models import modelformset_factory
+from django.forms.models import BaseModelFormSet, modelformset_factory
 from django.utils.translation import ugettext, ugettext_lazy as _
 
 # from nonefield.fields import NoneField
@@ -257,11 +257,40 @@ class _FormElementEntryForm(forms.ModelForm):
         fields = ('position',)
 
 
+class BaseFormElementEntryFormSet(BaseModelFormSet):
+    """Base FormElementEntry formset.
+
+    Saves the ordering (the positions posted are used for sorting only) by
+    updating the positions of the moved entries only.
+    """
+
+    def save(self, commit=True):
+        """Save the ordering."""
+        if not commit:
+            return super(BaseFormElementEntryFormSet, self).save(commit)
+
+        from .utils import update_form_element_entries_positions
+
+        forms = [form for form in self.forms if form.instance.pk]
+        if not forms:
+            return []
+
+        forms.sort(key=lambda form: form.cleaned_data.get('position') or 0)
+        positions = update_form_element_entries_positions(
+            forms[0].instance.form_entry_id,
+            [form.instance.pk for form in forms]
+        )
+        for form in forms:
+            form.instance.position = positions[form.instance.pk]
+        return [form.instance for form in forms]
+
+
 FormElementEntryFormSet = modelformset_factory(
     FormElementEntry,
     fields=('position',),
     extra=0,
-    form=_FormElementEntryForm
+    form=_FormElementEntryForm,
+    formset=BaseFormElementEntryFormSet
 )
 
 
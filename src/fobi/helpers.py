@@ -5,34 +5,46 @@ since it never imports from any of the fobi (sub)modules (except for the
 """
 from __future__ import unicode_literals
 import glob
+import hashlib
 import logging
 import os
 import shutil
+import tarfile
+import time
 import uuid
 
+from io import BytesIO
+
 from autoslug.settings import slugify
 
 from django import forms
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
 # from django.contrib.contenttypes.models import ContentType
+from django.core import signing
 from django.core.files.base import File
+from django.core.files.storage import default_storage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import CharField, Q, TextField
 # from django.db.utils import DatabaseError
 from django.http import HttpResponse
 from django.templatetags.static import static
 from django.test.client import RequestFactory
-from django.utils.encoding import force_text, smart_text
+from django.utils.encoding import force_bytes, force_text, smart_text
 from django.utils.html import format_html_join
 from django.utils.translation import ugettext_lazy as _
 
 from nine.user import User
 from nine.versions import DJANGO_GTE_1_8, DJANGO_GTE_1_10
 
-# import simplejson as json
+import simplejson as json
 
-from six import text_type, PY3
+from six import string_types, text_type, PY3
+from six.moves.urllib.parse import unquote
 
 from .constants import (
+    MODEL_OBJECT_CHOICES_IGNORED_APPS,
     SUBMIT_VALUE_AS_MIX,
     SUBMIT_VALUE_AS_REPR,
     SUBMIT_VALUE_AS_VAL,
@@ -55,8 +67,10 @@ __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
 __all__ = (
     'admin_change_url',
+    'bump_model_object_choices_version',
     'clean_dict',
     'clone_file',
+    'connect_model_object_choices_signals',
     'combine_dicts',
     'delete_file',
     'do_slugify',
@@ -64,15 +78,28 @@ __all__ = (
     'ensure_unique_filename',
     'flatatt_inverse_quotes',
     'get_app_label_and_model_name',
+    'get_cached_model_object_choices',
+    'get_file_field_values',
+    'get_file_from_upload_token',
+    'get_file_upload_token',
+    'get_file_upload_url',
     'get_form_element_entries_for_form_wizard_entry',
+    'get_hashed_filename',
     'get_ignorable_form_values',
     'get_model_name_for_object',
+    'get_model_object_choices',
+    'get_model_object_choices_url',
+    'get_model_object_choices_version',
+    'get_model_search_fields',
     'get_registered_models',
     'get_select_field_choices',
+    'get_storage_name',
     'get_wizard_form_field_value_from_post',
     'get_wizard_form_field_value_from_request',
     'get_wizard_form_field_value_from_session',
     'handle_uploaded_file',
+    'iter_json_lines',
+    'iter_tar_json_documents',
     'iterable_to_dict',
     'JSONDataExporter',
     'lists_overlap',
@@ -85,6 +112,7 @@ __all__ = (
     'update_plugin_data',
     'validate_initial_for_choices',
     'validate_initial_for_multiple_choices',
+    'validate_search_fields',
     'validate_submit_value_as',
 )
 
@@ -254,39 +282,78 @@ def ensure_unique_filename(destination):
         return destination
 
 
-def handle_uploaded_file(upload_dir, image_file):
-    """Handle uploaded files.
+def get_hashed_filename(upload_dir, uploaded_file):
+    """Get content-addressed filename of the uploaded file.
 
-    :param django.core.files.uploadedfile.InMemoryUploadedFile image_file:
-    :return string: Path to the image (relative).
+    The name is made of the SHA-256 hash of the file contents (read in
+    chunks) and the original extension. Identical files get identical names.
+
+    :param string upload_dir:
+    :param django.core.files.File uploaded_file:
+    :return string:
     """
-    upload_dir_absolute_path = os.path.join(settings.MEDIA_ROOT, upload_dir)
+    digest = hashlib.sha256()
+    for chunk in uploaded_file.chunks():
+        digest.update(chunk)
+    hexdigest = digest.hexdigest()
+
+    extension = os.path.splitext(uploaded_file.name)[1].lower()
+    return os.path.join(
+        upload_dir,
+        hexdigest[:2],
+        "{0}{1}".format(hexdigest, extension)
+    )
+
+
+def handle_uploaded_file(upload_dir, image_file, storage=None):
+    """Handle uploaded files.
 
-    # Create path if doesn't exist yet
-    if not os.path.exists(upload_dir_absolute_path):
-        os.makedirs(upload_dir_absolute_path)
+    The file is saved (in chunks) using the storage given under its
+    content-addressed name (see ``get_hashed_filename``), without checking
+    for its existence first. Identical files are stored only once: storages
+    overwriting the existing files simply rewrite the same contents, the
+    copies saved under an available (other) name are deleted.
 
+    :param string upload_dir:
+    :param django.core.files.uploadedfile.UploadedFile image_file:
+    :param django.core.files.storage.Storage storage: Defaults to the
+        ``default_storage``.
+    :return string: Path to the image (relative).
+    """
     if isinstance(image_file, File):
-        destination_path = ensure_unique_filename(
-            os.path.join(upload_dir_absolute_path, image_file.name)
-        )
-        image_filename = image_file.name
-        with open(destination_path, 'wb+') as destination:
-            image_filename = os.path.basename(destination.name)
-            for chunk in image_file.chunks():
-                destination.write(chunk)
-        return os.path.join(upload_dir, image_filename)
+        if storage is None:
+            storage = default_storage
+
+        filename = get_hashed_filename(upload_dir, image_file)
+        saved_filename = storage.save(filename, image_file)
+        if saved_filename != filename:
+            # Identical file has been stored already.
+            storage.delete(saved_filename)
+        return filename
     return image_file
 
 
-def delete_file(image_file):
-    """Delete file from disc."""
+def delete_file(image_file, storage=None):
+    """Delete file from the storage.
+
+    :param string image_file: Path to the file (relative).
+    :param django.core.files.storage.Storage storage: Defaults to the
+        ``default_storage``.
+    :return bool:
+    """
+    if storage is None:
+        storage = default_storage
+
     try:
         # Delete the main file.
-        file_path = os.path.join(settings.MEDIA_ROOT, image_file)
-        os.remove(file_path)
+        storage.delete(image_file)
+
+        # Delete the sized version of it (local storages only).
+        try:
+            file_path = storage.path(image_file)
+        except NotImplementedError:
+            return True
 
-        # Delete the sized version of it.
         files = glob.glob("{0}*".format(file_path))
         for __f in files:
             try:
@@ -325,6 +392,46 @@ def clone_file(upload_dir, source_filename, relative_path=True):
         logger.debug(str(err))
 
 
+def get_file_upload_token(name, salt):
+    """Get (signed) upload token of a stored file.
+
+    :param string name: Path to the file (relative).
+    :param string salt:
+    :return string:
+    """
+    return signing.dumps(name, salt=salt)
+
+
+def get_file_from_upload_token(token, salt, max_age=None):
+    """Get path to the stored file from the upload token given.
+
+    :param string token:
+    :param string salt:
+    :param int max_age: Max age of the token (in seconds).
+    :return string: Path to the file (relative) or None if token is invalid.
+    """
+    try:
+        return signing.loads(token, salt=salt, max_age=max_age)
+    except signing.BadSignature:
+        return None
+
+
+def get_file_upload_url(form_entry, field_name):
+    """Get URL of the file upload endpoint.
+
+    :param fobi.models.FormEntry form_entry:
+    :param str field_name:
+    :return str:
+    """
+    return reverse(
+        'fobi.form_entry_file_upload',
+        kwargs={
+            'form_entry_slug': form_entry.slug,
+            'field_name': field_name,
+        }
+    )
+
+
 def extract_file_path(name):
     """Extracts the file path.
 
@@ -340,6 +447,39 @@ def extract_file_path(name):
 # *****************************************************************************
 
 
+def get_file_field_values(form):
+    """Get values of the file fields of the form.
+
+    :param django.forms.Form form:
+    :return list: List of (field name, value) tuples. The value is either
+        the URL of the stored file or the uploaded file itself.
+    """
+    cleaned_data = getattr(form, 'cleaned_data', None) or {}
+    return [
+        (field_name, cleaned_data[field_name])
+        for field_name, field in form.fields.items()
+        if isinstance(field, forms.FileField) and cleaned_data.get(field_name)
+    ]
+
+
+def get_storage_name(url, storage=None):
+    """Get name of the file in the storage from its URL.
+
+    :param str url:
+    :param django.core.files.storage.Storage storage: Defaults to the
+        ``default_storage``.
+    :return str: Name or None if file doesn't belong to the storage.
+    """
+    if storage is None:
+        storage = default_storage
+    if not isinstance(url, string_types):
+        return None
+    base_url = storage.url('')
+    if not url.startswith(base_url):
+        return None
+    return unquote(url[len(base_url):])
+
+
 def get_registered_models(ignore=[]):
     """Gets registered models as list.
 
@@ -393,6 +533,219 @@ def get_app_label_and_model_name(path):
     parts = path.split('.')
     return (''.join(parts[:-1]), parts[-1])
 
+
+def get_model_search_fields(model, search_fields):
+    """Get the fields of the model the choices can be searched in.
+
+    Only the concrete, non-relation text fields (``CharField``,
+    ``TextField`` and their subclasses) of the model itself qualify.
+    Lookups spanning relations (``__``) are not allowed, since the choices
+    are searched by the anonymous users.
+
+    :param django.db.models.Model model:
+    :param iterable search_fields: Names of the fields.
+    :return list: Names of the valid fields (in the order given).
+    """
+    searchable_field_names = set()
+    for field in model._meta.get_fields():
+        if field.concrete and not field.is_relation \
+                and isinstance(field, (CharField, TextField)):
+            searchable_field_names.add(field.name)
+    return [
+        _f
+        for _f
+        in search_fields
+        if _f and '__' not in _f and _f in searchable_field_names
+    ]
+
+
+def get_model_object_choices(queryset, term=None, search_fields=None, page=1,
+                             limit=20, label_from_instance=safe_text):
+    """Get a single page of model object choices.
+
+    Used to serve the options of the model object select fields in the
+    "remote" mode, so that only a slice of (a possibly large) table is
+    fetched at once.
+
+    :param django.db.models.QuerySet queryset:
+    :param str term: Search term.
+    :param iterable search_fields: Names of the fields to search the `term`
+        in (case insensitive "contains" lookup). If empty, the `term` is
+        ignored.
+    :param int page: Page number (1-based).
+    :param int limit: Number of choices per page.
+    :param callable label_from_instance:
+    :return tuple: List of (pk, label) tuples and a boolean telling whether
+        there are more choices available.
+    """
+    search_fields = [_f for _f in (search_fields or []) if _f]
+    if term and search_fields:
+        query = Q()
+        for search_field in search_fields:
+            query |= Q(**{'{0}__icontains'.format(search_field): term})
+        queryset = queryset.filter(query)
+
+    # Slicing an unordered queryset gives unpredictable pages.
+    if not queryset.ordered:
+        queryset = queryset.order_by('pk')
+
+    page = max(page, 1)
+    offset = (page - 1) * limit
+    # Fetch one more object than requested to find out whether there's
+    # a next page, without an extra ``COUNT`` query.
+    objs = list(queryset[offset:offset + limit + 1])
+
+    choices = [(obj.pk, label_from_instance(obj)) for obj in objs[:limit]]
+    return choices, len(objs) > limit
+
+
+def get_model_object_choices_url(form_entry, field_name):
+    """Get URL of the model object choices endpoint.
+
+    :param fobi.models.FormEntry form_entry:
+    :param str field_name:
+    :return str:
+    """
+    return reverse(
+        'fobi.form_entry_model_object_choices',
+        kwargs={
+            'form_entry_slug': form_entry.slug,
+            'field_name': field_name,
+        }
+    )
+
+
+def _get_model_object_choices_version_key(model):
+    """Get cache key of the model object choices version of a model."""
+    return 'fobi.model_object_choices.version.{0}.{1}'.format(
+        model._meta.app_label,
+        model._meta.model_name
+    )
+
+
+def get_model_object_choices_version(model):
+    """Get model object choices version of a model.
+
+    The version is a counter, which is bumped on every change of the model
+    objects (see ``bump_model_object_choices_version``). It's initialised
+    with the current time (instead of 0 or 1), so that choices cached with
+    an evicted version are not re-used.
+
+    :param django.db.models.Model model:
+    :return int:
+    """
+    key = _get_model_object_choices_version_key(model)
+    version = cache.get(key)
+    if version is None:
+        version = int(time.time() * 1000)
+        if not cache.add(key, version, None):
+            version = cache.get(key, version)
+    return version
+
+
+def bump_model_object_choices_version(sender, **kwargs):
+    """Bump model object choices version of a model.
+
+    Meant to be connected to the ``post_save`` and ``post_delete`` signals.
+    Note, that queryset ``update`` and ``bulk_create`` do not send these
+    signals.
+
+    :param django.db.models.Model sender:
+    """
+    try:
+        cache.incr(_get_model_object_choices_version_key(sender))
+    except ValueError:
+        # The version is not initialised yet, thus nothing to invalidate.
+        pass
+
+
+def connect_model_object_choices_signals(ignore=[]):
+    """Connect ``bump_model_object_choices_version`` to the model signals.
+
+    Connected per model (``post_save`` and ``post_delete``), thus changes of
+    other models do not touch the cache. The models of fobi itself and of
+    the ``MODEL_OBJECT_CHOICES_IGNORED_APPS`` are never offered as choices,
+    thus never connected.
+
+    :param iterable ignore: Ignore the following models (should be in
+        ``app_label.model`` format (example ``auth.User``).
+    """
+    from django.db.models.signals import post_delete, post_save
+
+    ignore = set(model_label.lower() for model_label in ignore)
+
+    for model in django.apps.apps.get_models():
+        app_config = model._meta.app_config
+        if app_config.name == 'fobi' \
+                or app_config.name.startswith('fobi.') \
+                or model._meta.app_label in MODEL_OBJECT_CHOICES_IGNORED_APPS:
+            continue
+
+        model_label = "{0}.{1}".format(model._meta.app_label,
+                                       model._meta.model_name)
+        if model_label in ignore:
+            continue
+
+        post_save.connect(
+            bump_model_object_choices_version,
+            sender=model,
+            dispatch_uid='fobi.model_object_choices.post_save'
+        )
+        post_delete.connect(
+            bump_model_object_choices_version,
+            sender=model,
+            dispatch_uid='fobi.model_object_choices.post_delete'
+        )
+
+
+def get_cached_model_object_choices(queryset, element_data, timeout=None,
+                                    max_objects=None,
+                                    label_from_instance=safe_text):
+    """Get cached model object choices.
+
+    Returns list of (pk, label) tuples of all the objects in the `queryset`.
+    Meant for small reference tables only, thus if the queryset contains
+    more than `max_objects` objects, nothing is cached and None is
+    returned. The cache key is made of the model, the model object choices
+    version of the model and the `element_data`.
+
+    :param django.db.models.QuerySet queryset:
+    :param dict element_data: Plugin data of the form element.
+    :param int timeout: Cache timeout (in seconds).
+    :param int max_objects:
+    :param callable label_from_instance:
+    :return list|None:
+    """
+    model = queryset.model
+    key = 'fobi.model_object_choices.{0}.{1}.{2}.{3}'.format(
+        model._meta.app_label,
+        model._meta.model_name,
+        get_model_object_choices_version(model),
+        hashlib.md5(
+            force_bytes(json.dumps(element_data, sort_keys=True))
+        ).hexdigest()
+    )
+
+    choices = cache.get(key)
+    if choices is None:
+        if max_objects:
+            objs = list(queryset[:max_objects + 1])
+        else:
+            objs = list(queryset)
+
+        if max_objects and len(objs) > max_objects:
+            # Too many objects. Remember that, not to query again.
+            choices = False
+        else:
+            choices = [(obj.pk, label_from_instance(obj)) for obj in objs]
+
+        cache.set(key, choices, timeout)
+
+    if choices is False:
+        return None
+
+    return choices
+
 # *****************************************************************************
 # *****************************************************************************
 # ****************************** Admin helpers ********************************
@@ -430,16 +783,27 @@ def admin_change_url(app_label, module_name, object_id, extra_path='',
 # *****************************************************************************
 
 
-def update_plugin_data(entry, request=None):
+def update_plugin_data(entry, request=None, commit=True):
     """Update plugin data.
 
     Update plugin data of a given entry.
+
+    :param fobi.models.BaseAbstractPluginEntry entry:
+    :param django.http.HttpRequest request:
+    :param bool commit: If set to False, the entry is not saved.
+    :return bool: True if plugin data has been changed.
     """
     if entry:
         plugin = entry.get_plugin(request=request)
         logger.debug(plugin)
         if plugin:
-            return plugin._update_plugin_data(entry)
+            plugin_data = plugin._update_plugin_data(entry)
+            if plugin_data is not None and plugin_data != entry.plugin_data:
+                entry.plugin_data = plugin_data
+                if commit:
+                    entry.save()
+                return True
+    return False
 
 
 def get_select_field_choices(raw_choices_data,
@@ -560,6 +924,38 @@ def validate_initial_for_multiple_choices(plugin_form,
     return plugin_form.cleaned_data[field_name_initial]
 
 
+def validate_search_fields(plugin_form,
+                           field_name_model='model',
+                           field_name_search_fields='search_fields'):
+    """Validates the search fields for the model given.
+
+    :param fobi.base.BaseFormFieldPluginForm plugin_form:
+    :param str field_name_model:
+    :param str field_name_search_fields:
+    :return str:
+    """
+    value = plugin_form.cleaned_data[field_name_search_fields]
+    model_path = plugin_form.cleaned_data.get(field_name_model)
+    if not value or not model_path:
+        return value
+
+    app_label, model_name = get_app_label_and_model_name(model_path)
+    model = django.apps.apps.get_model(app_label, model_name)
+    search_fields = [_f.strip() for _f in value.split(',') if _f.strip()]
+    valid_search_fields = get_model_search_fields(model, search_fields)
+    invalid_search_fields = [
+        _f for _f in search_fields if _f not in valid_search_fields
+    ]
+    if invalid_search_fields:
+        raise forms.ValidationError(
+            _("Invalid search fields: {0}. Only the text fields of the "
+              "model itself can be searched in."
+              "".format(','.join(invalid_search_fields)))
+        )
+
+    return ','.join(search_fields)
+
+
 def validate_submit_value_as(value):
     """Validates the `SUBMIT_AS_VALUE`.
 
@@ -732,6 +1128,65 @@ class StrippedRequest(object):
 # *****************************************************************************
 
 
+def _dump_json_document(document, **kwargs):
+    """Dump the document to JSON (bytes).
+
+    Dates, times and decimals are serialized the way Django does.
+    """
+    return force_bytes(
+        json.dumps(document, default=DjangoJSONEncoder().default, **kwargs)
+    )
+
+
+def iter_json_lines(documents):
+    """Iterate through the documents dumped as JSON lines.
+
+    :param iterable documents: Iterable of JSON serializable documents.
+    :return iterable: Iterable of (bytes) lines.
+    """
+    for document in documents:
+        yield _dump_json_document(document) + b'\n'
+
+
+class _TarStreamBuffer(object):
+    """Write-only buffer for the streamed tar archive."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(data)
+        return len(data)
+
+    def pop(self):
+        """Get (and remove) the data written so far."""
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def iter_tar_json_documents(documents):
+    """Iterate through the (uncompressed) tar archive of JSON documents.
+
+    The archive is produced on the fly, a member at a time.
+
+    :param iterable documents: Iterable of (member name, JSON serializable
+        document) tuples.
+    :return iterable: Iterable of (bytes) chunks of the archive.
+    """
+    buffer = _TarStreamBuffer()
+    archive = tarfile.open(fileobj=buffer, mode='w|')
+    for name, document in documents:
+        content = _dump_json_document(document, indent=4)
+        tar_info = tarfile.TarInfo(name)
+        tar_info.size = len(content)
+        tar_info.mtime = time.time()
+        archive.addfile(tar_info, BytesIO(content))
+        yield buffer.pop()
+    archive.close()
+    yield buffer.pop()
+
+
 class JSONDataExporter(object):
     """Exporting the data into JSON."""
 
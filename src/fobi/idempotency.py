@@ -0,0 +1,220 @@
+import hashlib
+import uuid
+
+import simplejson as json
+from six import text_type
+
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils.encoding import force_text
+from django.utils.translation import ugettext
+
+from nine import versions
+
+from .settings import (
+    SUBMISSION_IDEMPOTENCY_CACHE,
+    SUBMISSION_IDEMPOTENCY_FINGERPRINT,
+    SUBMISSION_IDEMPOTENCY_TIMEOUT,
+)
+
+__title__ = 'fobi.idempotency'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = (
+    'IDEMPOTENCY_KEY_FIELD',
+    'IDEMPOTENCY_KEY_HEADER',
+    'claim_submission',
+    'complete_submission',
+    'get_idempotency_key',
+    'get_submission_in_progress_response',
+    'get_submission_key',
+    'get_submission_outcome',
+    'idempotency_keys_enabled',
+    'release_submission',
+)
+
+# Name of the (hidden) form field holding the idempotency key of the
+# submission.
+IDEMPOTENCY_KEY_FIELD = 'fobi_idempotency_key'
+
+# ``request.META`` key of the ``Idempotency-Key`` header.
+IDEMPOTENCY_KEY_HEADER = 'HTTP_IDEMPOTENCY_KEY'
+
+# Fields not taken into account when fingerprinting the submitted data.
+IGNORED_FIELDS = ('csrfmiddlewaretoken', IDEMPOTENCY_KEY_FIELD)
+
+
+def _get_cache():
+    """Get the cache the submissions are remembered in."""
+    return caches[SUBMISSION_IDEMPOTENCY_CACHE]
+
+
+def _get_client_key(request):
+    """Get the key identifying the client (user, session or address).
+
+    :param django.http.HttpRequest request:
+    :return str:
+    """
+    user = getattr(request, 'user', None)
+    if user is not None:
+        if versions.DJANGO_GTE_1_10:
+            user_is_authenticated = user.is_authenticated
+        else:
+            user_is_authenticated = user.is_authenticated()
+        if user_is_authenticated:
+            return 'user-{0}'.format(user.pk)
+
+    session = getattr(request, 'session', None)
+    if session is not None and session.session_key:
+        return 'session-{0}'.format(session.session_key)
+
+    return 'address-{0}'.format(request.META.get('REMOTE_ADDR', ''))
+
+
+def _get_data_fingerprint(data, files=None):
+    """Get the fingerprint (serialized) of the submitted data.
+
+    :param dict data: Submitted data (``QueryDict`` or ``dict``).
+    :param django.utils.datastructures.MultiValueDict files:
+    :return str:
+    """
+    if hasattr(data, 'lists'):
+        items = list(data.lists())
+    else:
+        items = list(dict(data).items())
+    items = sorted(
+        [(key, value) for key, value in items if key not in IGNORED_FIELDS],
+        key=lambda item: item[0]
+    )
+
+    file_items = []
+    for name in sorted(files or []):
+        uploaded_files = files.getlist(name) \
+            if hasattr(files, 'getlist') \
+            else [files[name]]
+        for uploaded_file in uploaded_files:
+            file_items.append((name, uploaded_file.name, uploaded_file.size))
+
+    return json.dumps([items, file_items], default=text_type)
+
+
+def idempotency_keys_enabled():
+    """Whether the idempotency keys are rendered into the form pages.
+
+    Pages holding the (per page) keys shall not be conditionally served:
+    a page revalidated by the browser (304) would resubmit the key of the
+    page cached and the submission would be taken for a duplicate.
+
+    :return bool:
+    """
+    return bool(SUBMISSION_IDEMPOTENCY_TIMEOUT)
+
+
+def get_idempotency_key():
+    """Get a new idempotency key.
+
+    Rendered (per page) into the ``fobi_idempotency_key`` hidden field of the
+    forms, so that the resubmissions of the page are recognised.
+
+    :return str:
+    """
+    if not idempotency_keys_enabled():
+        return None
+    return uuid.uuid4().hex
+
+
+def get_submission_key(request, form_entry, data=None, files=None):
+    """Get the key of the submission.
+
+    Given by the client (the ``Idempotency-Key`` header or the
+    ``fobi_idempotency_key`` form field). Otherwise, derived of the submitted
+    data if ``FOBI_SUBMISSION_IDEMPOTENCY_FINGERPRINT`` is set to True. Keys
+    are scoped to the form and the client (user, session or address).
+
+    :param django.http.HttpRequest request:
+    :param fobi.models.FormEntry form_entry:
+    :param dict data: Submitted data. Defaults to ``request.POST``.
+    :param django.utils.datastructures.MultiValueDict files: Submitted
+        files. Defaults to ``request.FILES``.
+    :return str: None if duplicates are not suppressed.
+    """
+    if not SUBMISSION_IDEMPOTENCY_TIMEOUT:
+        return None
+
+    if data is None:
+        data = request.POST
+        files = request.FILES
+
+    idempotency_key = request.META.get(IDEMPOTENCY_KEY_HEADER) \
+        or data.get(IDEMPOTENCY_KEY_FIELD)
+    if idempotency_key:
+        value = 'key|{0}'.format(force_text(idempotency_key))
+    elif SUBMISSION_IDEMPOTENCY_FINGERPRINT:
+        value = 'data|{0}'.format(_get_data_fingerprint(data, files))
+    else:
+        return None
+
+    digest = hashlib.md5('|'.join([
+        force_text(form_entry.pk),
+        _get_client_key(request),
+        value,
+    ]).encode('utf-8')).hexdigest()
+    return 'fobi.submission.{0}'.format(digest)
+
+
+def get_submission_outcome(key):
+    """Get the outcome of the submission.
+
+    :param str key: Key of the submission.
+    :return dict: None if not submitted (or forgotten already). While the
+        submission is being handled, ``{'completed': False}``.
+    """
+    if key is None:
+        return None
+    return _get_cache().get(key)
+
+
+def claim_submission(key):
+    """Claim handling of the submission.
+
+    :param str key: Key of the submission.
+    :return bool: False if the submission is handled already (duplicate).
+    """
+    if key is None:
+        return True
+    return _get_cache().add(key,
+                            {'completed': False},
+                            SUBMISSION_IDEMPOTENCY_TIMEOUT)
+
+
+def complete_submission(key, **outcome):
+    """Remember the outcome of the (claimed) submission.
+
+    :param str key: Key of the submission.
+    :param outcome: Outcome of the submission, returned to the duplicates.
+    """
+    if key is None:
+        return
+    outcome['completed'] = True
+    _get_cache().set(key, outcome, SUBMISSION_IDEMPOTENCY_TIMEOUT)
+
+
+def release_submission(key):
+    """Release the (claimed) submission, so that it can be retried.
+
+    :param str key: Key of the submission.
+    """
+    if key is not None:
+        _get_cache().delete(key)
+
+
+def get_submission_in_progress_response():
+    """Get the "409 Conflict" response.
+
+    Returned to the duplicates of the submissions still being handled.
+
+    :return django.http.HttpResponse:
+    """
+    return HttpResponse(ugettext("Submission is being processed."),
+                        status=409)
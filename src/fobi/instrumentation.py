@@ -0,0 +1,292 @@
+import logging
+import re
+import socket
+import threading
+
+from collections import defaultdict
+from timeit import default_timer
+
+from django.utils.module_loading import import_string
+
+from .settings import (
+    INSTRUMENTATION_BACKEND,
+    INSTRUMENTATION_BACKEND_OPTIONS,
+)
+
+__title__ = 'fobi.instrumentation'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = (
+    'BaseInstrumentationBackend',
+    'LoggingInstrumentationBackend',
+    'MemoryInstrumentationBackend',
+    'StatsdInstrumentationBackend',
+    'get_instrumentation_backend',
+    'incr',
+    'set_instrumentation_backend',
+    'span',
+)
+
+logger = logging.getLogger(__name__)
+
+_UNSET = object()
+
+_backend = _UNSET
+
+_backend_lock = threading.Lock()
+
+
+class BaseInstrumentationBackend(object):
+    """Base instrumentation backend.
+
+    Receives the timings of the spans (form assembly, validation, each form
+    element plugin, each callback stage, each form handler plugin) and the
+    counters. Shall be thread safe (form handlers may be run in threads).
+    """
+
+    def timing(self, name, duration, tags):
+        """Record the duration of the span.
+
+        :param str name: Name of the span, for instance "form_handler.run".
+        :param float duration: Duration in seconds.
+        :param dict tags: Tags of the span, for instance {'uid': 'mail'}.
+        """
+        raise NotImplementedError(
+            "You should implement the `timing` method in your {0} "
+            "subclass.".format(self.__class__.__name__)
+        )
+
+    def incr(self, name, value, tags):
+        """Increment the counter.
+
+        :param str name: Name of the counter, for instance
+            "form_handler.errors".
+        :param int value:
+        :param dict tags:
+        """
+        raise NotImplementedError(
+            "You should implement the `incr` method in your {0} "
+            "subclass.".format(self.__class__.__name__)
+        )
+
+
+class LoggingInstrumentationBackend(BaseInstrumentationBackend):
+    """Logs the timings and the counters.
+
+    :param str logger_name:
+    :param int level: Logging level.
+    """
+
+    def __init__(self, logger_name=__name__, level=logging.DEBUG):
+        self.logger = logging.getLogger(logger_name)
+        self.level = level
+
+    def timing(self, name, duration, tags):
+        """Log the duration of the span."""
+        self.logger.log(self.level, "%s %r: %.3f ms",
+                        name, tags, duration * 1000)
+
+    def incr(self, name, value, tags):
+        """Log the counter increment."""
+        self.logger.log(self.level, "%s %r: +%s", name, tags, value)
+
+
+class StatsdInstrumentationBackend(BaseInstrumentationBackend):
+    """Sends the timings and the counters to statsd (UDP).
+
+    Tag values are appended to the metric names, for instance
+    "fobi.form_handler.run.mail".
+
+    :param str host:
+    :param int port:
+    :param str prefix: Prefix of the metric names.
+    """
+
+    def __init__(self, host='localhost', port=8125, prefix='fobi'):
+        self.address = (host, port)
+        self.prefix = prefix
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def get_metric_name(self, name, tags):
+        """Get the name of the metric.
+
+        :param str name:
+        :param dict tags:
+        :return str:
+        """
+        parts = [self.prefix, name] if self.prefix else [name]
+        parts += ['{0}'.format(tags[key]) for key in sorted(tags)]
+        return re.sub(r'[^\w\-.]', '_', '.'.join(parts))
+
+    def send(self, data):
+        """Send the data (fire and forget)."""
+        try:
+            self.socket.sendto(data.encode('utf-8'), self.address)
+        except (socket.error, socket.gaierror) as err:
+            logger.debug("Failed to send the metric %s. Details: %s",
+                         data, err)
+
+    def timing(self, name, duration, tags):
+        """Send the duration of the span (in milliseconds)."""
+        self.send('{0}:{1:.3f}|ms'.format(self.get_metric_name(name, tags),
+                                          duration * 1000))
+
+    def incr(self, name, value, tags):
+        """Send the counter increment."""
+        self.send('{0}:{1}|c'.format(self.get_metric_name(name, tags),
+                                     value))
+
+
+class MemoryInstrumentationBackend(BaseInstrumentationBackend):
+    """Collects the timings and the counters in memory (tests).
+
+    Timings and counters are kept per name and tags, for instance
+    ``timings[('form_handler.run', (('uid', 'mail'),))]``.
+    """
+
+    def __init__(self):
+        self.timings = defaultdict(list)
+        self.counters = defaultdict(int)
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_key(name, tags):
+        """Get the key of the timings and the counters."""
+        return name, tuple(sorted(tags.items()))
+
+    def timing(self, name, duration, tags):
+        """Collect the duration of the span."""
+        with self.lock:
+            self.timings[self.get_key(name, tags)].append(duration)
+
+    def incr(self, name, value, tags):
+        """Collect the counter increment."""
+        with self.lock:
+            self.counters[self.get_key(name, tags)] += value
+
+    def get_timings(self, name, **tags):
+        """Get the collected durations of the span.
+
+        :param str name:
+        :param tags:
+        :return list:
+        """
+        with self.lock:
+            return list(self.timings.get(self.get_key(name, tags), []))
+
+    def get_count(self, name, **tags):
+        """Get the collected value of the counter.
+
+        :param str name:
+        :param tags:
+        :return int:
+        """
+        with self.lock:
+            return self.counters.get(self.get_key(name, tags), 0)
+
+    def reset(self):
+        """Reset the collected timings and counters."""
+        with self.lock:
+            self.timings.clear()
+            self.counters.clear()
+
+
+def get_instrumentation_backend():
+    """Get the instrumentation backend.
+
+    Set up with the ``FOBI_INSTRUMENTATION_BACKEND`` (dotted path to the
+    backend class) and the ``FOBI_INSTRUMENTATION_BACKEND_OPTIONS`` (keyword
+    arguments of the backend class) settings.
+
+    :return fobi.instrumentation.BaseInstrumentationBackend: None if
+        instrumentation is disabled.
+    """
+    global _backend
+    if _backend is _UNSET:
+        with _backend_lock:
+            if _backend is _UNSET:
+                backend = None
+                if INSTRUMENTATION_BACKEND:
+                    backend_cls = import_string(INSTRUMENTATION_BACKEND)
+                    backend = backend_cls(
+                        **(INSTRUMENTATION_BACKEND_OPTIONS or {})
+                    )
+                _backend = backend
+    return _backend
+
+
+def set_instrumentation_backend(backend):
+    """Set the instrumentation backend (overrides the settings).
+
+    :param fobi.instrumentation.BaseInstrumentationBackend backend: None to
+        disable instrumentation.
+    """
+    global _backend
+    with _backend_lock:
+        _backend = backend
+
+
+class _Span(object):
+    """Span timing the code within."""
+
+    __slots__ = ('backend', 'name', 'tags', 'start')
+
+    def __init__(self, backend, name, tags):
+        self.backend = backend
+        self.name = name
+        self.tags = tags
+        self.start = None
+
+    def __enter__(self):
+        self.start = default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.backend.timing(self.name, default_timer() - self.start, self.tags)
+        return False
+
+
+class _NullSpan(object):
+    """Span doing nothing (instrumentation disabled)."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, **tags):
+    """Time the code within.
+
+    :param str name: Name of the span.
+    :param tags: Tags of the span.
+
+    :example:
+    >>> with span('form_handler.run', uid='mail'):
+    >>>     plugin.run(form_entry, request, form)
+    """
+    backend = _backend if _backend is not _UNSET \
+        else get_instrumentation_backend()
+    if backend is None:
+        return _NULL_SPAN
+    return _Span(backend, name, tags)
+
+
+def incr(name, value=1, **tags):
+    """Increment the counter.
+
+    :param str name: Name of the counter.
+    :param int value:
+    :param tags: Tags of the counter.
+    """
+    backend = _backend if _backend is not _UNSET \
+        else get_instrumentation_backend()
+    if backend is not None:
+        backend.incr(name, value, tags)
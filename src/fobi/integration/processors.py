@@ -22,6 +22,14 @@ from ..constants import (
 )
 from ..dynamic import assemble_form_class
 from ..exceptions import ImproperlyConfigured
+from ..idempotency import (
+    claim_submission,
+    complete_submission,
+    get_idempotency_key,
+    get_submission_key,
+    get_submission_outcome,
+    release_submission,
+)
 from ..settings import GET_PARAM_INITIAL_DATA
 
 __title__ = 'fobi.integration.processors'
@@ -79,6 +87,7 @@ class IntegrationProcessor(object):
         """Get context data."""
         context = {
             'form_entry': instance.form_entry,
+            'fobi_idempotency_key': get_idempotency_key(),
         }
         context.update(kwargs)
         return context
@@ -139,6 +148,14 @@ class IntegrationProcessor(object):
                     request, instance, **kwargs
                 )
 
+        submission_key = None
+        if request.method == 'POST':
+            # Duplicate submissions (double clicks, client retries) are
+            # answered with the outcome of the original submission.
+            submission_key = get_submission_key(request, instance.form_entry)
+            if get_submission_outcome(submission_key) is not None:
+                return self._show_submitted(request, instance, **kwargs)
+
         form_element_entries = instance.form_entry.formelemententry_set.all(
         )[:]
         # This is where the most of the magic happens. Our form is being built
@@ -185,12 +202,20 @@ class IntegrationProcessor(object):
                     stage=CALLBACK_FORM_VALID
                 )
 
-                # Run all handlers
-                run_form_handlers(
-                    form_entry=instance.form_entry,
-                    request=request,
-                    form=form
-                )
+                # Run all handlers (once per submission)
+                if not claim_submission(submission_key):
+                    return self._show_submitted(request, instance, **kwargs)
+                try:
+                    run_form_handlers(
+                        form_entry=instance.form_entry,
+                        request=request,
+                        form=form
+                    )
+                except Exception:
+                    # Failed submissions can be retried
+                    release_submission(submission_key)
+                    raise
+                complete_submission(submission_key)
 
                 # Fire post handler callbacks
                 fire_form_callbacks(
@@ -206,12 +231,7 @@ class IntegrationProcessor(object):
                       'successfully.').format(instance.form_entry.name)
                 )
 
-                if self.can_redirect:
-                    return redirect(
-                        self.get_process_form_redirect_url(request, instance)
-                    )
-                else:
-                    return self._show_thanks_page(request, instance, **kwargs)
+                return self._show_submitted(request, instance, **kwargs)
 
             else:
                 # Fire post form validation callbacks
@@ -267,6 +287,20 @@ class IntegrationProcessor(object):
 
         self.rendered_output = render_to_string(**render_kwargs)
 
+    def _show_submitted(self, request, instance, **kwargs):
+        """Redirect to (or show) the thanks page.
+
+        :param django.http.HttpRequest request:
+        :param fobi.models.FormEntry instance: FormEntry instance.
+        :return django.http.HttpResponse | str:
+        """
+        if self.can_redirect:
+            return redirect(
+                self.get_process_form_redirect_url(request, instance)
+            )
+        else:
+            return self._show_thanks_page(request, instance, **kwargs)
+
     def _show_login_required_page(self, request, instance, **kwargs):
         """Displays text with login required.
 
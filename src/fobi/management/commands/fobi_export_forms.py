@@ -0,0 +1,92 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from nine.user import User
+
+from fobi.helpers import iter_json_lines, iter_tar_json_documents
+from fobi.utils import iter_export_documents
+
+EXPORT_TYPES = ('forms', 'wizards', 'all')
+
+
+class Command(BaseCommand):
+    """Exports forms (and form wizards) in bulk.
+
+    The export is written as it is produced, either as JSON lines (one form
+    per line) or as a tar archive of JSON documents (``forms/<slug>.json``
+    and ``form_wizards/<slug>.json``). Form entries are loaded in batches,
+    with a constant number of queries per batch.
+
+    Example:
+
+        ./manage.py fobi_export_forms --format=tar --output=forms.tar
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--format',
+            default='jsonl',
+            dest='format',
+            choices=['jsonl', 'tar'],
+            help='Export format (jsonl or tar).',
+        )
+        parser.add_argument(
+            '--output',
+            dest='output',
+            default=None,
+            help='Output file. Defaults to the standard output.',
+        )
+        parser.add_argument(
+            '--user',
+            dest='user',
+            default=None,
+            help='Export the forms of the given user (username) only.',
+        )
+        parser.add_argument(
+            '--type',
+            dest='type',
+            default='all',
+            choices=EXPORT_TYPES,
+            help='Export forms, wizards or all (default).',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            dest='batch_size',
+            help='Number of forms loaded at once.',
+        )
+
+    def handle(self, *args, **options):
+        """Handle."""
+        user = None
+        if options.get('user'):
+            try:
+                user = User._default_manager.get(username=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(
+                    "User {0} does not exist.".format(options['user'])
+                )
+
+        documents = iter_export_documents(
+            user=user,
+            form_entries=options['type'] in ('forms', 'all'),
+            form_wizard_entries=options['type'] in ('wizards', 'all'),
+            batch_size=options['batch_size']
+        )
+
+        if 'tar' == options['format']:
+            chunks = iter_tar_json_documents(documents)
+        else:
+            chunks = iter_json_lines(data for name, data in documents)
+
+        if options.get('output'):
+            with open(options['output'], 'wb') as output:
+                for chunk in chunks:
+                    output.write(chunk)
+        else:
+            output = getattr(sys.stdout, 'buffer', sys.stdout)
+            for chunk in chunks:
+                output.write(chunk)
+            output.flush()
@@ -1,12 +1,17 @@
 from __future__ import print_function
 
-from django.core.management.base import BaseCommand
+from collections import OrderedDict
 
-from fobi.base import (
-    get_registered_form_element_plugin_uids,
-    get_registered_form_handler_plugin_uids
+import simplejson as json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from fobi.utils import (
+    delete_broken_entries,
+    find_broken_entries,
+    get_plugin_entry_models,
+    remap_broken_entries,
 )
-from fobi.models import FormElementEntry, FormHandlerEntry
 
 
 class Command(BaseCommand):
@@ -14,48 +19,135 @@ class Command(BaseCommand):
 
     - ``fobi.models.FormElementEntry``
     - ``fobi.models.FormHandlerEntry``
+    - ``fobi.models.FormWizardHandlerEntry``
+
+    Broken entries (of the plugins no longer registered) are counted per
+    plugin UID in the database. Optionally, broken entries are deleted or
+    remapped to other (registered) plugins, in chunks.
     """
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--delete',
+            action='store_true',
+            dest='delete',
+            default=False,
+            help='Delete the broken entries (after remapping, if '
+                 '--remap is given).',
+        )
+        parser.add_argument(
+            '--remap',
+            action='append',
+            dest='remap',
+            default=[],
+            metavar='OLD_PLUGIN_UID=NEW_PLUGIN_UID',
+            help='Remap the broken entries of a plugin to another plugin. '
+                 'Can be given multiple times.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            dest='chunk_size',
+            help='Number of entries deleted/remapped at once.',
+        )
+        parser.add_argument(
+            '--format',
+            default='text',
+            dest='format',
+            choices=['text', 'json'],
+            help='Output format (text or json).',
+        )
+        parser.add_argument(
+            '--fail-on-broken',
+            action='store_true',
+            dest='fail_on_broken',
+            default=False,
+            help='Exit with an error if broken entries remain.',
+        )
+
     def handle(self, *args, **options):
         """Handle."""
-        form_element_entries = FormElementEntry._default_manager.all() \
-            .only('id', 'plugin_uid', 'form_entry') \
-            .values_list('id', 'plugin_uid', 'form_entry')
-        form_handler_entries = FormHandlerEntry._default_manager.all() \
-            .only('id', 'plugin_uid', 'form_entry') \
-            .values_list('id', 'plugin_uid', 'form_entry')
-
-        broken_form_element_entries = []
-        broken_form_handler_entries = []
-
-        registered_form_element_plugin_uids = \
-            get_registered_form_element_plugin_uids()
-
-        registered_form_handler_plugin_uids = \
-            get_registered_form_handler_plugin_uids()
-
-        for entry_id, plugin_uid, form_entry_id in form_element_entries:
-            if plugin_uid not in registered_form_element_plugin_uids:
-                broken_form_element_entries.append(
-                    (form_entry_id, entry_id, plugin_uid)
+        plugin_uid_map = OrderedDict()
+        for remap in options['remap']:
+            broken_plugin_uid, _sep, plugin_uid = remap.partition('=')
+            if not (broken_plugin_uid and plugin_uid):
+                raise CommandError(
+                    "Invalid --remap value {0}.".format(remap)
                 )
+            plugin_uid_map[broken_plugin_uid] = plugin_uid
+
+        report = OrderedDict()
+        remaining = 0
+        for entry_model_cls, plugin_uids in get_plugin_entry_models():
+            result = OrderedDict()
+            result['broken'] = find_broken_entries(entry_model_cls,
+                                                   plugin_uids)
 
-        if broken_form_element_entries:
-            print(
-                "Broken form element entries found (form ID, entry ID, "
-                "plugin UID)!",
-                broken_form_element_entries
+            _plugin_uid_map = OrderedDict(
+                (broken_plugin_uid, plugin_uid)
+                for broken_plugin_uid, plugin_uid in plugin_uid_map.items()
+                if broken_plugin_uid in result['broken']
             )
+            if _plugin_uid_map:
+                try:
+                    result['remapped'] = remap_broken_entries(
+                        entry_model_cls,
+                        plugin_uids,
+                        _plugin_uid_map,
+                        chunk_size=options['chunk_size']
+                    )
+                except ValueError as err:
+                    raise CommandError(
+                        "{0}: {1}".format(entry_model_cls.__name__, err)
+                    )
 
-        for entry_id, plugin_uid, form_entry_id in form_handler_entries:
-            if plugin_uid not in registered_form_handler_plugin_uids:
-                broken_form_handler_entries.append(
-                    (form_entry_id, entry_id, plugin_uid)
+            if options['delete'] and result['broken']:
+                result['deleted'] = delete_broken_entries(
+                    entry_model_cls,
+                    plugin_uids,
+                    chunk_size=options['chunk_size']
                 )
 
-        if broken_form_handler_entries:
-            print(
-                "Broken form handler entries found (form ID, entry ID, "
-                "plugin UID)!",
-                broken_form_handler_entries
+            if 'remapped' in result or 'deleted' in result:
+                result['remaining'] = sum(
+                    find_broken_entries(entry_model_cls,
+                                        plugin_uids).values()
+                )
+            else:
+                result['remaining'] = sum(result['broken'].values())
+            remaining += result['remaining']
+
+            report[entry_model_cls.__name__] = result
+
+        if 'json' == options['format']:
+            self.stdout.write(json.dumps(report, indent=4))
+        else:
+            for model_name, result in report.items():
+                for plugin_uid, count in result['broken'].items():
+                    self.stdout.write(
+                        "{0}: {1} broken entries of plugin {2}".format(
+                            model_name, count, plugin_uid
+                        )
+                    )
+                for plugin_uid, count in result.get('remapped', {}).items():
+                    self.stdout.write(
+                        "{0}: {1} entries of plugin {2} remapped to "
+                        "{3}".format(model_name,
+                                     count,
+                                     plugin_uid,
+                                     plugin_uid_map[plugin_uid])
+                    )
+                if result.get('deleted'):
+                    self.stdout.write(
+                        "{0}: {1} broken entries deleted".format(
+                            model_name, result['deleted']
+                        )
+                    )
+            if not remaining:
+                self.stdout.write("No broken entries found.")
+
+        if remaining and options['fail_on_broken']:
+            raise CommandError(
+                "{0} broken entries found.".format(remaining)
             )
@@ -0,0 +1,233 @@
+import multiprocessing
+import os
+
+import simplejson as json
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, IntegrityError
+
+from nine.user import User
+
+from fobi.base import (
+    get_registered_form_element_plugin_uids,
+    get_registered_form_handler_plugin_uids,
+)
+from fobi.exceptions import FormImportError
+from fobi.utils import import_form_entries, validate_form_entry_import_data
+
+
+def _is_form_wizard_data(form_data):
+    """Check if the data is a form wizard (export)."""
+    return isinstance(form_data, dict) and 'form_wizard_forms' in form_data
+
+
+def iter_forms_data(paths):
+    """Iterate through the form data in the files given.
+
+    Directories are scanned for ``.json`` files (single form or a list of
+    forms) and ``.jsonl`` files (JSON lines, one form per line). Form
+    wizards (as exported by ``fobi_export_forms``) are skipped.
+
+    :param iterable paths: Paths to files or directories.
+    :return iterable: Iterable of (location, form data) tuples.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            file_paths = [
+                os.path.join(path, name)
+                for name in sorted(os.listdir(path))
+                if name.endswith(('.json', '.jsonl'))
+            ]
+        else:
+            file_paths = [path]
+
+        for file_path in file_paths:
+            with open(file_path, 'rb') as _file:
+                if file_path.endswith('.jsonl'):
+                    for line_number, line in enumerate(_file, start=1):
+                        if not line.strip():
+                            continue
+                        form_data = json.loads(line.decode('utf-8'))
+                        if not _is_form_wizard_data(form_data):
+                            yield (
+                                '{0}:{1}'.format(file_path, line_number),
+                                form_data
+                            )
+                else:
+                    data = json.loads(_file.read().decode('utf-8'))
+                    if not isinstance(data, list):
+                        data = [data]
+                    for index, form_data in enumerate(data):
+                        if not _is_form_wizard_data(form_data):
+                            yield '{0}#{1}'.format(file_path, index), form_data
+
+
+def iter_batches(iterable, batch_size):
+    """Split iterable into batches (lists) of the given size."""
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _import_forms_batch(args):
+    """Import a batch of forms (run in worker processes).
+
+    :param tuple args: User ID, list of form data, the ignore broken
+        entries flag, the batch number and the number of forms in the
+        batches before.
+    :return int: Number of forms imported.
+    :raise django.core.management.base.CommandError: If the batch
+        conflicts with the forms already imported (for instance, forms of
+        the same name).
+    """
+    user_id, forms_data, ignore_broken_entries, number, offset = args
+    user = User._default_manager.get(pk=user_id)
+    try:
+        return len(import_form_entries(user,
+                                       forms_data,
+                                       ignore_broken_entries))
+    except IntegrityError as err:
+        raise CommandError(
+            "Batch #{0} (forms {1}-{2}) not imported: {3}. The batches "
+            "imported before are kept.".format(
+                number, offset + 1, offset + len(forms_data), err
+            )
+        )
+
+
+class Command(BaseCommand):
+    """Imports forms (as exported) in bulk.
+
+    All the forms are validated first. Forms are then imported in batches
+    (a transaction per batch), optionally in parallel worker processes.
+    The import as a whole is not atomic: if a batch fails, the batches
+    imported before are kept.
+
+    Example:
+
+        ./manage.py fobi_import_forms forms/ library.jsonl --user=admin
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'paths',
+            nargs='+',
+            help='Files (.json or .jsonl) or directories to import.',
+        )
+        parser.add_argument(
+            '--user',
+            required=True,
+            dest='user',
+            help='Username of the owner of the imported forms.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            dest='batch_size',
+            help='Number of forms imported in a single transaction.',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            dest='workers',
+            help='Number of worker processes. The import is not atomic: '
+                 'each batch is committed on its own (also in parallel).',
+        )
+        parser.add_argument(
+            '--ignore-broken-entries',
+            action='store_true',
+            dest='ignore_broken_entries',
+            default=False,
+            help='Skip the entries of the plugins missing in the system '
+                 '(instead of aborting the import).',
+        )
+
+    def handle(self, *args, **options):
+        """Handle."""
+        try:
+            user = User._default_manager.get(username=options['user'])
+        except User.DoesNotExist:
+            raise CommandError(
+                "User {0} does not exist.".format(options['user'])
+            )
+
+        paths = options['paths']
+        ignore_broken_entries = options['ignore_broken_entries']
+
+        # Validating all the forms up front.
+        form_element_plugin_uids = set(
+            get_registered_form_element_plugin_uids()
+        )
+        form_handler_plugin_uids = set(
+            get_registered_form_handler_plugin_uids()
+        )
+        errors = []
+        try:
+            for location, form_data in iter_forms_data(paths):
+                for error in validate_form_entry_import_data(
+                        form_data,
+                        form_element_plugin_uids,
+                        form_handler_plugin_uids):
+                    errors.append("{0}: {1}".format(location, error))
+        except (IOError, ValueError) as err:
+            raise CommandError(str(err))
+
+        if errors:
+            for error in errors:
+                self.stderr.write(error)
+            if not ignore_broken_entries:
+                raise CommandError(
+                    "Nothing imported. Use --ignore-broken-entries to skip "
+                    "the broken entries."
+                )
+
+        # Forms missing the essential data are skipped as a whole.
+        forms_data = (
+            form_data
+            for location, form_data in iter_forms_data(paths)
+            if isinstance(form_data, dict) and form_data.get('name')
+        )
+        batches = (
+            (user.pk,
+             batch,
+             ignore_broken_entries,
+             number,
+             (number - 1) * options['batch_size'])
+            for number, batch
+            in enumerate(iter_batches(forms_data, options['batch_size']),
+                         start=1)
+        )
+
+        imported = 0
+        try:
+            if options['workers'] > 1:
+                # Connections are not to be shared with the worker processes.
+                # Worker processes set up Django themselves (the "spawn"
+                # start method does not inherit the app registry).
+                connections.close_all()
+                pool = multiprocessing.Pool(options['workers'],
+                                            initializer=django.setup)
+                try:
+                    for count in pool.imap_unordered(_import_forms_batch,
+                                                     batches):
+                        imported += count
+                        self.stdout.write(
+                            "{0} forms imported".format(imported)
+                        )
+                finally:
+                    pool.close()
+                    pool.join()
+            else:
+                for batch in batches:
+                    imported += _import_forms_batch(batch)
+                    self.stdout.write("{0} forms imported".format(imported))
+        except FormImportError as err:
+            raise CommandError(str(err))
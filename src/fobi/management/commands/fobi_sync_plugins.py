@@ -1,3 +1,5 @@
+import simplejson as json
+
 from django.core.management.base import BaseCommand
 
 from nine import versions
@@ -13,10 +15,14 @@ class Command(BaseCommand):
 
         - ``fobi.models.FormElementPlugin``
         - ``fobi.models.FormHandlerPlugin``
+        - ``fobi.models.FormWizardHandlerPlugin``
+
+    Plugins added, as well as the stale ones (present in the database, but
+    no longer registered), are reported.
     """
 
-    if versions.DJANGO_GTE_2_0:
-        def add_arguments(self, parser):
+    def add_arguments(self, parser):
+        if versions.DJANGO_GTE_2_0:
             parser.add_argument(
                 '--noinput',
                 '--no-input',
@@ -25,7 +31,33 @@ class Command(BaseCommand):
                 help='Tells Django to NOT prompt the user for input of any '
                      'kind.',
             )
+        parser.add_argument(
+            '--format',
+            default='text',
+            dest='format',
+            choices=['text', 'json'],
+            help='Output format (text or json).',
+        )
 
     def handle(self, *args, **options):
         """Handle."""
-        sync_plugins()
+        report = sync_plugins()
+
+        if 'json' == options.get('format'):
+            self.stdout.write(json.dumps(report, indent=4))
+            return
+
+        if int(options.get('verbosity', 1)) < 1:
+            return
+
+        for model_name, result in report.items():
+            for plugin_uid in result['added']:
+                self.stdout.write(
+                    "{0}: plugin {1} added".format(model_name, plugin_uid)
+                )
+            for plugin_uid in result['stale']:
+                self.stdout.write(
+                    "{0}: plugin {1} is no longer registered".format(
+                        model_name, plugin_uid
+                    )
+                )
@@ -1,4 +1,4 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 
 from fobi.models import (
     FormElementEntry,
@@ -6,7 +6,13 @@ from fobi.models import (
     FormWizardHandlerEntry
 )
 
-from fobi.utils import update_plugin_data_for_entries
+from fobi.utils import update_plugin_data_in_chunks
+
+ENTRY_MODELS = (
+    ('element', FormElementEntry),
+    ('handler', FormHandlerEntry),
+    ('wizard_handler', FormWizardHandlerEntry),
+)
 
 
 class Command(BaseCommand):
@@ -16,16 +22,98 @@ class Command(BaseCommand):
 
     This command shall be ran if significant changes have been made to the
     system for which the data shall be updated.
+
+    Entries are processed in chunks. Progress (including the ID of the last
+    entry processed) is reported after each chunk, so that an interrupted
+    update can be resumed using the ``--start-after`` option (one type of
+    entries at a time, since the IDs of the entries of different types are
+    unrelated).
     """
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--entries',
+            action='append',
+            dest='entries',
+            choices=[key for key, entry_model_cls in ENTRY_MODELS],
+            help='Entries to update (element, handler or wizard_handler). '
+                 'Can be given multiple times. Defaults to all.',
+        )
+        parser.add_argument(
+            '--plugin-uid',
+            action='append',
+            dest='plugin_uids',
+            help='Update the entries of the given plugin only. Can be given '
+                 'multiple times.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            dest='chunk_size',
+            help='Number of entries processed at once.',
+        )
+        parser.add_argument(
+            '--start-after',
+            type=int,
+            default=None,
+            dest='start_after',
+            help='Update only the entries with greater ID (to resume an '
+                 'interrupted update). Requires exactly one --entries.',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            dest='workers',
+            help='Number of worker processes.',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            dest='dry_run',
+            default=False,
+            help='Report the entries to be updated, without saving them.',
+        )
+
+    def report_progress(self, entry_model_cls, stats):
+        """Report progress."""
+        elapsed = stats['elapsed'] or 1e-6
+        self.stdout.write(
+            "{0}: {1} processed, {2} updated, last ID {3} "
+            "({4:.1f} entries/s)".format(
+                entry_model_cls.__name__,
+                stats['processed'],
+                stats['updated'],
+                stats['last_pk'],
+                stats['processed'] / elapsed
+            )
+        )
+
     def handle(self, *args, **options):
         """Handle."""
-        form_element_entries = FormElementEntry._default_manager.all()
-        update_plugin_data_for_entries(entries=form_element_entries)
+        entries = options.get('entries')
+        if options.get('start_after') is not None \
+                and (not entries or len(set(entries)) != 1):
+            raise CommandError(
+                "--start-after requires exactly one --entries value (IDs "
+                "of the element, handler and wizard_handler entries are "
+                "unrelated)."
+            )
+
+        for key, entry_model_cls in ENTRY_MODELS:
+            if entries and key not in entries:
+                continue
 
-        form_handler_entries = FormHandlerEntry._default_manager.all()
-        update_plugin_data_for_entries(entries=form_handler_entries)
+            update_plugin_data_in_chunks(
+                entry_model_cls,
+                plugin_uids=options.get('plugin_uids'),
+                chunk_size=options['chunk_size'],
+                start_after=options.get('start_after'),
+                dry_run=options['dry_run'],
+                workers=options['workers'],
+                progress_callback=self.report_progress
+            )
 
-        form_wizard_handler_entries = FormWizardHandlerEntry \
-            ._default_manager.all()
-        update_plugin_data_for_entries(entries=form_wizard_handler_entries)
+        if options['dry_run']:
+            self.stdout.write("Dry run, nothing has been saved.")
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 2.2.28 on 2026-10-18 22:21
+from __future__ import unicode_literals
+
+from django.db import migrations
+from django.db.models import F
+
+FORM_ELEMENT_ENTRY_POSITION_STEP = 1024
+
+
+def space_positions(apps, schema_editor):
+    """Space the positions of the form element entries."""
+    FormElementEntry = apps.get_model('fobi', 'FormElementEntry')
+    FormElementEntry._default_manager \
+        .using(schema_editor.connection.alias) \
+        .filter(position__isnull=False) \
+        .update(position=F('position') * FORM_ELEMENT_ENTRY_POSITION_STEP)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fobi', '0015_auto_20180130_0013'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='formelemententry',
+            index_together={('form_entry', 'position')},
+        ),
+        migrations.RunPython(space_positions, migrations.RunPython.noop),
+    ]
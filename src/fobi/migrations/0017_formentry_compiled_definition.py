@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 2.2.28 on 2026-10-18 22:27
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fobi', '0016_formelemententry_form_entry_position_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='formentry',
+            name='compiled_definition',
+            field=models.TextField(blank=True, editable=False, help_text='Form elements and form handlers of the form (JSON), compiled automatically.', null=True, verbose_name='Compiled definition'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 2.2.28 on 2026-10-18 22:34
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fobi', '0017_formentry_compiled_definition'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FormWizardEntryVersion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField(verbose_name='Version')),
+                ('definition', models.TextField(editable=False, verbose_name='Definition')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Created')),
+                ('form_wizard_entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='versions', to='fobi.FormWizardEntry', verbose_name='Form wizard')),
+            ],
+            options={
+                'verbose_name': 'Form wizard entry version',
+                'verbose_name_plural': 'Form wizard entry versions',
+                'unique_together': {('form_wizard_entry', 'version')},
+            },
+        ),
+        migrations.CreateModel(
+            name='FormEntryVersion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField(verbose_name='Version')),
+                ('definition', models.TextField(editable=False, verbose_name='Definition')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Created')),
+                ('form_entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='versions', to='fobi.FormEntry', verbose_name='Form')),
+            ],
+            options={
+                'verbose_name': 'Form entry version',
+                'verbose_name_plural': 'Form entry versions',
+                'unique_together': {('form_entry', 'version')},
+            },
+        ),
+        migrations.AddField(
+            model_name='formentry',
+            name='published_version',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='fobi.FormEntryVersion', verbose_name='Published version'),
+        ),
+        migrations.AddField(
+            model_name='formwizardentry',
+            name='published_version',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='fobi.FormWizardEntryVersion', verbose_name='Published version'),
+        ),
+    ]
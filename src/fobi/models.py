@@ -4,9 +4,12 @@ import logging
 
 from autoslug import AutoSlugField
 
+import simplejson as json
+
 from django.conf import settings
 from django.contrib.auth.models import Group
-from django.db import models
+from django.core.cache import cache
+from django.db import models, router, transaction
 from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
@@ -22,7 +25,12 @@ from .base import (
     get_registered_form_handler_plugins,
     get_registered_form_wizard_handler_plugins,
 )
-from .constants import WIZARD_TYPES, DEFAULT_WIZARD_TYPE
+from .constants import (
+    COMPILED_FORM_DEFINITION_VERSION,
+    DEFAULT_WIZARD_TYPE,
+    WIZARD_TYPES,
+)
+from .settings import COMPILE_FORM_DEFINITIONS
 
 if DJANGO_GTE_1_10:
     from django.urls import reverse
@@ -46,11 +54,20 @@ __all__ = (
     'BaseAbstractPluginEntry',
     'FormElementEntry',
     'FormEntry',
+    'FormEntryVersion',
     'FormFieldsetEntry',
     'FormHandlerEntry',
     'FormWizardEntry',
+    'FormWizardEntryVersion',
     'FormWizardFormEntry',
     'FormWizardHandlerEntry',
+
+    # Versions
+    'AbstractVersion',
+
+    # Compiled form definitions
+    'invalidate_compiled_definitions',
+    'invalidate_version_definition',
 )
 
 
@@ -336,6 +353,15 @@ class FormWizardEntry(models.Model):
         blank=True,
         auto_now=True
     )
+    published_version = models.ForeignKey(
+        'fobi.FormWizardEntryVersion',
+        verbose_name=_("Published version"),
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='+',
+        on_delete=models.SET_NULL
+    )
 
     class Meta(object):
         """Meta class."""
@@ -359,6 +385,120 @@ class FormWizardEntry(models.Model):
             kwargs={'form_wizard_entry_slug': self.slug}
         )
 
+    def publish(self, using=None):
+        """Publish the form wizard.
+
+        Freezes the forms (their published versions; forms never published
+        are published first) and the form wizard handlers of the form
+        wizard into a new (immutable) version, served by the public views
+        from then on.
+
+        :param str using: Database alias.
+        :return fobi.models.FormWizardEntryVersion:
+        """
+        using = using or router.db_for_write(FormWizardEntry, instance=self)
+        with transaction.atomic(using=using):
+            queryset = FormWizardEntry._default_manager \
+                .using(using) \
+                .filter(pk=self.pk)
+            list(queryset.select_for_update().values_list('pk', flat=True))
+
+            forms = []
+            form_wizard_form_entries = FormWizardFormEntry._default_manager \
+                .using(using) \
+                .filter(form_wizard_entry_id=self.pk) \
+                .select_related('form_entry') \
+                .order_by('position', 'pk')
+            for form_wizard_form_entry in form_wizard_form_entries:
+                form_entry = form_wizard_form_entry.form_entry
+                if form_entry.published_version_id is None:
+                    form_entry.publish(using=using)
+                forms.append({
+                    'form_entry_id': form_entry.pk,
+                    'form_entry_version_id': form_entry.published_version_id,
+                })
+
+            form_wizard_handler_entries = FormWizardHandlerEntry \
+                ._default_manager \
+                .using(using) \
+                .filter(form_wizard_entry_id=self.pk) \
+                .order_by('plugin_uid', 'pk')
+
+            version = FormWizardEntryVersion._default_manager \
+                .using(using) \
+                .create(
+                    form_wizard_entry=self,
+                    version=FormWizardEntryVersion.get_next_version(
+                        using=using,
+                        form_wizard_entry_id=self.pk
+                    ),
+                    definition=json.dumps({
+                        'version': COMPILED_FORM_DEFINITION_VERSION,
+                        'forms': forms,
+                        'handlers': [
+                            entry.get_compiled_definition()
+                            for entry in form_wizard_handler_entries
+                        ],
+                    })
+                )
+            queryset.update(published_version=version)
+
+        self.published_version = version
+        return version
+
+    def get_form_entries(self, version_id=None):
+        """Get the forms of the form wizard (in order).
+
+        :param int version_id: ID of the form wizard version
+            (``fobi.models.FormWizardEntryVersion``) to get the forms of. If
+            not given, the current forms of the form wizard (draft).
+        :return list: List of tuples (``fobi.models.FormEntry`` instance, ID
+            of the form version to be used or None for the draft).
+        """
+        if version_id is None:
+            return [
+                (form_wizard_form_entry.form_entry,
+                 form_wizard_form_entry.form_entry.published_version_id)
+                for form_wizard_form_entry
+                in self.formwizardformentry_set
+                       .all()
+                       .select_related('form_entry')
+            ]
+
+        forms = FormWizardEntryVersion.get_definition(version_id)['forms']
+        form_entries = FormEntry._default_manager.in_bulk(
+            [form['form_entry_id'] for form in forms]
+        )
+        return [
+            (form_entries[form['form_entry_id']],
+             form['form_entry_version_id'])
+            for form in forms
+            if form['form_entry_id'] in form_entries
+        ]
+
+    def get_form_wizard_handler_entries(self, version_id=None):
+        """Get the form wizard handler entries of the form wizard.
+
+        :param int version_id: ID of the form wizard version
+            (``fobi.models.FormWizardEntryVersion``) to get the entries of.
+            If not given, the current entries of the form wizard (draft).
+        :return list: List of ``fobi.models.FormWizardHandlerEntry``
+            instances (in the order of their plugin UIDs).
+        """
+        if version_id is None:
+            return list(
+                self.formwizardhandlerentry_set.order_by('plugin_uid')
+            )
+
+        return [
+            FormWizardHandlerEntry.from_compiled_definition(
+                data,
+                form_wizard_entry=self
+            )
+            for data
+            in FormWizardEntryVersion.get_definition(version_id)['handlers']
+        ]
+
 
 @python_2_unicode_compatible
 class FormEntry(models.Model):
@@ -457,6 +597,23 @@ class FormEntry(models.Model):
         blank=True,
         auto_now=True
     )
+    compiled_definition = models.TextField(
+        _("Compiled definition"),
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=_("Form elements and form handlers of the form (JSON), "
+                    "compiled automatically.")
+    )
+    published_version = models.ForeignKey(
+        'fobi.FormEntryVersion',
+        verbose_name=_("Published version"),
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='+',
+        on_delete=models.SET_NULL
+    )
 
     class Meta(object):
         """Meta class."""
@@ -468,6 +625,42 @@ class FormEntry(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        """Save.
+
+        The compiled definition is not saved along with the other fields
+        (it is written by the ``update_compiled_definition`` only), so that
+        the definition compiled meanwhile is not overwritten by the one
+        loaded with the form entry.
+        """
+        using = kwargs.get('using') \
+            or router.db_for_write(FormEntry, instance=self)
+        if not args \
+                and not kwargs.get('force_insert') \
+                and not self._state.adding \
+                and self._state.db == using:
+            update_fields = kwargs.get('update_fields')
+            if update_fields is None:
+                update_fields = [
+                    field.name
+                    for field in self._meta.concrete_fields
+                    if not field.primary_key
+                ]
+            kwargs['update_fields'] = [
+                field_name
+                for field_name in update_fields
+                if field_name != 'compiled_definition'
+            ]
+        super(FormEntry, self).save(*args, **kwargs)
+
+    def refresh_from_db(self, *args, **kwargs):
+        """Refresh from the database.
+
+        The (parsed) compiled definition is parsed again once read.
+        """
+        super(FormEntry, self).refresh_from_db(*args, **kwargs)
+        self._parsed_compiled_definition = None
+
     @property
     def is_active(self):
         active_from_ok = True
@@ -496,6 +689,199 @@ class FormEntry(models.Model):
             kwargs={'form_entry_slug': self.slug}
         )
 
+    def compile_definition(self, using=None):
+        """Compile the definition of the form.
+
+        The compiled definition is a single JSON document holding the form
+        element entries (in the order of their positions) and the form
+        handler entries (in the order of their plugin UIDs) of the form,
+        with their plugin data already parsed (see
+        ``BaseAbstractPluginEntry.get_compiled_definition``), and the early
+        checks of the submissions (see ``fobi.base.check_submission``).
+
+        :param str using: Database alias.
+        :return str:
+        """
+        # Imported here, since ``fobi.base`` can not be imported before the
+        # apps are loaded.
+        from .base import get_form_element_submission_checks
+
+        using = using or router.db_for_read(FormEntry, instance=self)
+        form_element_entries = FormElementEntry._default_manager \
+            .using(using) \
+            .filter(form_entry_id=self.pk) \
+            .order_by('position', 'pk')
+        form_handler_entries = FormHandlerEntry._default_manager \
+            .using(using) \
+            .filter(form_entry_id=self.pk) \
+            .order_by('plugin_uid', 'pk')
+        form_element_entries = list(form_element_entries)
+        return json.dumps({
+            'version': COMPILED_FORM_DEFINITION_VERSION,
+            'elements': [
+                entry.get_compiled_definition()
+                for entry in form_element_entries
+            ],
+            'handlers': [
+                entry.get_compiled_definition()
+                for entry in form_handler_entries
+            ],
+            'submission_checks': get_form_element_submission_checks(
+                form_element_entries
+            ),
+        })
+
+    def update_compiled_definition(self, using=None):
+        """Compile the definition of the form and store it.
+
+        The form entry row is locked while compiling, so that concurrent
+        changes of the form elements (or handlers) are compiled one after
+        another.
+
+        :param str using: Database alias.
+        """
+        using = using or router.db_for_write(FormEntry, instance=self)
+        with transaction.atomic(using=using):
+            queryset = FormEntry._default_manager \
+                .using(using) \
+                .filter(pk=self.pk)
+            list(queryset.select_for_update().values_list('pk', flat=True))
+            self.compiled_definition = self.compile_definition(using=using)
+            queryset.update(compiled_definition=self.compiled_definition)
+        self._parsed_compiled_definition = None
+
+    def get_compiled_definition(self):
+        """Get the (parsed) compiled definition of the form.
+
+        Compiled (and stored) first if missing or outdated.
+
+        :return dict:
+        """
+        definition = getattr(self, '_parsed_compiled_definition', None)
+        if definition is not None:
+            return definition
+
+        if self.compiled_definition:
+            try:
+                definition = json.loads(self.compiled_definition)
+            except ValueError:
+                definition = None
+
+        if (not isinstance(definition, dict)
+                or COMPILED_FORM_DEFINITION_VERSION !=
+                definition.get('version')):
+            self.update_compiled_definition()
+            definition = json.loads(self.compiled_definition)
+
+        self._parsed_compiled_definition = definition
+        return definition
+
+    def publish(self, using=None):
+        """Publish the form.
+
+        Freezes the form elements and the form handlers of the form into a
+        new (immutable) version, served by the public views from then on.
+        Changes made afterwards (draft) are not served until published.
+
+        :param str using: Database alias.
+        :return fobi.models.FormEntryVersion:
+        """
+        using = using or router.db_for_write(FormEntry, instance=self)
+        with transaction.atomic(using=using):
+            queryset = FormEntry._default_manager \
+                .using(using) \
+                .filter(pk=self.pk)
+            list(queryset.select_for_update().values_list('pk', flat=True))
+            version = FormEntryVersion._default_manager \
+                .using(using) \
+                .create(
+                    form_entry=self,
+                    version=FormEntryVersion.get_next_version(
+                        using=using,
+                        form_entry_id=self.pk
+                    ),
+                    definition=self.compile_definition(using=using)
+                )
+            queryset.update(published_version=version)
+
+        self.published_version = version
+        return version
+
+    def _get_definition(self, version_id=None):
+        """Get the (parsed) definition of the version given or the draft.
+
+        :param int version_id:
+        :return dict: None if the draft is not compiled.
+        """
+        if version_id is not None:
+            return FormEntryVersion.get_definition(version_id)
+        if COMPILE_FORM_DEFINITIONS:
+            return self.get_compiled_definition()
+        return None
+
+    def get_form_element_entries(self, version_id=None):
+        """Get the form element entries of the form.
+
+        Read from the definition of the version given (public views use the
+        ``published_version_id``). Otherwise, the current entries of the
+        form (draft), read from the compiled definition of the form (no
+        database hit) if ``FOBI_COMPILE_FORM_DEFINITIONS`` is set to True.
+        Entries read from the definitions are not meant to be saved.
+
+        :param int version_id: ID of the form version
+            (``fobi.models.FormEntryVersion``).
+        :return list: List of ``fobi.models.FormElementEntry`` instances.
+        """
+        definition = self._get_definition(version_id)
+        if definition is None:
+            return list(self.formelemententry_set.all())
+
+        return [
+            FormElementEntry.from_compiled_definition(data,
+                                                      form_entry=self)
+            for data in definition['elements']
+        ]
+
+    def get_form_handler_entries(self, version_id=None):
+        """Get the form handler entries of the form.
+
+        See ``get_form_element_entries``.
+
+        :param int version_id: ID of the form version
+            (``fobi.models.FormEntryVersion``).
+        :return list: List of ``fobi.models.FormHandlerEntry`` instances
+            (in the order of their plugin UIDs).
+        """
+        definition = self._get_definition(version_id)
+        if definition is None:
+            return list(self.formhandlerentry_set.order_by('plugin_uid'))
+
+        return [
+            FormHandlerEntry.from_compiled_definition(data,
+                                                      form_entry=self)
+            for data in definition['handlers']
+        ]
+
+    def get_submission_checks(self, version_id=None):
+        """Get the early checks of the submissions of the form.
+
+        Precomputed (read from the definition), if possible. See
+        ``get_form_element_entries``.
+
+        :param int version_id: ID of the form version
+            (``fobi.models.FormEntryVersion``).
+        :return list: See ``fobi.base.check_submission``.
+        """
+        from .base import get_form_element_submission_checks
+
+        definition = self._get_definition(version_id)
+        if definition is not None and 'submission_checks' in definition:
+            return definition['submission_checks']
+
+        return get_form_element_submission_checks(
+            self.get_form_element_entries(version_id=version_id)
+        )
+
 
 @python_2_unicode_compatible
 class FormWizardFormEntry(models.Model):
@@ -536,6 +922,141 @@ class FormWizardFormEntry(models.Model):
         return "{0} - {1}".format(self.form_wizard_entry, self.form_entry)
 
 
+# ****************************************************************************
+# ****************************************************************************
+# ********************************* Versions *********************************
+# ****************************************************************************
+# ****************************************************************************
+
+
+class AbstractVersion(models.Model):
+    """Abstract (immutable) published version.
+
+    :Properties:
+
+        - `version` (int): Version number.
+        - `definition` (str): JSON formatted definition (snapshot).
+    """
+
+    version = models.PositiveIntegerField(_("Version"))
+    definition = models.TextField(_("Definition"), editable=False)
+    created = models.DateTimeField(_("Created"), auto_now_add=True)
+
+    class Meta(object):
+        """Meta class."""
+
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        """Save (versions can not be changed once saved)."""
+        if not self._state.adding:
+            raise ValueError("Published versions can not be changed.")
+        super(AbstractVersion, self).save(*args, **kwargs)
+
+    @classmethod
+    def get_next_version(cls, using=None, **filters):
+        """Get the next version number.
+
+        :param str using: Database alias.
+        :param dict filters: Container of the versions.
+        :return int:
+        """
+        last_version = cls._default_manager \
+            .using(using) \
+            .filter(**filters) \
+            .aggregate(version=models.Max('version'))['version']
+        return (last_version or 0) + 1
+
+    @classmethod
+    def get_definition_cache_key(cls, pk, using=None):
+        """Get the cache key of the definition of the version.
+
+        :param int pk: ID of the version.
+        :param str using: Database alias.
+        :return str:
+        """
+        return 'fobi.{0}.{1}.{2}.{3}'.format(
+            using or router.db_for_read(cls),
+            cls._meta.model_name,
+            COMPILED_FORM_DEFINITION_VERSION,
+            pk
+        )
+
+    @classmethod
+    def get_definition(cls, pk):
+        """Get the (parsed) definition of the version.
+
+        Since versions do not change, definitions are cached forever (per
+        database and format of the definitions).
+
+        :param int pk: ID of the version.
+        :return dict:
+        """
+        using = router.db_for_read(cls)
+        key = cls.get_definition_cache_key(pk, using=using)
+        definition = cache.get(key)
+        if definition is None:
+            definition = json.loads(
+                cls._default_manager.using(using)
+                                    .values_list('definition', flat=True)
+                                    .get(pk=pk)
+            )
+            cache.set(key, definition, None)
+        return definition
+
+
+@python_2_unicode_compatible
+class FormEntryVersion(AbstractVersion):
+    """Published version of the form.
+
+    Snapshot of the form elements and the form handlers of the form.
+    """
+
+    form_entry = models.ForeignKey(
+        FormEntry,
+        verbose_name=_("Form"),
+        related_name='versions',
+        on_delete=models.CASCADE
+    )
+
+    class Meta(object):
+        """Meta class."""
+
+        verbose_name = _("Form entry version")
+        verbose_name_plural = _("Form entry versions")
+        unique_together = (('form_entry', 'version'),)
+
+    def __str__(self):
+        return "{0} (version {1})".format(self.form_entry, self.version)
+
+
+@python_2_unicode_compatible
+class FormWizardEntryVersion(AbstractVersion):
+    """Published version of the form wizard.
+
+    Snapshot of the forms (versions) and the form wizard handlers of the
+    form wizard.
+    """
+
+    form_wizard_entry = models.ForeignKey(
+        FormWizardEntry,
+        verbose_name=_("Form wizard"),
+        related_name='versions',
+        on_delete=models.CASCADE
+    )
+
+    class Meta(object):
+        """Meta class."""
+
+        verbose_name = _("Form wizard entry version")
+        verbose_name_plural = _("Form wizard entry versions")
+        unique_together = (('form_wizard_entry', 'version'),)
+
+    def __str__(self):
+        return "{0} (version {1})".format(self.form_wizard_entry,
+                                          self.version)
+
+
 @python_2_unicode_compatible
 class FormFieldsetEntry(models.Model):
     """Form fieldset entry."""
@@ -585,6 +1106,10 @@ class BaseAbstractPluginEntry(models.Model):
 
         abstract = True
 
+    # Fields (besides the ID and the plugin data) kept in the compiled
+    # definitions.
+    compiled_definition_fields = ('plugin_uid',)
+
     def __str__(self):
         return "{0} plugin for user {1}".format(
             self.plugin_uid, self.entry_user
@@ -610,6 +1135,52 @@ class BaseAbstractPluginEntry(models.Model):
             "You should implement ``get_registry`` method!"
         )
 
+    def get_compiled_definition(self):
+        """Get the definition of the entry (as compiled).
+
+        The plugin data is kept parsed (``data``). Plugin data, which can
+        not be parsed, is kept as is (``plugin_data``).
+
+        :return dict:
+        """
+        definition = {'id': self.pk}
+        try:
+            definition['data'] = json.loads(self.plugin_data) \
+                if self.plugin_data \
+                else None
+        except ValueError:
+            definition['plugin_data'] = self.plugin_data
+
+        for field_name in self.compiled_definition_fields:
+            definition[field_name] = getattr(self, field_name)
+        return definition
+
+    @classmethod
+    def from_compiled_definition(cls, definition, **kwargs):
+        """Make an entry of the compiled definition.
+
+        :param dict definition: Definition of the entry (as returned by the
+            ``get_compiled_definition`` method).
+        :param dict kwargs: Container of the entry (for instance,
+            ``form_entry``).
+        :return fobi.models.BaseAbstractPluginEntry:
+        """
+        for field_name in cls.compiled_definition_fields:
+            kwargs[field_name] = definition.get(field_name)
+        data = definition.get('data')
+        # Definitions of the versions published before hold both.
+        plugin_data = definition.get('plugin_data')
+        if plugin_data is None and data is not None:
+            plugin_data = json.dumps(data)
+        entry = cls(
+            id=definition['id'],
+            plugin_data=plugin_data,
+            **kwargs
+        )
+        entry.compiled_plugin_data = data
+        entry._state.adding = False
+        return entry
+
     def plugin_uid_code(self):
         """Plugin uid code.
 
@@ -654,8 +1225,13 @@ class BaseAbstractPluginEntry(models.Model):
         # So that plugin has the request object
         plugin.request = request
 
+        # Plugin data already parsed (see ``from_compiled_definition``).
+        plugin_data = getattr(self, 'compiled_plugin_data', None)
+        if plugin_data is None:
+            plugin_data = self.plugin_data
+
         return plugin.process(
-            self.plugin_data, fetch_related_data=fetch_related_data
+            plugin_data, fetch_related_data=fetch_related_data
         )
 
 
@@ -732,6 +1308,13 @@ class FormElementEntry(AbstractPluginEntry):
         verbose_name = _("Form element entry")
         verbose_name_plural = _("Form element entries")
         ordering = ['position']
+        index_together = (('form_entry', 'position'),)
+
+    compiled_definition_fields = (
+        'plugin_uid',
+        'position',
+        'form_fieldset_entry_id',
+    )
 
     def get_registered_plugins(self):
         """Gets registered plugins."""
@@ -834,3 +1417,47 @@ class FormWizardHandlerEntry(AbstractFormWizardPluginEntry):
     def get_registry(self):
         """Get registry."""
         return form_wizard_handler_plugin_registry
+
+
+# ****************************************************************************
+# ****************************************************************************
+# ************************ Compiled form definitions *************************
+# ****************************************************************************
+# ****************************************************************************
+
+
+def invalidate_compiled_definitions(sender=None, instance=None, using=None,
+                                    form_entry_ids=None, **kwargs):
+    """Invalidate the compiled definitions of the forms.
+
+    Forms are compiled again once read (so that saving a number of entries
+    does not compile the form over and over again). Connected to the
+    ``post_save`` and ``post_delete`` signals of the ``FormElementEntry``
+    and ``FormHandlerEntry`` models and called after the entries are
+    changed in bulk.
+
+    :param iterable form_entry_ids: IDs of the forms. If not given, the form
+        of the ``instance`` given.
+    """
+    if form_entry_ids is None:
+        form_entry_ids = [instance.form_entry_id]
+
+    queryset = FormEntry._default_manager.filter(pk__in=list(form_entry_ids))
+    if using:
+        queryset = queryset.using(using)
+    queryset.update(compiled_definition=None)
+
+
+def invalidate_version_definition(sender, instance, using=None, **kwargs):
+    """Invalidate the cached definition of the version saved or deleted.
+
+    Connected to the ``post_save`` and ``post_delete`` signals of the
+    ``FormEntryVersion`` and ``FormWizardEntryVersion`` models. Versions
+    do not change, but IDs of the deleted (or rolled back) versions may be
+    reused by the new ones.
+    """
+    cache.delete_many([
+        sender.get_definition_cache_key(instance.pk, using=alias)
+        for alias in set([using, router.db_for_read(sender)])
+        if alias
+    ])
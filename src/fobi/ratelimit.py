@@ -0,0 +1,281 @@
+import logging
+import math
+import threading
+import time
+
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import HttpResponse
+from django.utils.translation import ugettext
+
+from nine import versions
+
+from .exceptions import ImproperlyConfigured
+from .instrumentation import incr
+from .settings import (
+    SUBMISSION_RATE_LIMIT_CACHE,
+    SUBMISSION_RATE_LIMITS,
+    SUBMISSION_RATE_LIMITS_PER_FORM,
+)
+
+__title__ = 'fobi.ratelimit'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = (
+    'SCOPE_FORM',
+    'SCOPE_IP',
+    'SCOPE_USER',
+    'check_submission_rate_limits',
+    'get_rate_limit_hits',
+    'get_rate_limited_response',
+    'get_submission_rate_limits',
+    'parse_rate',
+    'reset_rate_limit_hits',
+)
+
+logger = logging.getLogger(__name__)
+
+SCOPE_FORM = 'form'
+SCOPE_IP = 'ip'
+SCOPE_USER = 'user'
+
+# Narrow scopes are checked first, so that the clients hitting their own
+# limits do not use up the limits of the form.
+SCOPES = (SCOPE_USER, SCOPE_IP, SCOPE_FORM)
+
+PERIODS = {
+    's': 1,
+    'm': 60,
+    'h': 60 * 60,
+    'd': 24 * 60 * 60,
+}
+
+# Used if the configured cache is missing (or does not store anything).
+_LOCAL_CACHE = LocMemCache('fobi-ratelimit', {})
+
+_RATE_LIMIT_HITS = defaultdict(lambda: defaultdict(int))
+
+_RATE_LIMIT_HITS_LOCK = threading.Lock()
+
+
+def parse_rate(rate):
+    """Parse the rate.
+
+    :param str rate: Number of requests per period ("s", "m", "h" or "d"),
+        for instance "10/m".
+    :return tuple: Number of requests, period in seconds.
+    """
+    try:
+        num_requests, period = rate.split('/')
+        num_requests = int(num_requests)
+        period = PERIODS[period.strip()[:1].lower()]
+    except (AttributeError, KeyError, ValueError):
+        raise ImproperlyConfigured(
+            "Invalid rate {0}. Expected format is, for instance, "
+            "\"10/m\".".format(rate)
+        )
+    if num_requests < 1:
+        raise ImproperlyConfigured(
+            "Invalid rate {0}. At least one request per period shall be "
+            "allowed.".format(rate)
+        )
+    return num_requests, period
+
+
+def get_submission_rate_limits(form_entry):
+    """Get the rate limits of the submissions of the form.
+
+    :param fobi.models.FormEntry form_entry:
+    :return dict: Rates per scope.
+    """
+    rate_limits = SUBMISSION_RATE_LIMITS_PER_FORM.get(form_entry.slug,
+                                                      SUBMISSION_RATE_LIMITS)
+    return rate_limits or {}
+
+
+def _get_cache():
+    """Get the cache the rate limits are counted in."""
+    if SUBMISSION_RATE_LIMIT_CACHE in settings.CACHES:
+        cache = caches[SUBMISSION_RATE_LIMIT_CACHE]
+        if not isinstance(cache, DummyCache):
+            return cache
+    return _LOCAL_CACHE
+
+
+def _get_bucket_id(request, form_entry, scope):
+    """Get the ID of the token bucket of the scope.
+
+    :param django.http.HttpRequest request:
+    :param fobi.models.FormEntry form_entry:
+    :param str scope:
+    :return str: None if the scope does not apply to the request.
+    """
+    if SCOPE_FORM == scope:
+        return '{0}'.format(form_entry.pk)
+
+    if SCOPE_IP == scope:
+        return '{0}.{1}'.format(form_entry.pk,
+                                request.META.get('REMOTE_ADDR', ''))
+
+    if SCOPE_USER == scope:
+        user = getattr(request, 'user', None)
+        if user is None:
+            return None
+        if versions.DJANGO_GTE_1_10:
+            user_is_authenticated = user.is_authenticated
+        else:
+            user_is_authenticated = user.is_authenticated()
+        if not user_is_authenticated:
+            return None
+        return '{0}.{1}'.format(form_entry.pk, user.pk)
+
+    return None
+
+
+def _take_token(cache, key, num_requests, period):
+    """Take a token from the bucket.
+
+    Token buckets are implemented as the generic cell rate algorithm (GCRA),
+    using the atomic increments of the cache only: the theoretical arrival
+    time (TAT) of the next request is kept in the cache.
+
+    :param django.core.cache.backends.base.BaseCache cache:
+    :param str key: Cache key of the bucket.
+    :param int num_requests: Capacity of the bucket.
+    :param int period: Time (in seconds) the bucket is refilled in.
+    :return float: None if taken. Otherwise, number of seconds until the next
+        token is available.
+    """
+    now = int(time.time() * 1000)
+    interval = max(period * 1000 // num_requests, 1)
+    timeout = period + 1
+
+    try:
+        tat = cache.incr(key, interval)
+    except ValueError:
+        # New (or full and forgotten) bucket
+        if cache.add(key, now + interval, timeout):
+            return None
+        tat = cache.incr(key, interval)
+
+    if tat - interval < now:
+        # Bucket has been refilled in the meantime
+        cache.set(key, now + interval, timeout)
+        return None
+
+    if tat - now > num_requests * interval:
+        # Bucket is empty. Denied requests do not take tokens.
+        cache.decr(key, interval)
+        return (tat - num_requests * interval - now) / 1000.0
+
+    if hasattr(cache, 'touch'):
+        cache.touch(key, timeout)
+    return None
+
+
+def _return_token(cache, key, num_requests, period):
+    """Return the token taken to the bucket."""
+    cache.decr(key, max(period * 1000 // num_requests, 1))
+
+
+def check_submission_rate_limits(request, form_entry, action=None):
+    """Check the rate limits of the submission of the form.
+
+    Checked before the form is assembled. Limit hits are counted (see
+    ``get_rate_limit_hits``).
+
+    :param django.http.HttpRequest request:
+    :param fobi.models.FormEntry form_entry:
+    :param str action: Name of other action limited by the rates of the
+        submissions (such as "upload", the direct uploads of the files).
+        Counted apart from the submissions.
+    :return float: None if not limited. Otherwise, number of seconds until
+        the client may submit again.
+    """
+    rate_limits = get_submission_rate_limits(form_entry)
+    for scope in rate_limits:
+        if scope not in SCOPES:
+            raise ImproperlyConfigured(
+                "Invalid rate limit scope {0}. Expected one of: {1}.".format(
+                    scope, ', '.join(SCOPES)
+                )
+            )
+
+    taken = []
+    for scope in SCOPES:
+        rate = rate_limits.get(scope)
+        if not rate:
+            continue
+
+        bucket_id = _get_bucket_id(request, form_entry, scope)
+        if bucket_id is None:
+            continue
+
+        num_requests, period = parse_rate(rate)
+        key = 'fobi.ratelimit.{0}.{1}'.format(scope, bucket_id)
+        if action:
+            key = '{0}.{1}'.format(key, action)
+        cache = _get_cache()
+        try:
+            retry_after = _take_token(cache, key, num_requests, period)
+        except Exception as err:
+            if cache is _LOCAL_CACHE:
+                raise
+            logger.warning("Rate limit cache failed, falling back to the "
+                           "local memory. Details: %s", err)
+            cache = _LOCAL_CACHE
+            retry_after = _take_token(cache, key, num_requests, period)
+
+        if retry_after is None:
+            taken.append((cache, key, num_requests, period))
+            continue
+
+        # Limited submissions do not use up the limits of other scopes.
+        for token in taken:
+            _return_token(*token)
+
+        with _RATE_LIMIT_HITS_LOCK:
+            _RATE_LIMIT_HITS[form_entry.slug][scope] += 1
+        incr('submission.rate_limited', scope=scope)
+        logger.debug("Submission of the form %s rate limited (%s).",
+                     form_entry.slug,
+                     scope)
+        return max(retry_after, 0)
+
+    return None
+
+
+def get_rate_limited_response(retry_after):
+    """Get the "429 Too Many Requests" response.
+
+    :param float retry_after: Number of seconds until the client may submit
+        again.
+    :return django.http.HttpResponse:
+    """
+    response = HttpResponse(ugettext("Too many submissions."), status=429)
+    response['Retry-After'] = int(math.ceil(retry_after))
+    return response
+
+
+def get_rate_limit_hits():
+    """Get the counts of the rate limited submissions (in this process).
+
+    :return dict: Counts per scope per form slug.
+    """
+    with _RATE_LIMIT_HITS_LOCK:
+        return {
+            form_entry_slug: dict(counts)
+            for form_entry_slug, counts
+            in _RATE_LIMIT_HITS.items()
+        }
+
+
+def reset_rate_limit_hits():
+    """Reset the counts of the rate limited submissions."""
+    with _RATE_LIMIT_HITS_LOCK:
+        _RATE_LIMIT_HITS.clear()
@@ -0,0 +1,158 @@
+import threading
+import time
+
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS
+
+from .settings import READ_DATABASE, READ_DATABASE_PIN_SECONDS
+
+__title__ = 'fobi.routers'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = (
+    'PIN_SESSION_KEY',
+    'ReadDatabaseRouter',
+    'SAFE_METHODS',
+    'get_current_read_database',
+    'get_read_database',
+    'is_pinned_to_primary_database',
+    'pin_primary_database',
+    'read_database',
+)
+
+# Session key holding the time (timestamp) the session is served from the
+# default database until.
+PIN_SESSION_KEY = 'fobi.read_database.pinned_until'
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+_local = threading.local()
+
+
+def get_current_read_database():
+    """Get the alias of the database the current thread reads from.
+
+    :return str: Database alias or None if not reading from the read
+        database.
+    """
+    return getattr(_local, 'using', None)
+
+
+@contextmanager
+def read_database(using):
+    """Read the `fobi` models from the database given.
+
+    Works with the ``fobi.routers.ReadDatabaseRouter`` database router only.
+
+    :param str using: Database alias.
+
+    :example:
+    >>> with read_database('replica'):
+    >>>     form_entry = FormEntry.objects.get(slug='contact')
+    """
+    previous = get_current_read_database()
+    _local.using = using
+    try:
+        yield
+    finally:
+        _local.using = previous
+
+
+def is_pinned_to_primary_database(request):
+    """Check if the session is served from the default database.
+
+    :param django.http.HttpRequest request:
+    :return bool:
+    """
+    session = getattr(request, 'session', None)
+    if session is None:
+        return False
+    return session.get(PIN_SESSION_KEY, 0) > time.time()
+
+
+def pin_primary_database(request):
+    """Serve the session from the default database for a while.
+
+    Called after changing data, so that the changes are seen on the next
+    requests despite of the replication lag.
+
+    :param django.http.HttpRequest request:
+    """
+    session = getattr(request, 'session', None)
+    if READ_DATABASE and READ_DATABASE_PIN_SECONDS and session is not None:
+        session[PIN_SESSION_KEY] = time.time() + READ_DATABASE_PIN_SECONDS
+
+
+def get_read_database(request):
+    """Get the alias of the database the request shall read from.
+
+    Only the safe (read-only) requests of sessions not pinned to the default
+    database are read from the read database.
+
+    :param django.http.HttpRequest request:
+    :return str: Database alias or None if the request shall be served from
+        the default database.
+    """
+    if not READ_DATABASE \
+            or request.method not in SAFE_METHODS \
+            or is_pinned_to_primary_database(request):
+        return None
+    return READ_DATABASE
+
+
+def _is_fobi_model(model):
+    """Check if the model belongs to `fobi` (or one of its contrib apps).
+
+    :param django.db.models.Model model:
+    :return bool:
+    """
+    app_config = model._meta.app_config
+    if app_config is None:
+        return False
+    app_name = app_config.name
+    return 'fobi' == app_name or app_name.startswith('fobi.')
+
+
+class ReadDatabaseRouter(object):
+    """Database router reading the `fobi` models from the read database.
+
+    The `fobi` models are read from the read database (the
+    ``FOBI_READ_DATABASE`` setting) within the ``read_database`` context
+    only (the read-only public views). Everything else (submissions, form
+    builder changes) is read from and written to the default database.
+
+    :example:
+    >>> DATABASE_ROUTERS = ['fobi.routers.ReadDatabaseRouter']
+    >>> FOBI_READ_DATABASE = 'replica'
+    """
+
+    def db_for_read(self, model, **hints):
+        """Database to read the model from."""
+        if _is_fobi_model(model):
+            return get_current_read_database()
+        return None
+
+    def db_for_write(self, model, **hints):
+        """Database to write the model to.
+
+        Objects read from the read database are written to the default
+        database.
+        """
+        instance = hints.get('instance')
+        if READ_DATABASE \
+                and instance is not None \
+                and READ_DATABASE == instance._state.db \
+                and _is_fobi_model(model):
+            return DEFAULT_DB_ALIAS
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """Allow relations between the default and the read database."""
+        databases = (DEFAULT_DB_ALIAS, READ_DATABASE)
+        if READ_DATABASE \
+                and obj1._state.db in databases \
+                and obj2._state.db in databases:
+            return True
+        return None
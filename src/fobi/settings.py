@@ -14,6 +14,39 @@
   handler plugins are to be executed.
 - `FORM_WIZARD_HANDLER_PLUGINS_EXECUTION_ORDER` (tuple): Order in which the
   form handler plugins are to be executed.
+- `FORM_HANDLER_PLUGINS_MAX_WORKERS` (int): Max number of threads running
+  the I/O bound form handlers concurrently.
+- `MODEL_OBJECT_CHOICES_PAGE_SIZE` (int): Number of options returned per
+  page by the model object choices endpoint.
+- `MODEL_OBJECT_CHOICES_MAX_PAGE_SIZE` (int): Maximum page size the client
+  may request from the model object choices endpoint.
+- `COMPILE_FORM_DEFINITIONS` (bool): If set to True, the form elements and
+  the form handlers are read from the compiled form definition stored on
+  the form entry. Defaults to False.
+- `READ_DATABASE` (str): Alias of the database the read-only public views
+  read from.
+- `READ_DATABASE_PIN_SECONDS` (int): Number of seconds the session is served
+  from the default database after changing data.
+- `CACHE_CONTROL` (dict): Cache-Control directives of the form pages served
+  to the anonymous users.
+- `CACHE_CONTROL_PER_FORM` (dict): Cache-Control directives of the given
+  forms (slug as key).
+- `SUBMISSION_IDEMPOTENCY_TIMEOUT` (int): Number of seconds the submissions
+  are remembered for.
+- `SUBMISSION_IDEMPOTENCY_CACHE` (str): Alias of the cache the submissions
+  are remembered in.
+- `SUBMISSION_IDEMPOTENCY_FINGERPRINT` (bool): If set to True, submissions
+  without the idempotency key are identified by the submitted data.
+- `SUBMISSION_RATE_LIMITS` (dict): Rate limits of the form submissions
+  (scope as key).
+- `SUBMISSION_RATE_LIMITS_PER_FORM` (dict): Rate limits of the submissions
+  of the given forms (slug as key).
+- `SUBMISSION_RATE_LIMIT_CACHE` (str): Alias of the cache the rate limits are
+  counted in.
+- `INSTRUMENTATION_BACKEND` (str): Dotted path to the instrumentation backend
+  class.
+- `INSTRUMENTATION_BACKEND_OPTIONS` (dict): Keyword arguments of the
+  instrumentation backend class.
 - `DEBUG`
 """
 from .conf import get_setting
@@ -24,6 +57,9 @@ __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
 __all__ = (
+    'CACHE_CONTROL',
+    'CACHE_CONTROL_PER_FORM',
+    'COMPILE_FORM_DEFINITIONS',
     'CUSTOM_THEME_DATA',
     'DEBUG',
     'DEFAULT_MAX_LENGTH',
@@ -41,14 +77,27 @@ __all__ = (
     'FORM_CALLBACKS_MODULE_NAME',
     'FORM_ELEMENT_PLUGINS_MODULE_NAME',
     'FORM_HANDLER_PLUGINS_EXECUTION_ORDER',
+    'FORM_HANDLER_PLUGINS_MAX_WORKERS',
     'FORM_HANDLER_PLUGINS_MODULE_NAME',
     'SORT_PLUGINS_BY_VALUE',
     'FORM_IMPORTER_PLUGINS_MODULE_NAME',
     'FORM_WIZARD_HANDLER_PLUGINS_EXECUTION_ORDER',
     'GET_PARAM_INITIAL_DATA',
+    'INSTRUMENTATION_BACKEND',
+    'INSTRUMENTATION_BACKEND_OPTIONS',
     'INTEGRATION_FORM_ELEMENT_PLUGINS_MODULE_NAME',
     'INTEGRATION_FORM_HANDLER_PLUGINS_MODULE_NAME',
+    'MODEL_OBJECT_CHOICES_MAX_PAGE_SIZE',
+    'MODEL_OBJECT_CHOICES_PAGE_SIZE',
+    'READ_DATABASE',
+    'READ_DATABASE_PIN_SECONDS',
     'RESTRICT_PLUGIN_ACCESS',
+    'SUBMISSION_IDEMPOTENCY_CACHE',
+    'SUBMISSION_IDEMPOTENCY_FINGERPRINT',
+    'SUBMISSION_IDEMPOTENCY_TIMEOUT',
+    'SUBMISSION_RATE_LIMIT_CACHE',
+    'SUBMISSION_RATE_LIMITS',
+    'SUBMISSION_RATE_LIMITS_PER_FORM',
     'THEME_FOOTER_TEXT',
     'THEMES_MODULE_NAME',
     'WAIT_AT_TEST_END',
@@ -113,12 +162,49 @@ DEFAULT_MIN_LENGTH = get_setting('DEFAULT_MIN_LENGTH')
 DEFAULT_MAX_LENGTH = get_setting('DEFAULT_MAX_LENGTH')
 SORT_PLUGINS_BY_VALUE = get_setting('SORT_PLUGINS_BY_VALUE')
 
+MODEL_OBJECT_CHOICES_PAGE_SIZE = get_setting('MODEL_OBJECT_CHOICES_PAGE_SIZE')
+MODEL_OBJECT_CHOICES_MAX_PAGE_SIZE = \
+    get_setting('MODEL_OBJECT_CHOICES_MAX_PAGE_SIZE')
+
 FORM_HANDLER_PLUGINS_EXECUTION_ORDER = \
     get_setting('FORM_HANDLER_PLUGINS_EXECUTION_ORDER')
 
 FORM_WIZARD_HANDLER_PLUGINS_EXECUTION_ORDER = \
     get_setting('FORM_WIZARD_HANDLER_PLUGINS_EXECUTION_ORDER')
 
+FORM_HANDLER_PLUGINS_MAX_WORKERS = \
+    get_setting('FORM_HANDLER_PLUGINS_MAX_WORKERS')
+
+COMPILE_FORM_DEFINITIONS = get_setting('COMPILE_FORM_DEFINITIONS')
+
+READ_DATABASE = get_setting('READ_DATABASE')
+
+READ_DATABASE_PIN_SECONDS = get_setting('READ_DATABASE_PIN_SECONDS')
+
+CACHE_CONTROL = get_setting('CACHE_CONTROL')
+
+CACHE_CONTROL_PER_FORM = get_setting('CACHE_CONTROL_PER_FORM')
+
+SUBMISSION_IDEMPOTENCY_TIMEOUT = get_setting('SUBMISSION_IDEMPOTENCY_TIMEOUT')
+
+SUBMISSION_IDEMPOTENCY_CACHE = get_setting('SUBMISSION_IDEMPOTENCY_CACHE')
+
+SUBMISSION_IDEMPOTENCY_FINGERPRINT = get_setting(
+    'SUBMISSION_IDEMPOTENCY_FINGERPRINT'
+)
+
+SUBMISSION_RATE_LIMITS = get_setting('SUBMISSION_RATE_LIMITS')
+
+SUBMISSION_RATE_LIMITS_PER_FORM = \
+    get_setting('SUBMISSION_RATE_LIMITS_PER_FORM')
+
+SUBMISSION_RATE_LIMIT_CACHE = get_setting('SUBMISSION_RATE_LIMIT_CACHE')
+
+INSTRUMENTATION_BACKEND = get_setting('INSTRUMENTATION_BACKEND')
+
+INSTRUMENTATION_BACKEND_OPTIONS = \
+    get_setting('INSTRUMENTATION_BACKEND_OPTIONS')
+
 FAIL_ON_MISSING_FORM_ELEMENT_PLUGINS = \
     get_setting('FAIL_ON_MISSING_FORM_ELEMENT_PLUGINS')
 
@@ -0,0 +1,126 @@
+/*
+    Document   : fobi.builder.js
+    Author     : Artur Barseghyan (artur.barseghyan@gmail.com)
+    Description:
+        `django-fobi` form builder scripts. Saves the ordering of the form
+        elements as soon as they are dragged and dropped, and deletes the
+        form elements, without reloading the whole form.
+*/
+;
+var FobiBuilder = function(form) {
+    this.form = $(form);
+    this.orderUrl = this.form.attr('data-fobi-order-url');
+    this.init();
+};
+FobiBuilder.prototype = {
+    /**
+     * Bind the ordering and the deletion of the form elements.
+     */
+    init: function() {
+        var self = this;
+
+        this.form.on('sortupdate', function() {
+            self.saveOrdering();
+        });
+
+        this.form.on('click', 'a.fobi-delete-form-element-entry', function(event) {
+            event.preventDefault();
+            self.deleteElement($(this));
+        });
+    },
+
+    /**
+     * Headers of the requests.
+     */
+    getHeaders: function() {
+        return {
+            'X-CSRFToken': this.form.find('[name=csrfmiddlewaretoken]').val()
+        };
+    },
+
+    /**
+     * Inputs holding the IDs of the form elements (in the current order).
+     */
+    getIdInputs: function() {
+        return this.form.find('input[name$=-id]').filter(function() {
+            return /^form-\d+-id$/.test(this.name);
+        });
+    },
+
+    /**
+     * Save the ordering of all the form elements at once.
+     */
+    saveOrdering: function() {
+        var ids = this.getIdInputs().map(function() {
+            return $(this).val();
+        }).get();
+
+        $.ajax({
+            url: this.orderUrl,
+            type: 'POST',
+            traditional: true,
+            data: {form_element_entry_ids: ids},
+            dataType: 'json',
+            headers: this.getHeaders()
+        });
+    },
+
+    /**
+     * Delete the form element and remove it from the preview.
+     *
+     * @param {jQuery} link: Delete link of the form element.
+     */
+    deleteElement: function(link) {
+        var self = this;
+
+        $.ajax({
+            url: link.attr('href'),
+            type: 'POST',
+            dataType: 'json',
+            headers: this.getHeaders()
+        }).done(function() {
+            var items = self.form.data('ui-sortable') ?
+                self.form.sortable('option', 'items') :
+                '.form-group, .form-row, .row';
+            link.closest(items).remove();
+            self.renumber();
+        }).fail(function() {
+            window.location = link.attr('href');
+        });
+    },
+
+    /**
+     * Renumber the ordering inputs (as expected by the "Save ordering"
+     * formset) after a form element has been removed.
+     */
+    renumber: function() {
+        var self = this;
+        var idInputs = this.getIdInputs();
+
+        // Collected before renaming (names may clash while renaming).
+        var positionInputs = idInputs.map(function() {
+            var prefix = this.name.replace(/-id$/, '');
+            return self.form.find('[name="' + prefix + '-position"]').get(0);
+        });
+
+        idInputs.each(function(index) {
+            $(this).attr({
+                name: 'form-' + index + '-id',
+                id: 'id_form-' + index + '-id'
+            });
+            $(positionInputs[index]).attr({
+                name: 'form-' + index + '-position',
+                id: 'id_form-' + index + '-position'
+            }).val(index + 1);
+        });
+
+        this.form.find('[name=form-TOTAL_FORMS], [name=form-INITIAL_FORMS]')
+            .val(idInputs.length);
+    }
+};
+
+$(document).ready(function() {
+    $('#fobi-form[data-fobi-order-url]').each(function() {
+        $(this).data('fobiBuilder', new FobiBuilder(this));
+    });
+});
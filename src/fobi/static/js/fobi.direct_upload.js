@@ -0,0 +1,88 @@
+/*
+    Document   : fobi.direct_upload.js
+    Author     : Artur Barseghyan (artur.barseghyan@gmail.com)
+    Description:
+        `django-fobi` direct upload scripts. Uploads the files chosen in the
+        file inputs having the `data-fobi-upload-url` attribute as soon as
+        they are chosen. The form is then submitted with the upload token
+        only.
+*/
+;
+var FobiDirectUpload = function(input) {
+    this.input = $(input);
+    this.url = this.input.attr('data-fobi-upload-url');
+    this.name = this.input.attr('name');
+    this.form = this.input.closest('form');
+    this.request = null;
+    this.init();
+};
+FobiDirectUpload.prototype = {
+    /**
+     * Bind the upload to the change of the file input.
+     */
+    init: function() {
+        var self = this;
+
+        this.tokenInput = $('<input type="hidden">');
+        this.errorContainer = $('<span class="fobi-direct-upload-errors"></span>');
+        this.input.after(this.errorContainer);
+
+        this.input.on('change', function() {
+            self.upload();
+        });
+    },
+
+    /**
+     * Upload the chosen file.
+     */
+    upload: function() {
+        var self = this;
+        var file = this.input[0].files && this.input[0].files[0];
+
+        if (this.request) {
+            this.request.abort();
+        }
+
+        // Until the upload succeeds, the file is submitted regularly.
+        this.tokenInput.remove();
+        this.input.attr('name', this.name);
+        this.errorContainer.text('');
+
+        if (!file) {
+            return;
+        }
+
+        var data = new FormData();
+        data.append('file', file);
+
+        this.form.find('[type=submit]').prop('disabled', true);
+
+        this.request = $.ajax({
+            url: this.url,
+            type: 'POST',
+            data: data,
+            processData: false,
+            contentType: false,
+            dataType: 'json',
+            headers: {
+                'X-CSRFToken': this.form.find('[name=csrfmiddlewaretoken]').val()
+            }
+        }).done(function(data) {
+            self.tokenInput.attr('name', self.name).val(data.token);
+            self.input.removeAttr('name').after(self.tokenInput);
+        }).fail(function(xhr) {
+            if (xhr.responseJSON && xhr.responseJSON.errors) {
+                self.errorContainer.text(xhr.responseJSON.errors.join(' '));
+            }
+        }).always(function() {
+            self.request = null;
+            self.form.find('[type=submit]').prop('disabled', false);
+        });
+    }
+};
+
+$(document).ready(function() {
+    $('input[type=file][data-fobi-upload-url]').each(function() {
+        $(this).data('fobiDirectUpload', new FobiDirectUpload(this));
+    });
+});
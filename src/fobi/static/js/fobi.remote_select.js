@@ -0,0 +1,147 @@
+/*
+    Document   : fobi.remote_select.js
+    Author     : Artur Barseghyan (artur.barseghyan@gmail.com)
+    Description:
+        `django-fobi` remote select scripts. Loads the options of the
+        select elements having the `data-fobi-remote-url` attribute
+        incrementally (with search) from the JSON endpoint given.
+*/
+;
+var FobiRemoteSelect = function(select, options) {
+    this.select = $(select);
+    this.url = this.select.attr('data-fobi-remote-url');
+    this.page = 0;
+    this.term = '';
+    this.more = true;
+    this.request = null;
+    this.timer = null;
+    this.config(options);
+    this.init();
+};
+FobiRemoteSelect.prototype = {
+    /**
+     * Delay (in milliseconds) between the last keystroke and the search.
+     */
+    searchDelay: 300,
+
+    /**
+     * Placeholder of the search input.
+     */
+    searchPlaceholder: 'Search...',
+
+    /**
+     * Text of the "load more" link.
+     */
+    loadMoreText: 'Load more',
+
+    /**
+     * List/array of configurable properties (to avoid accidental mistakes).
+     */
+    configurable: ['searchDelay', 'searchPlaceholder', 'loadMoreText'],
+
+    /**
+     * Configure the defaults.
+     *
+     * @param {Dictionary} options:
+     */
+    config: function(options) {
+        if (options) {
+            for (key in options) {
+                if ((key in this) && (this.configurable.indexOf(key) !== -1)) {
+                    this[key] = options[key];
+                }
+            }
+        }
+    },
+
+    /**
+     * Init the search input and the "load more" link, load the first page.
+     */
+    init: function() {
+        var self = this;
+
+        this.searchInput = $('<input type="text" class="fobi-remote-select-search">')
+            .attr('placeholder', this.searchPlaceholder)
+            .addClass(this.select.attr('class'));
+        this.loadMoreLink = $('<a href="#" class="fobi-remote-select-more"></a>')
+            .text(this.loadMoreText)
+            .hide();
+
+        this.select.before(this.searchInput);
+        this.select.after(this.loadMoreLink);
+
+        this.searchInput.on('keyup', function() {
+            var term = $.trim($(this).val());
+            if (term === self.term) {
+                return;
+            }
+            clearTimeout(self.timer);
+            self.timer = setTimeout(function() {
+                self.term = term;
+                self.reset();
+                self.load();
+            }, self.searchDelay);
+        });
+
+        this.loadMoreLink.on('click', function(event) {
+            event.preventDefault();
+            self.load();
+        });
+
+        this.load();
+    },
+
+    /**
+     * Remove all the not selected options and reset the paging.
+     */
+    reset: function() {
+        this.page = 0;
+        this.more = true;
+        this.select.find('option').filter(function() {
+            return !this.selected && this.value !== '';
+        }).remove();
+    },
+
+    /**
+     * Load the next page of options.
+     */
+    load: function() {
+        var self = this;
+
+        if (!this.more) {
+            return;
+        }
+        if (this.request) {
+            this.request.abort();
+        }
+
+        this.request = $.getJSON(this.url, {
+            'q': this.term,
+            'page': this.page + 1
+        }).done(function(data) {
+            var existing = {};
+            self.select.find('option').each(function() {
+                existing[this.value] = true;
+            });
+            $.each(data.results, function(index, item) {
+                var value = String(item.id);
+                if (!existing[value]) {
+                    self.select.append(
+                        $('<option></option>').val(value).text(item.text)
+                    );
+                }
+            });
+            self.page += 1;
+            self.more = data.more;
+            self.loadMoreLink.toggle(self.more);
+        }).always(function() {
+            self.request = null;
+        });
+    }
+};
+
+$(document).ready(function() {
+    $('select[data-fobi-remote-url]').each(function() {
+        $(this).data('fobiRemoteSelect', new FobiRemoteSelect(this));
+    });
+});
@@ -2,10 +2,28 @@ from __future__ import print_function
 
 import unittest
 
+from .tests.test_broken_entries import *
 from .tests.test_browser_build_dynamic_forms import *
+from .tests.test_compiled_definition import *
+from .tests.test_conditional_responses import *
 from .tests.test_core import *
+from .tests.test_db_store import *
 from .tests.test_dynamic_forms import *
+from .tests.test_file_upload import *
+from .tests.test_form_builder import *
+from .tests.test_form_handlers import *
+from .tests.test_http_repost import *
+from .tests.test_idempotency import *
+from .tests.test_import_export import *
+from .tests.test_instrumentation import *
+from .tests.test_mail import *
+from .tests.test_model_object_choices import *
+from .tests.test_plugin_data import *
+from .tests.test_ratelimit import *
+from .tests.test_read_database import *
 from .tests.test_sortable_dict import *
+from .tests.test_submission_checks import *
+from .tests.test_versions import *
 
 __title__ = 'fobi.test'
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
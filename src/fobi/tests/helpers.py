@@ -7,7 +7,10 @@ from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.management import call_command
 
+import simplejson as json
+
 from fobi.models import FormEntry, FormElementEntry, FormHandlerEntry
+from fobi.utils import get_next_form_element_entry_position
 from fobi.contrib.plugins.form_elements.content \
          .content_text.fobi_form_elements import ContentTextPlugin
 from fobi.contrib.plugins.form_elements.content \
@@ -47,10 +50,13 @@ __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
 __all__ = (
+    'create_form_element_entry',
+    'create_form_entry',
     'create_form_with_entries',
     'db_clean_up',
     'get_or_create_admin_user',
     'get_or_create_admin_user',
+    'get_text_plugin_data',
     'phantom_js_clean_up',
     'setup_app',
 )
@@ -188,6 +194,76 @@ def create_form_with_entries(user=None,
     return form_entry
 
 
+def get_text_plugin_data(name, **kwargs):
+    """Get plugin data of a test text form element.
+
+    :param str name: Name of the field (the label is made of it).
+    :param kwargs: Overrides of the plugin data.
+    :return dict:
+    """
+    plugin_data = {
+        'label': name.title(),
+        'name': name,
+        'required': False,
+        'max_length': 255,
+    }
+    plugin_data.update(kwargs)
+    return plugin_data
+
+
+def create_form_element_entry(form_entry, plugin_uid, plugin_data,
+                              position=None):
+    """Create test form element entry.
+
+    :param fobi.models.FormEntry form_entry:
+    :param str plugin_uid:
+    :param dict plugin_data:
+    :param int position: Defaults to the position after the last entry.
+    :return fobi.models.FormElementEntry:
+    """
+    if position is None:
+        position = get_next_form_element_entry_position(form_entry)
+    return FormElementEntry._default_manager.create(
+        form_entry=form_entry,
+        plugin_uid=plugin_uid,
+        plugin_data=json.dumps(plugin_data),
+        position=position
+    )
+
+
+def create_form_entry(name=TEST_FORM_NAME,
+                      user=None,
+                      is_public=False,
+                      form_elements=(),
+                      form_handlers=()):
+    """Create test form entry.
+
+    :param str name:
+    :param django.contrib.auth.models.User user: Defaults to the admin user.
+    :param bool is_public:
+    :param iterable form_elements: The (plugin_uid, plugin_data) pairs of
+        the form element entries (positioned in the order given).
+    :param iterable form_handlers: The plugin_uids of the form handler
+        entries.
+    :return fobi.models.FormEntry:
+    """
+    if not user:
+        user = get_or_create_admin_user()
+
+    form_entry = FormEntry._default_manager.create(name=name,
+                                                   user=user,
+                                                   is_public=is_public)
+
+    for plugin_uid, plugin_data in form_elements:
+        create_form_element_entry(form_entry, plugin_uid, plugin_data)
+
+    for plugin_uid in form_handlers:
+        FormHandlerEntry._default_manager.create(form_entry=form_entry,
+                                                 plugin_uid=plugin_uid)
+
+    return form_entry
+
+
 def db_clean_up(clean_form=False, clean_elements=True, clean_handlers=True):
     """Clean up the database.
 
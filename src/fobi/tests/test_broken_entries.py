@@ -0,0 +1,117 @@
+import unittest
+
+import simplejson as json
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from six import StringIO
+
+from fobi.base import get_registered_form_element_plugins
+from fobi.models import (
+    FormElementEntry,
+    FormWizardEntry,
+    FormWizardHandlerEntry,
+)
+from fobi.utils import (
+    delete_broken_entries,
+    find_broken_entries,
+    remap_broken_entries,
+    sync_plugins,
+)
+
+from .core import print_info
+from .helpers import create_form_entry, get_or_create_admin_user, setup_app
+
+__title__ = 'fobi.tests.test_broken_entries'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiBrokenEntriesTest',)
+
+
+class FobiBrokenEntriesTest(TestCase):
+    """Tests of finding and repairing the entries of unknown plugins."""
+
+    def setUp(self):
+        """Set up."""
+        setup_app(fobi_sync_plugins=True)
+
+    @print_info
+    def test_01_broken_entries(self):
+        """Test finding and repairing broken entries."""
+        user = get_or_create_admin_user()
+        form_entry = create_form_entry(name="Broken", user=user)
+        form_wizard_entry = FormWizardEntry._default_manager.create(
+            user=user, name="Broken"
+        )
+        FormElementEntry._default_manager.bulk_create([
+            FormElementEntry(form_entry=form_entry,
+                             plugin_uid=plugin_uid,
+                             position=position)
+            for position, plugin_uid
+            in enumerate(['text', 'old_text', 'old_text', 'gone'] * 2)
+        ])
+        FormWizardHandlerEntry._default_manager.create(
+            form_wizard_entry=form_wizard_entry,
+            plugin_uid='gone'
+        )
+        element_plugin_uids = [
+            plugin_uid
+            for plugin_uid, plugin_name
+            in get_registered_form_element_plugins()
+        ]
+
+        self.assertEqual(
+            dict(find_broken_entries(FormElementEntry, element_plugin_uids)),
+            {'gone': 2, 'old_text': 4}
+        )
+
+        # Remapping and deleting in chunks
+        self.assertEqual(
+            dict(remap_broken_entries(FormElementEntry,
+                                      element_plugin_uids,
+                                      {'old_text': 'text'},
+                                      chunk_size=3)),
+            {'old_text': 4}
+        )
+        with self.assertRaises(ValueError):
+            remap_broken_entries(FormElementEntry,
+                                 element_plugin_uids,
+                                 {'gone': 'none'})
+        self.assertEqual(
+            delete_broken_entries(FormElementEntry,
+                                  element_plugin_uids,
+                                  chunk_size=1),
+            2
+        )
+        self.assertEqual(
+            form_entry.formelemententry_set.filter(plugin_uid='text').count(),
+            6
+        )
+
+        # Management command (JSON report)
+        out = StringIO()
+        call_command('fobi_find_broken_entries', '--format', 'json',
+                     stdout=out)
+        report = json.loads(out.getvalue())
+        self.assertEqual(report['FormElementEntry']['broken'], {})
+        self.assertEqual(report['FormWizardHandlerEntry']['broken'],
+                         {'gone': 1})
+        self.assertEqual(report['FormWizardHandlerEntry']['remaining'], 1)
+
+        out = StringIO()
+        call_command('fobi_find_broken_entries', '--delete',
+                     '--format', 'json', stdout=out)
+        report = json.loads(out.getvalue())
+        self.assertEqual(report['FormWizardHandlerEntry']['deleted'], 1)
+        self.assertEqual(report['FormWizardHandlerEntry']['remaining'], 0)
+
+        # Syncing plugins again adds nothing
+        sync_plugins()
+        for result in sync_plugins().values():
+            self.assertEqual(result['added'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import unittest
+
+import simplejson as json
+
+from django.test import TestCase
+
+from nine import versions
+
+from fobi.contrib.plugins.form_handlers.db_store.models import (
+    SavedFormDataEntry,
+)
+from fobi import models, utils
+from fobi.models import FormEntry
+
+from .core import print_info
+from .helpers import (
+    create_form_element_entry,
+    create_form_entry,
+    get_text_plugin_data,
+    setup_app,
+)
+
+__title__ = 'fobi.tests.test_compiled_definition'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiCompiledDefinitionTest',)
+
+if versions.DJANGO_GTE_1_10:
+    from django.urls import reverse
+else:
+    from django.core.urlresolvers import reverse
+
+
+class FobiCompiledDefinitionTest(TestCase):
+    """Tests of the compiled form definitions."""
+
+    def setUp(self):
+        """Set up."""
+        setup_app(fobi_sync_plugins=True)
+        self._compile_form_definitions = models.COMPILE_FORM_DEFINITIONS
+        models.COMPILE_FORM_DEFINITIONS = True
+        utils.COMPILE_FORM_DEFINITIONS = True
+
+    def tearDown(self):
+        """Tear down."""
+        models.COMPILE_FORM_DEFINITIONS = self._compile_form_definitions
+        utils.COMPILE_FORM_DEFINITIONS = self._compile_form_definitions
+
+    @print_info
+    def test_01_compiled_form_definition(self):
+        """Test the compiled form definition."""
+        form_entry = create_form_entry(
+            name="Compiled",
+            is_public=True,
+            form_elements=[('text', get_text_plugin_data(name))
+                           for name in ('first', 'second')],
+            form_handlers=['db_store']
+        )
+
+        # Invalidated on save (not compiled over and over again), compiled
+        # once read
+        form_entry.refresh_from_db()
+        self.assertIsNone(form_entry.compiled_definition)
+        form_element_entries = list(form_entry.formelemententry_set.all())
+        with self.assertNumQueries(2 * len(form_element_entries)):
+            for form_element_entry in form_element_entries:
+                form_element_entry.save()
+        form_entry.get_form_element_entries()
+        form_entry.refresh_from_db()
+        definition = json.loads(form_entry.compiled_definition)
+        self.assertEqual(
+            [element['data']['name'] for element in definition['elements']],
+            ['first', 'second']
+        )
+        self.assertEqual(
+            [handler['plugin_uid'] for handler in definition['handlers']],
+            ['db_store']
+        )
+        # Plugin data is kept parsed only
+        self.assertNotIn('plugin_data', definition['elements'][0])
+
+        # Form rendered with a single query
+        url = reverse('fobi.view_form_entry',
+                      kwargs={'form_entry_slug': form_entry.slug})
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertIn(b'name="second"', response.content)
+
+        # Invalidated on change, compiled again once read
+        first, second = form_entry.formelemententry_set.order_by('position')
+        second.plugin_data = json.dumps(get_text_plugin_data('email'))
+        second.save()
+        response = self.client.get(url)
+        self.assertIn(b'name="email"', response.content)
+        self.assertNotIn(b'name="second"', response.content)
+
+        # Invalidated on deletion, compiled again once read
+        second.delete()
+        form_entry.refresh_from_db()
+        self.assertIsNone(form_entry.compiled_definition)
+        self.assertEqual(
+            [entry.plugin_uid
+             for entry in form_entry.get_form_element_entries()],
+            ['text']
+        )
+        form_entry.refresh_from_db()
+        self.assertIsNotNone(form_entry.compiled_definition)
+
+        # Form handlers run from the compiled definition
+        response = self.client.post(url, {'first': "Value"})
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(
+            SavedFormDataEntry._default_manager.filter(
+                form_entry=form_entry,
+                saved_data__contains='Value'
+            ).exists()
+        )
+
+        # Not overwritten by the form entries loaded before the changes
+        stale_form_entry = FormEntry._default_manager.get(pk=form_entry.pk)
+        create_form_element_entry(form_entry,
+                                  'text',
+                                  get_text_plugin_data('third'))
+        stale_form_entry.name = "Compiled (renamed)"
+        stale_form_entry.save()
+        form_entry.refresh_from_db()
+        self.assertEqual(form_entry.name, "Compiled (renamed)")
+        self.assertIsNone(form_entry.compiled_definition)
+        self.assertEqual(
+            [json.loads(entry.plugin_data)['name']
+             for entry in form_entry.get_form_element_entries()],
+            ['first', 'third']
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
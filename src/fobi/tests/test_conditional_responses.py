@@ -0,0 +1,173 @@
+import unittest
+
+from django.conf import settings
+from django.test import TestCase
+
+from nine import versions
+
+from fobi import idempotency, models, utils
+from fobi.models import FormEntry
+
+from .core import print_info
+from .helpers import (
+    create_form_element_entry,
+    create_form_entry,
+    get_or_create_admin_user,
+    get_text_plugin_data,
+    setup_app,
+)
+
+__title__ = 'fobi.tests.test_conditional_responses'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiConditionalResponsesTest',)
+
+if versions.DJANGO_GTE_1_10:
+    from django.urls import reverse
+else:
+    from django.core.urlresolvers import reverse
+
+
+class FobiConditionalResponsesTest(TestCase):
+    """Tests of the conditional (ETag/Last-Modified) form responses."""
+
+    def setUp(self):
+        """Set up."""
+        setup_app(fobi_sync_plugins=True)
+        self._compile_form_definitions = models.COMPILE_FORM_DEFINITIONS
+        models.COMPILE_FORM_DEFINITIONS = True
+        utils.COMPILE_FORM_DEFINITIONS = True
+        # Pages holding the idempotency keys are served in full
+        self._idempotency_timeout = idempotency.SUBMISSION_IDEMPOTENCY_TIMEOUT
+        idempotency.SUBMISSION_IDEMPOTENCY_TIMEOUT = 0
+
+    def tearDown(self):
+        """Tear down."""
+        models.COMPILE_FORM_DEFINITIONS = self._compile_form_definitions
+        utils.COMPILE_FORM_DEFINITIONS = self._compile_form_definitions
+        idempotency.SUBMISSION_IDEMPOTENCY_TIMEOUT = self._idempotency_timeout
+
+    @print_info
+    def test_01_conditional_form_responses(self):
+        """Test the ETag/Last-Modified of the form pages."""
+        user = get_or_create_admin_user()
+        form_entry = create_form_entry(
+            name="Cached",
+            user=user,
+            is_public=True,
+            form_elements=[('text', get_text_plugin_data('first'))]
+        )
+
+        def add_element(name):
+            return create_form_element_entry(form_entry,
+                                             'text',
+                                             get_text_plugin_data(name))
+
+        url = reverse('fobi.view_form_entry',
+                      kwargs={'form_entry_slug': form_entry.slug})
+
+        # CSRF cookie is set by the first response
+        self.client.get(url)
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertIn('private', response['Cache-Control'])
+        self.assertIn('no-cache', response['Cache-Control'])
+        self.assertFalse(response.has_header('Last-Modified'))
+
+        # Not modified responses are served without assembling the form
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # Changes of the draft change the ETag (once compiled again)
+        add_element('second')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'name="second"', response.content)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+        # Published forms have the Last-Modified as well
+        form_entry.publish()
+        response = self.client.get(url)
+        etag = response['ETag']
+        last_modified = response['Last-Modified']
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+        add_element('third')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # Cache-Control directives per form
+        utils.CACHE_CONTROL_PER_FORM[form_entry.slug] = {'public': True,
+                                                         'max_age': 60}
+        try:
+            response = self.client.get(
+                reverse('fobi.form_entry_submitted',
+                        kwargs={'form_entry_slug': form_entry.slug})
+            )
+            self.assertIn('public', response['Cache-Control'])
+            self.assertIn('max-age=60', response['Cache-Control'])
+            self.assertTrue(response.has_header('ETag'))
+
+            utils.CACHE_CONTROL_PER_FORM[form_entry.slug] = None
+            response = self.client.get(url)
+            self.assertFalse(response.has_header('ETag'))
+        finally:
+            utils.CACHE_CONTROL_PER_FORM.pop(form_entry.slug)
+
+        # Pages of the authenticated users are served in full
+        self.client.force_login(user)
+        response = self.client.get(url)
+        self.assertFalse(response.has_header('ETag'))
+
+    @unittest.skipIf(
+        'fobi.contrib.apps.drf_integration' not in settings.INSTALLED_APPS,
+        "DRF integration app is not installed."
+    )
+    @print_info
+    def test_02_conditional_drf_responses(self):
+        """Test the ETag of the DRF integration app retrieve action."""
+        form_entry = create_form_entry(
+            name="Cached API",
+            is_public=True,
+            form_elements=[('text', get_text_plugin_data('first'))]
+        )
+        form_entry.publish()
+        api_url = reverse('fobi_form_entry-detail',
+                          kwargs={'slug': form_entry.slug})
+
+        response = self.client.get(api_url, {'format': 'json'})
+        etag = response['ETag']
+        self.assertIn('no-cache', response['Cache-Control'])
+        response = self.client.get(api_url, {'format': 'json'},
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # Changes of the draft do not change the data served
+        create_form_element_entry(form_entry,
+                                  'text',
+                                  get_text_plugin_data('second'))
+        response = self.client.get(api_url, {'format': 'json'},
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # Changes of the data served do (even if not timestamped)
+        FormEntry._default_manager.filter(pk=form_entry.pk) \
+                                  .update(title="Renamed")
+        response = self.client.get(api_url, {'format': 'json'},
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['title'], "Renamed")
+        self.assertNotEqual(response['ETag'], etag)
+
+        # Browsable API is served in full
+        response = self.client.get(api_url, HTTP_ACCEPT='text/html')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('ETag'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,249 @@
+import datetime
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+
+import simplejson as json
+
+from django.core.management import call_command
+from django.test import TestCase, RequestFactory
+from django.utils import timezone
+
+from six import StringIO
+
+from fobi.contrib.plugins.form_handlers.db_store.base import (
+    DBStoreHandlerPlugin,
+)
+from fobi.contrib.plugins.form_handlers.db_store.helpers import (
+    get_form_data_aggregates,
+    search_form_data_entries,
+)
+from fobi.contrib.plugins.form_handlers.db_store.models import (
+    SavedFormDataCount,
+    SavedFormDataEntry,
+)
+from fobi.contrib.plugins.form_handlers.db_store.views import (
+    search_saved_form_data_entries,
+)
+
+from .core import print_info
+from .helpers import create_form_entry, get_or_create_admin_user, setup_app
+
+__title__ = 'fobi.tests.test_db_store'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiDBStoreTest',)
+
+
+class FobiDBStoreTest(TestCase):
+    """Tests of the saved form data (DB store form handler)."""
+
+    def setUp(self):
+        """Set up."""
+        setup_app(fobi_sync_plugins=True)
+
+    @print_info
+    def test_01_form_data_aggregates(self):
+        """Test the aggregates of the saved form data."""
+        user = get_or_create_admin_user()
+        form_entry = create_form_entry(name="Aggregates", form_elements=[
+            ('select', {'name': 'colour'}),
+            ('checkbox_select_multiple', {'name': 'toppings'}),
+            ('integer', {'name': 'age', 'min_value': 0, 'max_value': 100}),
+            ('float', {'name': 'weight'}),
+            ('text', {'name': 'comment'}),
+        ])
+
+        request = RequestFactory().post('/')
+        request.user = user
+        plugin = DBStoreHandlerPlugin()
+        for colour, toppings, age, weight in (
+                ('red', ['cheese', 'ham'], 20, 61.5),
+                ('blue', ['cheese'], 35, 80.0),
+                ('red', [], 100, None)):
+            plugin.save_form_data_entry(
+                form_entry,
+                request,
+                {},
+                {'colour': colour,
+                 'toppings': toppings,
+                 'age': age,
+                 'weight': weight,
+                 'comment': "Test"},
+                form_element_entries=form_entry.formelemententry_set.all()
+            )
+
+        aggregates = get_form_data_aggregates(form_entry)
+        self.assertEqual(aggregates['submissions']['total'], 3)
+        self.assertEqual(list(aggregates['fields'].keys()),
+                         ['age', 'colour', 'toppings', 'weight'])
+        fields = aggregates['fields']
+        self.assertEqual(dict(fields['colour']['choices']),
+                         {'red': 2, 'blue': 1})
+        self.assertEqual(dict(fields['toppings']['choices']),
+                         {'cheese': 2, 'ham': 1})
+        self.assertEqual(
+            (fields['age']['count'], fields['age']['min'],
+             fields['age']['max'], fields['age']['mean']),
+            (3, 20, 100, 155.0 / 3)
+        )
+        # Max value belongs to the last bin
+        self.assertEqual(dict(fields['age']['histogram']),
+                         {'20.0': 1, '30.0': 1, '90.0': 1})
+        self.assertEqual(dict(fields['weight']['histogram']),
+                         {'61.0': 1, '80.0': 1})
+
+        # Rebuilt aggregates are the same
+        SavedFormDataCount._default_manager.filter(
+            form_entry=form_entry, field_name='colour'
+        ).delete()
+        out = StringIO()
+        call_command('fobi_db_store_rebuild_aggregates',
+                     '--form-entry', str(form_entry.pk),
+                     '--batch-size', '2',
+                     stdout=out)
+        self.assertIn('3 saved form data entries processed', out.getvalue())
+        self.assertEqual(get_form_data_aggregates(form_entry), aggregates)
+
+    @print_info
+    def test_02_search_saved_form_data_entries(self):
+        """Test the search of the saved form data entries."""
+        user = get_or_create_admin_user()
+        form_entry = create_form_entry(name="Search", user=user)
+        entries = {}
+        for name, email in (('John Doe', 'john.doe@example.com'),
+                            ('Jane Doe', 'jane@example.org'),
+                            ('Ann Smith', 'ann.smith@example.com')):
+            entries[name] = SavedFormDataEntry._default_manager.create(
+                form_entry=form_entry,
+                saved_data=json.dumps({'name': name,
+                                       'email': email,
+                                       'tags': ['a', 'b']})
+            )
+        queryset = SavedFormDataEntry._default_manager.filter(
+            form_entry=form_entry
+        )
+
+        def search(query):
+            return set(
+                search_form_data_entries(queryset, query)
+                .values_list('pk', flat=True)
+            )
+
+        self.assertEqual(search('DOE@EXAMPLE'),
+                         {entries['John Doe'].pk})
+        self.assertEqual(search(' doe '),
+                         {entries['John Doe'].pk, entries['Jane Doe'].pk})
+        self.assertEqual(search('.com'),
+                         {entries['John Doe'].pk, entries['Ann Smith'].pk})
+        # Shorter than a trigram
+        self.assertEqual(search('sm'), {entries['Ann Smith'].pk})
+        self.assertEqual(search('"'), set())
+        self.assertEqual(search(''), set(entries[name].pk
+                                         for name in entries))
+
+        # Kept in sync on save and delete
+        entry = entries['Ann Smith']
+        entry.saved_data = json.dumps({'name': 'Ann Jones'})
+        entry.save()
+        self.assertEqual(search('smith'), set())
+        self.assertEqual(search('jones'), {entry.pk})
+        entry.delete()
+        self.assertEqual(search('jones'), set())
+
+        # Bulk created entries are indexed on rebuild
+        SavedFormDataEntry._default_manager.bulk_create([
+            SavedFormDataEntry(form_entry=form_entry,
+                               saved_data=json.dumps({'name': 'Bulk'}))
+        ])
+        self.assertEqual(search('bulk'), set())
+        out = StringIO()
+        call_command('fobi_db_store_rebuild_search_index',
+                     '--batch-size', '2',
+                     stdout=out)
+        self.assertIn('1 saved form data entries updated', out.getvalue())
+        self.assertEqual(len(search('bulk')), 1)
+
+        # Search view (paginated)
+        request = RequestFactory().get('/', {'q': 'doe', 'per_page': 1,
+                                             'page': 2})
+        request.user = user
+        response = search_saved_form_data_entries(request, form_entry.pk)
+        data = json.loads(response.content.decode('utf-8'))
+        self.assertEqual(
+            (data['count'], data['page'], data['num_pages']),
+            (2, 2, 2)
+        )
+        self.assertEqual(
+            [(result['id'], result['data']['name'])
+             for result in data['results']],
+            [(entries['John Doe'].pk, 'John Doe')]
+        )
+
+    @print_info
+    def test_03_archive_saved_form_data_entries(self):
+        """Test the archival of the old saved form data entries."""
+        user = get_or_create_admin_user()
+        form_entry = create_form_entry(name="Archive", user=user)
+        for age in (100, 40, 31, 5):
+            entry = SavedFormDataEntry._default_manager.create(
+                form_entry=form_entry,
+                user=user,
+                form_data_headers=json.dumps({'age': "Age"}),
+                saved_data=json.dumps({'age': age})
+            )
+            SavedFormDataEntry._default_manager.filter(pk=entry.pk).update(
+                created=timezone.now() - datetime.timedelta(days=age)
+            )
+        queryset = SavedFormDataEntry._default_manager.filter(
+            form_entry=form_entry
+        )
+
+        out = StringIO()
+        call_command('fobi_db_store_archive',
+                     '--no-archive',
+                     '--days', '30',
+                     '--dry-run',
+                     stdout=out)
+        self.assertIn('3 saved form data entries to archive', out.getvalue())
+        self.assertEqual(queryset.count(), 4)
+
+        output_dir = tempfile.mkdtemp()
+        try:
+            out = StringIO()
+            call_command('fobi_db_store_archive',
+                         '--output-dir', output_dir,
+                         '--form-entry', str(form_entry.pk),
+                         '--days', '30',
+                         '--batch-size', '2',
+                         stdout=out)
+            self.assertIn('3 saved form data entries archived',
+                          out.getvalue())
+            file_names = os.listdir(output_dir)
+            self.assertEqual(len(file_names), 1)
+            with gzip.open(os.path.join(output_dir, file_names[0])) as _file:
+                documents = [json.loads(line.decode('utf-8'))
+                             for line in _file]
+        finally:
+            shutil.rmtree(output_dir)
+
+        # Oldest first
+        self.assertEqual([document['data']['age'] for document in documents],
+                         [100, 40, 31])
+        self.assertEqual(
+            (documents[0]['form_entry'], documents[0]['user'],
+             documents[0]['headers']),
+            (form_entry.slug, user.pk, {'age': "Age"})
+        )
+        self.assertEqual(
+            [json.loads(saved_data)['age']
+             for saved_data in queryset.values_list('saved_data', flat=True)],
+            [5]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,8 @@ from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
+from fobi.models import FormEntry
+
 from .constants import FOBI_TEST_USER_USERNAME, FOBI_TEST_USER_PASSWORD
 from .data import (
     TEST_DYNAMIC_FORMS_DEFINITION_DATA_DRF,
@@ -9,7 +11,11 @@ from .data import (
     TEST_DYNAMIC_FORMS_PUT_DATA,
     TEST_DYNAMIC_FORMS_PUT_DATA_ALL,
 )
-from .helpers import create_form_with_entries
+from .helpers import (
+    create_form_element_entry,
+    create_form_with_entries,
+    get_text_plugin_data,
+)
 
 __title__ = 'fobi.tests.test_drf_integration'
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
@@ -171,3 +177,44 @@ class FobiDjangoRestFrameworkIntegrationTests(APITestCase):
         # Testing GET action call
         get_response = self.client.get(self.non_public_url)
         self.assertEqual(get_response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_11_published_version_public_form(self):
+        """Test actions use the published version of the public form."""
+        form_entry = FormEntry._default_manager.get(pk=self.form_entry.pk)
+        form_entry.publish()
+
+        # Changes of the draft are not served until published
+        create_form_element_entry(
+            form_entry,
+            'text',
+            get_text_plugin_data('draft_only', required=True)
+        )
+
+        options_response = self.client.options(self.url)
+        self.assertEqual(options_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(options_response.data['actions']['PUT'],
+                         TEST_DYNAMIC_FORMS_OPTIONS_RESPONSE)
+
+        get_response = self.client.get(self.url)
+        self.assertEqual(get_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(get_response.data['id'], form_entry.pk)
+
+        put_response = self.client.put(
+            self.url,
+            TEST_DYNAMIC_FORMS_PUT_DATA,
+            format='json'
+        )
+        self.assertEqual(put_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(dict(put_response.data),
+                         dict(TEST_DYNAMIC_FORMS_PUT_DATA))
+
+        # Once published, the changes are served
+        form_entry.publish()
+        put_response = self.client.put(
+            self.url,
+            TEST_DYNAMIC_FORMS_PUT_DATA,
+            format='json'
+        )
+        self.assertEqual(put_response.status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        self.assertIn('draft_only', put_response.data)
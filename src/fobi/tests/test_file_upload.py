@@ -0,0 +1,119 @@
+import shutil
+import tempfile
+import unittest
+
+import simplejson as json
+
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+
+from nine import versions
+
+from fobi import ratelimit
+
+from .core import print_info
+from .helpers import create_form_entry, setup_app
+
+__title__ = 'fobi.tests.test_file_upload'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiFileUploadTest',)
+
+if versions.DJANGO_GTE_1_10:
+    from django.urls import reverse
+else:
+    from django.core.urlresolvers import reverse
+
+
+class FobiFileUploadTest(TestCase):
+    """Tests of the uploads of the file fields."""
+
+    def setUp(self):
+        """Set up."""
+        setup_app(fobi_sync_plugins=True)
+
+    @print_info
+    def test_01_file_direct_upload(self):
+        """Test direct upload of the file fields."""
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+
+        form_entry = create_form_entry(is_public=True, form_elements=[
+            ('file', {'label': "Test file",
+                      'name': 'test_file',
+                      'help_text': '',
+                      'initial': '',
+                      'max_length': 255,
+                      'required': True,
+                      'allowed_extensions': '.txt',
+                      'direct_upload': True}),
+        ])
+
+        url = reverse(
+            'fobi.form_entry_file_upload',
+            kwargs={'form_entry_slug': form_entry.slug,
+                    'field_name': 'test_file'}
+        )
+
+        with override_settings(MEDIA_ROOT=media_root):
+            # Not allowed extension
+            response = self.client.post(
+                url,
+                {'file': SimpleUploadedFile('test.pdf', b'Lorem ipsum')}
+            )
+            self.assertEqual(response.status_code, 400)
+
+            tokens = []
+            for __i in range(2):
+                response = self.client.post(
+                    url,
+                    {'file': SimpleUploadedFile('test.txt', b'Lorem ipsum')}
+                )
+                self.assertEqual(response.status_code, 200)
+                tokens.append(
+                    json.loads(response.content.decode('utf-8'))['token']
+                )
+
+            # Identical files are stored once
+            self.assertEqual(tokens[0], tokens[1])
+            [directory], __files = default_storage.listdir('fobi_plugins/file')
+            self.assertEqual(
+                len(default_storage.listdir(
+                    'fobi_plugins/file/{0}'.format(directory)
+                )[1]),
+                1
+            )
+
+            # Invalid token
+            response = self.client.post(form_entry.get_absolute_url(),
+                                        {'test_file': 'invalid'})
+            self.assertEqual(response.status_code, 200)
+
+            response = self.client.post(form_entry.get_absolute_url(),
+                                        {'test_file': tokens[0]})
+            self.assertEqual(response.status_code, 302)
+
+            # Uploads are rate limited
+            ratelimit.SUBMISSION_RATE_LIMITS_PER_FORM[form_entry.slug] = {
+                ratelimit.SCOPE_IP: '2/h',
+            }
+            ratelimit.reset_rate_limit_hits()
+            try:
+                for status_code in (200, 200, 429):
+                    response = self.client.post(
+                        url,
+                        {'file': SimpleUploadedFile('test.txt', b'Limited')}
+                    )
+                    self.assertEqual(response.status_code, status_code)
+                self.assertTrue(response.has_header('Retry-After'))
+                self.assertEqual(ratelimit.get_rate_limit_hits(),
+                                 {form_entry.slug: {ratelimit.SCOPE_IP: 1}})
+            finally:
+                ratelimit.SUBMISSION_RATE_LIMITS_PER_FORM.pop(form_entry.slug)
+                ratelimit.reset_rate_limit_hits()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,221 @@
+import unittest
+
+import simplejson as json
+
+from django.test import TestCase
+
+from nine import versions
+
+from fobi.constants import FORM_ELEMENT_ENTRY_POSITION_STEP
+from fobi.forms import FormElementEntryFormSet
+from fobi.models import FormElementEntry
+from fobi.utils import (
+    get_next_form_element_entry_position,
+    update_form_element_entries_positions,
+)
+
+from .core import print_info
+from .helpers import (
+    create_form_entry,
+    get_or_create_admin_user,
+    get_text_plugin_data,
+    setup_app,
+)
+
+__title__ = 'fobi.tests.test_form_builder'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiFormBuilderTest',)
+
+if versions.DJANGO_GTE_1_10:
+    from django.urls import reverse
+else:
+    from django.core.urlresolvers import reverse
+
+
+class FobiFormBuilderTest(TestCase):
+    """Tests of the form builder."""
+
+    def setUp(self):
+        """Set up."""
+        setup_app(fobi_sync_plugins=True)
+
+    @print_info
+    def test_01_form_builder_ajax(self):
+        """Test the AJAX form builder API."""
+        user = get_or_create_admin_user()
+        self.client.force_login(user)
+        form_entry = create_form_entry(name="Builder", form_elements=[
+            ('text', get_text_plugin_data(name)) for name in ('first', 'second')
+        ])
+        first, second = form_entry.formelemententry_set.order_by('position')
+        ajax_kwargs = {'HTTP_X_REQUESTED_WITH': 'XMLHttpRequest'}
+
+        # Adding renders only the element added
+        response = self.client.post(
+            reverse('fobi.add_form_element_entry',
+                    kwargs={'form_entry_id': form_entry.pk,
+                            'form_element_plugin_uid': 'text'}),
+            {'label': "Third", 'name': 'third', 'max_length': 255},
+            **ajax_kwargs
+        )
+        data = json.loads(response.content.decode('utf-8'))
+        third = FormElementEntry._default_manager.get(pk=data['id'])
+        self.assertEqual(data['position'],
+                         second.position + FORM_ELEMENT_ENTRY_POSITION_STEP)
+        self.assertIn('name="third"', data['html'])
+        self.assertIn(
+            reverse('fobi.delete_form_element_entry',
+                    kwargs={'form_element_entry_id': third.pk}),
+            data['html']
+        )
+        self.assertNotIn('name="first"', data['html'])
+
+        # Editing renders only the element edited
+        response = self.client.post(
+            reverse('fobi.edit_form_element_entry',
+                    kwargs={'form_element_entry_id': first.pk}),
+            {'label': "Renamed", 'name': 'first', 'max_length': 255},
+            **ajax_kwargs
+        )
+        data = json.loads(response.content.decode('utf-8'))
+        self.assertEqual(data['id'], first.pk)
+        self.assertIn('Renamed', data['html'])
+        self.assertNotIn('name="third"', data['html'])
+
+        # Invalid data renders the (AJAX) plugin form
+        response = self.client.post(
+            reverse('fobi.edit_form_element_entry',
+                    kwargs={'form_element_entry_id': first.pk}),
+            {'label': "", 'name': 'first', 'max_length': 255},
+            **ajax_kwargs
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(b'<html', response.content)
+
+        # Ordering is saved at once
+        order_url = reverse('fobi.order_form_element_entries',
+                            kwargs={'form_entry_id': form_entry.pk})
+        response = self.client.get(
+            reverse('fobi.edit_form_entry',
+                    kwargs={'form_entry_id': form_entry.pk})
+        )
+        self.assertIn(
+            'data-fobi-order-url="{0}"'.format(order_url).encode('utf-8'),
+            response.content
+        )
+        with self.assertNumQueries(8):
+            # Session, user, form entry and positions fetched; positions
+            # updated and the compiled definition invalidated (single
+            # transaction)
+            response = self.client.post(
+                order_url,
+                {'form_element_entry_ids': [third.pk, first.pk, second.pk]},
+                **ajax_kwargs
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            list(form_entry.formelemententry_set.order_by('position')
+                 .values_list('pk', flat=True)),
+            [third.pk, first.pk, second.pk]
+        )
+        response = self.client.post(
+            order_url,
+            {'form_element_entry_ids': [third.pk, first.pk]},
+            **ajax_kwargs
+        )
+        self.assertEqual(response.status_code, 400)
+
+        # Deleting
+        response = self.client.post(
+            reverse('fobi.delete_form_element_entry',
+                    kwargs={'form_element_entry_id': second.pk}),
+            **ajax_kwargs
+        )
+        self.assertEqual(json.loads(response.content.decode('utf-8')),
+                         {'id': second.pk})
+        self.assertEqual(form_entry.formelemententry_set.count(), 2)
+
+    @print_info
+    def test_02_form_element_entries_positions(self):
+        """Test the gap-based positions of the form element entries."""
+        form_entry = create_form_entry(name="Positions")
+        self.assertEqual(get_next_form_element_entry_position(form_entry),
+                         FORM_ELEMENT_ENTRY_POSITION_STEP)
+        FormElementEntry._default_manager.bulk_create([
+            FormElementEntry(form_entry=form_entry,
+                             plugin_uid='text',
+                             plugin_data='{}',
+                             position=FORM_ELEMENT_ENTRY_POSITION_STEP * index)
+            for index in range(1, 301)
+        ])
+        self.assertEqual(get_next_form_element_entry_position(form_entry),
+                         FORM_ELEMENT_ENTRY_POSITION_STEP * 301)
+
+        def get_ids():
+            return list(
+                form_entry.formelemententry_set.order_by('position')
+                .values_list('pk', flat=True)
+            )
+
+        def get_positions():
+            return dict(
+                form_entry.formelemententry_set.values_list('pk', 'position')
+            )
+
+        ids = get_ids()
+
+        # Moving a single entry updates a single row (positions fetched;
+        # moved row updated and the compiled definition invalidated in a
+        # transaction)
+        ids.insert(10, ids.pop(200))
+        positions_before = get_positions()
+        with self.assertNumQueries(5):
+            update_form_element_entries_positions(form_entry, ids)
+        self.assertEqual(get_ids(), ids)
+        positions_after = get_positions()
+        self.assertEqual(
+            [pk for pk in ids if positions_before[pk] != positions_after[pk]],
+            [ids[10]]
+        )
+
+        # Moving to the end and to the beginning
+        ids.append(ids.pop(0))
+        ids.insert(0, ids.pop(150))
+        update_form_element_entries_positions(form_entry, ids)
+        self.assertEqual(get_ids(), ids)
+
+        # Positions are rebalanced once there is no gap left
+        for _index in range(12):
+            ids.insert(1, ids.pop(-1))
+            update_form_element_entries_positions(form_entry, ids)
+            self.assertEqual(get_ids(), ids)
+        self.assertEqual(len(set(get_positions().values())), 300)
+
+        # Entries of other forms are not accepted
+        with self.assertRaises(ValueError):
+            update_form_element_entries_positions(form_entry, ids[:-1])
+
+        # The ordering formset saves the moved entries only
+        ids.reverse()
+        data = {
+            'form-TOTAL_FORMS': '300',
+            'form-INITIAL_FORMS': '300',
+        }
+        for index, pk in enumerate(get_ids()):
+            data['form-{0}-id'.format(index)] = str(pk)
+            data['form-{0}-position'.format(index)] = str(
+                ids.index(pk) + 1
+            )
+        formset = FormElementEntryFormSet(
+            data,
+            queryset=form_entry.formelemententry_set.all()
+        )
+        self.assertTrue(formset.is_valid())
+        formset.save()
+        self.assertEqual(get_ids(), ids)
+
+
+if __name__ == '__main__':
+    unittest.main()
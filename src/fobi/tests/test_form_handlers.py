@@ -0,0 +1,142 @@
+import threading
+import time
+import unittest
+
+from django.test import TestCase
+from django.utils import translation
+
+from fobi import base
+from fobi.base import (
+    form_handler_plugin_registry,
+    FormHandlerPlugin,
+    get_handler_plugin_stages,
+    get_ordered_form_handler_plugin_uids,
+    run_handler_plugins,
+    sort_handler_entries,
+)
+from fobi.models import FormHandlerEntry
+from fobi.routers import get_current_read_database, read_database
+
+from .core import print_info
+from .helpers import setup_app
+
+__title__ = 'fobi.tests.test_form_handlers'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiFormHandlersTest',)
+
+
+class FobiFormHandlersTest(TestCase):
+    """Tests of running the form handler plugins."""
+
+    def setUp(self):
+        """Set up."""
+        setup_app(fobi_sync_plugins=True)
+
+    @print_info
+    def test_01_run_handler_plugins(self):
+        """Test running the handler plugins in stages."""
+        class Plugin(object):
+            def __init__(self, uid, io_bound, run_after=(), delay=0):
+                self.uid = uid
+                self.io_bound = io_bound
+                self.run_after = run_after
+                self.delay = delay
+
+        repost_1 = Plugin('http_repost', True, delay=0.2)
+        repost_2 = Plugin('http_repost', True)
+        mail = Plugin('mail', True, run_after=('custom',))
+        custom = Plugin('custom', True, delay=0.1)
+        db_store = Plugin('db_store', False)
+        plugins = [repost_1, repost_2, mail, custom, db_store]
+
+        self.assertEqual(
+            get_handler_plugin_stages(plugins),
+            [[repost_1, repost_2, custom], [mail], [db_store]]
+        )
+
+        completed = []
+        contexts = []
+
+        def run_handler_plugin(plugin):
+            time.sleep(plugin.delay)
+            completed.append(plugin)
+            contexts.append((translation.get_language(),
+                             get_current_read_database(),
+                             threading.current_thread()))
+            return (plugin is not mail, plugin.uid)
+
+        # Run sequentially by default
+        results = run_handler_plugins(plugins, run_handler_plugin)
+        self.assertEqual(completed,
+                         [repost_1, repost_2, custom, mail, db_store])
+        self.assertEqual(
+            set(thread for language, using, thread in contexts),
+            set([threading.current_thread()])
+        )
+
+        # Concurrently, if enabled
+        completed[:], contexts[:] = [], []
+        max_workers = base.FORM_HANDLER_PLUGINS_MAX_WORKERS
+        base.FORM_HANDLER_PLUGINS_MAX_WORKERS = 4
+        try:
+            with translation.override('nl'), read_database('replica'):
+                results = run_handler_plugins(plugins, run_handler_plugin)
+        finally:
+            base.FORM_HANDLER_PLUGINS_MAX_WORKERS = max_workers
+
+        # Results are in the order of execution, regardless of completion
+        self.assertEqual(
+            [plugin for plugin, success, response in results],
+            [repost_1, repost_2, custom, mail, db_store]
+        )
+        self.assertEqual([success for plugin, success, response in results],
+                         [True, True, True, False, True])
+        # Stages are run one after another
+        self.assertEqual(completed[3:], [mail, db_store])
+        self.assertNotEqual(completed[:3], [repost_1, repost_2, custom])
+        # With the language and the read database of the submitting thread
+        self.assertEqual(
+            set((language, using) for language, using, thread in contexts),
+            set([('nl', 'replica')])
+        )
+
+    @print_info
+    def test_02_handler_plugins_execution_order(self):
+        """Test the (cached) execution order of the form handler plugins."""
+        ordered_plugin_uids = get_ordered_form_handler_plugin_uids()
+        self.assertIs(get_ordered_form_handler_plugin_uids(),
+                      ordered_plugin_uids)
+
+        class ExecutionOrderTestPlugin(FormHandlerPlugin):
+            uid = 'execution_order_test'
+            name = "Execution order test"
+
+        # Order is recomputed on changes of the registry
+        form_handler_plugin_registry.register(ExecutionOrderTestPlugin)
+        try:
+            self.assertEqual(get_ordered_form_handler_plugin_uids(),
+                             ordered_plugin_uids + ('execution_order_test',))
+        finally:
+            form_handler_plugin_registry.unregister(ExecutionOrderTestPlugin)
+        self.assertEqual(get_ordered_form_handler_plugin_uids(),
+                         ordered_plugin_uids)
+
+        # Entries of unknown plugins are left out
+        handler_entries = [
+            FormHandlerEntry(plugin_uid=plugin_uid)
+            for plugin_uid in ('mail', 'gone', 'db_store', 'mail')
+        ]
+        self.assertEqual(
+            [
+                handler_entry.plugin_uid
+                for handler_entry
+                in sort_handler_entries(handler_entries, ('db_store', 'mail'))
+            ],
+            ['db_store', 'mail', 'mail']
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
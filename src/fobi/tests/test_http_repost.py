@@ -0,0 +1,116 @@
+import threading
+import unittest
+
+import simplejson as json
+
+from django.test import TestCase
+
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from six.moves.socketserver import ThreadingMixIn
+
+from fobi.contrib.plugins.form_handlers.http_repost.helpers import (
+    CircuitBreaker,
+    get_session,
+    http_repost,
+)
+from fobi.models import FormHandlerEntry
+
+from .core import print_info
+from .helpers import create_form_entry, get_text_plugin_data, setup_app
+
+__title__ = 'fobi.tests.test_http_repost'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiHttpRepostTest',)
+
+
+class FobiHttpRepostTest(TestCase):
+    """Tests of the HTTP repost form handler."""
+
+    def setUp(self):
+        """Set up."""
+        setup_app(fobi_sync_plugins=True)
+
+    @print_info
+    def test_01_http_repost(self):
+        """Test reposting the form data to a (local) endpoint."""
+        received = []
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                length = int(self.headers['Content-Length'])
+                received.append((self.path, self.rfile.read(length)))
+                status = 200
+                if self.path == '/gateway/':
+                    status = 502
+                elif self.path == '/busy/' \
+                        and [path for path, body in received] == ['/busy/']:
+                    status = 503
+                self.send_response(status)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        class Server(ThreadingMixIn, HTTPServer):
+            daemon_threads = True
+
+        server = Server(('127.0.0.1', 0), RequestHandler)
+        server_thread = threading.Thread(target=server.serve_forever)
+        server_thread.daemon = True
+        server_thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        base_url = 'http://127.0.0.1:{0}'.format(server.server_address[1])
+
+        form_entry = create_form_entry(is_public=True, form_elements=[
+            ('text', get_text_plugin_data('test_name', required=True)),
+        ])
+        for path in ('/one/', '/two/'):
+            FormHandlerEntry._default_manager.create(
+                form_entry=form_entry,
+                plugin_uid='http_repost',
+                plugin_data=json.dumps({'endpoint_url': base_url + path})
+            )
+
+        response = self.client.post(form_entry.get_absolute_url(),
+                                    {'test_name': 'reposted'})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(sorted(path for path, body in received),
+                         ['/one/', '/two/'])
+        self.assertTrue(all(b'reposted' in body for path, body in received))
+
+        # Single (pooled) session per endpoint host
+        self.assertIs(get_session(base_url + '/one/'),
+                      get_session(base_url + '/two/'))
+
+        # Refused (503) requests are retried, the ones possibly processed
+        # behind a gateway (502, 504) are not
+        del received[:]
+        response = http_repost(base_url + '/busy/', {'test_name': 'busy'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([path for path, body in received],
+                         ['/busy/', '/busy/'])
+        del received[:]
+        response = http_repost(base_url + '/gateway/',
+                               {'test_name': 'gateway'})
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual([path for path, body in received], ['/gateway/'])
+
+        # Circuit breaker
+        circuit_breaker = CircuitBreaker(threshold=2, reset_timeout=60)
+        circuit_breaker.record_failure()
+        self.assertTrue(circuit_breaker.allow_request())
+        circuit_breaker.record_failure()
+        self.assertFalse(circuit_breaker.allow_request())
+        circuit_breaker.record_success()
+        self.assertTrue(circuit_breaker.allow_request())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+import unittest
+
+import simplejson as json
+
+from django.conf import settings
+from django.test import TestCase
+
+from nine import versions
+
+from fobi import base, idempotency, models, utils
+from fobi.base import form_handler_plugin_registry
+from fobi.contrib.plugins.form_handlers.db_store.models import (
+    SavedFormDataEntry,
+)
+
+from .core import print_info
+from .helpers import create_form_entry, get_text_plugin_data, setup_app
+
+__title__ = 'fobi.tests.test_idempotency'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiIdempotencyTest',)
+
+if versions.DJANGO_GTE_1_10:
+    from django.urls import reverse
+else:
+    from django.core.urlresolvers import reverse
+
+
+class FobiIdempotencyTest(TestCase):
+    """Tests of suppressing the duplicate submissions."""
+
+    def setUp(self):
+        """Set up."""
+        setup_app(fobi_sync_plugins=True)
+        self._compile_form_definitions = models.COMPILE_FORM_DEFINITIONS
+        models.COMPILE_FORM_DEFINITIONS = True
+        utils.COMPILE_FORM_DEFINITIONS = True
+
+    def tearDown(self):
+        """Tear down."""
+        models.COMPILE_FORM_DEFINITIONS = self._compile_form_definitions
+        utils.COMPILE_FORM_DEFINITIONS = self._compile_form_definitions
+
+    @print_info
+    def test_01_idempotent_submissions(self):
+        """Test suppressing the duplicate submissions."""
+        form_entry = create_form_entry(
+            name="Idempotent",
+            is_public=True,
+            form_elements=[
+                ('text', get_text_plugin_data('name', required=True)),
+            ],
+            form_handlers=['db_store']
+        )
+        url = reverse('fobi.view_form_entry',
+                      kwargs={'form_entry_slug': form_entry.slug})
+        submitted_url = reverse('fobi.form_entry_submitted',
+                                kwargs={'form_entry_slug': form_entry.slug})
+
+        def count_saved():
+            return SavedFormDataEntry._default_manager \
+                .filter(form_entry=form_entry) \
+                .count()
+
+        # Idempotency key is rendered per page
+        response = self.client.get(url)
+        key = response.context['fobi_idempotency_key']
+        self.assertIn(
+            'name="{0}" value="{1}"'.format(
+                idempotency.IDEMPOTENCY_KEY_FIELD, key
+            ).encode('utf-8'),
+            response.content
+        )
+        self.assertNotEqual(self.client.get(url).context[
+            'fobi_idempotency_key'
+        ], key)
+
+        # Pages holding the keys are not conditionally served, so that the
+        # returning visitors do not resubmit the key of the page cached
+        self.assertFalse(response.has_header('ETag'))
+        timeout = idempotency.SUBMISSION_IDEMPOTENCY_TIMEOUT
+        idempotency.SUBMISSION_IDEMPOTENCY_TIMEOUT = 0
+        try:
+            etag = self.client.get(url)['ETag']
+            self.assertEqual(
+                self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code,
+                304
+            )
+        finally:
+            idempotency.SUBMISSION_IDEMPOTENCY_TIMEOUT = timeout
+        for name in ("Returning", "Returning (again)"):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
+            self.client.post(url, {
+                'name': name,
+                idempotency.IDEMPOTENCY_KEY_FIELD:
+                    response.context['fobi_idempotency_key'],
+            })
+        self.assertEqual(count_saved(), 2)
+
+        # Double click
+        for _ in range(2):
+            response = self.client.post(
+                url,
+                {'name': "First", idempotency.IDEMPOTENCY_KEY_FIELD: key}
+            )
+            self.assertEqual(response.status_code, 302)
+            self.assertTrue(response['Location'].endswith(submitted_url))
+        self.assertEqual(count_saved(), 3)
+
+        # Submissions without the key are not suppressed by default
+        for _ in range(2):
+            self.client.post(url, {'name': "Second"})
+        self.assertEqual(count_saved(), 5)
+
+        # Unless identified by the submitted data
+        fingerprint = idempotency.SUBMISSION_IDEMPOTENCY_FINGERPRINT
+        idempotency.SUBMISSION_IDEMPOTENCY_FINGERPRINT = True
+        try:
+            for _ in range(2):
+                self.client.post(url, {'name': "Third"})
+            self.assertEqual(count_saved(), 6)
+
+            # Other data is another submission
+            self.client.post(url, {'name': "Third (other)"})
+            self.assertEqual(count_saved(), 7)
+        finally:
+            idempotency.SUBMISSION_IDEMPOTENCY_FINGERPRINT = fingerprint
+
+        # Invalid submissions are not remembered
+        data = {'name': "", idempotency.IDEMPOTENCY_KEY_FIELD: 'abc'}
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 200)
+
+        # Duplicates of the submissions being handled are answered with
+        # 409 Conflict
+        handler_plugin = form_handler_plugin_registry._registry['db_store']
+        original_run = handler_plugin.run
+        duplicate_responses = []
+
+        def duplicating_run(*args, **kwargs):
+            duplicate_responses.append(
+                self.client.post(url, dict(data, name="Fourth (retry)"))
+            )
+            return original_run(*args, **kwargs)
+
+        handler_plugin.run = duplicating_run
+        try:
+            response = self.client.post(url, dict(data, name="Fourth"))
+        finally:
+            handler_plugin.run = original_run
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            [response.status_code for response in duplicate_responses],
+            [409]
+        )
+        self.assertEqual(count_saved(), 8)
+
+        # Failed submissions can be retried
+        fail_on_errors = base.FAIL_ON_ERRORS_IN_FORM_HANDLER_PLUGINS
+        data[idempotency.IDEMPOTENCY_KEY_FIELD] = 'ghi'
+
+        def failing_run(*args, **kwargs):
+            raise ValueError("Failed")
+
+        handler_plugin.run = failing_run
+        base.FAIL_ON_ERRORS_IN_FORM_HANDLER_PLUGINS = True
+        try:
+            with self.assertRaises(ValueError):
+                self.client.post(url, dict(data, name="Fifth"))
+        finally:
+            handler_plugin.run = original_run
+            base.FAIL_ON_ERRORS_IN_FORM_HANDLER_PLUGINS = fail_on_errors
+        self.client.post(url, dict(data, name="Fifth"))
+        self.assertEqual(count_saved(), 9)
+
+        # Duplicates are not suppressed if disabled
+        timeout = idempotency.SUBMISSION_IDEMPOTENCY_TIMEOUT
+        idempotency.SUBMISSION_IDEMPOTENCY_TIMEOUT = 0
+        try:
+            self.client.post(url, dict(data, name="Fifth"))
+        finally:
+            idempotency.SUBMISSION_IDEMPOTENCY_TIMEOUT = timeout
+        self.assertEqual(count_saved(), 10)
+
+        # Retries of the DRF integration app update action
+        if 'fobi.contrib.apps.drf_integration' in settings.INSTALLED_APPS:
+            api_url = reverse('fobi_form_entry-detail',
+                              kwargs={'slug': form_entry.slug})
+            for name in ("Sixth", "Sixth (retry)"):
+                response = self.client.put(
+                    api_url,
+                    json.dumps({'name': name}),
+                    content_type='application/json',
+                    HTTP_IDEMPOTENCY_KEY='def'
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data, {'name': "Sixth"})
+            self.assertEqual(count_saved(), 11)
+
+
+if __name__ == '__main__':
+    unittest.main()
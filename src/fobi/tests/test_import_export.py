@@ -0,0 +1,189 @@
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+
+import simplejson as json
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from six import BytesIO, StringIO
+
+from fobi.exceptions import FormImportError
+from fobi.helpers import iter_json_lines, iter_tar_json_documents
+from fobi.models import FormEntry
+from fobi.utils import import_form_entries, iter_export_documents
+
+from .core import print_info
+from .helpers import get_or_create_admin_user, setup_app
+
+__title__ = 'fobi.tests.test_import_export'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiImportExportTest',)
+
+
+def make_form_data(name, plugin_uid='text', num_form_elements=3):
+    """Make the import data of a form."""
+    return {
+        'name': name,
+        'form_elements': [
+            {
+                'plugin_uid': plugin_uid,
+                'position': position,
+                'plugin_data': json.dumps({
+                    'label': "Test name",
+                    'name': 'test_name_{0}'.format(position),
+                }),
+            }
+            for position in range(num_form_elements)
+        ],
+        'form_handlers': [
+            {'plugin_uid': 'db_store', 'plugin_data': ''},
+        ],
+    }
+
+
+class FobiImportExportTest(TestCase):
+    """Tests of importing and exporting the forms in bulk."""
+
+    def setUp(self):
+        """Set up."""
+        setup_app(fobi_sync_plugins=True)
+
+    @print_info
+    def test_01_import_forms(self):
+        """Test importing forms in bulk."""
+        user = get_or_create_admin_user()
+
+        form_entries = import_form_entries(
+            user,
+            [make_form_data('Bulk 1'), make_form_data('Bulk 2')]
+        )
+        self.assertEqual(len(form_entries), 2)
+        for form_entry in form_entries:
+            self.assertEqual(form_entry.formelemententry_set.count(), 3)
+            self.assertEqual(form_entry.formhandlerentry_set.count(), 1)
+
+        # Nothing is imported if any of the forms is broken
+        count = FormEntry._default_manager.count()
+        with self.assertRaises(FormImportError):
+            import_form_entries(
+                user,
+                [make_form_data('Bulk 3'), make_form_data('Bulk 4', 'none')]
+            )
+        self.assertEqual(FormEntry._default_manager.count(), count)
+
+        # Directory of JSON and JSON lines files
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        with open(os.path.join(directory, 'single.json'), 'w') as _file:
+            _file.write(json.dumps(make_form_data('File 1')))
+        with open(os.path.join(directory, 'archive.jsonl'), 'w') as _file:
+            for name in ('File 2', 'File 3', 'File 4'):
+                _file.write(json.dumps(make_form_data(name)) + '\n')
+
+        out = StringIO()
+        call_command('fobi_import_forms', directory,
+                     '--user', user.username,
+                     '--batch-size', '2',
+                     stdout=out)
+        self.assertIn('4 forms imported', out.getvalue())
+        self.assertEqual(
+            FormEntry._default_manager
+                     .filter(name__startswith='File ').count(),
+            4
+        )
+
+        # Conflicting forms (of the same name) are reported by batch
+        with open(os.path.join(directory, 'single.json'), 'w') as _file:
+            _file.write(json.dumps(make_form_data('File 5')))
+        out = StringIO()
+        with self.assertRaises(CommandError) as context:
+            call_command('fobi_import_forms', directory,
+                         '--user', user.username,
+                         '--batch-size', '2',
+                         stdout=out)
+        self.assertIn('Batch #1 (forms 1-2) not imported',
+                      str(context.exception))
+        self.assertEqual(
+            FormEntry._default_manager
+                     .filter(name__startswith='File ').count(),
+            4
+        )
+
+    @print_info
+    def test_02_export_forms(self):
+        """Test exporting forms in bulk."""
+        user = get_or_create_admin_user()
+
+        import_form_entries(user, [
+            make_form_data('Export {0}'.format(index),
+                           num_form_elements=index + 1)
+            for index in range(5)
+        ])
+        form_entries_count = FormEntry._default_manager \
+            .filter(user=user).count()
+
+        # Number of queries does not depend on the number of forms (3 per
+        # batch of forms and, if the last batch is full, the empty one).
+        full_batches, rest = divmod(form_entries_count, 2)
+        with self.assertNumQueries(3 * full_batches + (3 if rest else 1)):
+            documents = list(iter_export_documents(user=user,
+                                                   form_wizard_entries=False,
+                                                   batch_size=2))
+        self.assertEqual(len(documents), form_entries_count)
+        documents = dict(documents)
+        exported = [
+            documents['forms/{0}.json'.format(form_entry.slug)]
+            for form_entry
+            in FormEntry._default_manager.filter(name__startswith='Export ')
+        ]
+        self.assertEqual(len(exported), 5)
+        for data in exported:
+            index = int(data['name'].split(' ')[1])
+            self.assertEqual(len(data['form_elements']), index + 1)
+            self.assertEqual(len(data['form_handlers']), 1)
+
+        # JSON lines
+        lines = b''.join(
+            iter_json_lines(documents.values())
+        ).decode('utf-8').splitlines()
+        self.assertEqual(len(lines), form_entries_count)
+        self.assertIn(json.loads(lines[0]), list(documents.values()))
+
+        # Tar archive
+        archive = tarfile.open(
+            fileobj=BytesIO(b''.join(
+                iter_tar_json_documents(documents.items())
+            ))
+        )
+        self.assertEqual(sorted(archive.getnames()), sorted(documents.keys()))
+        for name in archive.getnames():
+            self.assertEqual(
+                json.loads(archive.extractfile(name).read().decode('utf-8')),
+                documents[name]
+            )
+
+        # Management command output can be imported back
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'forms.jsonl')
+        call_command('fobi_export_forms', '--output', path,
+                     '--user', user.username)
+        out = StringIO()
+        call_command('fobi_import_forms', path,
+                     '--user', user.username,
+                     stdout=out)
+        self.assertIn(
+            '{0} forms imported'.format(form_entries_count),
+            out.getvalue()
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
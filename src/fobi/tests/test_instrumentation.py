@@ -0,0 +1,101 @@
+import socket
+import unittest
+
+from django.test import TestCase
+
+from nine import versions
+
+from fobi import instrumentation
+from fobi.constants import CALLBACK_FORM_VALID
+
+from .core import print_info
+from .helpers import create_form_entry, get_text_plugin_data, setup_app
+
+__title__ = 'fobi.tests.test_instrumentation'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiInstrumentationTest',)
+
+if versions.DJANGO_GTE_1_10:
+    from django.urls import reverse
+else:
+    from django.core.urlresolvers import reverse
+
+
+class FobiInstrumentationTest(TestCase):
+    """Tests of the instrumentation of the form pipeline."""
+
+    def setUp(self):
+        """Set up."""
+        setup_app(fobi_sync_plugins=True)
+
+    @print_info
+    def test_01_instrumentation(self):
+        """Test the instrumentation of the form submissions."""
+        form_entry = create_form_entry(
+            name="Instrumented",
+            is_public=True,
+            form_elements=[
+                ('text', get_text_plugin_data('name', required=True)),
+                ('honeypot', {'label': "Honeypot",
+                              'name': 'website',
+                              'initial': ''}),
+            ],
+            form_handlers=['db_store']
+        )
+        url = reverse('fobi.view_form_entry',
+                      kwargs={'form_entry_slug': form_entry.slug})
+
+        # Disabled by default
+        self.assertIsNone(instrumentation.get_instrumentation_backend())
+        self.assertIs(instrumentation.span('form.assemble'),
+                      instrumentation.span('form.validate'))
+
+        backend = instrumentation.MemoryInstrumentationBackend()
+        instrumentation.set_instrumentation_backend(backend)
+        try:
+            response = self.client.post(url, {'name': "Timed",
+                                              'website': ''})
+            self.assertEqual(response.status_code, 302)
+            response = self.client.post(url, {'name': "Bot",
+                                              'website': 'http://spam'})
+            self.assertEqual(response.status_code, 400)
+        finally:
+            instrumentation.set_instrumentation_backend(None)
+
+        for name, tags in (
+                ('form.assemble', {}),
+                ('form.validate', {}),
+                ('form_element.get_plugin', {'uid': 'text'}),
+                ('form_element.get_form_field_instances', {'uid': 'text'}),
+                ('form_element.submit_plugin_form_data', {'uid': 'honeypot'}),
+                ('form_callbacks.fire', {'stage': CALLBACK_FORM_VALID}),
+                ('form_handlers.run', {}),
+                ('form_handler.run', {'uid': 'db_store'})):
+            self.assertEqual(len(backend.get_timings(name, **tags)), 1,
+                             name)
+        self.assertEqual(backend.get_count('submission.rejected',
+                                           uid='honeypot'), 1)
+
+        # Statsd backend
+        server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        server.bind(('127.0.0.1', 0))
+        server.settimeout(5)
+        try:
+            backend = instrumentation.StatsdInstrumentationBackend(
+                host='127.0.0.1',
+                port=server.getsockname()[1]
+            )
+            backend.timing('form_handler.run', 0.0125, {'uid': 'mail'})
+            self.assertEqual(server.recv(1024),
+                             b'fobi.form_handler.run.mail:12.500|ms')
+            backend.incr('submission.rate_limited', 1, {'scope': 'ip'})
+            self.assertEqual(server.recv(1024),
+                             b'fobi.submission.rate_limited.ip:1|c')
+        finally:
+            server.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
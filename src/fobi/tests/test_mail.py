@@ -0,0 +1,157 @@
+import shutil
+import tempfile
+import unittest
+
+from django.core import mail
+from django.core.files.base import ContentFile
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+
+from fobi.contrib.plugins.form_handlers.mail.helpers import (
+    MailDispatcher,
+    prepare_attachments,
+)
+
+from .core import print_info
+
+__title__ = 'fobi.tests.test_mail'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiMailTest',)
+
+
+class FobiMailTest(TestCase):
+    """Tests of the mail form handler helpers."""
+
+    @print_info
+    def test_01_mail_attachments(self):
+        """Test preparing the mail attachments."""
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+
+        with override_settings(MEDIA_ROOT=media_root):
+            small = default_storage.save('test/small.txt',
+                                         ContentFile(b'a' * 10))
+            large = default_storage.save('test/large.txt',
+                                         ContentFile(b'b' * 100))
+
+            attachments = prepare_attachments(
+                [
+                    ('small', default_storage.url(small)),
+                    ('large', default_storage.url(large)),
+                    ('external', 'http://example.com/external.txt'),
+                ],
+                filenames={'small': 'original.txt'},
+                max_size=50,
+                max_total_size=50
+            )
+            self.assertEqual(list(attachments.keys()), ['small'])
+            self.assertEqual(attachments['small'],
+                             ('original.txt', b'a' * 10, 'text/plain'))
+
+            # Total size cap
+            attachments = prepare_attachments(
+                [
+                    ('small_1', default_storage.url(small)),
+                    ('small_2', default_storage.url(small)),
+                ],
+                max_size=50,
+                max_total_size=15
+            )
+            self.assertEqual(list(attachments.keys()), ['small_1'])
+
+    @print_info
+    def test_02_mail_dispatcher(self):
+        """Test sending mail messages over a shared connection."""
+        def make_message(subject):
+            return mail.EmailMessage(subject, 'Body', 'from@example.com',
+                                     ['to@example.com'])
+
+        mail.outbox = []
+        connection = mail.get_connection(
+            'django.core.mail.backends.locmem.EmailBackend'
+        )
+
+        # Immediate mode
+        dispatcher = MailDispatcher(delivery_mode='immediate',
+                                    connection=connection)
+        dispatcher.send(make_message('1'))
+        self.assertEqual(len(mail.outbox), 1)
+
+        # Batched mode, sent when the batch size is reached
+        dispatcher = MailDispatcher(delivery_mode='batched',
+                                    batch_size=2,
+                                    batch_interval=60,
+                                    connection=connection)
+        dispatcher.send(make_message('2'))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(dispatcher.get_metrics()['messages_pending'], 1)
+
+        dispatcher.send(make_message('3'))
+        self.assertEqual(len(mail.outbox), 3)
+
+        # Batched mode, sent on flush
+        dispatcher.send(make_message('4'))
+        self.assertEqual(len(mail.outbox), 3)
+        dispatcher.flush()
+        self.assertEqual(len(mail.outbox), 4)
+
+        metrics = dispatcher.get_metrics()
+        self.assertEqual(metrics['messages_queued'], 3)
+        self.assertEqual(metrics['messages_sent'], 3)
+        self.assertEqual(metrics['batches_sent'], 2)
+        self.assertEqual(metrics['messages_pending'], 0)
+        self.assertIsNone(dispatcher.timer)
+
+    @print_info
+    def test_03_mail_dispatcher_shutdown(self):
+        """Test flushing the queued mail messages on shutdown."""
+        class FailingEmailBackend(BaseEmailBackend):
+            def send_messages(self, email_messages):
+                raise IOError("Connection refused")
+
+        def make_message(subject):
+            return mail.EmailMessage(subject, 'Body', 'from@example.com',
+                                     ['to@example.com'])
+
+        mail.outbox = []
+
+        # Nothing queued
+        dispatcher = MailDispatcher(delivery_mode='batched',
+                                    batch_size=10,
+                                    batch_interval=60)
+        self.assertEqual(dispatcher.shutdown(), 0)
+
+        # Queued messages are sent
+        dispatcher = MailDispatcher(
+            delivery_mode='batched',
+            batch_size=10,
+            batch_interval=60,
+            connection=mail.get_connection(
+                'django.core.mail.backends.locmem.EmailBackend'
+            )
+        )
+        dispatcher.send(make_message('1'))
+        self.assertEqual(dispatcher.shutdown(), 0)
+        self.assertEqual(len(mail.outbox), 1)
+
+        # Messages which could not be sent are counted in the logs
+        dispatcher = MailDispatcher(delivery_mode='batched',
+                                    batch_size=10,
+                                    batch_interval=60,
+                                    connection=FailingEmailBackend())
+        dispatcher.send(make_message('2'))
+        dispatcher.send(make_message('3'))
+        logger_name = 'fobi.contrib.plugins.form_handlers.mail.helpers'
+        with self.assertLogs(logger_name, level='WARNING') as logs:
+            self.assertEqual(dispatcher.shutdown(), 2)
+        self.assertIn("2 of 2 queued mail messages were not sent",
+                      logs.output[-1])
+        self.assertEqual(dispatcher.get_metrics()['messages_pending'], 0)
+        self.assertEqual(len(mail.outbox), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
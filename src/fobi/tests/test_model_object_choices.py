@@ -0,0 +1,167 @@
+import unittest
+
+import simplejson as json
+
+from django.test import TestCase
+
+from nine import versions
+from nine.user import User
+
+from fobi.contrib.plugins.form_elements.fields.select_model_object.forms \
+    import SelectModelObjectInputForm
+from fobi.helpers import get_model_object_choices_version
+from fobi.models import FormElementEntry, FormEntry
+
+from .core import print_info
+from .helpers import (
+    create_form_element_entry,
+    create_form_entry,
+    setup_app,
+)
+
+__title__ = 'fobi.tests.test_model_object_choices'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiModelObjectChoicesTest',)
+
+if versions.DJANGO_GTE_1_10:
+    from django.urls import reverse
+else:
+    from django.core.urlresolvers import reverse
+
+
+class FobiModelObjectChoicesTest(TestCase):
+    """Tests of the choices of the model object select fields."""
+
+    def setUp(self):
+        """Set up."""
+        setup_app(fobi_sync_plugins=True)
+
+    @print_info
+    def test_01_model_object_choices(self):
+        """Test model object choices of a remote select field."""
+        form_entry = create_form_entry(is_public=True, form_elements=[
+            ('select_model_object', {'label': "Test user",
+                                     'name': 'test_user',
+                                     'model': 'auth.user',
+                                     'help_text': '',
+                                     'initial': '',
+                                     'required': False,
+                                     'remote': True,
+                                     'search_fields': 'username'}),
+        ])
+        for index in range(5):
+            User._default_manager.create(
+                username='choices_test_{0}'.format(index)
+            )
+
+        url = reverse(
+            'fobi.form_entry_model_object_choices',
+            kwargs={'form_entry_slug': form_entry.slug,
+                    'field_name': 'test_user'}
+        )
+
+        response = self.client.get(url, {'q': 'choices_test_', 'limit': 2})
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content.decode('utf-8'))
+        self.assertEqual(len(data['results']), 2)
+        self.assertTrue(data['more'])
+
+        response = self.client.get(
+            url, {'q': 'choices_test_', 'limit': 2, 'page': 3}
+        )
+        data = json.loads(response.content.decode('utf-8'))
+        self.assertEqual(len(data['results']), 1)
+        self.assertFalse(data['more'])
+
+        # Options are not rendered in the form, but loaded remotely
+        response = self.client.get(form_entry.get_absolute_url())
+        self.assertContains(response, 'data-fobi-remote-url="{0}"'.format(url))
+        self.assertNotContains(response, 'choices_test_')
+
+        # Validation is done by the primary key lookup only
+        user = User._default_manager.get(username='choices_test_4')
+        response = self.client.post(form_entry.get_absolute_url(),
+                                    {'test_user': user.pk})
+        self.assertEqual(response.status_code, 302)
+
+        # Fields not in the remote mode are not served
+        response = self.client.get(url.replace('test_user', 'unknown'))
+        self.assertEqual(response.status_code, 404)
+
+        # Only the text fields of the model itself can be searched in
+        def get_form(search_fields):
+            return SelectModelObjectInputForm(data={
+                'label': "Test user",
+                'name': 'test_user',
+                'model': 'auth.user',
+                'search_fields': search_fields,
+            })
+
+        self.assertTrue(get_form('username, email').is_valid())
+        for search_fields in ('username,groups',
+                              'username,missing',
+                              'is_staff',
+                              'groups__name'):
+            form = get_form(search_fields)
+            self.assertFalse(form.is_valid())
+            self.assertIn('search_fields', form.errors)
+
+        # Invalid search fields (saved otherwise) are ignored
+        form_element_entry = FormElementEntry._default_manager.get(
+            form_entry=form_entry
+        )
+        plugin_data = json.loads(form_element_entry.plugin_data)
+        plugin_data['search_fields'] = 'groups__name,missing,username'
+        form_element_entry.plugin_data = json.dumps(plugin_data)
+        form_element_entry.save()
+        response = self.client.get(url, {'q': 'choices_test_1'})
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content.decode('utf-8'))
+        self.assertEqual([result['text'] for result in data['results']],
+                         ['choices_test_1'])
+
+    @print_info
+    def test_02_cached_model_object_choices(self):
+        """Test cached choices of the model object select fields."""
+        form_entry = create_form_entry()
+        form_element_entry = create_form_element_entry(
+            form_entry,
+            'select_model_object',
+            {'label': "Test user",
+             'name': 'test_user',
+             'model': 'auth.user',
+             'help_text': '',
+             'initial': '',
+             'required': False,
+             'cache_choices': True}
+        )
+        User._default_manager.create(username='cached_choices_test_1')
+
+        def get_choices():
+            plugin = form_element_entry.get_plugin()
+            [(name, field_cls, field_kwargs)] = \
+                plugin.get_form_field_instances(form_entry=form_entry)
+            return [label for value, label in field_cls(**field_kwargs)
+                    .widget.choices]
+
+        self.assertIn('cached_choices_test_1', get_choices())
+
+        # Served from cache
+        with self.assertNumQueries(0):
+            self.assertIn('cached_choices_test_1', get_choices())
+
+        # Invalidated on change
+        User._default_manager.create(username='cached_choices_test_2')
+        self.assertIn('cached_choices_test_2', get_choices())
+
+        # Changes of other models (not offered as choices) are ignored
+        version = get_model_object_choices_version(FormEntry)
+        form_entry.save()
+        self.assertEqual(get_model_object_choices_version(FormEntry),
+                         version)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+
+import simplejson as json
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from six import StringIO
+
+from fobi.base import form_element_plugin_registry
+from fobi.models import FormElementEntry
+from fobi.utils import update_plugin_data_in_chunks
+
+from .core import print_info
+from .helpers import create_form_entry, get_text_plugin_data, setup_app
+
+__title__ = 'fobi.tests.test_plugin_data'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiPluginDataTest',)
+
+
+class FobiPluginDataTest(TestCase):
+    """Tests of updating the plugin data of the entries."""
+
+    def setUp(self):
+        """Set up."""
+        setup_app(fobi_sync_plugins=True)
+
+    @print_info
+    def test_01_update_plugin_data_in_chunks(self):
+        """Test updating the plugin data chunk by chunk."""
+        form_entry = create_form_entry(form_elements=[
+            ('text', get_text_plugin_data('test_name_{0}'.format(index),
+                                          label="Test name"))
+            for index in range(5)
+        ])
+        entries = FormElementEntry._default_manager \
+            .filter(form_entry=form_entry) \
+            .order_by('pk')
+        pks = list(entries.values_list('pk', flat=True))
+
+        plugin_cls = form_element_plugin_registry.get('text')
+        plugin_cls.update_plugin_data = \
+            lambda plugin, entry: {'label': "Updated"}
+        self.addCleanup(delattr, plugin_cls, 'update_plugin_data')
+
+        def get_labels():
+            return [json.loads(entry.plugin_data)['label']
+                    for entry in entries.all()]
+
+        progress = []
+        stats = update_plugin_data_in_chunks(
+            FormElementEntry,
+            plugin_uids=['text'],
+            chunk_size=2,
+            dry_run=True,
+            progress_callback=lambda cls, stats: progress.append(stats)
+        )
+        self.assertEqual(stats['processed'], 5)
+        self.assertEqual(stats['updated'], 5)
+        self.assertEqual(stats['last_pk'], pks[-1])
+        self.assertEqual(len(progress), 3)
+        self.assertEqual(get_labels(), ["Test name"] * 5)
+
+        # Resume after the second entry
+        stats = update_plugin_data_in_chunks(FormElementEntry,
+                                             chunk_size=2,
+                                             start_after=pks[1])
+        self.assertEqual(stats['updated'], 3)
+        self.assertEqual(get_labels(), ["Test name"] * 2 + ["Updated"] * 3)
+
+        # Unchanged entries are not updated
+        out = StringIO()
+        call_command('fobi_update_plugin_data', '--entries', 'element',
+                     '--chunk-size', '2', stdout=out)
+        self.assertIn('5 processed, 2 updated', out.getvalue())
+        self.assertEqual(get_labels(), ["Updated"] * 5)
+
+        # Resuming is done per type of entries (IDs are unrelated)
+        with self.assertRaises(CommandError):
+            call_command('fobi_update_plugin_data',
+                         '--start-after', str(pks[1]), stdout=out)
+        call_command('fobi_update_plugin_data', '--entries', 'element',
+                     '--start-after', str(pks[1]), stdout=out)
+        self.assertIn('3 processed, 0 updated', out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
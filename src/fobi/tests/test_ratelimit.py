@@ -0,0 +1,108 @@
+import unittest
+
+import simplejson as json
+
+from django.conf import settings
+from django.test import TestCase
+
+from nine import versions
+
+from fobi import ratelimit
+from fobi.exceptions import ImproperlyConfigured
+from fobi.ratelimit import get_rate_limit_hits
+
+from .core import print_info
+from .helpers import create_form_entry, get_text_plugin_data, setup_app
+
+__title__ = 'fobi.tests.test_ratelimit'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiRateLimitTest',)
+
+if versions.DJANGO_GTE_1_10:
+    from django.urls import reverse
+else:
+    from django.core.urlresolvers import reverse
+
+
+class FobiRateLimitTest(TestCase):
+    """Tests of the rate limits of the submissions."""
+
+    def setUp(self):
+        """Set up."""
+        setup_app(fobi_sync_plugins=True)
+
+    @print_info
+    def test_01_submission_rate_limits(self):
+        """Test the rate limits of the submissions."""
+        form_entry = create_form_entry(
+            name="Rate limited",
+            is_public=True,
+            form_elements=[
+                ('text', get_text_plugin_data('name', required=True)),
+            ]
+        )
+        url = reverse('fobi.view_form_entry',
+                      kwargs={'form_entry_slug': form_entry.slug})
+
+        self.assertEqual(ratelimit.parse_rate('10/m'), (10, 60))
+        self.assertEqual(ratelimit.parse_rate('2/hour'), (2, 3600))
+        with self.assertRaises(ImproperlyConfigured):
+            ratelimit.parse_rate('10')
+
+        ratelimit.SUBMISSION_RATE_LIMITS_PER_FORM[form_entry.slug] = {
+            ratelimit.SCOPE_IP: '2/h',
+            ratelimit.SCOPE_FORM: '3/h',
+        }
+        ratelimit.reset_rate_limit_hits()
+        try:
+            for _ in range(2):
+                response = self.client.post(url, {'name': ""})
+                self.assertEqual(response.status_code, 200)
+
+            # Limited submissions are rejected without assembling the form
+            with self.assertNumQueries(1):
+                response = self.client.post(url, {'name': ""})
+            self.assertEqual(response.status_code, 429)
+            self.assertTrue(
+                1790 <= int(response['Retry-After']) <= 1800
+            )
+            self.assertEqual(get_rate_limit_hits(),
+                             {form_entry.slug: {ratelimit.SCOPE_IP: 1}})
+
+            # Other clients are limited by the limit of the form only (not
+            # used up by the limited submissions)
+            response = self.client.post(url, {'name': ""},
+                                        REMOTE_ADDR='10.0.0.2')
+            self.assertEqual(response.status_code, 200)
+            response = self.client.post(url, {'name': ""},
+                                        REMOTE_ADDR='10.0.0.3')
+            self.assertEqual(response.status_code, 429)
+            self.assertEqual(get_rate_limit_hits(),
+                             {form_entry.slug: {ratelimit.SCOPE_IP: 1,
+                                                ratelimit.SCOPE_FORM: 1}})
+
+            # So is the DRF integration app update action
+            if 'fobi.contrib.apps.drf_integration' in settings.INSTALLED_APPS:
+                response = self.client.put(
+                    reverse('fobi_form_entry-detail',
+                            kwargs={'slug': form_entry.slug}),
+                    json.dumps({'name': "Limited"}),
+                    content_type='application/json',
+                    REMOTE_ADDR='10.0.0.4'
+                )
+                self.assertEqual(response.status_code, 429)
+                self.assertTrue(response.has_header('Retry-After'))
+
+            # Limits are set per form
+            ratelimit.SUBMISSION_RATE_LIMITS_PER_FORM[form_entry.slug] = None
+            response = self.client.post(url, {'name': ""})
+            self.assertEqual(response.status_code, 200)
+        finally:
+            ratelimit.SUBMISSION_RATE_LIMITS_PER_FORM.pop(form_entry.slug)
+            ratelimit.reset_rate_limit_hits()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+import time
+import unittest
+
+import simplejson as json
+
+from django.conf import settings
+from django.db import router
+from django.test import TestCase, override_settings
+
+from nine import versions
+
+from fobi import routers
+from fobi.contrib.plugins.form_handlers.db_store.models import (
+    SavedFormDataEntry,
+)
+from fobi.models import FormEntry
+from fobi.routers import PIN_SESSION_KEY, read_database
+
+from .core import print_info
+from .helpers import (
+    create_form_element_entry,
+    create_form_entry,
+    get_or_create_admin_user,
+    get_text_plugin_data,
+    setup_app,
+)
+
+__title__ = 'fobi.tests.test_read_database'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiReadDatabaseTest',)
+
+if versions.DJANGO_GTE_1_10:
+    from django.urls import reverse
+else:
+    from django.core.urlresolvers import reverse
+
+READ_DATABASE = 'replica'
+
+
+@unittest.skipIf(READ_DATABASE not in settings.DATABASES,
+                 "Read database is not configured.")
+@override_settings(DATABASE_ROUTERS=['fobi.routers.ReadDatabaseRouter'])
+class FobiReadDatabaseTest(TestCase):
+    """Tests of reading from the read database (read replica)."""
+
+    if versions.DJANGO_GTE_2_2:
+        databases = '__all__'
+    else:
+        multi_db = True
+
+    def setUp(self):
+        """Set up."""
+        setup_app(fobi_sync_plugins=True)
+        self._read_database = routers.READ_DATABASE
+        routers.READ_DATABASE = READ_DATABASE
+
+    def tearDown(self):
+        """Tear down."""
+        routers.READ_DATABASE = self._read_database
+
+    @print_info
+    def test_01_read_database(self):
+        """Test reading the public views from the read database."""
+        user = get_or_create_admin_user()
+        form_entry = create_form_entry(
+            name="Replicated",
+            user=user,
+            is_public=True,
+            form_elements=[('text', get_text_plugin_data('first'))],
+            form_handlers=['db_store']
+        )
+
+        # The read database lags behind: it has the first element only.
+        entries = list(form_entry.formelemententry_set.all()) \
+            + list(form_entry.formhandlerentry_set.all())
+        user.save(using=READ_DATABASE)
+        form_entry.save(using=READ_DATABASE)
+        for entry in entries:
+            entry.save(using=READ_DATABASE)
+        create_form_element_entry(form_entry,
+                                  'text',
+                                  get_text_plugin_data('second'))
+
+        # Objects read from the read database are written to the default one
+        with read_database(READ_DATABASE):
+            replicated = FormEntry._default_manager.get(pk=form_entry.pk)
+        self.assertEqual(replicated._state.db, READ_DATABASE)
+        self.assertEqual(router.db_for_write(FormEntry, instance=replicated),
+                         'default')
+
+        # Public form is read from the read database
+        url = reverse('fobi.view_form_entry',
+                      kwargs={'form_entry_slug': form_entry.slug})
+        with self.assertNumQueries(0, using='default'):
+            response = self.client.get(url)
+        self.assertIn(b'name="first"', response.content)
+        self.assertNotIn(b'name="second"', response.content)
+
+        # So is the DRF form metadata
+        if 'fobi.contrib.apps.drf_integration' in settings.INSTALLED_APPS:
+            with self.assertNumQueries(0, using='default'):
+                response = self.client.options(reverse(
+                    'fobi_form_entry-detail',
+                    kwargs={'slug': form_entry.slug}
+                ))
+            self.assertIn(b'"first"', response.content)
+            self.assertNotIn(b'"second"', response.content)
+
+        # Submissions go to the default database and pin the session to it
+        response = self.client.post(url, {'first': "Primary"})
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(
+            SavedFormDataEntry._default_manager.using('default')
+                                               .filter(form_entry=form_entry)
+                                               .exists()
+        )
+        self.assertFalse(
+            SavedFormDataEntry._default_manager.using(READ_DATABASE)
+                                               .exists()
+        )
+        response = self.client.get(url)
+        self.assertIn(b'name="second"', response.content)
+
+        # Once the pin expires, the read database is used again
+        session = self.client.session
+        session[PIN_SESSION_KEY] = 0
+        session.save()
+        response = self.client.get(url)
+        self.assertNotIn(b'name="second"', response.content)
+
+        # Saved form data is listed from the read database
+        SavedFormDataEntry._default_manager.using(READ_DATABASE).create(
+            form_entry_id=form_entry.pk,
+            form_data_headers=json.dumps({'first': "First"}),
+            saved_data=json.dumps({'first': "Replica"})
+        )
+        self.client.force_login(user)
+        response = self.client.get(reverse(
+            'fobi.contrib.plugins.form_handlers.db_store.'
+            'view_saved_form_data_entries',
+            kwargs={'form_entry_id': form_entry.pk}
+        ))
+        self.assertIn(b'Replica', response.content)
+        self.assertNotIn(b'Primary', response.content)
+
+        def is_pinned():
+            return self.client.session.get(PIN_SESSION_KEY, 0) > time.time()
+
+        # Viewing the form builder does not pin the session
+        response = self.client.get(reverse(
+            'fobi.edit_form_entry',
+            kwargs={'form_entry_id': form_entry.pk}
+        ))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(is_pinned())
+
+        # Form builder changes pin the session to the default database
+        self.client.post(reverse('fobi.publish_form_entry',
+                                 kwargs={'form_entry_id': form_entry.pk}))
+        self.assertTrue(is_pinned())
+
+        # So do the form builder changes made by the links (GET)
+        session = self.client.session
+        session[PIN_SESSION_KEY] = 0
+        session.save()
+        self.client.get(reverse(
+            'fobi.delete_form_element_entry',
+            kwargs={'form_element_entry_id': entries[0].pk}
+        ))
+        self.assertTrue(is_pinned())
+
+
+if __name__ == '__main__':
+    unittest.main()
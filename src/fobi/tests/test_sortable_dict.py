@@ -1,6 +1,7 @@
+import pickle
 import unittest
 
-from copy import copy
+from copy import copy, deepcopy
 
 from django.test import TestCase
 
@@ -67,6 +68,74 @@ class FobiDataStructuresTest(TestCase):
 
         return flow
 
+    @print_info
+    def test_03_sortable_dict_operations(self):
+        """Test the `fobi.data_structures.SortableDict` operations."""
+        sortable_dict = SortableDict([(key, key) for key in 'abcde'])
+
+        del sortable_dict['b']
+        self.assertEqual(sortable_dict.pop('d'), 'd')
+        self.assertEqual(sortable_dict.popitem(), ('e', 'e'))
+        self.assertEqual(list(sortable_dict.keys()), ['a', 'c'])
+
+        sortable_dict.insert(1, 'b', 'b')
+        sortable_dict.insert_after_key('c', 'd', 'd')
+        sortable_dict.insert_before_key('a', 'z', 'z')
+        self.assertEqual(list(sortable_dict.keys()), ['z', 'a', 'b', 'c', 'd'])
+        self.assertEqual(sortable_dict.value_for_index(-1), 'd')
+
+        self.assertTrue(sortable_dict.move_after_key('z', 'd'))
+        self.assertFalse(sortable_dict.move_after_key('z', 'x'))
+        self.assertEqual(list(reversed(sortable_dict)),
+                         ['z', 'd', 'c', 'b', 'a'])
+
+        for copied in (copy(sortable_dict),
+                       deepcopy(sortable_dict),
+                       pickle.loads(pickle.dumps(sortable_dict))):
+            self.assertEqual(list(copied.items()),
+                             list(sortable_dict.items()))
+
+    @print_info
+    def test_04_sortable_dict_benchmark(self):
+        """Benchmark the `fobi.data_structures.SortableDict` operations.
+
+        Deleting, inserting before/after and moving the keys shall not walk
+        through the keys (take a constant time, regardless of the size of
+        the dictionary). Inserting by index walks through the keys before
+        the index only.
+        """
+        class CountingSortableDict(SortableDict):
+            """Counts the keys walked through."""
+
+            walked = 0
+
+            def __iter__(self):
+                for key in super(CountingSortableDict, self).__iter__():
+                    self.walked += 1
+                    yield key
+
+            def _get_node(self, index):
+                self.walked += min(index, len(self._nodes))
+                return super(CountingSortableDict, self)._get_node(index)
+
+        size, operations = 1000, 100
+        sortable_dict = CountingSortableDict(
+            [(key, key) for key in range(size)]
+        )
+        sortable_dict.walked = 0
+        for index in range(operations):
+            sortable_dict.move_after_key(index, size - 1 - index)
+            sortable_dict.insert_before_key(index, -index - 1, None)
+            del sortable_dict[-index - 1]
+            sortable_dict.pop(index)
+            sortable_dict[index] = index
+        self.assertEqual(sortable_dict.walked, 0)
+        self.assertEqual(len(sortable_dict), size)
+
+        sortable_dict.insert(2, size - 1, None)
+        self.assertLessEqual(sortable_dict.walked, 2)
+        self.assertEqual(sortable_dict.value_for_index(2), None)
+
 
 if __name__ == '__main__':
     unittest.main()
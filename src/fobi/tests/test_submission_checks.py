@@ -0,0 +1,107 @@
+import unittest
+
+from django.test import TestCase
+
+from nine import versions
+
+from fobi import models, utils
+from fobi.base import (
+    form_element_plugin_registry,
+    get_rejected_submissions_counts,
+    reset_rejected_submissions_counts,
+)
+
+from .core import print_info
+from .helpers import create_form_entry, get_text_plugin_data, setup_app
+
+__title__ = 'fobi.tests.test_submission_checks'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiSubmissionChecksTest',)
+
+if versions.DJANGO_GTE_1_10:
+    from django.urls import reverse
+else:
+    from django.core.urlresolvers import reverse
+
+
+class FobiSubmissionChecksTest(TestCase):
+    """Tests of the early rejection of the (bot) submissions."""
+
+    def setUp(self):
+        """Set up."""
+        setup_app(fobi_sync_plugins=True)
+        self._compile_form_definitions = models.COMPILE_FORM_DEFINITIONS
+        models.COMPILE_FORM_DEFINITIONS = True
+        utils.COMPILE_FORM_DEFINITIONS = True
+
+    def tearDown(self):
+        """Tear down."""
+        models.COMPILE_FORM_DEFINITIONS = self._compile_form_definitions
+        utils.COMPILE_FORM_DEFINITIONS = self._compile_form_definitions
+
+    @print_info
+    def test_01_early_submission_rejection(self):
+        """Test rejecting the bot submissions before assembling the form."""
+        form_entry = create_form_entry(
+            name="Protected",
+            is_public=True,
+            form_elements=[
+                ('text', get_text_plugin_data('name', required=True)),
+                ('honeypot', {'label': "Honeypot",
+                              'name': 'website',
+                              'initial': ''}),
+            ]
+        )
+
+        self.assertEqual(
+            form_entry.get_submission_checks(),
+            [{'plugin_uid': 'honeypot',
+              'data': {'name': 'website', 'value': ''}}]
+        )
+
+        reset_rejected_submissions_counts()
+        url = reverse('fobi.view_form_entry',
+                      kwargs={'form_entry_slug': form_entry.slug})
+
+        # Filled in honeypot is rejected without assembling the form
+        with self.assertNumQueries(1):
+            response = self.client.post(url, {'name': "Bot",
+                                              'website': 'http://spam'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(get_rejected_submissions_counts(),
+                         {form_entry.slug: {'honeypot': 1}})
+
+        # Checks of the published version come from the compiled definition
+        form_entry.publish()
+        response = self.client.post(url, {'name': "Bot",
+                                          'website': 'http://spam'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(get_rejected_submissions_counts(),
+                         {form_entry.slug: {'honeypot': 2}})
+
+        # Legitimate submissions pass
+        response = self.client.post(url, {'name': "Human", 'website': ''})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(get_rejected_submissions_counts(),
+                         {form_entry.slug: {'honeypot': 2}})
+
+        reset_rejected_submissions_counts()
+        self.assertEqual(get_rejected_submissions_counts(), {})
+
+        # Optional reCAPTCHA (and captcha) elements are not checked
+        for uid in ('recaptcha', 'invisible_recaptcha', 'captcha'):
+            plugin_cls = form_element_plugin_registry._registry.get(uid)
+            if plugin_cls is None:
+                continue
+            self.assertIsNone(plugin_cls.get_submission_check(
+                {'name': uid, 'required': False}
+            ))
+            self.assertIsNotNone(plugin_cls.get_submission_check(
+                {'name': uid, 'required': True}
+            ))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import unittest
+
+from django.test import TestCase
+
+from nine import versions
+
+from fobi.contrib.plugins.form_handlers.db_store.models import (
+    SavedFormDataEntry,
+    SavedFormWizardDataEntry,
+)
+from fobi.models import (
+    FormWizardEntry,
+    FormWizardFormEntry,
+    FormWizardHandlerEntry,
+)
+
+from .core import print_info
+from .helpers import (
+    create_form_element_entry,
+    create_form_entry,
+    get_or_create_admin_user,
+    get_text_plugin_data,
+    setup_app,
+)
+
+__title__ = 'fobi.tests.test_versions'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2014-2018 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = ('FobiVersionsTest',)
+
+if versions.DJANGO_GTE_1_10:
+    from django.urls import reverse
+else:
+    from django.core.urlresolvers import reverse
+
+
+class FobiVersionsTest(TestCase):
+    """Tests of the published versions of the forms and form wizards."""
+
+    def setUp(self):
+        """Set up."""
+        setup_app(fobi_sync_plugins=True)
+
+    @print_info
+    def test_01_form_entry_versions(self):
+        """Test the published versions of the forms and form wizards."""
+        user = get_or_create_admin_user()
+        form_entry = create_form_entry(
+            name="Versioned",
+            user=user,
+            is_public=True,
+            form_elements=[
+                ('text', get_text_plugin_data('first', required=True)),
+            ],
+            form_handlers=['db_store']
+        )
+
+        def add_element(name):
+            return create_form_element_entry(
+                form_entry,
+                'text',
+                get_text_plugin_data(name, required=True)
+            )
+
+        url = reverse('fobi.view_form_entry',
+                      kwargs={'form_entry_slug': form_entry.slug})
+
+        # Publishing
+        self.client.force_login(user)
+        response = self.client.post(
+            reverse('fobi.publish_form_entry',
+                    kwargs={'form_entry_id': form_entry.pk})
+        )
+        self.assertEqual(response.status_code, 302)
+        self.client.logout()
+        form_entry.refresh_from_db()
+        first_version = form_entry.published_version
+        self.assertEqual(first_version.version, 1)
+        with self.assertRaises(ValueError):
+            first_version.save()
+
+        # Draft changes are not served until published
+        add_element('second')
+        response = self.client.get(url)
+        self.assertIn(b'name="first"', response.content)
+        self.assertNotIn(b'name="second"', response.content)
+
+        # Submissions record the version used
+        response = self.client.post(url, {'first': "Value"})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            SavedFormDataEntry._default_manager.get(
+                form_entry=form_entry
+            ).form_entry_version,
+            first_version
+        )
+
+        self.assertEqual(form_entry.publish().version, 2)
+        response = self.client.get(url)
+        self.assertIn(b'name="second"', response.content)
+
+        # Form wizards in progress are completed with the version they
+        # were started with
+        form_wizard_entry = FormWizardEntry._default_manager.create(
+            user=user, name="Versioned wizard", is_public=True
+        )
+        FormWizardFormEntry._default_manager.create(
+            form_wizard_entry=form_wizard_entry,
+            form_entry=form_entry,
+            position=1
+        )
+        FormWizardHandlerEntry._default_manager.create(
+            form_wizard_entry=form_wizard_entry,
+            plugin_uid='db_store'
+        )
+        wizard_version = form_wizard_entry.publish()
+        wizard_url = reverse(
+            'fobi.view_form_wizard_entry',
+            kwargs={'form_wizard_entry_slug': form_wizard_entry.slug}
+        )
+        response = self.client.get(wizard_url)
+        self.assertIn(b'name="versioned-second"', response.content)
+
+        add_element('third')
+        form_entry.publish()
+        form_wizard_entry.publish()
+
+        response = self.client.post(wizard_url, {
+            'form_wizard_view-current_step': form_entry.slug,
+            '{0}-first'.format(form_entry.slug): "Value",
+            '{0}-second'.format(form_entry.slug): "Value",
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            SavedFormWizardDataEntry._default_manager.get(
+                form_wizard_entry=form_wizard_entry
+            ).form_wizard_entry_version,
+            wizard_version
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,12 +20,16 @@ from fobi.views import (
     edit_form_handler_entry,
     edit_form_wizard_entry,
     edit_form_wizard_handler_entry,
+    export_form_entries,
     export_form_entry,
     export_form_wizard_entry,
     form_importer,
     form_wizards_dashboard,
     import_form_entry,
-    import_form_wizard_entry
+    import_form_wizard_entry,
+    order_form_element_entries,
+    publish_form_entry,
+    publish_form_wizard_entry
 )
 
 __title__ = 'fobi.urls.edit'
@@ -64,6 +68,16 @@ urlpatterns = [
         export_form_entry,
         name='fobi.export_form_entry'),
 
+    # Publish form entry
+    url(_(r'^forms/publish/(?P<form_entry_id>\d+)/$'),
+        publish_form_entry,
+        name='fobi.publish_form_entry'),
+
+    # Export all form entries (streamed)
+    url(_(r'^forms/export/$'),
+        export_form_entries,
+        name='fobi.export_form_entries'),
+
     # Import form entry
     url(_(r'^forms/import/$'),
         import_form_entry,
@@ -94,6 +108,11 @@ urlpatterns = [
         delete_form_element_entry,
         name='fobi.delete_form_element_entry'),
 
+    # Order form element entries
+    url(_(r'^forms/elements/order/(?P<form_entry_id>\d+)/$'),
+        order_form_element_entries,
+        name='fobi.order_form_element_entries'),
+
     # ***********************************************************************
     # *********************** Form handler entry CUD ************************
     # ***********************************************************************
@@ -182,6 +201,11 @@ urlpatterns = [
         export_form_wizard_entry,
         name='fobi.export_form_wizard_entry'),
 
+    # Publish form wizard entry
+    url(_(r'^wizard/publish/(?P<form_wizard_entry_id>\d+)/$'),
+        publish_form_wizard_entry,
+        name='fobi.publish_form_wizard_entry'),
+
     # Import form wizard entry
     url(_(r'^wizard/import/$'),
         import_form_wizard_entry,
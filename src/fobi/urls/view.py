@@ -1,6 +1,8 @@
 from django.conf.urls import url
 from django.utils.translation import ugettext_lazy as _
 from fobi.views import (
+    form_entry_file_upload,
+    form_entry_model_object_choices,
     form_entry_submitted,
     view_form_entry,
     form_wizard_entry_submitted,
@@ -32,6 +34,18 @@ urlpatterns = [
         view=form_entry_submitted,
         name='fobi.form_entry_submitted'),
 
+    # Model object choices of a form element (JSON)
+    url(_(r'^view/(?P<form_entry_slug>[\w_\-]+)/choices/'
+          r'(?P<field_name>[\w_\-]+)/$'),
+        view=form_entry_model_object_choices,
+        name='fobi.form_entry_model_object_choices'),
+
+    # File upload of a form element (JSON)
+    url(_(r'^view/(?P<form_entry_slug>[\w_\-]+)/upload/'
+          r'(?P<field_name>[\w_\-]+)/$'),
+        view=form_entry_file_upload,
+        name='fobi.form_entry_file_upload'),
+
     # ***********************************************************************
     # *************************** Form wizard entry *************************
     # ***********************************************************************
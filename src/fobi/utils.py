@@ -2,22 +2,32 @@
 Another helper module. This module can NOT be safely imported from any fobi
 (sub)module - thus should be imported carefully.
 """
+import bisect
 import datetime
+import hashlib
 import logging
+import multiprocessing
 import os
+import time
 
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 
+import django
+from django.apps import apps
 from django.conf import settings
 from django.contrib import messages
+from django.contrib.messages import get_messages
+from django.db import connections, transaction
+from django.db.models import Case, Count, IntegerField, Value, When
 from django.forms.widgets import TextInput
 from django.utils.encoding import force_text
 from django.utils.translation import (
+    get_language,
     ugettext,
     # ugettext_lazy as _,
 )
 
-from nine.versions import DJANGO_GTE_1_10
+from nine.versions import DJANGO_GTE_1_10, DJANGO_GTE_2_2
 
 from six import PY3
 
@@ -36,17 +46,27 @@ from .base import (
     get_theme,
 
 )
+from .constants import FORM_ELEMENT_ENTRY_POSITION_STEP
 from .dynamic import assemble_form_class
+from .exceptions import FormImportError
 from .helpers import update_plugin_data, safe_text
+from .idempotency import idempotency_keys_enabled
 from .models import (
     FormEntry,
     FormElement,
     FormElementEntry,
     FormHandler,
     FormHandlerEntry,
+    FormWizardEntry,
+    FormWizardFormEntry,
     FormWizardHandler,
+    FormWizardHandlerEntry,
+    invalidate_compiled_definitions,
 )
 from .settings import (
+    CACHE_CONTROL,
+    CACHE_CONTROL_PER_FORM,
+    COMPILE_FORM_DEFINITIONS,
     RESTRICT_PLUGIN_ACCESS,
     DEBUG,
     WIZARD_FILES_UPLOAD_DIR,
@@ -64,10 +84,15 @@ __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
 __all__ = (
     'append_edit_and_delete_links_to_field',
+    'delete_broken_entries',
+    'find_broken_entries',
     'get_allowed_form_element_plugin_uids',
     'get_allowed_form_handler_plugin_uids',
     'get_allowed_form_wizard_handler_plugin_uids',
     'get_allowed_plugin_uids',
+    'get_form_entry_cache_validators',
+    'get_next_form_element_entry_position',
+    'get_plugin_entry_models',
     'get_user_form_element_plugin_uids',
     'get_user_form_element_plugins',
     'get_user_form_element_plugins_grouped',
@@ -82,9 +107,18 @@ __all__ = (
     'get_user_plugins',
     'get_user_plugins_grouped',
     'get_wizard_files_upload_dir',
+    'import_form_entries',
+    'iter_export_documents',
+    'iter_form_entries_export_data',
+    'iter_form_wizard_entries_export_data',
     'perform_form_entry_import',
     'prepare_form_entry_export_data',
+    'prepare_form_wizard_entry_export_data',
+    'remap_broken_entries',
     'sync_plugins',
+    'update_form_element_entries_positions',
+    'update_plugin_data_in_chunks',
+    'validate_form_entry_import_data',
 )
 
 logger = logging.getLogger(__name__)
@@ -97,6 +131,9 @@ def sync_plugins():
     ``fobi.models.FormFieldPluginModel``,
     ``fobi.models.FormHandlerPluginModel`` and
     ``fobi.models.FormWizardHandlerPluginModel``.
+
+    :return dict: Plugin UIDs ``added`` to the database and the ``stale``
+        ones (no longer registered), plugin model name as key.
     """
     ensure_autodiscover()
 
@@ -106,6 +143,7 @@ def sync_plugins():
         :param callable get_plugin_uids_func:
         :param fobi.models.AbstractPluginModel plugin_model_cls: Subclass of
             ``fobi.models.AbstractPluginModel``.
+        :return dict:
         """
         # If not in restricted mode, the quit.
         # TODO - perform a subclass check
@@ -117,26 +155,196 @@ def sync_plugins():
         registered_plugins = set(get_plugin_uids_func())
 
         synced_plugins = set(
-            [p.plugin_uid for p in
-             plugin_model_cls._default_manager.only('plugin_uid')]
+            plugin_model_cls._default_manager.filter(
+                plugin_uid__in=registered_plugins
+            ).values_list('plugin_uid', flat=True)
+        )
+
+        non_synced_plugins = sorted(registered_plugins - synced_plugins)
+
+        if non_synced_plugins:
+            plugin_model_cls._default_manager.bulk_create([
+                plugin_model_cls(plugin_uid=plugin_uid)
+                for plugin_uid in non_synced_plugins
+            ])
+
+        stale_plugins = plugin_model_cls._default_manager \
+            .exclude(plugin_uid__in=registered_plugins) \
+            .order_by('plugin_uid') \
+            .values_list('plugin_uid', flat=True)
+
+        return {
+            'added': non_synced_plugins,
+            'stale': list(stale_plugins),
+        }
+
+    return OrderedDict((
+        (plugin_model_cls.__name__,
+         base_sync_plugins(get_plugin_uids_func, plugin_model_cls))
+        for get_plugin_uids_func, plugin_model_cls in (
+            (get_registered_form_element_plugin_uids, FormElement),
+            (get_registered_form_handler_plugin_uids, FormHandler),
+            (get_registered_form_wizard_handler_plugin_uids,
+             FormWizardHandler),
         )
+    ))
+
+
+def get_plugin_entry_models():
+    """Get the plugin entry models along with their registered plugin UIDs.
+
+    :return list: List of (plugin entry model, registered plugin UIDs)
+        tuples.
+    """
+    ensure_autodiscover()
+    return [
+        (FormElementEntry, get_registered_form_element_plugin_uids()),
+        (FormHandlerEntry, get_registered_form_handler_plugin_uids()),
+        (FormWizardHandlerEntry,
+         get_registered_form_wizard_handler_plugin_uids()),
+    ]
+
+
+def _invalidate_compiled_definitions_of_entries(entry_model_cls,
+                                                entries=None,
+                                                ids=None):
+    """Invalidate the compiled definitions of the forms of the entries.
 
-        non_synced_plugins = registered_plugins - synced_plugins
+    Called after the entries are changed in bulk (no signals sent).
+
+    :param fobi.models.BaseAbstractPluginEntry entry_model_cls:
+    :param iterable entries: Entries changed.
+    :param iterable ids: IDs of the entries changed (if no entries given).
+    """
+    if entry_model_cls not in (FormElementEntry, FormHandlerEntry):
+        return
+
+    if entries is not None:
+        form_entry_ids = set(entry.form_entry_id for entry in entries)
+    else:
+        form_entry_ids = entry_model_cls._default_manager \
+            .filter(pk__in=ids) \
+            .values_list('form_entry_id', flat=True) \
+            .distinct()
+
+    invalidate_compiled_definitions(form_entry_ids=form_entry_ids)
+
+
+def _get_broken_entries_queryset(entry_model_cls, plugin_uids,
+                                 broken_plugin_uids=None):
+    """Get the queryset of the broken plugin entries.
+
+    :param fobi.models.BaseAbstractPluginEntry entry_model_cls:
+    :param iterable plugin_uids: Registered plugin UIDs.
+    :param iterable broken_plugin_uids: If given, limits the entries to the
+        ones of the plugin UIDs given.
+    :return django.db.models.QuerySet:
+    """
+    queryset = entry_model_cls._default_manager \
+        .exclude(plugin_uid__in=list(plugin_uids))
+    if broken_plugin_uids is not None:
+        queryset = queryset.filter(plugin_uid__in=list(broken_plugin_uids))
+    return queryset
+
+
+def find_broken_entries(entry_model_cls, plugin_uids):
+    """Find the entries of the plugins no longer registered.
+
+    The check is done in the database (a single query).
+
+    :param fobi.models.BaseAbstractPluginEntry entry_model_cls:
+    :param iterable plugin_uids: Registered plugin UIDs.
+    :return collections.OrderedDict: Number of broken entries, plugin UID
+        as key.
+    """
+    queryset = _get_broken_entries_queryset(entry_model_cls, plugin_uids) \
+        .order_by('plugin_uid') \
+        .values('plugin_uid') \
+        .annotate(count=Count('pk'))
+    return OrderedDict(
+        (row['plugin_uid'], row['count']) for row in queryset
+    )
 
-        if not non_synced_plugins:
+
+def _iter_broken_entry_ids_chunks(entry_model_cls, plugin_uids,
+                                  broken_plugin_uids, chunk_size):
+    """Iterate through the IDs of the broken entries in chunks.
+
+    Entries of a chunk are expected to be fixed (deleted or remapped)
+    before the next chunk is fetched.
+    """
+    queryset = _get_broken_entries_queryset(entry_model_cls,
+                                            plugin_uids,
+                                            broken_plugin_uids)
+    while True:
+        ids = list(
+            queryset.order_by('pk').values_list('pk', flat=True)[:chunk_size]
+        )
+        if not ids:
             return
+        yield ids
 
-        buf = []
 
-        for plugin_uid in non_synced_plugins:
-            buf.append(plugin_model_cls(plugin_uid=plugin_uid))
+def delete_broken_entries(entry_model_cls, plugin_uids,
+                          broken_plugin_uids=None, chunk_size=1000):
+    """Delete the entries of the plugins no longer registered.
 
-        plugin_model_cls._default_manager.bulk_create(buf)
+    Entries are deleted in chunks (a query per chunk).
 
-    base_sync_plugins(get_registered_form_element_plugin_uids, FormElement)
-    base_sync_plugins(get_registered_form_handler_plugin_uids, FormHandler)
-    base_sync_plugins(get_registered_form_wizard_handler_plugin_uids,
-                      FormWizardHandler)
+    :param fobi.models.BaseAbstractPluginEntry entry_model_cls:
+    :param iterable plugin_uids: Registered plugin UIDs.
+    :param iterable broken_plugin_uids: If given, only the entries of the
+        plugin UIDs given are deleted.
+    :param int chunk_size:
+    :return int: Number of entries deleted.
+    """
+    deleted = 0
+    for ids in _iter_broken_entry_ids_chunks(entry_model_cls,
+                                             plugin_uids,
+                                             broken_plugin_uids,
+                                             chunk_size):
+        entry_model_cls._default_manager.filter(pk__in=ids).delete()
+        deleted += len(ids)
+    return deleted
+
+
+def remap_broken_entries(entry_model_cls, plugin_uids, plugin_uid_map,
+                         chunk_size=1000):
+    """Remap the entries of the plugins no longer registered.
+
+    Entries are updated in chunks (a query per chunk). The plugin data is
+    kept as is.
+
+    :param fobi.models.BaseAbstractPluginEntry entry_model_cls:
+    :param iterable plugin_uids: Registered plugin UIDs.
+    :param dict plugin_uid_map: New plugin UIDs, broken plugin UID as key.
+        New plugin UIDs shall be registered.
+    :param int chunk_size:
+    :return dict: Number of entries remapped, broken plugin UID as key.
+    """
+    plugin_uids = list(plugin_uids)
+    unknown_plugin_uids = set(plugin_uid_map.values()) - set(plugin_uids)
+    if unknown_plugin_uids:
+        raise ValueError(
+            "Plugins {0} are not registered.".format(
+                ', '.join(sorted(unknown_plugin_uids))
+            )
+        )
+
+    remapped = OrderedDict()
+    for broken_plugin_uid, plugin_uid in plugin_uid_map.items():
+        remapped[broken_plugin_uid] = 0
+        for ids in _iter_broken_entry_ids_chunks(entry_model_cls,
+                                                 plugin_uids,
+                                                 [broken_plugin_uid],
+                                                 chunk_size):
+            entry_model_cls._default_manager \
+                .filter(pk__in=ids) \
+                .update(plugin_uid=plugin_uid)
+            _invalidate_compiled_definitions_of_entries(entry_model_cls,
+                                                        ids=ids)
+            remapped[broken_plugin_uid] += len(ids)
+    return remapped
 
 # ****************************************************************************
 # ****************************************************************************
@@ -653,6 +861,274 @@ def append_edit_and_delete_links_to_field(form_element_plugin,
     return data_dict
 
 
+def get_next_form_element_entry_position(form_entry):
+    """Get the position of the form element entry added to the form (last).
+
+    Served by the ``(form_entry, position)`` index.
+
+    :param fobi.models.FormEntry form_entry:
+    :return int:
+    """
+    last_position = FormElementEntry._default_manager \
+        .filter(form_entry=form_entry, position__isnull=False) \
+        .order_by('-position') \
+        .values_list('position', flat=True) \
+        .first()
+    return (last_position or 0) + FORM_ELEMENT_ENTRY_POSITION_STEP
+
+
+def _get_increasing_subsequence_indexes(values):
+    """Get indexes of the longest strictly increasing subsequence.
+
+    :param list values: Values (None values are skipped).
+    :return set:
+    """
+    tails = []
+    tail_indexes = []
+    previous_indexes = [None] * len(values)
+    for index, value in enumerate(values):
+        if value is None:
+            continue
+        tail = bisect.bisect_left(tails, value)
+        if tail == len(tails):
+            tails.append(value)
+            tail_indexes.append(index)
+        else:
+            tails[tail] = value
+            tail_indexes[tail] = index
+        previous_indexes[index] = tail_indexes[tail - 1] if tail else None
+
+    indexes = set()
+    index = tail_indexes[-1] if tail_indexes else None
+    while index is not None:
+        indexes.add(index)
+        index = previous_indexes[index]
+    return indexes
+
+
+def _get_gap_positions(current_positions):
+    """Get the positions of the entries (in the new order) moved into gaps.
+
+    Entries forming the longest (already) ordered sequence keep their
+    positions. The others get the positions spread evenly in the gaps
+    between them.
+
+    :param list current_positions: Current positions in the new order.
+    :return list: New positions, or None if there is no gap to move into.
+    """
+    kept_indexes = _get_increasing_subsequence_indexes(current_positions)
+    positions = [
+        position if index in kept_indexes else None
+        for index, position in enumerate(current_positions)
+    ]
+
+    index = 0
+    while index < len(positions):
+        if positions[index] is not None:
+            index += 1
+            continue
+
+        # Run of the moved entries
+        end = index
+        while end < len(positions) and positions[end] is None:
+            end += 1
+        count = end - index
+        low = positions[index - 1] if index else 0
+        if end < len(positions):
+            high = positions[end]
+        else:
+            high = low + FORM_ELEMENT_ENTRY_POSITION_STEP * (count + 1)
+
+        gap = (high - low) // (count + 1)
+        if gap < 1:
+            return None
+        for offset in range(count):
+            positions[index + offset] = low + gap * (offset + 1)
+        index = end
+
+    return positions
+
+
+def _bulk_update_form_element_entries_positions(form_element_entries):
+    """Update the positions of the form element entries (single query).
+
+    :param list form_element_entries:
+    """
+    if not form_element_entries:
+        return
+
+    if DJANGO_GTE_2_2:
+        FormElementEntry._default_manager.bulk_update(form_element_entries,
+                                                      ['position'])
+    else:
+        FormElementEntry._default_manager.filter(
+            pk__in=[entry.pk for entry in form_element_entries]
+        ).update(
+            position=Case(
+                *[When(pk=entry.pk, then=Value(entry.position))
+                  for entry in form_element_entries],
+                output_field=IntegerField()
+            )
+        )
+
+
+def update_form_element_entries_positions(form_entry, form_element_entry_ids):
+    """Update the positions of the form element entries (ordering).
+
+    Positions are spaced (by ``FORM_ELEMENT_ENTRY_POSITION_STEP``). Only the
+    moved entries are updated (in a single query): they are put into the
+    gaps between the positions of the others. If there is no gap left, the
+    positions of the form are rebalanced (spaced evenly again).
+
+    :param fobi.models.FormEntry form_entry:
+    :param iterable form_element_entry_ids: IDs of all the form element
+        entries of the form, in the new order.
+    :return collections.OrderedDict: New positions (ID as key).
+    :raise ValueError: If the IDs given are not the IDs of the form element
+        entries of the form.
+    """
+    form_element_entry_ids = [int(pk) for pk in form_element_entry_ids]
+    current_positions = dict(
+        FormElementEntry._default_manager
+                        .filter(form_entry=form_entry)
+                        .order_by()
+                        .values_list('pk', 'position')
+    )
+    if len(form_element_entry_ids) != len(current_positions) \
+            or set(form_element_entry_ids) != set(current_positions):
+        raise ValueError(
+            "Form element entries do not match the ones of the form."
+        )
+
+    new_positions = _get_gap_positions(
+        [current_positions[pk] for pk in form_element_entry_ids]
+    )
+    if new_positions is None:
+        # Rebalancing
+        new_positions = [
+            FORM_ELEMENT_ENTRY_POSITION_STEP * index
+            for index in range(1, len(form_element_entry_ids) + 1)
+        ]
+
+    positions = OrderedDict(zip(form_element_entry_ids, new_positions))
+    moved_form_element_entries = [
+        FormElementEntry(pk=pk, position=position)
+        for pk, position in positions.items()
+        if current_positions[pk] != position
+    ]
+    if moved_form_element_entries:
+        with transaction.atomic():
+            _bulk_update_form_element_entries_positions(
+                moved_form_element_entries
+            )
+            invalidate_compiled_definitions(
+                form_entry_ids=[getattr(form_entry, 'pk', form_entry)]
+            )
+
+    return positions
+
+
+def _get_form_entry_cache_validators(request, form_entry_slug):
+    """Get the cache validators of the form page (not memoized).
+
+    :param django.http.HttpRequest request:
+    :param str form_entry_slug:
+    :return tuple:
+    """
+    no_validators = (None, None, None)
+    if not form_entry_slug or request.method not in ('GET', 'HEAD'):
+        return no_validators
+
+    if DJANGO_GTE_1_10:
+        user_is_authenticated = request.user.is_authenticated
+    else:
+        user_is_authenticated = request.user.is_authenticated()
+    # Pages of the authenticated users (non-public forms) or showing
+    # messages are always served in full.
+    if user_is_authenticated or len(get_messages(request)):
+        return no_validators
+
+    cache_control = CACHE_CONTROL_PER_FORM.get(form_entry_slug,
+                                               CACHE_CONTROL)
+    # Pages holding the idempotency keys (new key per page) are always
+    # served in full.
+    if cache_control is None or idempotency_keys_enabled():
+        return no_validators
+
+    form_entry_data = FormEntry._default_manager \
+        .filter(slug=form_entry_slug, is_public=True) \
+        .values_list('pk',
+                     'updated',
+                     'published_version_id',
+                     'published_version__created',
+                     'compiled_definition') \
+        .first()
+    if form_entry_data is None:
+        return no_validators
+
+    (form_entry_id, updated, published_version_id, published,
+     compiled_definition) = form_entry_data
+
+    if published_version_id:
+        # Published versions do not change.
+        definition_key = 'version-{0}'.format(published_version_id)
+        last_modified = max(updated, published) if updated else published
+    elif COMPILE_FORM_DEFINITIONS and compiled_definition:
+        # Compiled definition of the draft is invalidated on each change of
+        # the form elements (or handlers), but there's no timestamp of the
+        # changes.
+        definition_key = hashlib.md5(
+            compiled_definition.encode('utf-8')
+        ).hexdigest()
+        last_modified = None
+    else:
+        return no_validators
+
+    etag = hashlib.md5('|'.join([
+        force_text(form_entry_id),
+        updated.isoformat() if updated else '',
+        definition_key,
+        get_theme(request=request, as_instance=True).uid,
+        get_language() or '',
+        request.GET.urlencode(),
+        request.META.get('HTTP_ACCEPT', ''),
+        # Pages hold the CSRF token.
+        request.META.get('CSRF_COOKIE', ''),
+    ]).encode('utf-8')).hexdigest()
+
+    return etag, last_modified, cache_control
+
+
+def get_form_entry_cache_validators(request, form_entry_slug):
+    """Get the cache validators of the form page.
+
+    Only the GET (and HEAD) requests of the anonymous users to the public
+    forms are conditionally served, and only if the idempotency keys are not
+    rendered into the form pages (``FOBI_SUBMISSION_IDEMPOTENCY_TIMEOUT`` set
+    to 0). The ETag is derived of the published version of the form (or of
+    the compiled definition of the draft, if never published) and of the
+    form itself.
+
+    Memoized per request.
+
+    :param django.http.HttpRequest request:
+    :param str form_entry_slug:
+    :return tuple: ETag (str), Last-Modified (``datetime.datetime``) and
+        Cache-Control directives (dict). All None if the page shall not be
+        conditionally served.
+    """
+    validators = getattr(request, '_fobi_cache_validators', None)
+    if validators is None:
+        validators = {}
+        request._fobi_cache_validators = validators
+
+    if form_entry_slug not in validators:
+        validators[form_entry_slug] = _get_form_entry_cache_validators(
+            request, form_entry_slug
+        )
+    return validators[form_entry_slug]
+
+
 def update_plugin_data_for_entries(entries=None,
                                    request=None,
                                    entry_model_cls=None):
@@ -679,6 +1155,193 @@ def update_plugin_data_for_entries(entries=None,
     logger.debug(entries)
 
 
+def _get_entry_user_field_name(entry_model_cls):
+    """Get name of the field (lookup) pointing to the user of the entry.
+
+    :param fobi.models.BaseAbstractPluginEntry entry_model_cls:
+    :return str:
+    """
+    field_names = [field.name for field in entry_model_cls._meta.get_fields()]
+    for field_name in ('form_entry', 'form_wizard_entry'):
+        if field_name in field_names:
+            return '{0}__user'.format(field_name)
+
+
+def _update_plugin_data_of_entries(entries, dry_run=False):
+    """Update plugin data of the entries (in bulk).
+
+    :param list entries: List of plugin entries (of the same model).
+    :param bool dry_run: If set to True, nothing is saved.
+    :return int: Number of entries updated.
+    """
+    updated_entries = [
+        entry
+        for entry in entries
+        if update_plugin_data(entry, commit=False)
+    ]
+
+    if updated_entries and not dry_run:
+        entry_model_cls = updated_entries[0].__class__
+        with transaction.atomic():
+            if DJANGO_GTE_2_2:
+                entry_model_cls._default_manager.bulk_update(
+                    updated_entries,
+                    ['plugin_data']
+                )
+            else:
+                for entry in updated_entries:
+                    entry_model_cls._default_manager \
+                        .filter(pk=entry.pk) \
+                        .update(plugin_data=entry.plugin_data)
+            _invalidate_compiled_definitions_of_entries(entry_model_cls,
+                                                        updated_entries)
+
+    return len(updated_entries)
+
+
+def _get_plugin_entries_queryset(entry_model_cls, plugin_uids=None):
+    """Get plugin entries queryset (ordered by primary key).
+
+    :param fobi.models.BaseAbstractPluginEntry entry_model_cls:
+    :param iterable plugin_uids:
+    :return django.db.models.QuerySet:
+    """
+    queryset = entry_model_cls._default_manager \
+        .select_related(_get_entry_user_field_name(entry_model_cls)) \
+        .order_by('pk')
+    if plugin_uids:
+        queryset = queryset.filter(plugin_uid__in=plugin_uids)
+    return queryset
+
+
+def _update_plugin_data_of_range(args):
+    """Update plugin data of the entries in the primary key range.
+
+    Run in worker processes (Django is set up by the pool initializer).
+
+    :param tuple args: Model label, primary key to start after, last primary
+        key, plugin uids and the dry run flag.
+    :return tuple: Number of entries processed and updated.
+    """
+    model_label, start_after, end_pk, plugin_uids, dry_run = args
+    entry_model_cls = apps.get_model(model_label)
+    queryset = _get_plugin_entries_queryset(entry_model_cls, plugin_uids) \
+        .filter(pk__lte=end_pk)
+    if start_after is not None:
+        queryset = queryset.filter(pk__gt=start_after)
+
+    entries = list(queryset)
+    return len(entries), _update_plugin_data_of_entries(entries, dry_run)
+
+
+def update_plugin_data_in_chunks(entry_model_cls,
+                                 plugin_uids=None,
+                                 chunk_size=1000,
+                                 start_after=None,
+                                 dry_run=False,
+                                 workers=1,
+                                 progress_callback=None):
+    """Update plugin data of the entries, chunk by chunk.
+
+    Entries are processed in the primary key order, ``chunk_size`` entries
+    at once (only the chunk is held in memory). Changed entries of the
+    chunk are saved in bulk. Since the primary key of the last entry
+    processed is reported after each chunk, an interrupted update can be
+    resumed (see ``start_after``).
+
+    :param fobi.models.BaseAbstractPluginEntry entry_model_cls:
+    :param iterable plugin_uids: If given, only the entries of the plugins
+        given are updated.
+    :param int chunk_size:
+    :param int start_after: If given, only entries with greater primary key
+        are updated.
+    :param bool dry_run: If set to True, nothing is saved.
+    :param int workers: Number of worker processes. If greater than 1,
+        chunks are processed in parallel.
+    :param callable progress_callback: Called after each chunk with the
+        entry model class and the stats (dict) so far.
+    :return dict: Stats (number of entries processed and updated, primary
+        key of the last entry processed, time elapsed).
+    """
+    queryset = _get_plugin_entries_queryset(entry_model_cls, plugin_uids)
+    if start_after is not None:
+        queryset = queryset.filter(pk__gt=start_after)
+
+    stats = {
+        'processed': 0,
+        'updated': 0,
+        'last_pk': start_after,
+        'elapsed': 0.0,
+    }
+    started = time.time()
+
+    def report(processed, updated, last_pk):
+        stats['processed'] += processed
+        stats['updated'] += updated
+        stats['last_pk'] = last_pk
+        stats['elapsed'] = time.time() - started
+        if progress_callback is not None:
+            progress_callback(entry_model_cls, dict(stats))
+
+    if workers > 1:
+        # Chunk boundaries (last primary key of each chunk).
+        end_pks = [
+            pk
+            for index, pk in enumerate(
+                queryset.values_list('pk', flat=True).iterator()
+            )
+            if (index + 1) % chunk_size == 0
+        ]
+        last_pk = queryset.values_list('pk', flat=True).last()
+        if last_pk is not None and last_pk not in end_pks:
+            end_pks.append(last_pk)
+
+        ranges = [
+            (
+                entry_model_cls._meta.label,
+                end_pks[index - 1] if index else start_after,
+                end_pk,
+                plugin_uids,
+                dry_run
+            )
+            for index, end_pk in enumerate(end_pks)
+        ]
+
+        # Connections are not to be shared with the worker processes.
+        # Worker processes set up Django themselves (the "spawn" start
+        # method does not inherit the app registry).
+        connections.close_all()
+        pool = multiprocessing.Pool(workers, initializer=django.setup)
+        try:
+            results = pool.imap(_update_plugin_data_of_range, ranges)
+            for (processed, updated), range_ in zip(results, ranges):
+                report(processed, updated, range_[2])
+        finally:
+            pool.close()
+            pool.join()
+
+        return stats
+
+    last_pk = start_after
+    while True:
+        chunk_queryset = queryset
+        if last_pk is not None:
+            chunk_queryset = chunk_queryset.filter(pk__gt=last_pk)
+
+        entries = list(chunk_queryset[:chunk_size])
+        if not entries:
+            break
+
+        last_pk = entries[-1].pk
+        report(
+            len(entries),
+            _update_plugin_data_of_entries(entries, dry_run),
+            last_pk
+        )
+
+    return stats
+
+
 # ****************************************************************************
 # ****************************************************************************
 # **************************** Form wizards specific *************************
@@ -736,10 +1399,10 @@ def prepare_form_entry_export_data(form_entry,
         'form_handlers': [],
     }
 
-    if not form_element_entries:
+    if form_element_entries is None:
         form_element_entries = form_entry.formelemententry_set.all()[:]
 
-    if not form_handler_entries:
+    if form_handler_entries is None:
         form_handler_entries = form_entry.formhandlerentry_set.all()[:]
 
     for form_element_entry in form_element_entries:
@@ -761,89 +1424,412 @@ def prepare_form_entry_export_data(form_entry,
     return data
 
 
-def perform_form_entry_import(request, form_data):
-    """Perform form entry import.
+def prepare_form_wizard_entry_export_data(form_wizard_entry,
+                                          form_entries_data=None,
+                                          form_wizard_handler_entries=None):
+    """Prepare form wizard entry export data.
 
-    :param django.http.HttpRequest request:
-    :param dict form_data:
-    :return :class:`fobi.modes.FormEntry: Instance of.
+    :param fobi.modes.FormWizardEntry form_wizard_entry: Instance of.
+    :param iterable form_entries_data: Export data of the form entries of
+        the wizard (as returned by ``prepare_form_entry_export_data``).
+    :param django.db.models.QuerySet form_wizard_handler_entries: QuerySet
+        of FormWizardHandlerEntry instances.
+    :return dict:
     """
-    form_elements_data = form_data.pop('form_elements', [])
-    form_handlers_data = form_data.pop('form_handlers', [])
-
-    form_data_keys_whitelist = (
-        'name',
-        'title',
-        'slug',
-        'is_public',
-        'active_date_from',
-        'active_date_to',
-        'inactive_page_title',
-        'inactive_page_message',
-        'is_cloneable',
-        # 'position',
-        'success_page_title',
-        'success_page_message',
-        'action',
-    )
+    data = {
+        'name': form_wizard_entry.name,
+        'slug': form_wizard_entry.slug,
+        'is_public': False,
+        'is_cloneable': False,
+        'success_page_title': form_wizard_entry.success_page_title,
+        'success_page_message': form_wizard_entry.success_page_message,
+        'form_wizard_forms': [],
+        'form_wizard_handlers': [],
+    }
 
-    # In this way we keep possible trash out.
-    for key in list(form_data.keys()):
-        if key not in form_data_keys_whitelist:
-            form_data.pop(key)
+    if form_entries_data is None:
+        form_entries_data = [
+            prepare_form_entry_export_data(wizard_form_entry.form_entry)
+            for wizard_form_entry
+            in form_wizard_entry.formwizardformentry_set.all()[:]
+        ]
 
-    # User information we always recreate!
-    form_data['user'] = request.user
+    if form_wizard_handler_entries is None:
+        form_wizard_handler_entries = \
+            form_wizard_entry.formwizardhandlerentry_set.all()[:]
 
-    form_entry = FormEntry(**form_data)
+    data['form_wizard_forms'].extend(form_entries_data)
 
-    form_entry.name += ugettext(" (imported on {0})").format(
-        datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    )
-    form_entry.save()
-
-    # One by one, importing form element plugins.
-    for form_element_data in form_elements_data:
-        if form_element_plugin_registry.registry.get(
-                form_element_data.get('plugin_uid', None), None):
-            form_element = FormElementEntry(**form_element_data)
-            form_element.form_entry = form_entry
-            form_element.save()
-        else:
-            if form_element_data.get('plugin_uid', None):
-                messages.warning(
-                    request,
-                    ugettext('Plugin {0} is missing in the system.').format(
-                        form_element_data.get('plugin_uid')
-                    )
-                )
-            else:
-                messages.warning(
-                    request,
+    for wizard_handler_entry in form_wizard_handler_entries:
+        data['form_wizard_handlers'].append(
+            {
+                'plugin_uid': wizard_handler_entry.plugin_uid,
+                'plugin_data': wizard_handler_entry.plugin_data,
+            }
+        )
+    return data
+
+
+def _iter_queryset_chunks(queryset, chunk_size):
+    """Iterate through the queryset in chunks (lists), ordered by ID.
+
+    :param django.db.models.QuerySet queryset:
+    :param int chunk_size:
+    :return iterable:
+    """
+    queryset = queryset.order_by('pk')
+    last_pk = None
+    while True:
+        chunk_queryset = queryset
+        if last_pk is not None:
+            chunk_queryset = chunk_queryset.filter(pk__gt=last_pk)
+        chunk = list(chunk_queryset[:chunk_size])
+        if chunk:
+            yield chunk
+        if len(chunk) < chunk_size:
+            return
+        last_pk = chunk[-1].pk
+
+
+def _group_by_form_entry(entry_model_cls, form_entry_ids):
+    """Get the entries of the given form entries in a single query.
+
+    :param fobi.models.AbstractPluginEntry entry_model_cls:
+    :param iterable form_entry_ids:
+    :return dict: Lists of entries (form entry ID as key).
+    """
+    entries = defaultdict(list)
+    for entry in entry_model_cls._default_manager \
+            .filter(form_entry_id__in=form_entry_ids):
+        entries[entry.form_entry_id].append(entry)
+    return entries
+
+
+def _prepare_form_entries_export_data(form_entries):
+    """Prepare export data of the given form entries.
+
+    Element and handler entries of all the form entries are loaded at once
+    (two queries, regardless of the number of form entries).
+
+    :param list form_entries: List of FormEntry instances.
+    :return list: List of (form entry, export data) tuples.
+    """
+    form_entry_ids = [form_entry.pk for form_entry in form_entries]
+    form_element_entries = _group_by_form_entry(FormElementEntry,
+                                                form_entry_ids)
+    form_handler_entries = _group_by_form_entry(FormHandlerEntry,
+                                                form_entry_ids)
+    return [
+        (
+            form_entry,
+            prepare_form_entry_export_data(
+                form_entry,
+                form_element_entries=form_element_entries[form_entry.pk],
+                form_handler_entries=form_handler_entries[form_entry.pk]
+            )
+        )
+        for form_entry in form_entries
+    ]
+
+
+def iter_form_entries_export_data(form_entries, batch_size=100):
+    """Iterate through the export data of the given form entries.
+
+    Form entries are loaded in batches. Each batch takes a constant number
+    of queries (form entries, element entries and handler entries).
+
+    :param django.db.models.QuerySet form_entries: QuerySet of FormEntry
+        instances.
+    :param int batch_size: Number of form entries loaded at once.
+    :return iterable: Iterable of (form entry, export data) tuples.
+    """
+    for chunk in _iter_queryset_chunks(form_entries, batch_size):
+        for form_entry, data in _prepare_form_entries_export_data(chunk):
+            yield form_entry, data
+
+
+def iter_form_wizard_entries_export_data(form_wizard_entries, batch_size=100):
+    """Iterate through the export data of the given form wizard entries.
+
+    Form wizard entries are loaded in batches. Each batch takes a constant
+    number of queries (form wizard entries, their form entries, element
+    entries, handler entries and wizard handler entries).
+
+    :param django.db.models.QuerySet form_wizard_entries: QuerySet of
+        FormWizardEntry instances.
+    :param int batch_size: Number of form wizard entries loaded at once.
+    :return iterable: Iterable of (form wizard entry, export data) tuples.
+    """
+    for chunk in _iter_queryset_chunks(form_wizard_entries, batch_size):
+        form_wizard_entry_ids = [
+            form_wizard_entry.pk for form_wizard_entry in chunk
+        ]
+
+        wizard_form_entries = FormWizardFormEntry._default_manager \
+            .filter(form_wizard_entry_id__in=form_wizard_entry_ids) \
+            .select_related('form_entry') \
+            .order_by('form_wizard_entry_id', 'position')
+
+        form_entries = OrderedDict()
+        for wizard_form_entry in wizard_form_entries:
+            form_entries[wizard_form_entry.form_entry_id] = \
+                wizard_form_entry.form_entry
+        form_entries_data = dict(
+            (form_entry.pk, data)
+            for form_entry, data
+            in _prepare_form_entries_export_data(list(form_entries.values()))
+        )
+
+        wizard_forms_data = defaultdict(list)
+        for wizard_form_entry in wizard_form_entries:
+            wizard_forms_data[wizard_form_entry.form_wizard_entry_id].append(
+                form_entries_data[wizard_form_entry.form_entry_id]
+            )
+
+        wizard_handler_entries = defaultdict(list)
+        for wizard_handler_entry in FormWizardHandlerEntry._default_manager \
+                .filter(form_wizard_entry_id__in=form_wizard_entry_ids):
+            wizard_handler_entries[
+                wizard_handler_entry.form_wizard_entry_id
+            ].append(wizard_handler_entry)
+
+        for form_wizard_entry in chunk:
+            yield form_wizard_entry, prepare_form_wizard_entry_export_data(
+                form_wizard_entry,
+                form_entries_data=wizard_forms_data[form_wizard_entry.pk],
+                form_wizard_handler_entries=wizard_handler_entries[
+                    form_wizard_entry.pk
+                ]
+            )
+
+
+def iter_export_documents(user=None, form_entries=True,
+                          form_wizard_entries=True, batch_size=100):
+    """Iterate through the export documents of the form (wizard) entries.
+
+    Documents are named ``forms/<slug>.json`` and
+    ``form_wizards/<slug>.json`` respectively.
+
+    :param django.contrib.auth.models.User user: If given, only the entries
+        of the user are exported.
+    :param bool form_entries: Export form entries.
+    :param bool form_wizard_entries: Export form wizard entries.
+    :param int batch_size: Number of entries loaded at once.
+    :return iterable: Iterable of (name, export data) tuples.
+    """
+    if form_entries:
+        queryset = FormEntry._default_manager.all()
+        if user is not None:
+            queryset = queryset.filter(user__pk=user.pk)
+        for form_entry, data in iter_form_entries_export_data(queryset,
+                                                              batch_size):
+            yield 'forms/{0}.json'.format(form_entry.slug), data
+
+    if form_wizard_entries:
+        queryset = FormWizardEntry._default_manager.all()
+        if user is not None:
+            queryset = queryset.filter(user__pk=user.pk)
+        for form_wizard_entry, data in iter_form_wizard_entries_export_data(
+                queryset, batch_size):
+            yield 'form_wizards/{0}.json'.format(form_wizard_entry.slug), data
+
+
+FORM_ENTRY_IMPORT_KEYS = (
+    'name',
+    'title',
+    'slug',
+    'is_public',
+    'active_date_from',
+    'active_date_to',
+    'inactive_page_title',
+    'inactive_page_message',
+    'is_cloneable',
+    # 'position',
+    'success_page_title',
+    'success_page_message',
+    'action',
+)
+
+FORM_ELEMENT_ENTRY_IMPORT_KEYS = ('plugin_uid', 'plugin_data', 'position')
+
+FORM_HANDLER_ENTRY_IMPORT_KEYS = ('plugin_uid', 'plugin_data')
+
+
+def validate_form_entry_import_data(form_data,
+                                    form_element_plugin_uids=None,
+                                    form_handler_plugin_uids=None):
+    """Validate form entry import data.
+
+    :param dict form_data:
+    :param iterable form_element_plugin_uids: Registered form element plugin
+        uids (looked up if not given).
+    :param iterable form_handler_plugin_uids: Registered form handler plugin
+        uids (looked up if not given).
+    :return list: List of error messages (of the broken entries).
+    """
+    if form_element_plugin_uids is None:
+        form_element_plugin_uids = get_registered_form_element_plugin_uids()
+    if form_handler_plugin_uids is None:
+        form_handler_plugin_uids = get_registered_form_handler_plugin_uids()
+
+    if not isinstance(form_data, dict) or not form_data.get('name'):
+        return [ugettext('Some essential data missing in the JSON import.')]
+
+    errors = []
+    for entries_key, plugin_uids in (
+            ('form_elements', form_element_plugin_uids),
+            ('form_handlers', form_handler_plugin_uids)):
+        for entry_data in form_data.get(entries_key, []):
+            plugin_uid = entry_data.get('plugin_uid', None)
+            if not plugin_uid:
+                errors.append(
                     ugettext('Some essential plugin data missing in the JSON '
                              'import.')
                 )
-
-    # One by one, importing form handler plugins.
-    for form_handler_data in form_handlers_data:
-        if form_handler_plugin_registry.registry.get(
-                form_handler_data.get('plugin_uid', None), None):
-            form_handler = FormHandlerEntry(**form_handler_data)
-            form_handler.form_entry = form_entry
-            form_handler.save()
-        else:
-            if form_handler_data.get('plugin_uid', None):
-                messages.warning(
-                    request,
+            elif plugin_uid not in plugin_uids:
+                errors.append(
                     ugettext('Plugin {0} is missing in the system.').format(
-                        form_handler_data.get('plugin_uid')
+                        plugin_uid
                     )
                 )
-            else:
-                messages.warning(
-                    request,
-                    ugettext('Some essential data missing in the JSON '
-                             'import.')
-                )
+
+    return errors
+
+
+def _prepare_form_entry_import(user,
+                               form_data,
+                               form_element_plugin_uids,
+                               form_handler_plugin_uids):
+    """Prepare (not yet saved) form entry and its entries for import.
+
+    Entries of the plugins missing in the system are skipped.
+
+    :return tuple: Form entry, list of form element entries, list of form
+        handler entries.
+    """
+    form_entry_data = dict(
+        (key, value)
+        for key, value in form_data.items()
+        if key in FORM_ENTRY_IMPORT_KEYS
+    )
+
+    # User information we always recreate!
+    form_entry_data['user'] = user
+
+    form_entry = FormEntry(**form_entry_data)
+    form_entry.name += ugettext(" (imported on {0})").format(
+        datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    )
+
+    form_element_entries = [
+        FormElementEntry(**dict(
+            (key, value)
+            for key, value in form_element_data.items()
+            if key in FORM_ELEMENT_ENTRY_IMPORT_KEYS
+        ))
+        for form_element_data in form_data.get('form_elements', [])
+        if form_element_data.get('plugin_uid', None)
+        in form_element_plugin_uids
+    ]
+
+    form_handler_entries = [
+        FormHandlerEntry(**dict(
+            (key, value)
+            for key, value in form_handler_data.items()
+            if key in FORM_HANDLER_ENTRY_IMPORT_KEYS
+        ))
+        for form_handler_data in form_data.get('form_handlers', [])
+        if form_handler_data.get('plugin_uid', None)
+        in form_handler_plugin_uids
+    ]
+
+    return form_entry, form_element_entries, form_handler_entries
+
+
+def import_form_entries(user, forms_data, ignore_broken_entries=False):
+    """Import form entries in bulk.
+
+    All the forms are validated up front. Then the forms are imported in a
+    single transaction: each form entry is saved and the form element and
+    form handler entries of all the forms are inserted with ``bulk_create``.
+
+    :param django.contrib.auth.models.User user: Owner of the forms.
+    :param iterable forms_data: List of form data dicts (as exported).
+    :param bool ignore_broken_entries: If set to True, entries of the plugins
+        missing in the system are skipped. Otherwise, ``FormImportError`` is
+        raised.
+    :return list: List of ``fobi.models.FormEntry`` instances imported.
+    :raise fobi.exceptions.FormImportError:
+    """
+    form_element_plugin_uids = set(get_registered_form_element_plugin_uids())
+    form_handler_plugin_uids = set(get_registered_form_handler_plugin_uids())
+
+    forms_data = list(forms_data)
+    for index, form_data in enumerate(forms_data):
+        errors = validate_form_entry_import_data(form_data,
+                                                 form_element_plugin_uids,
+                                                 form_handler_plugin_uids)
+        broken = not isinstance(form_data, dict) \
+            or not form_data.get('name')
+        if errors and (broken or not ignore_broken_entries):
+            raise FormImportError(
+                "Form #{0}: {1}".format(index, " ".join(errors))
+            )
+
+    form_entries = []
+    form_element_entries = []
+    form_handler_entries = []
+
+    with transaction.atomic():
+        for form_data in forms_data:
+            form_entry, element_entries, handler_entries = \
+                _prepare_form_entry_import(user,
+                                           form_data,
+                                           form_element_plugin_uids,
+                                           form_handler_plugin_uids)
+            form_entry.save()
+
+            for entry in element_entries + handler_entries:
+                entry.form_entry = form_entry
+
+            form_entries.append(form_entry)
+            form_element_entries += element_entries
+            form_handler_entries += handler_entries
+
+        FormElementEntry._default_manager.bulk_create(form_element_entries)
+        FormHandlerEntry._default_manager.bulk_create(form_handler_entries)
+
+    return form_entries
+
+
+def perform_form_entry_import(request, form_data):
+    """Perform form entry import.
+
+    :param django.http.HttpRequest request:
+    :param dict form_data:
+    :return :class:`fobi.modes.FormEntry: Instance of.
+    """
+    form_element_plugin_uids = set(get_registered_form_element_plugin_uids())
+    form_handler_plugin_uids = set(get_registered_form_handler_plugin_uids())
+
+    for error in validate_form_entry_import_data(form_data,
+                                                 form_element_plugin_uids,
+                                                 form_handler_plugin_uids):
+        messages.warning(request, error)
+
+    form_entry, form_element_entries, form_handler_entries = \
+        _prepare_form_entry_import(request.user,
+                                   form_data,
+                                   form_element_plugin_uids,
+                                   form_handler_plugin_uids)
+
+    with transaction.atomic():
+        form_entry.save()
+
+        for entry in form_element_entries + form_handler_entries:
+            entry.form_entry = form_entry
+
+        FormElementEntry._default_manager.bulk_create(form_element_entries)
+        FormHandlerEntry._default_manager.bulk_create(form_handler_entries)
 
     return form_entry
@@ -18,8 +18,9 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.core.files.storage import FileSystemStorage
 from django.core.serializers.json import DjangoJSONEncoder
 from django.forms import ValidationError
-from django.http import Http404, HttpResponseRedirect
+from django.http import Http404, HttpResponseBadRequest, HttpResponseRedirect
 from django.utils.datastructures import MultiValueDictKeyError
+from django.utils.decorators import method_decorator
 from django.utils.translation import ugettext, ugettext_lazy as _
 from django.views.generic import View, RedirectView, TemplateView, FormView
 from django.views.generic.detail import SingleObjectMixin
@@ -30,6 +31,7 @@ from django.views.generic.edit import FormMixin, DeleteView, UpdateView, Process
 from nine import versions
 
 from ..base import (
+    check_submission,
     fire_form_callbacks,
     run_form_handlers,
     run_form_wizard_handlers,
@@ -46,7 +48,13 @@ from ..constants import (
     CALLBACK_FORM_VALID_AFTER_FORM_HANDLERS,
     CALLBACK_FORM_INVALID,
 )
-from ..decorators import permissions_required, SATISFY_ALL, SATISFY_ANY
+from ..decorators import (
+    form_entry_condition,
+    permissions_required,
+    SATISFY_ALL,
+    SATISFY_ANY,
+    use_read_database,
+)
 from ..dynamic import assemble_form_class
 from ..form_importers import (
     ensure_autodiscover as ensure_importers_autodiscover,
@@ -63,6 +71,15 @@ from ..forms import (
     FormWizardFormEntryForm,
 )
 from ..helpers import JSONDataExporter
+from ..idempotency import (
+    claim_submission,
+    complete_submission,
+    get_idempotency_key,
+    get_submission_in_progress_response,
+    get_submission_key,
+    get_submission_outcome,
+    release_submission,
+)
 from ..models import (
     FormEntry,
     FormElementEntry,
@@ -71,6 +88,10 @@ from ..models import (
     FormWizardFormEntry,
     FormWizardHandlerEntry,
 )
+from ..ratelimit import (
+    check_submission_rate_limits,
+    get_rate_limited_response,
+)
 from ..settings import (
     GET_PARAM_INITIAL_DATA,
     DEBUG,
@@ -508,11 +529,23 @@ class ViewFormEntryView(FormEntryMixin,FobiThemeRedirectMixin,ProcessFormView):
     def get_form_valid_redirect_kwargs(self):
         return {'form_entry_slug': self.form_entry.slug}
 
+    def get_submitted_redirect(self):
+        return HttpResponseRedirect(
+            reverse('fobi.form_entry_submitted',
+                    kwargs=self.get_form_valid_redirect_kwargs())
+        )
+
     def get_theme_template_name(self):
         if not self.form_entry.is_active:
             return self.theme.form_entry_inactive_template
         return super(ViewFormEntryView, self).get_theme_template_name()
 
+    def get_form_element_entries(self):
+        """Form element entries of the published version of the form."""
+        return self.form_entry.get_form_element_entries(
+            version_id=self.form_entry.published_version_id
+        )
+
     def get_form(self, **kwargs):
         form = super(ViewFormEntryView, self).get_form(**kwargs)
         if DEBUG:
@@ -522,15 +555,17 @@ class ViewFormEntryView(FormEntryMixin,FobiThemeRedirectMixin,ProcessFormView):
                 logger.error(err)
         return form
 
+    @method_decorator(use_read_database)
+    @method_decorator(form_entry_condition())
     def dispatch(self, request,  *args, **kwargs):
         response = super(ViewFormEntryView, self).dispatch(request, *args, **kwargs)
-        self.theme.collect_plugin_media(self.form_entry.formelemententry_set.all()[:])
+        self.theme.collect_plugin_media(self.get_form_element_entries())
         return response
 
     def get_form_class(self):
         return assemble_form_class(
             self.form_entry,
-            form_element_entries=self.form_entry.formelemententry_set.all()[:],
+            form_element_entries=self.get_form_element_entries(),
             request=self.request,
         )
 
@@ -543,8 +578,9 @@ class ViewFormEntryView(FormEntryMixin,FobiThemeRedirectMixin,ProcessFormView):
                             or self.form_entry.title
                             or self.form_entry.name)
             })
-        kwargs['form_element_entries'] = self.form_entry.formelemententry_set.all()[:]
+        kwargs['form_element_entries'] = self.get_form_element_entries()
         kwargs['fobi_form_title'] = self.form_entry.title
+        kwargs['fobi_idempotency_key'] = get_idempotency_key()
         if 'form' not in kwargs:
             kwargs['form'] = self.get_form()
         return kwargs
@@ -578,6 +614,30 @@ class ViewFormEntryView(FormEntryMixin,FobiThemeRedirectMixin,ProcessFormView):
         return kwargs
 
     def post(self, *args, **kwargs):
+        # Rate limits are checked before the form is assembled.
+        retry_after = check_submission_rate_limits(self.request,
+                                                   self.form_entry)
+        if retry_after is not None:
+            return get_rate_limited_response(retry_after)
+
+        # Obvious bot submissions are rejected before the form is assembled.
+        if check_submission(
+                self.form_entry,
+                self.request.POST,
+                self.form_entry.get_submission_checks(
+                    version_id=self.form_entry.published_version_id
+                )):
+            return HttpResponseBadRequest(ugettext("Submission rejected."))
+
+        # Duplicate submissions are answered with the outcome of the original
+        # submission (409 Conflict while it is still being handled).
+        submission_key = get_submission_key(self.request, self.form_entry)
+        outcome = get_submission_outcome(submission_key)
+        if outcome is not None:
+            if not outcome.get('completed'):
+                return get_submission_in_progress_response()
+            return self.get_submitted_redirect()
+
         form = self.form = self.get_form()
         fire_form_callbacks(
             **self._get_form_callback_kwargs(
@@ -600,13 +660,21 @@ class ViewFormEntryView(FormEntryMixin,FobiThemeRedirectMixin,ProcessFormView):
                      stage=CALLBACK_FORM_VALID,
                  )                    
             )
-            # Run all handlers
-            handler_responses, handler_errors = run_form_handlers(
-                form_entry=self.form_entry,
-                request=self.request,
-                form=form,
-                form_element_entries=self.get_context_data().get('form_element_entries'),
-            )
+            # Run all handlers (once per submission)
+            if not claim_submission(submission_key):
+                return get_submission_in_progress_response()
+            try:
+                handler_responses, handler_errors = run_form_handlers(
+                    form_entry=self.form_entry,
+                    request=self.request,
+                    form=form,
+                    form_element_entries=self.get_context_data().get('form_element_entries'),
+                )
+            except Exception:
+                # Failed submissions can be retried
+                release_submission(submission_key)
+                raise
+            complete_submission(submission_key)
             if handler_errors:
                 for handler_error in handler_errors:
                     messages.warning(
@@ -631,6 +699,11 @@ class FormWizardView(DynamicSessionWizardView):
         location=get_wizard_files_upload_dir()
     )
 
+    @method_decorator(use_read_database)
+    def dispatch(self, request, *args, **kwargs):
+        """Dispatch (reading from the read database, if configured)."""
+        return super(FormWizardView, self).dispatch(request, *args, **kwargs)
+
     def get_context_data(self, form, **kwargs):
         """Get context data."""
         context_data = super(FormWizardView, self).get_context_data(
@@ -669,20 +742,31 @@ class FormWizardView(DynamicSessionWizardView):
         except ObjectDoesNotExist as err:
             raise Http404(ugettext("Form wizard entry not found."))
 
-        form_entries = [
-            form_wizard_form_entry.form_entry
-            for form_wizard_form_entry
-            in form_wizard_entry.formwizardformentry_set
-                                .all()
-                                .select_related('form_entry')
-        ]
+        # Version of the form wizard the wizard was started with (changes
+        # published in the meantime do not affect the wizard in progress).
+        form_wizard_entry_version_id = form_wizard_entry.published_version_id
+        if 'POST' == request.method:
+            form_wizard_entry_version_id = self.storage.extra_data.get(
+                'form_wizard_entry_version_id',
+                form_wizard_entry_version_id
+            )
+            self.storage.extra_data = dict(
+                self.storage.extra_data,
+                form_wizard_entry_version_id=form_wizard_entry_version_id
+            )
+
+        form_entries = form_wizard_entry.get_form_entries(
+            version_id=form_wizard_entry_version_id
+        )
         form_list = []
         form_entry_mapping = {}
         form_element_entry_mapping = {}
         wizard_form_element_entries = []
-        for creation_counter, form_entry in enumerate(form_entries):
-            # Using frozen queryset to minimize query usage
-            form_element_entries = form_entry.formelemententry_set.all()[:]
+        for creation_counter, (form_entry, form_entry_version_id) \
+                in enumerate(form_entries):
+            form_element_entries = form_entry.get_form_element_entries(
+                version_id=form_entry_version_id
+            )
             wizard_form_element_entries += form_element_entries
             form_cls = assemble_form_class(
                 form_entry,
@@ -711,12 +795,26 @@ class FormWizardView(DynamicSessionWizardView):
             'form_list': form_list,
             'template_name': theme.view_form_wizard_entry_template,
             'form_wizard_entry': form_wizard_entry,
+            'form_wizard_entry_version_id': form_wizard_entry_version_id,
             'wizard_form_element_entries': wizard_form_element_entries,
             'form_entry_mapping': form_entry_mapping,
             'form_element_entry_mapping': form_element_entry_mapping,
             'fobi_theme': theme,
         }
 
+    def get(self, *args, **kwargs):
+        """GET requests.
+
+        The version of the form wizard is kept in the storage (reset on
+        start), so that the wizard is completed with the same version.
+        """
+        response = super(FormWizardView, self).get(*args, **kwargs)
+        self.storage.extra_data = dict(
+            self.storage.extra_data,
+            form_wizard_entry_version_id=self.form_wizard_entry_version_id
+        )
+        return response
+
     def post(self, *args, **kwargs):
         """POST requests.
 
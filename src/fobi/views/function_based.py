@@ -17,15 +17,27 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.core.files.storage import FileSystemStorage
 from django.core.serializers.json import DjangoJSONEncoder
 from django.forms import ValidationError
-from django.http import Http404, HttpResponseRedirect
+from django.forms.models import ModelChoiceField
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseBadRequest,
+    HttpResponseRedirect,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import redirect
 from django.template import RequestContext
+from django.template.loader import render_to_string
 from django.utils.datastructures import MultiValueDictKeyError
+from django.utils.encoding import force_text
 from django.utils.translation import ugettext, ugettext_lazy as _
+from django.views.decorators.http import require_POST
 
 from nine import versions
 
 from ..base import (
+    check_submission,
     fire_form_callbacks,
     run_form_handlers,
     run_form_wizard_handlers,
@@ -43,7 +55,14 @@ from ..constants import (
     CALLBACK_FORM_VALID_AFTER_FORM_HANDLERS,
     CALLBACK_FORM_INVALID,
 )
-from ..decorators import permissions_required, SATISFY_ALL, SATISFY_ANY
+from ..decorators import (
+    form_entry_condition,
+    permissions_required,
+    pins_primary_database,
+    SATISFY_ALL,
+    SATISFY_ANY,
+    use_read_database,
+)
 from ..dynamic import assemble_form_class
 from ..form_importers import (
     ensure_autodiscover as ensure_importers_autodiscover,
@@ -59,7 +78,25 @@ from ..forms import (
     FormWizardFormEntryFormSet,
     # FormWizardFormEntryForm,
 )
-from ..helpers import JSONDataExporter
+from ..fields import DirectUploadFileMixin
+from ..helpers import (
+    JSONDataExporter,
+    get_file_upload_token,
+    get_model_object_choices,
+    get_model_search_fields,
+    handle_uploaded_file,
+    iter_json_lines,
+    iter_tar_json_documents,
+)
+from ..idempotency import (
+    claim_submission,
+    complete_submission,
+    get_idempotency_key,
+    get_submission_in_progress_response,
+    get_submission_key,
+    get_submission_outcome,
+    release_submission,
+)
 from ..models import (
     FormEntry,
     FormElementEntry,
@@ -68,13 +105,21 @@ from ..models import (
     FormWizardFormEntry,
     FormWizardHandlerEntry,
 )
+from ..ratelimit import (
+    check_submission_rate_limits,
+    get_rate_limited_response,
+)
+from ..routers import pin_primary_database
 from ..settings import (
     GET_PARAM_INITIAL_DATA,
     DEBUG,
+    MODEL_OBJECT_CHOICES_MAX_PAGE_SIZE,
+    MODEL_OBJECT_CHOICES_PAGE_SIZE,
     SORT_PLUGINS_BY_VALUE,
 )
 from ..utils import (
     append_edit_and_delete_links_to_field,
+    get_next_form_element_entry_position,
     get_user_form_element_plugins_grouped,
     get_user_form_field_plugin_uids,
     # get_user_form_element_plugins,
@@ -84,9 +129,13 @@ from ..utils import (
     get_user_form_handler_plugin_uids,
     get_user_form_wizard_handler_plugin_uids,
     get_wizard_files_upload_dir,
+    iter_export_documents,
     perform_form_entry_import,
     prepare_form_entry_export_data,
+    prepare_form_wizard_entry_export_data,
+    update_form_element_entries_positions,
 )
+from ..widgets import RemoteSelectMixin
 from ..wizard import (
     # DynamicCookieWizardView,
     DynamicSessionWizardView,
@@ -127,14 +176,20 @@ __all__ = (
     'edit_form_handler_entry',
     'edit_form_wizard_entry',
     'edit_form_wizard_handler_entry',
+    'export_form_entries',
     'export_form_entry',
     'export_form_wizard_entry',
+    'form_entry_file_upload',
+    'form_entry_model_object_choices',
     'form_entry_submitted',
     'form_importer',
     'form_wizard_entry_submitted',
     'form_wizards_dashboard',
     'import_form_entry',
     'import_form_wizard_entry',
+    'order_form_element_entries',
+    'publish_form_entry',
+    'publish_form_wizard_entry',
     'view_form_entry',
 )
 
@@ -181,7 +236,12 @@ def _delete_plugin_entry(request,
 
     plugin._delete_plugin_data()
 
+    obj_id = obj.pk
     obj.delete()
+    pin_primary_database(request)
+
+    if request.is_ajax():
+        return JsonResponse({'id': obj_id})
 
     messages.info(request, message.format(plugin.name))
 
@@ -226,6 +286,7 @@ def _delete_wizard_plugin_entry(request,
     plugin._delete_plugin_data()
 
     obj.delete()
+    pin_primary_database(request)
 
     messages.info(request, message.format(plugin.name))
 
@@ -236,6 +297,51 @@ def _delete_wizard_plugin_entry(request,
     return redirect("{0}{1}".format(redirect_url, html_anchor))
 
 
+def _render_form_element_entry(request, form_element_entry, theme=None):
+    """Render the form element entry as in the form builder preview.
+
+    Only the fields of the given form element entry are assembled and
+    rendered (using the form edit snippet of the theme).
+
+    :param django.http.HttpRequest request:
+    :param fobi.models.FormElementEntry form_element_entry:
+    :param fobi.base.BaseTheme theme: Theme instance.
+    :return str:
+    """
+    if not theme:
+        theme = get_theme(request=request, as_instance=True)
+
+    form_cls = assemble_form_class(
+        form_element_entry.form_entry,
+        origin='edit_form_entry',
+        origin_kwargs_update_func=append_edit_and_delete_links_to_field,
+        request=request,
+        form_element_entries=[form_element_entry]
+    )
+
+    return render_to_string(
+        theme.form_edit_snippet_template_name,
+        {'form': form_cls(), 'fobi_theme': theme},
+        request=request
+    )
+
+
+def _form_element_entry_response(request, form_element_entry, theme=None):
+    """JSON response of the (added or edited) form element entry.
+
+    :param django.http.HttpRequest request:
+    :param fobi.models.FormElementEntry form_element_entry:
+    :param fobi.base.BaseTheme theme: Theme instance.
+    :return django.http.JsonResponse:
+    """
+    return JsonResponse({
+        'id': form_element_entry.pk,
+        'position': form_element_entry.position,
+        'html': _render_form_element_entry(request,
+                                           form_element_entry,
+                                           theme=theme),
+    })
+
 # *****************************************************************************
 # *****************************************************************************
 # ******************************** Dashboards *********************************
@@ -357,6 +463,7 @@ create_form_entry_permissions = [
 
 @login_required
 @permissions_required(satisfy=SATISFY_ALL, perms=create_form_entry_permissions)
+@pins_primary_database
 def create_form_entry(request, theme=None, template_name=None):
     """Create form entry.
 
@@ -425,6 +532,7 @@ edit_form_entry_permissions = [
 
 @login_required
 @permissions_required(satisfy=SATISFY_ANY, perms=edit_form_entry_permissions)
+@pins_primary_database
 def edit_form_entry(request, form_entry_id, theme=None, template_name=None):
     """Edit form entry.
 
@@ -609,6 +717,7 @@ delete_form_entry_permissions = [
 @login_required
 @permissions_required(satisfy=SATISFY_ALL,
                       perms=delete_form_entry_permissions)
+@pins_primary_database
 def delete_form_entry(request, form_entry_id, template_name=None):
     """Delete form entry.
 
@@ -624,6 +733,7 @@ def delete_form_entry(request, form_entry_id, template_name=None):
         raise Http404(ugettext("Form entry not found."))
 
     obj.delete()
+    pin_primary_database(request)
 
     messages.info(
         request,
@@ -632,6 +742,42 @@ def delete_form_entry(request, form_entry_id, template_name=None):
 
     return redirect('fobi.dashboard')
 
+# *****************************************************************************
+# ***************************** Publish form entry ****************************
+# *****************************************************************************
+
+
+@login_required
+@permission_required('fobi.change_formentry')
+@require_POST
+@pins_primary_database
+def publish_form_entry(request, form_entry_id):
+    """Publish form entry.
+
+    Freezes the current form elements and form handlers of the form into a
+    new version, served by the public views from then on.
+
+    :param django.http.HttpRequest request:
+    :param int form_entry_id:
+    :return django.http.HttpResponse:
+    """
+    try:
+        form_entry = FormEntry._default_manager \
+                              .get(pk=form_entry_id, user__pk=request.user.pk)
+    except ObjectDoesNotExist as err:
+        raise Http404(ugettext("Form entry not found."))
+
+    version = form_entry.publish()
+
+    messages.info(
+        request,
+        ugettext('The form "{0}" was published (version {1}).').format(
+            form_entry.name, version.version
+        )
+    )
+
+    return redirect('fobi.edit_form_entry', form_entry_id=form_entry.pk)
+
 # *****************************************************************************
 # **************************** Add form element entry *************************
 # *****************************************************************************
@@ -639,6 +785,7 @@ def delete_form_entry(request, form_entry_id, template_name=None):
 
 @login_required
 @permission_required('fobi.add_formelemententry')
+@pins_primary_database
 def add_form_element_entry(request,
                            form_entry_id,
                            form_element_plugin_uid,
@@ -713,20 +860,14 @@ def add_form_element_entry(request,
 
     if save_object:
         # Handling the position
-        position = 1
-        records = FormElementEntry.objects.filter(form_entry=form_entry) \
-                                  .aggregate(models.Max('position'))
-        if records:
-            try:
-                position = records['{0}__max'.format('position')] + 1
-
-            except TypeError as err:
-                pass
-
-        obj.position = position
+        obj.position = get_next_form_element_entry_position(form_entry)
 
         # Save the object.
         obj.save()
+        pin_primary_database(request)
+
+        if request.is_ajax():
+            return _form_element_entry_response(request, obj, theme=theme)
 
         messages.info(
             request,
@@ -754,7 +895,10 @@ def add_form_element_entry(request,
     if not template_name:
         if not theme:
             theme = get_theme(request=request, as_instance=True)
-        template_name = theme.add_form_element_entry_template
+        if request.is_ajax():
+            template_name = theme.add_form_element_entry_ajax_template
+        else:
+            template_name = theme.add_form_element_entry_template
 
     if versions.DJANGO_GTE_1_10:
         return render(request, template_name, context)
@@ -770,6 +914,7 @@ def add_form_element_entry(request,
 
 @login_required
 @permission_required('fobi.change_formelemententry')
+@pins_primary_database
 def edit_form_element_entry(request,
                             form_element_entry_id,
                             theme=None,
@@ -830,6 +975,9 @@ def edit_form_element_entry(request,
             # Save the object.
             obj.save()
 
+            if request.is_ajax():
+                return _form_element_entry_response(request, obj, theme=theme)
+
             messages.info(
                 request,
                 ugettext('The form element plugin "{0}" was edited '
@@ -859,7 +1007,10 @@ def edit_form_element_entry(request,
     if not template_name:
         if not theme:
             theme = get_theme(request=request, as_instance=True)
-        template_name = theme.edit_form_element_entry_template
+        if request.is_ajax():
+            template_name = theme.edit_form_element_entry_ajax_template
+        else:
+            template_name = theme.edit_form_element_entry_template
 
     if versions.DJANGO_GTE_1_10:
         return render(request, template_name, context)
@@ -875,6 +1026,7 @@ def edit_form_element_entry(request,
 
 @login_required
 @permission_required('fobi.delete_formelemententry')
+@pins_primary_database
 def delete_form_element_entry(request, form_element_entry_id):
     """Delete form element entry.
 
@@ -893,6 +1045,51 @@ def delete_form_element_entry(request, form_element_entry_id):
         html_anchor='?active_tab=tab-form-elements'
     )
 
+# *****************************************************************************
+# **************************** Order form element entries *********************
+# *****************************************************************************
+
+
+@login_required
+@permission_required('fobi.change_formelemententry')
+@require_POST
+@pins_primary_database
+def order_form_element_entries(request, form_entry_id):
+    """Order the form element entries (JSON).
+
+    Used by the form builder to save the ordering of the form elements
+    (the ``form_element_entry_ids`` POST params: IDs of all the form element
+    entries of the form in the new order) at once.
+
+    :param django.http.HttpRequest request:
+    :param int form_entry_id:
+    :return django.http.HttpResponse:
+    """
+    try:
+        form_entry = FormEntry._default_manager \
+                              .only('pk') \
+                              .get(pk=form_entry_id, user__pk=request.user.pk)
+    except ObjectDoesNotExist as err:
+        raise Http404(ugettext("Form entry not found."))
+
+    try:
+        positions = update_form_element_entries_positions(
+            form_entry,
+            request.POST.getlist('form_element_entry_ids')
+        )
+    except ValueError as err:
+        return HttpResponseBadRequest(
+            json.dumps({'errors': [str(err)]}),
+            content_type='application/json'
+        )
+
+    return JsonResponse({
+        'positions': [
+            {'id': pk, 'position': position}
+            for pk, position in positions.items()
+        ],
+    })
+
 # *****************************************************************************
 # **************************** Add form handler entry *************************
 # *****************************************************************************
@@ -900,6 +1097,7 @@ def delete_form_element_entry(request, form_element_entry_id):
 
 @login_required
 @permission_required('fobi.add_formhandlerentry')
+@pins_primary_database
 def add_form_handler_entry(request,
                            form_entry_id,
                            form_handler_plugin_uid,
@@ -981,6 +1179,7 @@ def add_form_handler_entry(request,
     if save_object:
         # Save the object.
         obj.save()
+        pin_primary_database(request)
 
         messages.info(
             request,
@@ -1026,6 +1225,7 @@ def add_form_handler_entry(request,
 
 @login_required
 @permission_required('fobi.change_formhandlerentry')
+@pins_primary_database
 def edit_form_handler_entry(request,
                             form_handler_entry_id,
                             theme=None,
@@ -1119,6 +1319,7 @@ def edit_form_handler_entry(request,
 
 @login_required
 @permission_required('fobi.delete_formhandlerentry')
+@pins_primary_database
 def delete_form_handler_entry(request, form_handler_entry_id):
     """Delete form handler entry.
 
@@ -1158,6 +1359,7 @@ create_form_wizard_entry_permissions = [
 @login_required
 @permissions_required(satisfy=SATISFY_ALL,
                       perms=create_form_wizard_entry_permissions)
+@pins_primary_database
 def create_form_wizard_entry(request, theme=None, template_name=None):
     """Create form wizard entry.
 
@@ -1233,6 +1435,7 @@ edit_form_wizard_entry_permissions = [
 @login_required
 @permissions_required(satisfy=SATISFY_ANY,
                       perms=edit_form_wizard_entry_permissions)
+@pins_primary_database
 def edit_form_wizard_entry(request, form_wizard_entry_id, theme=None,
                            template_name=None):
     """Edit form wizard entry.
@@ -1402,6 +1605,7 @@ delete_form_wizard_entry_permissions = [
 @login_required
 @permissions_required(satisfy=SATISFY_ALL,
                       perms=delete_form_wizard_entry_permissions)
+@pins_primary_database
 def delete_form_wizard_entry(request, form_wizard_entry_id,
                              template_name=None):
     """Delete form wizard entry.
@@ -1418,6 +1622,7 @@ def delete_form_wizard_entry(request, form_wizard_entry_id,
         raise Http404(ugettext("Form wizard entry not found."))
 
     obj.delete()
+    pin_primary_database(request)
 
     messages.info(
         request,
@@ -1428,11 +1633,50 @@ def delete_form_wizard_entry(request, form_wizard_entry_id,
 
     return redirect('fobi.form_wizards_dashboard')
 
+# *****************************************************************************
+# ************************** Publish form wizard entry ************************
+# *****************************************************************************
+
+
+@login_required
+@permission_required('fobi.change_formwizardentry')
+@require_POST
+@pins_primary_database
+def publish_form_wizard_entry(request, form_wizard_entry_id):
+    """Publish form wizard entry.
+
+    Freezes the current forms (published versions) and form wizard handlers
+    of the form wizard into a new version, served by the public views from
+    then on. Forms of the form wizard never published are published too.
+
+    :param django.http.HttpRequest request:
+    :param int form_wizard_entry_id:
+    :return django.http.HttpResponse:
+    """
+    try:
+        form_wizard_entry = FormWizardEntry._default_manager \
+            .get(pk=form_wizard_entry_id, user__pk=request.user.pk)
+    except ObjectDoesNotExist as err:
+        raise Http404(ugettext("Form wizard entry not found."))
+
+    version = form_wizard_entry.publish()
+
+    messages.info(
+        request,
+        ugettext('The form wizard "{0}" was published (version {1}).').format(
+            form_wizard_entry.name, version.version
+        )
+    )
+
+    return redirect('fobi.edit_form_wizard_entry',
+                    form_wizard_entry_id=form_wizard_entry.pk)
+
 # *****************************************************************************
 # ************************** View form wizard entry success *******************
 # *****************************************************************************
 
 
+@use_read_database
 def form_wizard_entry_submitted(request, form_wizard_entry_slug=None,
                                 template_name=None):
     """Form wizard entry submitted.
@@ -1485,6 +1729,7 @@ def form_wizard_entry_submitted(request, form_wizard_entry_slug=None,
 
 @login_required
 @permission_required('fobi.add_formwizardformentry')
+@pins_primary_database
 def add_form_wizard_form_entry(request,
                                form_wizard_entry_id,
                                form_entry_id,
@@ -1556,6 +1801,7 @@ def add_form_wizard_form_entry(request,
 
     # Save the object.
     obj.save()
+    pin_primary_database(request)
 
     messages.info(
         request,
@@ -1581,6 +1827,7 @@ def add_form_wizard_form_entry(request,
 
 @login_required
 @permission_required('fobi.delete_formwizardformentry')
+@pins_primary_database
 def delete_form_wizard_form_entry(request, form_wizard_form_entry_id):
     """Delete form wizard form entry.
 
@@ -1603,6 +1850,7 @@ def delete_form_wizard_form_entry(request, form_wizard_form_entry_id):
 
     form_wizard_entry_id = obj.form_wizard_entry_id
     obj.delete()
+    pin_primary_database(request)
 
     messages.info(
         request,
@@ -1632,6 +1880,7 @@ def delete_form_wizard_form_entry(request, form_wizard_form_entry_id):
 
 @login_required
 @permission_required('fobi.add_formwizardhandlerentry')
+@pins_primary_database
 def add_form_wizard_handler_entry(request,
                                   form_wizard_entry_id,
                                   form_wizard_handler_plugin_uid,
@@ -1719,6 +1968,7 @@ def add_form_wizard_handler_entry(request,
     if save_object:
         # Save the object.
         obj.save()
+        pin_primary_database(request)
 
         messages.info(
             request,
@@ -1766,6 +2016,7 @@ def add_form_wizard_handler_entry(request,
 
 @login_required
 @permission_required('fobi.change_formwizardhandlerentry')
+@pins_primary_database
 def edit_form_wizard_handler_entry(request,
                                    form_wizard_handler_entry_id,
                                    theme=None,
@@ -1866,6 +2117,7 @@ def edit_form_wizard_handler_entry(request,
 
 @login_required
 @permission_required('fobi.delete_formwizardhandlerentry')
+@pins_primary_database
 def delete_form_wizard_handler_entry(request, form_wizard_handler_entry_id):
     """Delete form handler entry.
 
@@ -1895,6 +2147,8 @@ def delete_form_wizard_handler_entry(request, form_wizard_handler_entry_id):
 # *****************************************************************************
 
 
+@use_read_database
+@form_entry_condition()
 def view_form_entry(request, form_entry_slug, theme=None, template_name=None):
     """View created form.
 
@@ -1936,7 +2190,37 @@ def view_form_entry(request, form_entry_slug, theme=None, template_name=None):
                 template_name, context, context_instance=RequestContext(request)
             )
 
-    form_element_entries = form_entry.formelemententry_set.all()[:]
+    success_url = reverse('fobi.form_entry_submitted', args=[form_entry.slug])
+    submission_key = None
+
+    if request.method == 'POST':
+        # Rate limits are checked before the form is assembled.
+        retry_after = check_submission_rate_limits(request, form_entry)
+        if retry_after is not None:
+            return get_rate_limited_response(retry_after)
+
+        # Obvious bot submissions (filled in honeypot, missing captcha) are
+        # rejected before the form is assembled.
+        if check_submission(form_entry,
+                            request.POST,
+                            form_entry.get_submission_checks(
+                                version_id=form_entry.published_version_id
+                            )):
+            return HttpResponseBadRequest(ugettext("Submission rejected."))
+
+        # Duplicate submissions (double clicks, client retries) are answered
+        # with the outcome of the original submission (409 Conflict while
+        # the original submission is still being handled).
+        submission_key = get_submission_key(request, form_entry)
+        outcome = get_submission_outcome(submission_key)
+        if outcome is not None:
+            if not outcome.get('completed'):
+                return get_submission_in_progress_response()
+            return redirect(success_url)
+
+    form_element_entries = form_entry.get_form_element_entries(
+        version_id=form_entry.published_version_id
+    )
 
     # This is where the most of the magic happens. Our form is being built
     # dynamically.
@@ -1975,13 +2259,21 @@ def view_form_entry(request, form_entry_slug, theme=None, template_name=None):
                                        request=request, form=form,
                                        stage=CALLBACK_FORM_VALID)
 
-            # Run all handlers
-            handler_responses, handler_errors = run_form_handlers(
-                form_entry=form_entry,
-                request=request,
-                form=form,
-                form_element_entries=form_element_entries
-            )
+            # Run all handlers (once per submission)
+            if not claim_submission(submission_key):
+                return get_submission_in_progress_response()
+            try:
+                handler_responses, handler_errors = run_form_handlers(
+                    form_entry=form_entry,
+                    request=request,
+                    form=form,
+                    form_element_entries=form_element_entries
+                )
+            except Exception:
+                # Failed submissions can be retried
+                release_submission(submission_key)
+                raise
+            complete_submission(submission_key)
 
             # Warning that not everything went ok.
             if handler_errors:
@@ -2005,9 +2297,7 @@ def view_form_entry(request, form_entry_slug, theme=None, template_name=None):
                     form_entry.name
                 )
             )
-            return redirect(
-                reverse('fobi.form_entry_submitted', args=[form_entry.slug])
-            )
+            return redirect(success_url)
         else:
             # Fire post form validation callbacks
             fire_form_callbacks(form_entry=form_entry, request=request,
@@ -2039,6 +2329,7 @@ def view_form_entry(request, form_entry_slug, theme=None, template_name=None):
         'form_entry': form_entry,
         'fobi_theme': theme,
         'fobi_form_title': form_entry.title,
+        'fobi_idempotency_key': get_idempotency_key(),
     }
 
     if not template_name:
@@ -2051,11 +2342,184 @@ def view_form_entry(request, form_entry_slug, theme=None, template_name=None):
             template_name, context, context_instance=RequestContext(request)
         )
 
+# *****************************************************************************
+# ************************ Form entry element endpoints ***********************
+# *****************************************************************************
+
+
+def _get_form_entry_field(request, form_entry_slug, field_name,
+                          plugin_data_flag, field_base_cls):
+    """Get the field of a form element (for the form element endpoints).
+
+    Access rules are same as for viewing the form.
+
+    :param django.http.HttpRequest request:
+    :param string form_entry_slug:
+    :param string field_name:
+    :param string plugin_data_flag: Name of the (boolean) plugin data
+        attribute, which has to be set (to enable the endpoint).
+    :param type field_base_cls: Class the field has to be a subclass of.
+    :return tuple: ``fobi.models.FormEntry``,
+        ``fobi.base.FormElementPlugin`` and the field instance.
+    """
+    if versions.DJANGO_GTE_1_10:
+        user_is_authenticated = request.user.is_authenticated
+    else:
+        user_is_authenticated = request.user.is_authenticated()
+    try:
+        kwargs = {'slug': form_entry_slug}
+        if not user_is_authenticated:
+            kwargs.update({'is_public': True})
+        form_entry = FormEntry._default_manager.get(**kwargs)
+    except ObjectDoesNotExist as err:
+        raise Http404(ugettext("Form entry not found."))
+
+    if not form_entry.is_active:
+        raise Http404(ugettext("Form entry not found."))
+
+    form_element_entries = form_entry.get_form_element_entries(
+        version_id=form_entry.published_version_id
+    )
+
+    for form_element_entry in form_element_entries:
+        plugin = form_element_entry.get_plugin(request=request)
+        if not plugin \
+                or getattr(plugin.data, 'name', None) != field_name \
+                or not getattr(plugin.data, plugin_data_flag, False):
+            continue
+
+        for name, field_cls, field_kwargs in plugin.get_form_field_instances(
+                request=request,
+                form_entry=form_entry,
+                form_element_entries=form_element_entries):
+            if name == field_name and issubclass(field_cls, field_base_cls):
+                return form_entry, plugin, field_cls(**field_kwargs)
+        break
+
+    raise Http404(ugettext("Form element not found."))
+
+
+@use_read_database
+def form_entry_model_object_choices(request, form_entry_slug, field_name):
+    """Model object choices of a form element (JSON).
+
+    Serves the options of the model object select fields in the "remote"
+    mode. Accepts the following GET params: ``q`` (search term), ``page``
+    and ``limit``.
+
+    :param django.http.HttpRequest request:
+    :param string form_entry_slug:
+    :param string field_name:
+    :return django.http.HttpResponse:
+    """
+    form_entry, plugin, field = _get_form_entry_field(
+        request,
+        form_entry_slug,
+        field_name,
+        plugin_data_flag='remote',
+        field_base_cls=ModelChoiceField
+    )
+    if not isinstance(field.widget, RemoteSelectMixin):
+        raise Http404(ugettext("Form element not found."))
+
+    # Search fields are validated when the form element is saved, but the
+    # plugin data might have been changed otherwise (or the model since).
+    search_fields = get_model_search_fields(
+        field.queryset.model,
+        [
+            _f.strip()
+            for _f
+            in (getattr(plugin.data, 'search_fields', '') or '').split(',')
+        ]
+    )
+
+    try:
+        page = int(request.GET.get('page', 1))
+    except (TypeError, ValueError):
+        page = 1
+
+    try:
+        limit = int(request.GET.get('limit', MODEL_OBJECT_CHOICES_PAGE_SIZE))
+    except (TypeError, ValueError):
+        limit = MODEL_OBJECT_CHOICES_PAGE_SIZE
+    limit = min(max(limit, 1), MODEL_OBJECT_CHOICES_MAX_PAGE_SIZE)
+
+    choices, more = get_model_object_choices(
+        field.queryset,
+        term=request.GET.get('q', '').strip(),
+        search_fields=search_fields,
+        page=page,
+        limit=limit,
+        label_from_instance=field.label_from_instance
+    )
+
+    data = {
+        'results': [
+            {'id': force_text(value), 'text': label}
+            for value, label
+            in choices
+        ],
+        'more': more,
+    }
+
+    return HttpResponse(
+        json.dumps(data),
+        content_type='application/json'
+    )
+
+
+@require_POST
+def form_entry_file_upload(request, form_entry_slug, field_name):
+    """Upload file of a form element (JSON).
+
+    Used by the file fields in the direct upload mode. The file (``file``
+    POST param) is validated and stored, the upload token is returned. The
+    token is then submitted with the form instead of the file. Uploads are
+    rate limited as the submissions of the form are (counted apart).
+
+    :param django.http.HttpRequest request:
+    :param string form_entry_slug:
+    :param string field_name:
+    :return django.http.HttpResponse:
+    """
+    form_entry, plugin, field = _get_form_entry_field(
+        request,
+        form_entry_slug,
+        field_name,
+        plugin_data_flag='direct_upload',
+        field_base_cls=DirectUploadFileMixin
+    )
+
+    retry_after = check_submission_rate_limits(request,
+                                               form_entry,
+                                               action='upload')
+    if retry_after is not None:
+        return get_rate_limited_response(retry_after)
+
+    try:
+        uploaded_file = field.clean(request.FILES.get('file'))
+        if not uploaded_file:
+            raise ValidationError(field.error_messages['required'])
+    except ValidationError as err:
+        return HttpResponseBadRequest(
+            json.dumps({'errors': err.messages}),
+            content_type='application/json'
+        )
+
+    filename = handle_uploaded_file(field.upload_dir, uploaded_file)
+    data = {
+        'token': get_file_upload_token(filename, salt=field.token_salt),
+    }
+
+    return HttpResponse(json.dumps(data), content_type='application/json')
+
 # *****************************************************************************
 # **************************** View form entry success ************************
 # *****************************************************************************
 
 
+@use_read_database
+@form_entry_condition()
 def form_entry_submitted(request, form_entry_slug=None, template_name=None):
     """Form entry submitted.
 
@@ -2132,6 +2596,43 @@ def export_form_entry(request, form_entry_id, template_name=None):
 
     return data_exporter.export()
 
+
+@login_required
+@permissions_required(satisfy=SATISFY_ALL, perms=create_form_entry_permissions)
+def export_form_entries(request):
+    """Export all form entries (and form wizard entries) of the user.
+
+    The export is streamed, either as JSON lines (one form per line,
+    ``?format=jsonl``, default) or as a tar archive of JSON documents
+    (``?format=tar``).
+
+    :param django.http.HttpRequest request:
+    :return django.http.StreamingHttpResponse:
+    """
+    export_format = request.GET.get('format', 'jsonl')
+    documents = iter_export_documents(user=request.user)
+
+    if 'tar' == export_format:
+        response = StreamingHttpResponse(
+            iter_tar_json_documents(documents),
+            content_type='application/x-tar'
+        )
+        filename = 'forms.tar'
+    elif 'jsonl' == export_format:
+        response = StreamingHttpResponse(
+            iter_json_lines(data for name, data in documents),
+            content_type='application/x-ndjson'
+        )
+        filename = 'forms.jsonl'
+    else:
+        return HttpResponseBadRequest(
+            ugettext("Unknown export format {0}.").format(export_format)
+        )
+
+    response['Content-Disposition'] = \
+        'attachment; filename={0}'.format(filename)
+    return response
+
 # *****************************************************************************
 # *****************************************************************************
 # **************************** Import form entry ******************************
@@ -2141,6 +2642,7 @@ def export_form_entry(request, form_entry_id, template_name=None):
 
 @login_required
 @permissions_required(satisfy=SATISFY_ALL, perms=create_form_entry_permissions)
+@pins_primary_database
 def import_form_entry(request, template_name=None):
     """Import form entry.
 
@@ -2302,35 +2804,7 @@ def export_form_wizard_entry(request,
     except ObjectDoesNotExist as err:
         raise Http404(ugettext("Form wizard entry not found."))
 
-    data = {
-        'name': form_wizard_entry.name,
-        'slug': form_wizard_entry.slug,
-        'is_public': False,
-        'is_cloneable': False,
-        'success_page_title': form_wizard_entry.success_page_title,
-        'success_page_message': form_wizard_entry.success_page_message,
-        'form_wizard_forms': [],
-        'form_wizard_handlers': [],
-    }
-
-    form_wizard_form_entries = \
-        form_wizard_entry.formwizardformentry_set.all()[:]
-    form_wizard_handler_entries = \
-        form_wizard_entry.formwizardhandlerentry_set.all()[:]
-
-    for wizard_form_entry in form_wizard_form_entries:
-        data['form_wizard_forms'].append(
-            prepare_form_entry_export_data(wizard_form_entry.form_entry)
-        )
-
-    for wizard_handler_entry in form_wizard_handler_entries:
-        data['form_wizard_handlers'].append(
-            {
-                'plugin_uid': wizard_handler_entry.plugin_uid,
-                'plugin_data': wizard_handler_entry.plugin_data,
-            }
-        )
-
+    data = prepare_form_wizard_entry_export_data(form_wizard_entry)
     data_exporter = JSONDataExporter(
         json.dumps(data, cls=DjangoJSONEncoder),
         form_wizard_entry.slug
@@ -2349,6 +2823,7 @@ def export_form_wizard_entry(request,
 @login_required
 @permissions_required(satisfy=SATISFY_ALL,
                       perms=create_form_wizard_entry_permissions)
+@pins_primary_database
 def import_form_wizard_entry(request, template_name=None):
     """Import form wizard entry.
 
@@ -2404,19 +2879,27 @@ def import_form_wizard_entry(request, template_name=None):
             )
             form_wizard_entry.save()
 
-            # One by one, importing form element plugins.
+            # Importing the forms of the wizard.
+            form_wizard_form_entries = []
             for counter, form_entry_data \
                     in enumerate(form_wizard_forms_data):
                 form_entry = perform_form_entry_import(
                     request,
                     form_entry_data
                 )
-                FormWizardFormEntry.objects.create(
-                    form_wizard_entry=form_wizard_entry,
-                    form_entry=form_entry,
-                    position=counter
+                form_wizard_form_entries.append(
+                    FormWizardFormEntry(
+                        form_wizard_entry=form_wizard_entry,
+                        form_entry=form_entry,
+                        position=counter
+                    )
                 )
-            # One by one, importing form handler plugins.
+            FormWizardFormEntry._default_manager.bulk_create(
+                form_wizard_form_entries
+            )
+
+            # Importing form wizard handler plugins.
+            form_wizard_handlers = []
             for form_wizard_handler_data in form_wizard_handlers_data:
                 if form_wizard_handler_plugin_registry.registry.get(
                         form_wizard_handler_data.get('plugin_uid', None),
@@ -2426,7 +2909,7 @@ def import_form_wizard_entry(request, template_name=None):
                         **form_wizard_handler_data
                     )
                     form_wizard_handler.form_wizard_entry = form_wizard_entry
-                    form_wizard_handler.save()
+                    form_wizard_handlers.append(form_wizard_handler)
                 else:
                     if form_wizard_handler_data.get('plugin_uid', None):
                         messages.warning(
@@ -2443,6 +2926,9 @@ def import_form_wizard_entry(request, template_name=None):
                             _('Some essential data missing in the JSON '
                               'import.')
                         )
+            FormWizardHandlerEntry._default_manager.bulk_create(
+                form_wizard_handlers
+            )
 
             messages.info(
                 request,
@@ -1,4 +1,11 @@
-from django.forms.widgets import RadioSelect, Select
+from django.core.exceptions import ValidationError
+from django.forms.widgets import (
+    ClearableFileInput,
+    RadioSelect,
+    Select,
+    SelectMultiple,
+)
+from django.utils.encoding import force_text
 from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 from django.utils.translation import ugettext_lazy as _
@@ -24,7 +31,10 @@ __copyright__ = '2014-2018 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
 __all__ = (
     'BooleanRadioSelect',
+    'DirectUploadFileInput',
     'NumberInput',
+    'RemoteSelect',
+    'RemoteSelectMultiple',
     'RichSelect',
     'RichSelectInverseQuotes',
 )
@@ -189,3 +199,127 @@ class RichSelectInverseQuotes(RichSelect):
                     format_html(self.append_html)
                 ])
             )
+
+
+class RemoteSelectMixin(object):
+    """Mixin for select widgets loading their options remotely.
+
+    Only the selected options are rendered. The rest is loaded incrementally
+    (with search) from the JSON endpoint given by ``url`` by the
+    ``js/fobi.remote_select.js`` script. Meant to be used with the
+    ``ModelChoiceField`` and ``ModelMultipleChoiceField`` (or subclasses),
+    which validate the submitted values with a primary key lookup.
+    """
+
+    def __init__(self, url, attrs=None, choices=()):
+        """Constructor.
+
+        :param str url: URL of the JSON endpoint serving the choices.
+        :param dict attrs:
+        :param tuple choices:
+        """
+        attrs = dict(attrs or {})
+        attrs['data-fobi-remote-url'] = url
+        self.url = url
+        super(RemoteSelectMixin, self).__init__(attrs=attrs, choices=choices)
+
+    class Media(object):
+        """Media."""
+
+        js = ('js/fobi.remote_select.js',)
+
+    def get_selected_choices(self, value):
+        """Get choices for the selected values only.
+
+        :param mixed value: Single value or a list of values.
+        :return list:
+        """
+        if not isinstance(value, (list, tuple)):
+            value = [value]
+
+        values = [getattr(_v, 'pk', _v) for _v in value
+                  if _v not in (None, '')]
+
+        choices = []
+        field = getattr(self.choices, 'field', None)
+        queryset = getattr(self.choices, 'queryset', None)
+
+        if field is not None and field.empty_label is not None \
+                and not self.allow_multiple_selected:
+            choices.append(('', field.empty_label))
+
+        if not values:
+            return choices
+
+        if queryset is None:
+            values = set(force_text(_v) for _v in values)
+            choices += [_c for _c in self.choices
+                        if force_text(_c[0]) in values]
+            return choices
+
+        try:
+            objs = list(queryset.filter(pk__in=values))
+        except (ValueError, TypeError, ValidationError):
+            return choices
+
+        choices += [(field.prepare_value(obj), field.label_from_instance(obj))
+                    for obj in objs]
+        return choices
+
+    def render(self, name, value, attrs=None, **kwargs):
+        """Render the widget with the selected options only."""
+        all_choices = self.choices
+        self.choices = self.get_selected_choices(value)
+        try:
+            return super(RemoteSelectMixin, self).render(
+                name,
+                value,
+                attrs=attrs,
+                **kwargs
+            )
+        finally:
+            self.choices = all_choices
+
+
+class RemoteSelect(RemoteSelectMixin, Select):
+    """Select widget loading its options remotely."""
+
+
+class RemoteSelectMultiple(RemoteSelectMixin, SelectMultiple):
+    """Select multiple widget loading its options remotely."""
+
+
+class DirectUploadFileInput(ClearableFileInput):
+    """File input uploading the file before the form is submitted.
+
+    The ``js/fobi.direct_upload.js`` script uploads the chosen file to the
+    ``url`` given and puts the upload token received into a hidden input
+    of the same name. Falls back to the regular upload if no token is
+    submitted.
+    """
+
+    def __init__(self, url, attrs=None):
+        """Constructor.
+
+        :param str url: URL of the upload endpoint.
+        :param dict attrs:
+        """
+        attrs = dict(attrs or {})
+        attrs['data-fobi-upload-url'] = url
+        self.url = url
+        super(DirectUploadFileInput, self).__init__(attrs=attrs)
+
+    class Media(object):
+        """Media."""
+
+        js = ('js/fobi.direct_upload.js',)
+
+    def value_from_datadict(self, data, files, name):
+        """Get the upload token or the uploaded file."""
+        token = data.get(name)
+        if token:
+            return token
+
+        return super(DirectUploadFileInput, self).value_from_datadict(
+            data, files, name
+        )